@@ -0,0 +1,11 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks package
+
+Performance benchmarks of keripy hot paths. Not part of the unit test suite.
+Run from repo root with src on the path, for example:
+
+$ python -m benchmarks.replay
+$ python -m benchmarks.suite --list
+
+"""
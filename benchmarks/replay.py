@@ -0,0 +1,97 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.replay module
+
+Micro-benchmark of full KEL replay measuring the gain from memoized
+qb64b/qb64/qb2 encodings on Matter, Indexer and Counter primitives.
+
+Replays a KEL of configurable length into a fresh Kevery and times the
+parse, validate, log and clone (replay) cycle once with memoized encodings
+and once with memoization defeated so every access re-encodes as before.
+
+$ python -m benchmarks.replay --count 200 --rounds 3
+
+"""
+import argparse
+import json
+import time
+from contextlib import contextmanager
+
+from keri.app import habbing
+from keri import core
+from keri.core import coring, counting, indexing, parsing, eventing
+
+
+def unmemoized(klas):
+    """Returns dict of property overrides on klas that re-encode every access"""
+    return dict(qb64b=property(lambda self: self._infil()),
+                qb64=property(lambda self: self._infil().decode("utf-8")),
+                qb2=property(lambda self: self._binfil()))
+
+
+@contextmanager
+def baseline():
+    """Context manager that temporarily defeats encoding memoization"""
+    klases = (coring.Matter, indexing.Indexer, counting.Counter)
+    saved = {klas: {name: klas.__dict__[name] for name in ("qb64b", "qb64", "qb2")}
+             for klas in klases}
+    try:
+        for klas in klases:
+            for name, prop in unmemoized(klas).items():
+                setattr(klas, name, prop)
+        yield
+    finally:
+        for klas, props in saved.items():
+            for name, prop in props.items():
+                setattr(klas, name, prop)
+
+
+def replay(msgs, rounds):
+    """Returns best elapsed seconds over rounds of parse and replay of msgs"""
+    best = None
+    for _ in range(rounds):
+        with habbing.openHby(name="val", base="bench") as hby:
+            kvy = eventing.Kevery(db=hby.db, lax=True, local=False)
+            start = time.perf_counter()
+            parsing.Parser().parse(ims=bytearray(msgs), kvy=kvy, local=False)
+            kever = next(iter(kvy.kevers.values()))
+            clone = bytearray()
+            for msg in hby.db.clonePreIter(pre=kever.prefixer.qb64):
+                clone.extend(msg)
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(count=100, rounds=3):
+    """Returns dict of benchmark results for KEL of count events"""
+    with habbing.openHby(name="src", base="bench",
+                         salt=core.Salter(raw=b'0123456789abcdef').qb64) as hby:
+        hab = hby.makeHab(name="src", isith="2", icount=3)
+        for sn in range(1, count):
+            if sn % 10:
+                hab.interact()
+            else:
+                hab.rotate(isith="2", ncount=3)
+        msgs = bytes(hab.replay())
+
+    replay(msgs, 1)  # warm up imports and caches
+    memo = replay(msgs, rounds)
+    with baseline():
+        base = replay(msgs, rounds)
+
+    return dict(name="kel_replay", events=count, bytes=len(msgs), rounds=rounds,
+                memoized=memo, baseline=base,
+                speedup=(base / memo) if memo else None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KEL replay encoding benchmark")
+    parser.add_argument("--count", type=int, default=100, help="events in KEL")
+    parser.add_argument("--rounds", type=int, default=3, help="timed rounds")
+    args = parser.parse_args()
+    print(json.dumps(run(count=args.count, rounds=args.rounds)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.suite module
+
+KEL and TEL benchmark suite over the reproducible synthetic workloads of
+benchmarks.workloads. Each benchmark builds its workload once, then times
+its operation over rounds each against fresh temporary databases.
+
+Emits one JSON object per benchmark per line so results can be collected
+and compared across commits and machines. Each record carries the run
+environment, the workload parameters, the per round seconds, and the best
+and median seconds and ops per second.
+
+$ python -m benchmarks.suite --scale 1 --rounds 3 --only kel_ --out bench.jsonl
+
+"""
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass
+
+import keri
+from keri.app import habbing, storing
+from keri.core import eventing, parsing
+from keri.vdr import eventing as teventing
+from keri.vdr import verifying, viring
+
+from . import workloads
+
+
+@dataclass
+class Bench:
+    """
+    Bench is a named benchmark
+
+    Attributes:
+        name (str): unique benchmark name
+        doc (str): what is timed
+        make (Callable): given scale returns (params, workload)
+        setup (Callable): given ExitStack and workload returns untimed state
+            of one round against fresh databases
+        op (Callable): given state performs timed operation and returns
+            number of ops performed
+    """
+    name: str
+    doc: str
+    make: callable
+    setup: callable
+    op: callable
+
+
+Benches = {}
+
+
+def bench(name, doc, make, setup):
+    """
+    Returns decorator that registers its function as the timed op of Bench
+    """
+    def decorator(op):
+        Benches[name] = Bench(name=name, doc=doc, make=make, setup=setup, op=op)
+        return op
+    return decorator
+
+
+def validator(stack, name="val"):
+    """
+    Returns (hby, kvy) of fresh validator Habery entered on stack
+    """
+    hby = stack.enter_context(habbing.openHby(name=name, base="bench"))
+    return hby, eventing.Kevery(db=hby.db, lax=False, local=False)
+
+
+def kelSetup(stack, stream):
+    hby, kvy = validator(stack)
+    return dict(hby=hby, kvy=kvy, stream=stream, prior=set(kvy.kevers))
+
+
+def accepted(state):
+    """
+    Returns number of events accepted into KELs not known before round
+    """
+    return sum(kever.sn + 1 for pre, kever in state["kvy"].kevers.items()
+               if pre not in state["prior"])
+
+
+def kelParse(state):
+    parsing.Parser().parse(ims=bytearray(state["stream"]), kvy=state["kvy"], local=False)
+    return accepted(state)
+
+
+bench("kel_single", "parse single sig KEL into Kevery",
+      lambda scale: (dict(events=100 * scale),
+                     workloads.kel(100 * scale, name="single")),
+      kelSetup)(kelParse)
+
+bench("kel_multisig", "parse 2 of 3 multisig KEL into Kevery",
+      lambda scale: (dict(events=100 * scale, icount=3, isith="2"),
+                     workloads.kel(100 * scale, icount=3, isith="2", name="multi")),
+      kelSetup)(kelParse)
+
+bench("kel_witnessed", "parse KEL with 3 witness receipts per event into Kevery",
+      lambda scale: (dict(events=100 * scale, wits=3),
+                     workloads.kel(100 * scale, wits=3, name="witnessed")),
+      kelSetup)(kelParse)
+
+bench("kel_delegation", "parse delegation tree of depth 2 into Kevery",
+      lambda scale: (dict(depth=2, fanout=4 * scale, events=2),
+                     workloads.delegation(depth=2, fanout=4 * scale, events=2)),
+      kelSetup)(kelParse)
+
+
+@bench("kel_escrow_flood", "parse reversed KEL into Kevery then drain escrows",
+       lambda scale: (dict(events=50 * scale), workloads.flood(50 * scale)),
+       kelSetup)
+def escrowFlood(state):
+    kvy = state["kvy"]
+    parsing.Parser().parse(ims=bytearray(state["stream"]), kvy=kvy, local=False)
+    while True:  # each pass unescrows at least the next event in order
+        sn = sum(kever.sn for kever in kvy.kevers.values())
+        kvy.processEscrows()
+        if sum(kever.sn for kever in kvy.kevers.values()) == sn:
+            break
+    return accepted(state)
+
+
+def cloneSetup(stack, stream):
+    state = kelSetup(stack, stream)
+    kelParse(state)
+    return state
+
+
+@bench("kel_clone_all", "clone all KELs from Baser with Baser.cloneAllPreIter",
+       lambda scale: (dict(depth=2, fanout=4 * scale, events=2),
+                      workloads.delegation(depth=2, fanout=4 * scale, events=2)),
+       cloneSetup)
+def cloneAll(state):
+    return sum(1 for _ in state["hby"].db.cloneAllPreIter())
+
+
+def rotateSetup(stack, count):
+    hby = stack.enter_context(habbing.openHby(name="rot", base="bench",
+                                              salt=workloads.salter("rot").qb64))
+    return dict(hab=hby.makeHab(name="rot", isith="2", icount=3), count=count)
+
+
+@bench("hab_rotate", "rotate 2 of 3 multisig Hab with Hab.rotate",
+       lambda scale: (dict(rotations=10 * scale, icount=3, isith="2"), 10 * scale),
+       rotateSetup)
+def habRotate(state):
+    hab = state["hab"]
+    for _ in range(state["count"]):
+        hab.rotate(isith="2", ncount=3)
+    return state["count"]
+
+
+def telSetup(stack, tel):
+    hby, kvy = validator(stack)
+    reger = stack.enter_context(viring.openReger(name="val", temp=True))
+    tvy = teventing.Tevery(reger=reger, db=hby.db, local=False)
+    hby.db.schema.pin(tel.schemer.said, tel.schemer)
+    return dict(hby=hby, kvy=kvy, tvy=tvy, reger=reger, tel=tel)
+
+
+@bench("tel_parse", "parse issuer KEL and registry TEL into Kevery and Tevery",
+       lambda scale: (dict(creds=20 * scale, revoke=0.5), workloads.tel(20 * scale)),
+       telSetup)
+def telParse(state):
+    parser = parsing.Parser(kvy=state["kvy"], tvy=state["tvy"], local=False)
+    parser.parse(ims=bytearray(state["tel"].kel))
+    parser.parse(ims=bytearray(state["tel"].tel))
+    return len(state["tel"].creds)
+
+
+def credSetup(stack, tel):
+    state = telSetup(stack, tel)
+    telParse(state)
+    state["vry"] = verifying.Verifier(hby=state["hby"], reger=state["reger"])
+    return state
+
+
+@bench("tel_credentials", "verify credentials with Verifier.processCredential",
+       lambda scale: (dict(creds=20 * scale, revoke=0.5), workloads.tel(20 * scale)),
+       credSetup)
+def processCredentials(state):
+    vry = state["vry"]
+    for creder, prefixer, seqner, saider in state["tel"].creds:
+        vry.processCredential(creder, prefixer, seqner, saider)
+    return len(state["tel"].creds)
+
+
+def mailboxSetup(stack, msgs):
+    mbx = storing.Mailboxer(name="bench", temp=True)
+    stack.callback(mbx.close, clear=True)
+    return dict(mbx=mbx, msgs=msgs)
+
+
+@bench("mbx_store", "store messages in Mailboxer across 8 topics",
+       lambda scale: (dict(msgs=1000 * scale, topics=8, size=256),
+                      workloads.mailbox(1000 * scale, topics=8)),
+       mailboxSetup)
+def mailboxStore(state):
+    mbx = state["mbx"]
+    for topic, msg in state["msgs"]:
+        mbx.storeMsg(topic=topic, msg=msg)
+    return len(state["msgs"])
+
+
+def mailboxFilled(stack, msgs):
+    state = mailboxSetup(stack, msgs)
+    mailboxStore(state)
+    return state
+
+
+@bench("mbx_read", "read all messages of 8 topics with batched topic cursors",
+       lambda scale: (dict(msgs=1000 * scale, topics=8, size=256),
+                      workloads.mailbox(1000 * scale, topics=8)),
+       mailboxFilled)
+def mailboxRead(state):
+    mbx = state["mbx"]
+    count = 0
+    for topic in dict.fromkeys(topic for topic, _ in state["msgs"]):
+        cursor = mbx.cursor(topic, 0)
+        while batch := cursor.read():
+            count += len(batch)
+    return count
+
+
+def environment():
+    """
+    Returns dict of run environment recorded with each result
+    """
+    return dict(keri=keri.__version__, python=platform.python_version(),
+                implementation=platform.python_implementation(),
+                platform=platform.platform(), machine=platform.machine(),
+                time=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
+
+
+def run(name, scale=1, rounds=3):
+    """
+    Returns dict of results of benchmark name at scale over rounds
+
+    Parameters:
+        name (str): registered benchmark name
+        scale (int): workload size multiplier
+        rounds (int): number of timed rounds
+    """
+    b = Benches[name]
+    params, workload = b.make(scale)
+    times = []
+    ops = 0
+    for _ in range(rounds):
+        with ExitStack() as stack:
+            state = b.setup(stack, workload)
+            gc.collect()
+            start = time.perf_counter()
+            ops = b.op(state)
+            times.append(time.perf_counter() - start)
+    best = min(times)
+    return dict(name=name, doc=b.doc, scale=scale, params=params, rounds=rounds,
+                ops=ops, times=times, best=best, median=statistics.median(times),
+                ops_per_s=(ops / best) if best else None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KEL and TEL benchmark suite")
+    parser.add_argument("--only", action="append", default=[],
+                        help="run benchmarks whose name starts with prefix. Repeatable")
+    parser.add_argument("--scale", type=int, default=1, help="workload size multiplier")
+    parser.add_argument("--rounds", type=int, default=3, help="timed rounds")
+    parser.add_argument("--out", default=None, help="append JSON lines to file")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for b in Benches.values():
+            print(f"{b.name}: {b.doc}")
+        return
+
+    env = environment()
+    names = [name for name in Benches
+             if not args.only or any(name.startswith(p) for p in args.only)]
+    out = open(args.out, "a") if args.out else sys.stdout
+    try:
+        for name in names:
+            result = dict(env=env, **run(name, scale=args.scale, rounds=args.rounds))
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.workloads module
+
+Reproducible synthetic workloads for the benchmark suite. Every workload is
+derived from fixed salts so the same parameters always generate the same
+byte streams, prefixes and SAIDs across runs and machines.
+
+KEL workloads are built directly with the eventing message factories and
+deterministic signers so they do not depend on any Habery state. TEL and
+credential workloads are issued through a Habery and Regery so they exercise
+the same code paths as a real issuer.
+"""
+from dataclasses import dataclass, field
+
+from keri import core, kering
+from keri.app import habbing
+from keri.core import coring, eventing, scheming, serdering
+from keri.core.eventing import SealEvent
+from keri.help import helping
+from keri.vc import proving
+from keri.vdr import credentialing
+
+
+def salter(name):
+    """
+    Returns Salter whose raw salt is derived from name so keys are reproducible
+
+    Parameters:
+        name (str): unique name of synthetic controller
+    """
+    return core.Salter(raw=(name.encode("utf-8") * 16)[:16])
+
+
+@dataclass
+class Controller:
+    """
+    Controller is a synthetic KERI controller that builds signed key event
+    messages from deterministic key sets. Key set ridx is derived from the
+    controller salt at path ridx so each establishment event commits to the
+    digests of key set ridx + 1.
+
+    Attributes:
+        name (str): unique name from which salt is derived
+        icount (int): number of signing keys per key set
+        isith (str): signing threshold of each key set
+        wits (list): witness Controllers
+        toad (int): witness threshold
+        delegator (Controller | None): delegating controller
+        pre (str): identifier prefix qb64
+        sn (int): sequence number of latest event
+        said (str): SAID of latest event
+        ridx (int): index of current key set
+        msgs (list): messagized events in order
+    """
+    name: str
+    icount: int = 1
+    isith: str = "1"
+    wits: list = field(default_factory=list)
+    toad: int = 0
+    delegator: "Controller | None" = None
+    pre: str = ""
+    sn: int = 0
+    said: str = ""
+    ridx: int = 0
+    msgs: list = field(default_factory=list)
+
+    def signers(self, ridx, transferable=True):
+        """
+        Returns list of Signers of key set ridx
+        """
+        return salter(self.name).signers(count=self.icount, path=f"{ridx:x}.",
+                                         temp=True, transferable=transferable)
+
+    def ndigs(self, ridx):
+        """
+        Returns list of qb64 digests of public keys of key set ridx
+        """
+        return [coring.Diger(ser=signer.verfer.qb64b).qb64 for signer in self.signers(ridx)]
+
+    def incept(self):
+        """
+        Returns inception or delegated inception message and anchors it in
+        the KEL of .delegator if any
+        """
+        keys = [signer.verfer.qb64 for signer in self.signers(0)]
+        kwa = dict(isith=self.isith, ndigs=self.ndigs(1), nsith=self.isith,
+                   wits=[wit.pre for wit in self.wits], toad=self.toad)
+        if self.delegator is not None:
+            serder = eventing.delcept(keys=keys, delpre=self.delegator.pre, **kwa)
+        else:
+            serder = eventing.incept(keys=keys, code=coring.MtrDex.Blake3_256, **kwa)
+        self.pre = serder.pre
+        return self._log(serder)
+
+    def rotate(self):
+        """
+        Returns rotation or delegated rotation message to next key set
+        """
+        self.ridx += 1
+        keys = [signer.verfer.qb64 for signer in self.signers(self.ridx)]
+        kwa = dict(isith=self.isith, ndigs=self.ndigs(self.ridx + 1), nsith=self.isith,
+                   wits=[wit.pre for wit in self.wits], toad=self.toad, sn=self.sn + 1)
+        if self.delegator is not None:
+            serder = eventing.deltate(pre=self.pre, keys=keys, dig=self.said, **kwa)
+        else:
+            serder = eventing.rotate(pre=self.pre, keys=keys, dig=self.said, **kwa)
+        return self._log(serder)
+
+    def interact(self, data=None):
+        """
+        Returns interaction message with seals data
+        """
+        serder = eventing.interact(pre=self.pre, dig=self.said, sn=self.sn + 1,
+                                   data=data if data is not None else [])
+        return self._log(serder)
+
+    def _log(self, serder):
+        """
+        Returns messagized serder signed by current key set and witnesses and
+        with delegation source seal when delegated. Appends to .msgs
+        """
+        self.sn = serder.sn
+        self.said = serder.said
+        sigers = [signer.sign(serder.raw, index=i)
+                  for i, signer in enumerate(self.signers(self.ridx))]
+        wigers = [wit.signers(0, transferable=False)[0].sign(serder.raw, index=i)
+                  for i, wit in enumerate(self.wits)] or None
+        msg = eventing.messagize(serder, sigers=sigers, wigers=wigers)
+        if self.delegator is not None and serder.ilk in (coring.Ilks.dip, coring.Ilks.drt):
+            anchor = self.delegator.interact(data=[SealEvent(serder.pre, serder.snh,
+                                                             serder.said)._asdict()])
+            msg.extend(core.Counter(core.Codens.SealSourceCouples, count=1,
+                                    gvrsn=kering.Vrsn_1_0).qb64b)
+            msg.extend(coring.Seqner(sn=self.delegator.sn).qb64b)
+            msg.extend(coring.Saider(qb64=self.delegator.said).qb64b)
+            self.msgs.append(bytes(msg))
+            return bytes(anchor) + bytes(msg)  # delegator anchor first
+        self.msgs.append(bytes(msg))
+        return bytes(msg)
+
+
+def kel(count, icount=1, isith="1", wits=0, name="kel"):
+    """
+    Returns bytes stream of KEL of count events of one controller with one
+    rotation every ten events and the rest interactions.
+
+    Parameters:
+        count (int): number of events in KEL
+        icount (int): number of signing keys. More than one is multisig
+        isith (str): signing threshold
+        wits (int): number of witnesses whose indexed receipts are attached
+        name (str): unique name of controller
+    """
+    witnesses = [Controller(name=f"{name}.wit{i}") for i in range(wits)]
+    for wit in witnesses:
+        wit.pre = wit.signers(0, transferable=False)[0].verfer.qb64
+    ctl = Controller(name=name, icount=icount, isith=isith, wits=witnesses, toad=wits)
+    stream = bytearray(ctl.incept())
+    for sn in range(1, count):
+        stream.extend(ctl.rotate() if sn % 10 == 0 else ctl.interact())
+    return bytes(stream)
+
+
+def delegation(depth, fanout, events=1, name="del"):
+    """
+    Returns bytes stream of a delegation tree of given depth where each
+    delegator has fanout delegates. Each delegated controller adds events - 1
+    rotations. Delegator anchoring interactions precede each delegated event.
+
+    Parameters:
+        depth (int): number of delegation levels below the root
+        fanout (int): number of delegates of each delegator
+        events (int): number of establishment events per delegate
+        name (str): unique name of root controller
+    """
+    root = Controller(name=name)
+    stream = bytearray(root.incept())
+    level = [root]
+    for lvl in range(depth):
+        nextLevel = []
+        for dor in level:
+            for i in range(fanout):
+                dee = Controller(name=f"{dor.name}.{i}", delegator=dor)
+                stream.extend(dee.incept())
+                for _ in range(events - 1):
+                    stream.extend(dee.rotate())
+                nextLevel.append(dee)
+        level = nextLevel
+    return bytes(stream)
+
+
+def split(stream):
+    """
+    Returns list of messages with attachments framed from stream of
+    messages each as produced by Controller._log
+    """
+    msgs = []
+    ims = bytearray(stream)
+    while ims:
+        serder = serdering.SerderKERI(raw=ims)
+        end = ims.find(b'{"v":"KERI', serder.size)
+        end = len(ims) if end < 0 else end
+        msgs.append(bytes(ims[:end]))
+        del ims[:end]
+    return msgs
+
+
+def flood(count, name="flood"):
+    """
+    Returns bytes stream of KEL of count events with every event after
+    inception in reverse order so all but the last processed land in the
+    out of order escrow.
+
+    Parameters:
+        count (int): number of events in KEL
+        name (str): unique name of controller
+    """
+    msgs = split(kel(count, name=name))
+    return b"".join([msgs[0]] + msgs[:0:-1])
+
+
+Schema = {"$id": "",
+          "$schema": "http://json-schema.org/draft-07/schema#",
+          "title": "Benchmark Credential",
+          "description": "Synthetic credential of the benchmark suite",
+          "type": "object",
+          "properties": {"v": {"type": "string"},
+                         "d": {"type": "string"},
+                         "i": {"type": "string"},
+                         "ri": {"type": "string"},
+                         "s": {"type": "string"},
+                         "a": {"type": "object",
+                               "properties": {"d": {"type": "string"},
+                                              "i": {"type": "string"},
+                                              "dt": {"type": "string", "format": "date-time"},
+                                              "n": {"type": "integer"}},
+                               "required": ["d", "i", "dt", "n"]}},
+          "required": ["v", "d", "i", "ri", "s", "a"]}
+
+
+def schemer():
+    """
+    Returns Schemer of benchmark credential schema
+    """
+    _, sad = coring.Saider.saidify(dict(Schema), label=coring.Saids.dollar)
+    return scheming.Schemer(sed=sad)
+
+
+@dataclass
+class Tel:
+    """
+    Tel is the output of the tel workload
+
+    Attributes:
+        kel (bytes): issuer KEL with anchoring events
+        tel (bytes): registry and credential TEL events
+        creds (list): of (creder, prefixer, seqner, saider) credential
+            with its anchoring KEL event
+        schemer (Schemer): credential schema
+    """
+    kel: bytes
+    tel: bytes
+    creds: list
+    schemer: scheming.Schemer
+
+
+def tel(count, revoke=0.5, name="tel"):
+    """
+    Returns Tel of a registry that issues count credentials and then revokes
+    the first count * revoke of them.
+
+    Parameters:
+        count (int): number of credentials issued
+        revoke (float): fraction of credentials revoked
+        name (str): unique name of issuer
+    """
+    with habbing.openHby(name=name, base="bench", salt=salter(name).qb64) as hby:
+        hab = hby.makeHab(name=name)
+        regery = credentialing.Regery(hby=hby, name=name, temp=True)
+        try:
+            issuer = regery.makeRegistry(prefix=hab.pre, name=name, noBackers=True)
+            _anchor(hab, issuer, issuer.regk, issuer.regd)
+            regery.processEscrows()
+
+            schema = schemer()
+            creds = []
+            for n in range(count):
+                subject = dict(d="", i=hab.pre, dt=helping.nowIso8601(), n=n)
+                _, subject = coring.Saider.saidify(sad=subject, label=coring.Saids.d)
+                creder = proving.credential(issuer=hab.pre, schema=schema.said,
+                                            data=subject, status=issuer.regk)
+                iss = issuer.issue(said=creder.said)
+                seqner, saider = _anchor(hab, issuer, iss.pre, iss.said)
+                regery.processEscrows()
+                creds.append((creder, hab.kever.prefixer, seqner, saider))
+
+            for creder, *_ in creds[:int(count * revoke)]:
+                rev = issuer.revoke(said=creder.said)
+                _anchor(hab, issuer, rev.pre, rev.said)
+                regery.processEscrows()
+
+            telStream = bytearray()
+            for pre in [issuer.regk] + [creder.said for creder, *_ in creds]:
+                for msg in regery.reger.clonePreIter(pre=pre):
+                    telStream.extend(msg)
+            return Tel(kel=bytes(hab.replay()), tel=bytes(telStream), creds=creds,
+                       schemer=schema)
+        finally:
+            regery.close()
+
+
+def _anchor(hab, issuer, pre, said):
+    """
+    Returns (seqner, saider) of interaction of hab anchoring TEL event pre
+    said and attaches anchor to TEL event of issuer
+    """
+    hab.interact(data=[SealEvent(pre, "0", said)._asdict()])
+    seqner = coring.Seqner(sn=hab.kever.sn)
+    saider = coring.Saider(qb64=hab.kever.serder.said)
+    issuer.anchorMsg(pre=pre, regd=said, seqner=seqner, saider=saider)
+    return seqner, saider
+
+
+def mailbox(count, topics, size=256, name="mbx"):
+    """
+    Returns list of (topic, msg) of count synthetic mailbox messages spread
+    round robin over topics topics of one recipient.
+
+    Parameters:
+        count (int): number of messages
+        topics (int): number of topics
+        size (int): bytes per message
+        name (str): unique name of recipient
+    """
+    pre = salter(name).signer(temp=True).verfer.qb64
+    names = ["/receipt", "/reply", "/replay", "/multisig", "/credential",
+             "/challenge", "/delegate", "/oobi"]
+    out = []
+    for i in range(count):
+        topic = f"{pre}{names[i % topics % len(names)]}{i % topics // len(names) or ''}"
+        body = f'{{"i":"{pre}","n":{i},"p":"'.encode("utf-8")
+        out.append((topic, body + b"x" * max(0, size - len(body) - 2) + b'"}'))
+    return out
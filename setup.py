@@ -98,6 +98,7 @@ setup(
                         'qrcode>=7.4.2'
     ],
     extras_require={
+        'fast': ['orjson>=3.8.3'],
     },
     tests_require=[
                     'coverage>=7.4.4',
@@ -5,14 +5,17 @@ keri.kli.commands module
 
 """
 import argparse
+import mmap
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from hio import help
 from hio.base import doing
 
 from keri.app import habbing
 from keri.app.cli.common import existing
-from keri.core import coring, serdering, parsing
+from keri.core import coring, serdering, bulking
 
 logger = help.ogler.getLogger()
 
@@ -25,6 +28,8 @@ parser.add_argument('--base', '-b', help='additional optional prefix to file loc
 parser.add_argument('--passcode', '-p', help='21 character encryption passcode for keystore (is not saved)',
                     dest="bran", default=None)  # passcode => bran
 parser.add_argument("--file", help="File of streamed CESR events to import", required=True)
+parser.add_argument("--workers", "-w", help="number of signature verification worker threads. 0 means "
+                                          "verify in main thread", type=int, default=0)
 
 
 def export(args):
@@ -35,14 +40,16 @@ def export(args):
     ed = ImportDoer(name=args.name,
                     base=args.base,
                     bran=args.bran,
-                    file=args.file)
+                    file=args.file,
+                    workers=args.workers)
     return [ed]
 
 
 class ImportDoer(doing.DoDoer):
 
-    def __init__(self, name, base, bran, file):
+    def __init__(self, name, base, bran, file, workers=0):
         self.file = file
+        self.workers = workers
 
         self.hby = existing.setupHby(name=name, base=base, bran=bran)
 
@@ -67,8 +74,18 @@ class ImportDoer(doing.DoDoer):
         _ = (yield self.tock)
 
         with open(self.file, 'rb') as f:
-            ims = f.read()
-            parsing.Parser(kvy=self.hby.kvy, rvy=self.hby.rvy, local=False).parse(ims=ims)
+            if os.fstat(f.fileno()).st_size:  # mmap so parser reads in chunks not whole file
+                pool = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 0 else None
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as ims:
+                        bulker = bulking.Bulker(kvy=self.hby.kvy, rvy=self.hby.rvy,
+                                                pool=pool, local=False)
+                        stats = bulker.ingest(ims=ims)
+                finally:
+                    if pool is not None:
+                        pool.shutdown()
+                print(f"Imported {stats['events']} events in {stats['elapsed']:.2f}s "
+                      f"({stats['eps']:.1f} events/s, {stats['bps']:.1f} bytes/s)")
             self.hby.kvy.processEscrows()
 
         self.exit()
@@ -4,6 +4,7 @@ keri.kli.commands module
 
 """
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
 from hio.base import doing
@@ -33,6 +34,8 @@ parser.add_argument('--passcode', '-p', help='21 character encryption passcode f
                     dest="bran", default=None)  # passcode => bran
 parser.add_argument('--aeid', help='qualified base64 of non-transferable identifier prefix for  authentication '
                                    'and encryption of secrets in keystore', default=None)
+parser.add_argument("--workers", help="number of key derivation worker processes. 0 means "
+                                     "derive keys in main process", type=int, default=0)
 incepting.addInceptingArgs(parser)
 
 
@@ -72,7 +75,7 @@ def handler(args):
     kwa = mergeArgsWithFile(args).__dict__
 
     icpDoer = InceptDoer(name=name, base=base, alias=alias, bran=bran, endpoint=endpoint, proxy=proxy,
-                         cnfg=config_dir, **kwa)
+                         cnfg=config_dir, workers=args.workers, **kwa)
 
     doers = [icpDoer]
     return doers
@@ -127,7 +130,7 @@ class InceptDoer(doing.DoDoer):
     """ DoDoer for creating a new identifier prefix and Hab with an alias.
     """
 
-    def __init__(self, name, base, alias, bran, endpoint, proxy=None, cnfg=None, **kwa):
+    def __init__(self, name, base, alias, bran, endpoint, proxy=None, cnfg=None, workers=0, **kwa):
 
         cf = None
         if config is not None:
@@ -148,6 +151,7 @@ class InceptDoer(doing.DoDoer):
 
         self.inits = kwa
         self.alias = alias
+        self.workers = workers
         super(InceptDoer, self).__init__(doers=doers)
 
     def inceptDo(self, tymth, tock=0.0):
@@ -164,7 +168,14 @@ class InceptDoer(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
-        hab = self.hby.makeHab(name=self.alias, **self.inits)
+        if self.workers > 0:  # stretch salty keys across worker processes
+            self.hby.mgr.pool = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            hab = self.hby.makeHab(name=self.alias, **self.inits)
+        finally:
+            if self.hby.mgr.pool is not None:
+                self.hby.mgr.pool.shutdown()
+                self.hby.mgr.pool = None
         witDoer = agenting.WitnessReceiptor(hby=self.hby)
         receiptor = agenting.Receiptor(hby=self.hby)
         self.extend([witDoer, receiptor])
@@ -14,9 +14,9 @@ from hio.base import doing
 from keri import help, kering
 from keri.app import indirecting
 from keri.app.cli.common import existing, terming
-from keri.core import scheming
+from keri.core import coring, scheming
 from keri.help import helping
-from keri.vdr import credentialing, verifying
+from keri.vdr import credentialing, querying, verifying
 
 logger = help.ogler.getLogger()
 
@@ -107,14 +107,12 @@ class ListDoer(doing.DoDoer):
                 yield 1.0
             print("\n")
 
+        querier = querying.Querier(reger=self.rgy.reger)
         if self.issued:
-            saids = self.rgy.reger.issus.get(keys=self.hab.pre)
+            found = querier.seek(issuer=self.hab.pre, schema=self.schema)
         else:
-            saids = self.rgy.reger.subjs.get(keys=self.hab.pre)
-
-        if self.schema is not None:
-            scads = self.rgy.reger.schms.get(keys=self.schema)
-            saids = [saider for saider in saids if saider.qb64 in [saider.qb64 for saider in scads]]
+            found = querier.seek(subject=self.hab.pre, schema=self.schema)
+        saids = [coring.Saider(qb64=said) for _, said in found]
 
         if self.said:
             for said in saids:
@@ -669,6 +669,9 @@ class Habery:
         Parameters:
            clear is boolean, True means clear resource directories
         """
+        if self.mgr:
+            self.mgr.wipe()
+
         if self.ks:
             self.ks.close(clear=self.ks.temp or clear)
 
@@ -1524,18 +1527,36 @@ class BaseHab:
             fn is int first seen ordering number
 
         """
-        if not pre:
-            pre = self.pre
-
         msgs = bytearray()
-        kever = self.kevers[pre]
-        for msg in self.db.cloneDelegation(kever=kever):
+        for msg in self.replayIter(pre=pre, fn=fn):
             msgs.extend(msg)
+        return msgs
 
-        for msg in self.db.clonePreIter(pre=pre, fn=fn):
-            msgs.extend(msg)
+    def replayIter(self, pre=None, fn=0):
+        """
+        Returns generator of bytes chunks of messages of replay of FEL first
+        seen event log for pre starting from fn preceded by replay of its
+        delegation chain if any. Default pre is own .pre
+        Streams bounded chunks so memory is constant in KEL length. Each chunk
+        is read in its own read transaction so none is held while suspended.
 
-        return msgs
+        Parameters:
+            pre is qb64 str or bytes of identifier prefix.
+                default is own .pre
+            fn is int first seen ordering number
+
+        """
+        if not pre:
+            pre = self.pre
+
+        kever = self.kevers[pre]
+        delpres = []  # delegation chain from root delegator as in .db.cloneDelegation
+        while kever.delegated and kever.delpre in self.kevers:
+            delpres.insert(0, kever.delpre)
+            kever = self.kevers[kever.delpre]
+        for delpre in delpres:
+            yield from self.db.clonePreChunkIter(pre=delpre)
+        yield from self.db.clonePreChunkIter(pre=pre, fn=fn)
 
     def replayAll(self):
         """
@@ -1546,10 +1567,17 @@ class BaseHab:
 
         """
         msgs = bytearray()
-        for msg in self.db.cloneAllPreIter():
+        for msg in self.replayAllIter():
             msgs.extend(msg)
         return msgs
 
+    def replayAllIter(self):
+        """
+        Returns generator of messages of replay of FEL first seen event log
+        for all pre. Streams one message at a time so memory is constant.
+        """
+        yield from self.db.cloneAllPreIter()
+
     def makeOtherEvent(self, pre, sn):
         """
         Returns: messagized bytearray message with attached signatures of
@@ -1903,11 +1931,30 @@ class BaseHab:
         return msgs
 
     def replyEndRole(self, cid, role=None, eids=None, scheme=""):
-
         """
         Returns a reply message stream composed of entries authed by the given
         cid from the appropriate reply database including associated attachments
         in order to disseminate (percolate) BADA reply data authentication proofs.
+        Accumulates .replyEndRoleIter into one bytearray.
+
+        Parameters:
+            cid (str): identifier prefix qb64 of controller authZ endpoint provided
+                       eid is witness
+            role (str): authorized role for eid
+            eids (list): when provided restrict returns to only eids in eids
+            scheme (str): url scheme
+        """
+        msgs = bytearray()
+        for msg in self.replyEndRoleIter(cid=cid, role=role, eids=eids, scheme=scheme):
+            msgs.extend(msg)
+        return msgs
+
+    def replyEndRoleIter(self, cid, role=None, eids=None, scheme=""):
+
+        """
+        Returns generator of reply messages composed of entries authed by the given
+        cid from the appropriate reply database including associated attachments
+        in order to disseminate (percolate) BADA reply data authentication proofs.
 
         Currently uses promiscuous model for permitting endpoint discovery.
         Future is to use identity constraint graph to constrain discovery
@@ -1937,15 +1984,13 @@ class BaseHab:
             eids (list): when provided restrict returns to only eids in eids
             scheme (str): url scheme
         """
-        msgs = bytearray()
-
         if eids is None:
             eids = []
 
         if cid not in self.kevers:
-            return msgs
+            return
 
-        msgs.extend(self.replay(cid))
+        yield from self.replayIter(cid)
 
         kever = self.kevers[cid]
         witness = self.pre in kever.wits  # see if we are cid's witness
@@ -1955,18 +2000,17 @@ class BaseHab:
             for eid in kever.wits:
                 if not eids or eid in eids:
                     if eid == self.pre:
-                        msgs.extend(self.replyLocScheme(eid=eid, scheme=scheme))
+                        yield self.replyLocScheme(eid=eid, scheme=scheme)
                     else:
-                        msgs.extend(self.loadLocScheme(eid=eid, scheme=scheme))
+                        yield self.loadLocScheme(eid=eid, scheme=scheme)
                     if not witness:  # we are not witness, send auth records
-                        msgs.extend(self.makeEndRole(eid=eid, role=role))
+                        yield self.makeEndRole(eid=eid, role=role)
 
-        for (_, erole, eid), end in self.db.ends.getItemIter(keys=(cid,)):
+        # read ends before yielding so no read transaction is held while suspended
+        for (_, erole, eid), end in list(self.db.ends.getItemIter(keys=(cid,))):
             if (end.enabled or end.allowed) and (not role or role == erole) and (not eids or eid in eids):
-                msgs.extend(self.loadLocScheme(eid=eid, scheme=scheme))
-                msgs.extend(self.loadEndRole(cid=cid, eid=eid, role=erole))
-
-        return msgs
+                yield self.loadLocScheme(eid=eid, scheme=scheme)
+                yield self.loadEndRole(cid=cid, eid=eid, role=erole)
 
     def replyToOobi(self, aid, role, eids=None):
         """
@@ -1992,6 +2036,19 @@ class BaseHab:
         # not permiteed in .habs.oobis
         return self.replyEndRole(cid=aid, role=role, eids=eids)
 
+    def replyToOobiIter(self, aid, role, eids=None):
+        """
+        Returns generator of reply messages of .replyToOobi so a response may
+        stream them with bounded buffering instead of accumulating them.
+
+        Parameters:
+            aid (str): qb64 of identifier in oobi, may be cid or eid
+            role (str): authorized role for eid
+            eids (list): when provided restrict returns to only eids in eids
+
+        """
+        return self.replyEndRoleIter(cid=aid, role=role, eids=eids)
+
     def getOwnEvent(self, sn, allowPartiallySigned=False):
         """
         Returns: message Serder and controller signatures of
@@ -2455,10 +2512,10 @@ class SignifyHab(BaseHab):
             raise kering.ConfigurationError(f"Improper Habitat event type={serder.ked['t']} for "
                                             f"pre={self.pre}.")
 
-    def replyEndRole(self, cid, role=None, eids=None, scheme=""):
+    def replyEndRoleIter(self, cid, role=None, eids=None, scheme=""):
 
         """
-        Returns a reply message stream composed of entries authed by the given
+        Returns generator of reply messages composed of entries authed by the given
         cid from the appropriate reply database including associated attachments
         in order to disseminate (percolate) BADA reply data authentication proofs.
 
@@ -2490,13 +2547,11 @@ class SignifyHab(BaseHab):
             eids (list): when provided restrict returns to only eids in eids
             scheme (str): url scheme
         """
-        msgs = bytearray()
-
         if eids is None:
             eids = []
 
         # introduce yourself, please
-        msgs.extend(self.replay(cid))
+        yield from self.replayIter(cid)
 
         if role == kering.Roles.witness:
             if kever := self.kevers[cid] if cid in self.kevers else None:
@@ -2505,19 +2560,18 @@ class SignifyHab(BaseHab):
                 # latest key state for cid
                 for eid in kever.wits:
                     if not eids or eid in eids:
-                        msgs.extend(self.loadLocScheme(eid=eid, scheme=scheme))
+                        yield self.loadLocScheme(eid=eid, scheme=scheme)
                         if not witness:  # we are not witness, send auth records
-                            msgs.extend(self.makeEndRole(eid=eid, role=role))
+                            yield self.makeEndRole(eid=eid, role=role)
                 if witness:  # we are witness, set KEL as authz
-                    msgs.extend(self.replay(cid))
+                    yield from self.replayIter(cid)
 
-        for (_, erole, eid), end in self.db.ends.getItemIter(keys=(cid,)):
+        # read ends before yielding so no read transaction is held while suspended
+        for (_, erole, eid), end in list(self.db.ends.getItemIter(keys=(cid,))):
             if (end.enabled or end.allowed) and (not role or role == erole) and (not eids or eid in eids):
-                msgs.extend(self.replay(eid))
-                msgs.extend(self.loadLocScheme(eid=eid, scheme=scheme))
-                msgs.extend(self.loadEndRole(cid=cid, eid=eid, role=erole))
-
-        return msgs
+                yield from self.replayIter(eid)
+                yield self.loadLocScheme(eid=eid, scheme=scheme)
+                yield self.loadEndRole(cid=cid, eid=eid, role=erole)
 
 
 class SignifyGroupHab(SignifyHab):
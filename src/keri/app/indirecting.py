@@ -27,13 +27,17 @@ from ..core import (eventing, parsing, routing, coring, serdering,
 from ..core.coring import Ilks
 from ..db import basing, dbing
 from ..end import ending
-from ..help import helping
+from ..help import helping, metering
 from ..peer import exchanging
 from ..vdr import verifying, viring
 from ..vdr.eventing import Tevery
 
 logger = help.ogler.getLogger()
 
+Cues = metering.registry.gauge("keri_cue_depth", "Pending cues per queue", ("queue",))
+Fills = metering.registry.gauge("keri_lmdb_map_fill",
+                                "Fraction of LMDB map in use per database", ("db",))
+
 
 def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPort=5632,
                  keypath=None, certpath=None, cafilepath=None):
@@ -63,13 +67,15 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
     ending.loadEnds(app=app, hby=hby, default=hab.pre)
     oobiing.loadEnds(app=app, hby=hby, prefix="/ext")
     rep = storing.Respondant(hby=hby, mbx=mbx, aids=aids)
+    retainer = storing.Retainer(mbx=mbx, tock=1.0)  # mailbox garbage collection
 
     rvy = routing.Revery(db=hby.db, cues=cues)
     kvy = eventing.Kevery(db=hby.db,
                           lax=True,
                           local=False,
                           rvy=rvy,
-                          cues=cues)
+                          cues=cues,
+                          driven=True)
     kvy.registerReplyRoutes(router=rvy.rtr)
 
     tvy = Tevery(reger=verfer.reger,
@@ -88,8 +94,9 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
     app.add_route("/", httpEnd)
     receiptEnd = ReceiptEnd(hab=hab, inbound=cues, aids=aids)
     app.add_route("/receipts", receiptEnd)
-    queryEnd = QueryEnd(hab=hab)
+    queryEnd = QueryEnd(hab=hab, reger=reger)
     app.add_route("/query", queryEnd)
+    app.add_route("/metrics", MetricsEnd(dbs=[hby.db, reger, mbx]))
 
     server = createHttpServer(host, httpPort, app, keypath, certpath, cafilepath)
     if not server.reopen():
@@ -112,7 +119,12 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
                             kvy=kvy, tvy=tvy, rvy=rvy, exc=exchanger, replies=rep.reps,
                             responses=rep.cues, queries=httpEnd.qrycues)
 
-    doers.extend([regDoer, httpServerDoer, rep, witStart, receiptEnd, *oobiery.doers])
+    for queue, deck in (("kevery", cues), ("exchanger", exchanger.cues),
+                        ("receipts", receiptEnd.outbound), ("responses", rep.cues),
+                        ("replies", rep.reps), ("queries", httpEnd.qrycues)):
+        Cues.track(deck, queue)
+
+    doers.extend([regDoer, httpServerDoer, rep, retainer, witStart, receiptEnd, *oobiery.doers])
     return doers
 
 
@@ -992,6 +1004,16 @@ class QryRpyMailboxIterable:
 
 
 class MailboxIterable:
+    """
+    MailboxIterable streams the messages of mailbox topics of pre as SSE events.
+    Subscribes to the mailbox so that it reads only topics notified of new
+    messages and otherwise returns empty without touching the database.
+    Each iteration reads at most one bounded batch per topic so a large
+    backlog streams in chunks.
+
+    Class Attributes:
+        TimeoutMBX (float): seconds without new messages before stream ends
+    """
     TimeoutMBX = 30000000
 
     def __init__(self, mbx, pre, topics, retry=5000):
@@ -1002,6 +1024,12 @@ class MailboxIterable:
 
     def __iter__(self):
         self.start = self.end = time.perf_counter()
+        self.cursors = {topic: self.mbx.cursor(self.pre + topic, fn=idx)
+                        for topic, idx in self.topics.items()}
+        self.sub = self.mbx.subscribe(self.pre + topic for topic in self.topics)
+        self.names = dict(zip(self.sub.keys, self.topics))  # topic by key
+        self.dirty = set(topic for topic, cursor in self.cursors.items()
+                         if cursor.pending)  # backlog
         return self
 
     def __next__(self):
@@ -1011,20 +1039,26 @@ class MailboxIterable:
                 return bytearray(f"retry: {self.retry}\n\n".encode("utf-8"))
 
             data = bytearray()
-            for topic, idx in self.topics.items():
-                key = self.pre + topic
-                for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
+            if self.sub.ready:
+                self.dirty.update(self.names[key] for key in self.sub.drain())
+
+            # only topics with new messages, in subscribed topics order
+            for topic in [topic for topic in self.cursors if topic in self.dirty]:
+                cursor = self.cursors[topic]
+                for fn, msg in cursor.read():  # one bounded batch per topic
                     data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
                                           .encode("utf-8")))
                     data.extend(msg)
                     data.extend(b'\n\n')
-                    idx = idx + 1
                     self.start = time.perf_counter()
 
-                self.topics[topic] = idx
+                self.topics[topic] = cursor.fn
+                if not cursor.pending:
+                    self.dirty.discard(topic)
             self.end = time.perf_counter()
             return data
 
+        self.mbx.unsubscribe(self.sub)
         raise StopIteration
 
 
@@ -1192,9 +1226,46 @@ class QueryEnd:
 
      """
 
-    def __init__(self, hab):
+    def __init__(self, hab, reger=None):
+        """
+        Parameters:
+            hab (Hab): witness environment
+            reger (Reger | None): credential registry database of witness.
+                None means open registry of hab
+        """
         self.hab = hab
-        self.reger = viring.Reger(name=hab.name, db=hab.db, temp=False)
+        self.reger = reger if reger is not None else viring.Reger(name=hab.name, db=hab.db,
+                                                                   temp=False)
+
+    def kelIter(self, pre, sn=0, size=65536):
+        """ Returns generator of bytes chunks of cloned event messages of KEL of
+        pre at or after sn. Each chunk is read in its own read transaction that
+        ends before the chunk is yielded.
+
+            Parameters:
+                pre (str): qb64 identifier prefix of KEL
+                sn (int): sequence number of first event
+                size (int): min chunk size in bytes before chunk is yielded
+        """
+        preb = pre.encode("utf-8")
+        done = False
+        while not done:
+            chunk = bytearray()
+            with self.hab.db.snapshot():  # one read transaction per chunk
+                while True:
+                    if not (digs := self.hab.db.getKes(dbing.snKey(pre=preb, sn=sn))):
+                        done = True  # gap or end of KEL
+                        break
+                    if len(chunk) >= size:
+                        break
+                    for dig in digs:
+                        try:
+                            chunk.extend(self.hab.db.cloneEvtMsg(pre=preb, fn=0, dig=dig))
+                        except Exception:
+                            continue  # skip this event
+                    sn += 1
+            if chunk:
+                yield bytes(chunk)
    
     def on_get(self, req, rep):
         """ Handles GET requests to query KEL or TEL events of a pre from a witness.
@@ -1235,8 +1306,6 @@ class QueryEnd:
             if not pre:
                 raise falcon.HTTPBadRequest(description="'pre' query param is required")
             
-            evnts = bytearray()
-
             sn = req.get_param_as_int("sn")
             if sn is not None: ## query for event with seq-num >= sn
                 preb = pre.encode("utf-8")
@@ -1245,20 +1314,14 @@ class QueryEnd:
                 if dig is None:
                     raise falcon.HTTPBadRequest(description=f"non-existant event at seq-num {sn}")
 
-                for dig in self.hab.db.getKelIter(pre, sn=sn):
-                    try:
-                        msg = self.hab.db.cloneEvtMsg(pre=pre, fn=0, dig=dig)
-                    except Exception:
-                        continue  # skip this event
-                    evnts.extend(msg)
+                chunks = self.kelIter(pre=pre, sn=sn)
             else:
-                for msg in self.hab.db.clonePreIter(pre=pre):
-                    evnts.extend(msg)
-                
-            
+                chunks = self.hab.db.clonePreChunkIter(pre=pre)
+
+            # stream KEL in bounded chunks each read in its own read transaction
             rep.set_header('Content-Type', "application/json+cesr")
             rep.status = falcon.HTTP_200
-            rep.data = bytes(evnts)
+            rep.stream = chunks
 
         elif typ == "tel":
             regk = req.get_param("reg")
@@ -1285,4 +1348,47 @@ class QueryEnd:
         else:
             rep.set_header('Content-Type', "application/json")
             rep.text = "unkown query type."
-            rep.status = falcon.HTTP_400
\ No newline at end of file
+            rep.status = falcon.HTTP_400
+
+
+class MetricsEnd:
+    """
+    MetricsEnd exposes the metrics of metering.registry over HTTP GET in the
+    Prometheus text exposition format. Responds 404 while metrics disabled.
+
+    Attributes:
+        registry (Registry): metrics registry to expose
+        dbs (list): of LMDBer whose map fill is sampled on each scrape
+    """
+
+    def __init__(self, registry=None, dbs=None):
+        """
+        Parameters:
+            registry (Registry | None): metrics registry. None means metering.registry
+            dbs (Iterable[LMDBer] | None): databases whose map fill is sampled
+        """
+        self.registry = registry if registry is not None else metering.registry
+        self.dbs = list(dbs) if dbs is not None else []
+
+    def on_get(self, req, rep):
+        """ Handles GET requests for metrics
+
+            Parameters:
+                req (Request) Falcon HTTP request
+                rep (Response) Falcon HTTP response
+
+            Response:
+                - 200 OK: metrics in Prometheus text format version 0.0.4
+                - 404 Not Found: metrics are disabled
+        """
+        if not self.registry.enabled:
+            raise falcon.HTTPNotFound(description="metrics disabled, set "
+                                                  f"{metering.KERIMetricsKey} to enable")
+
+        for db in self.dbs:
+            if db.opened:
+                Fills.set(db.filled(), db.name)
+
+        rep.status = falcon.HTTP_200
+        rep.content_type = "text/plain; version=0.0.4; charset=utf-8"
+        rep.data = self.registry.expose().encode("utf-8")
@@ -23,18 +23,22 @@ raw = json.dumps(ked, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 """
 import math
-from collections import namedtuple, deque
+import os
+import time
+from collections import namedtuple, deque, OrderedDict
 from dataclasses import dataclass, asdict, field
 
 import pysodium
 from hio.base import doing
 
-from .. import kering
+from .. import help, kering
 from .. import core
 from ..core import coring
 from ..db import dbing, subing, koming
 from ..help import helping
 
+logger = help.ogler.getLogger()
+
 Algoage = namedtuple("Algoage", 'randy salty group extern')
 Algos = Algoage(randy='randy', salty='salty', group="group", extern="extern")  # randy is rerandomize, salty is use salt
 
@@ -383,6 +387,19 @@ class Creator:
         """
         return []
 
+    def creates(self, sets=(), **kwa):
+        """
+        Returns list of lists of signers one list per key pair set in sets
+
+        Parameters:
+            sets (Iterable): of (codes, ridx, kidx) triples one per key pair
+                set where codes is list of derivation codes one per key pair,
+                ridx is rotation index and kidx is starting key index of set
+            kwa (dict): other parameters of .create shared by all sets
+        """
+        return [self.create(codes=codes, count=0, ridx=ridx, kidx=kidx, **kwa)
+                for codes, ridx, kidx in sets]
+
     @property
     def salt(self):
         """
@@ -503,7 +520,8 @@ class SaltyCreator(Creator):
         return self.salter.tier
 
     def create(self, codes=None, count=1, code=coring.MtrDex.Ed25519_Seed,
-               pidx=0, ridx=0, kidx=0, transferable=True, temp=False, **kwa):
+               pidx=0, ridx=0, kidx=0, transferable=True, temp=False,
+               pool=None, budget=0, **kwa):
         """
         Returns list of signers one per kidx in kidxs
 
@@ -517,12 +535,26 @@ class SaltyCreator(Creator):
             transferable is Boolean, True means use trans deriv code. Otherwise nontrans
             temp is Boolean True means use temp stretch otherwise use time set
                  by tier for streching
+            pool (Executor | None): executor to stretch keys concurrently.
+                None means stretch serially. Signers are identical either way.
+            budget (int): max bytes of memory for concurrent stretches.
+                0 means bounded only by workers of pool.
         """
         signers = []
         if not codes:  # if not codes make list len count of same code
             codes = [code for i in range(count)]
 
         stem = self.stem if self.stem else "{:x}".format(pidx)  # if not stem use pidx
+        if pool is not None and len(codes) > 1:
+            paths = ["{}{:x}{:x}".format(stem, ridx, kidx + i) for i in range(len(codes))]
+            return self.salter.pooledSigners(codes=codes,
+                                             paths=paths,
+                                             transferable=transferable,
+                                             tier=self.tier,
+                                             temp=temp,
+                                             pool=pool,
+                                             budget=budget)
+
         for i, code in enumerate(codes):
             path = "{}{:x}{:x}".format(stem, ridx, kidx + i)
             signers.append(self.salter.signer(path=path,
@@ -532,6 +564,50 @@ class SaltyCreator(Creator):
                                               temp=temp))
         return signers
 
+    def creates(self, sets=(), pidx=0, transferable=True, temp=False,
+                pool=None, budget=0, **kwa):
+        """
+        Returns list of lists of signers one list per key pair set in sets.
+        With pool the key pairs of all sets are stretched as one batch so
+        that small sets such as the current and next keys of an inception
+        are stretched concurrently.
+
+        Parameters:
+            sets (Iterable): of (codes, ridx, kidx) triples one per key pair
+                set where codes is list of derivation codes one per key pair,
+                ridx is rotation index and kidx is starting key index of set
+            pidx is int prefix index for key pair sequence
+            transferable is Boolean, True means use trans deriv code. Otherwise nontrans
+            temp is Boolean True means use temp stretch otherwise use time set
+                 by tier for streching
+            pool (Executor | None): executor to stretch keys concurrently.
+                None means stretch serially. Signers are identical either way.
+            budget (int): max bytes of memory for concurrent stretches.
+                0 means bounded only by workers of pool.
+        """
+        sets = [(list(codes or []), ridx, kidx) for codes, ridx, kidx in sets]
+        if pool is None or sum(len(codes) for codes, _, _ in sets) <= 1:
+            return super(SaltyCreator, self).creates(sets=sets, pidx=pidx,
+                                                     transferable=transferable,
+                                                     temp=temp)
+
+        stem = self.stem if self.stem else "{:x}".format(pidx)  # if not stem use pidx
+        codes = [code for cs, _, _ in sets for code in cs]
+        paths = ["{}{:x}{:x}".format(stem, ridx, kidx + i)
+                 for cs, ridx, kidx in sets for i in range(len(cs))]
+        signers = self.salter.pooledSigners(codes=codes,
+                                            paths=paths,
+                                            transferable=transferable,
+                                            tier=self.tier,
+                                            temp=temp,
+                                            pool=pool,
+                                            budget=budget)
+        batches = []
+        for cs, _, _ in sets:
+            batches.append(signers[:len(cs)])
+            signers = signers[len(cs):]
+        return batches
+
 
 class Creatory:
     """
@@ -591,10 +667,26 @@ class Creatory:
 Initage = namedtuple("Initage", 'aeid pidx salt tier')
 
 
+KERIManagerSignerCacheSizeKey = "KERI_MANAGER_SIGNER_CACHE_SIZE"
+KERIManagerSignerCacheTTLKey = "KERI_MANAGER_SIGNER_CACHE_TTL"
+KERIManagerStretchBudgetKey = "KERI_MANAGER_STRETCH_BUDGET"
+
+
 class Manager:
     """Manages key pairs creation, storage, and signing
     Class for managing key pair creation, storage, retrieval, and message signing.
 
+    Class Attributes:
+        SignerCacheSize (int): max number of decrypted signers held in memory
+            keyed by public key so repeated signing with the same keys does not
+            decrypt the private key from the keeper each time. 0 means disabled.
+            May be overridden by env var KERI_MANAGER_SIGNER_CACHE_SIZE
+        SignerCacheTTL (float): seconds a cached signer may be used after it
+            was decrypted. May be overridden by env var KERI_MANAGER_SIGNER_CACHE_TTL
+        StretchBudget (int): max bytes of memory for salty key stretches run
+            concurrently on .pool. May be overridden by env var
+            KERI_MANAGER_STRETCH_BUDGET
+
     Attributes:
         ks (Keeper): key store LMDB database instance for storing public and private keys
         encrypter (core.Encrypter): instance for encrypting secrets. Public
@@ -603,9 +695,16 @@ class Manager:
             decryption key is derived seed (private signing key seed)
         inited (bool): True means fully initialized wrt database.
                           False means not yet fully initialized
+        pool (Executor | None): executor to stretch salty keys concurrently
+            when creating key sets. None means stretch serially.
 
     Attributes (Hidden):
 
+        _signers (OrderedDict): cached decrypted signers keyed by public key
+            qb64 with values (signer, monotonic time decrypted) in least
+            recently used order.
+            Wiped whenever the aeid changes, keys rotate, or manager closes.
+
         _seed (str): qb64 private-signing key (seed) for the aeid from which
                 the private decryption key is derived. If aeid stored in
                 database is not empty then seed may required to do any key
@@ -641,8 +740,11 @@ class Manager:
     Methods:
 
     """
+    SignerCacheSize = 0  # disabled
+    SignerCacheTTL = 60.0  # seconds
+    StretchBudget = 1073741824  # 1 GiB
 
-    def __init__(self, *, ks=None, seed=None, **kwa):
+    def __init__(self, *, ks=None, seed=None, pool=None, **kwa):
         """
         Setup Manager.
 
@@ -658,6 +760,9 @@ class Manager:
                 and decryption secret for the Manager and must be stored on
                 another device from the device that runs the Manager.
                 Currently only code MtrDex.Ed25519_Seed is supported.
+            pool (Executor | None): concurrent.futures executor to stretch salty
+                keys concurrently. A ProcessPoolExecutor runs argon2id across
+                cores. None means stretch serially.
 
         Parameters: Passthrough to .setup for later initialization
             aeid (str): qb64 of non-transferable identifier prefix for
@@ -677,6 +782,30 @@ class Manager:
         self.decrypter = None
         self._seed = seed if seed is not None else ""
         self.inited = False
+        self.pool = pool
+
+        if (cacheSize := os.getenv(KERIManagerSignerCacheSizeKey)) is not None:
+            try:
+                self.SignerCacheSize = int(cacheSize)
+            except ValueError:
+                logger.error("KERI_MANAGER_SIGNER_CACHE_SIZE must be an integer value >=0!")
+                raise
+
+        if (cacheTTL := os.getenv(KERIManagerSignerCacheTTLKey)) is not None:
+            try:
+                self.SignerCacheTTL = float(cacheTTL)
+            except ValueError:
+                logger.error("KERI_MANAGER_SIGNER_CACHE_TTL must be a number >=0!")
+                raise
+
+        if (budget := os.getenv(KERIManagerStretchBudgetKey)) is not None:
+            try:
+                self.StretchBudget = int(budget)
+            except ValueError:
+                logger.error("KERI_MANAGER_STRETCH_BUDGET must be an integer value >=0!")
+                raise
+
+        self._signers = OrderedDict()
 
         # save keyword arg parameters to init later if db not opened yet
         self._inits = kwa
@@ -816,6 +945,7 @@ class Manager:
 
         self.ks.gbls.pin("aeid", aeid)  # set aeid in db
         self._seed = seed  # set .seed in memory
+        self.wipe()  # cached signers were decrypted under prior aeid
 
         # update .decrypter
         self.decrypter = core.Decrypter(seed=seed) if seed else None
@@ -996,20 +1126,18 @@ class Manager:
                 raise ValueError("Invalid icount={} must be > 0.".format(icount))
             icodes = [icode for i in range(icount)]
 
-        isigners = creator.create(codes=icodes,
-                                  pidx=pidx, ridx=ridx, kidx=kidx,
-                                  transferable=transferable, temp=temp)
-        verfers = [signer.verfer for signer in isigners]
-
         if not ncodes:  # all same code, make list of len ncount of same code
             if ncount < 0:  # next may be zero if non-trans
                 raise ValueError("Invalid ncount={} must be >= 0.".format(ncount))
             ncodes = [ncode for i in range(ncount)]
 
-        # count set to 0 to ensure does not create signers if ncodes is empty
-        nsigners = creator.create(codes=ncodes, count=0,
-                                  pidx=pidx, ridx=ridx+1, kidx=kidx+len(icodes),
-                                  transferable=transferable, temp=temp)
+        # current and next stretched as one batch, empty ncodes creates no signers
+        isigners, nsigners = creator.creates(sets=[(icodes, ridx, kidx),
+                                                   (ncodes, ridx+1, kidx+len(icodes))],
+                                             pidx=pidx,
+                                             transferable=transferable, temp=temp,
+                                             pool=self.pool, budget=self.StretchBudget)
+        verfers = [signer.verfer for signer in isigners]
         digers = [coring.Diger(ser=signer.verfer.qb64b, code=dcode) for signer in nsigners]
 
         # Secret to encrypt here
@@ -1170,6 +1298,7 @@ class Manager:
         ps.new = ps.nxt  # move prior nxt to new which new is now current signer
 
         verfers = []  # assign verfers from current new was prior nxt
+        self.wipe()  # rotation makes cached signers stale
         for pub in ps.new.pubs:
             if self.aeid and not self.decrypter:  # maybe should rethink this
                 raise kering.DecryptError("Unauthorized decryption attempt. "
@@ -1200,10 +1329,10 @@ class Manager:
         ridx = ps.new.ridx + 1
         kidx = ps.nxt.kidx + len(ps.new.pubs)
 
-        # count set to 0 to ensure does not create signers if codes is empty
-        signers = creator.create(codes=ncodes, count=0,
-                                 pidx=pidx, ridx=ridx, kidx=kidx,
-                                 transferable=transferable, temp=temp)
+        # current signers are stored so only next is stretched, empty ncodes creates none
+        signers, = creator.creates(sets=[(ncodes, ridx, kidx)], pidx=pidx,
+                                   transferable=transferable, temp=temp,
+                                   pool=self.pool, budget=self.StretchBudget)
         digers = [coring.Diger(ser=signer.verfer.qb64b, code=dcode) for signer in signers]
 
         dt = helping.nowIso8601()
@@ -1335,24 +1464,11 @@ class Manager:
 
         if pubs:
             for pub in pubs:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(pub))
-                signers.append(signer)
+                signers.append(self._fetchSigner(pub))
 
         else:
             for verfer in verfers:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(verfer.qb64,
-                                                decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(verfer.qb64))
-                signers.append(signer)
+                signers.append(self._fetchSigner(verfer.qb64))
 
         if indices and len(indices) != len(signers):
             raise ValueError(f"Mismatch indices length={len(indices)} and resultant"
@@ -1396,6 +1512,51 @@ class Manager:
             return cigars
 
 
+    def _fetchSigner(self, pub):
+        """
+        Returns signer for public key pub from signer cache when cached and not
+        expired otherwise from keeper decrypted and then cached.
+
+        Parameters:
+            pub (str): qb64 public key to lookup private key
+
+        Raises:
+            DecryptError: when aeid but no decrypter
+            ValueError: when private key missing from keeper
+        """
+        if self.aeid and not self.decrypter:
+            raise kering.DecryptError("Unauthorized decryption attempt. "
+                                      "Aeid but no decrypter.")
+
+        if self.SignerCacheSize <= 0:  # cache disabled
+            if (signer := self.ks.pris.get(pub, decrypter=self.decrypter)) is None:
+                raise ValueError("Missing prikey in db for pubkey={}".format(pub))
+            return signer
+
+        now = time.monotonic()
+        if (entry := self._signers.get(pub)) is not None:
+            signer, mark = entry
+            if now - mark < self.SignerCacheTTL:
+                self._signers.move_to_end(pub)
+                return signer
+            del self._signers[pub]
+
+        if (signer := self.ks.pris.get(pub, decrypter=self.decrypter)) is None:
+            raise ValueError("Missing prikey in db for pubkey={}".format(pub))
+
+        self._signers[pub] = (signer, now)
+        while len(self._signers) > self.SignerCacheSize:
+            self._signers.popitem(last=False)  # evict least recently used
+        return signer
+
+
+    def wipe(self):
+        """
+        Wipes all cached decrypted signers from memory
+        """
+        self._signers.clear()
+
+
     def decrypt(self, qb64, pubs=None, verfers=None):
         """
         Returns decrypted plaintext of encrypted qb64 ciphertext serialization.
@@ -1417,24 +1578,11 @@ class Manager:
         signers = []
         if pubs:
             for pub in pubs:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(pub))
-                signers.append(signer)
+                signers.append(self._fetchSigner(pub))
 
         else:
             for verfer in verfers:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(verfer.qb64,
-                                                decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(verfer.qb64))
-                signers.append(signer)
+                signers.append(self._fetchSigner(verfer.qb64))
 
         if hasattr(qb64, "encode"):
             qb64 = qb64.encode()  # convert str to bytes
@@ -1607,7 +1755,8 @@ class Manager:
         # create nxt signers after ingested signers
         nsigners = creator.create(count=ncount, code=ncode,
                                   pidx=pidx, ridx=ridx, kidx=kidx,
-                                  transferable=transferable, temp=temp)
+                                  transferable=transferable, temp=temp,
+                                  pool=self.pool, budget=self.StretchBudget)
 
 
         for signer in nsigners:  # store secrets (private key val keyed by public key)
@@ -1684,6 +1833,7 @@ class Manager:
 
 
         verfers = []  # assign verfers from current new was prior nxt
+        self.wipe()  # rotation makes cached signers stale
         for pub in ps.new.pubs:
             if self.aeid and not self.decrypter:  # maybe should rethink this
                 raise kering.DecryptError("Unauthorized decryption attempt. "
@@ -1764,4 +1914,4 @@ class ManagerDoer(doing.Doer):
 
     def exit(self):
         """"""
-        pass
+        self.manager.wipe()
@@ -3,6 +3,11 @@
 keri.app.storing module
 
 """
+import itertools
+import os
+import time
+import weakref
+from collections import deque
 
 from hio.base import doing
 from hio.help import decking
@@ -13,6 +18,7 @@ from .. import help
 from ..core import coring, serdering
 from ..core.coring import MtrDex
 from ..db import dbing, subing
+from ..kering import MaxON
 
 logger = help.ogler.getLogger()
 
@@ -21,10 +27,37 @@ class Mailboxer(dbing.LMDBer):
     """
     Mailboxer stores exn messages in order and provider iterator access at an index.
 
+    Class Attributes:
+        Batch (int): default max number of messages per batched topic read
+        Budget (int): default max bytes of messages per batched topic read
+
+    Attributes:
+        tpcs (subing.OnSuber): topic index of message digests by topic.on
+        msgs (subing.Suber): messages by digest
+        stms (subing.OnSuber): store time of each topic index entry by topic.on
+            as hex microseconds since epoch
+        rcts (subing.Suber): reference count of each message by digest as hex
+            count of topic index entries referencing it
+        nxts (subing.Suber): next ordinal number of each topic by topic as hex.
+            Kept when retention empties a topic so ordinals are never reused
+            and readers positioned at the old high-water mark see new messages
+
+    Hidden:
+        _marks (dict): high-water mark of each topic keyed by topic key bytes.
+            Mark is the ordinal number after the last message ever appended to
+            the topic. Loaded on first lookup and advanced by .storeMsg so that polling a
+            topic with nothing new is a dict lookup. Appends made by another
+            process sharing the database are not seen until reopen.
+        _subs (dict): weakref.WeakSet of Subscriptions keyed by topic key bytes
+            notified by .storeMsg. Appends made by another process are not
+            notified.
+
     """
     TailDirPath = "keri/mbx"
     AltTailDirPath = ".keri/mbx"
     TempPrefix = "keri_mbx_"
+    Batch = 256
+    Budget = 1048576  # 1 MiB
 
     def __init__(self, name="mbx", headDirPath=None, reopen=True, **kwa):
         """
@@ -48,6 +81,11 @@ class Mailboxer(dbing.LMDBer):
         """
         self.tpcs = None
         self.msgs = None
+        self.stms = None
+        self.rcts = None
+        self.nxts = None
+        self._marks = {}
+        self._subs = {}
 
         super(Mailboxer, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -60,18 +98,45 @@ class Mailboxer(dbing.LMDBer):
         super(Mailboxer, self).reopen(**kwa)
         self.tpcs = subing.OnSuber(db=self, subkey='tpcs.')
         self.msgs = subing.Suber(db=self, subkey='msgs.')  # key states
+        self.stms = subing.OnSuber(db=self, subkey='stms.')  # store times
+        self.rcts = subing.Suber(db=self, subkey='rcts.')  # reference counts
+        self.nxts = subing.Suber(db=self, subkey='nxts.')  # next topic ordinals
+        self._marks = {}
+
+        if (not self.readonly and next(self.rcts.getItemIter(), None) is None
+                and next(self.tpcs.getItemIter(), None) is not None):
+            self.recount()  # topic index predates reference counts
 
         return self.env
 
+    def recount(self):
+        """
+        Rebuilds reference count in .rcts of each message from the topic index
+        entries in .tpcs that reference it. Run on open of a mailbox whose
+        messages were stored before reference counting.
+
+        Returns:
+            count (int): number of referenced messages
+        """
+        counts = {}
+        for keys, on, dig in self.tpcs.getOnItemIter(keys=b''):
+            counts[dig] = counts.get(dig, 0) + 1
+        with self.transact():  # one atomic commit
+            self.rcts.trim()
+            for dig, count in counts.items():
+                self.rcts.pin(keys=dig, val=f"{count:x}")
+        return len(counts)
+
     def delTopic(self, key, on=0):
-        """Removes topic index from .tpcs without deleting message from .msgs
+        """Removes topic index from .tpcs and dereferences its message in .msgs
+        which is removed once no topic references it
 
         Returns:
             result (boo): True if full key consisting of key and serialized on
                              exists in database so removed
                           False otherwise (not removed)
         """
-        return self.tpcs.remOn(keys=key, on=on)
+        return self.remTopicMsg(key, on) is not None
 
     def appendToTopic(self, topic, val):
         """Appends val to end of db entries with same topic but with on
@@ -85,7 +150,29 @@ class Mailboxer(dbing.LMDBer):
             topic (bytes):  topic identifier for message
             val (bytes): msg digest
         """
-        return self.tpcs.appendOn(key=topic, val=val)
+        with self.transact():  # one atomic commit
+            on = self._appendRef(topic, val)
+        self._marks[self.tpcs._tokey(topic)] = on + 1
+        return on
+
+    def _appendRef(self, topic, dig):
+        """
+        Appends dig to topic at the next ordinal number of topic in .nxts with
+        its store time and counts the reference to its message. Returns
+        ordinal number of appended entry. Must be called inside .transact and
+        caller advances ._marks once committed.
+
+        Parameters:
+            topic (str | bytes): topic key prefix of message index
+            dig (bytes): msg digest
+        """
+        on = self.mark(topic)  # never reuses ordinals of removed entries
+        self.tpcs.pinOn(keys=topic, on=on, val=dig)
+        self.nxts.pin(keys=topic, val=f"{on + 1:x}")
+        self.stms.pinOn(keys=topic, on=on, val=f"{int(time.time() * 1e6):x}")
+        count = self.rcts.get(keys=dig)
+        self.rcts.pin(keys=dig, val=f"{int(count, 16) + 1 if count else 1:x}")
+        return on
 
 
     def getTopicMsgs(self, topic, fn=0):
@@ -101,11 +188,212 @@ class Mailboxer(dbing.LMDBer):
              fn (int): starting index ordinal number used with onKey(pre,on)
                     to form key at at which to initiate retrieval
         """
+        if not topic:  # whole database
+            return [msg.encode() for keys, on, dig in self.tpcs.getOnItemIter(keys=topic, on=fn)
+                    if (msg := self.msgs.get(keys=dig))]
+        msgs, _ = self.readTopic(topic, fn=fn, limit=0, budget=0)
+        return [msg for on, msg in msgs]
+
+
+    def mark(self, topic):
+        """
+        Returns:
+            mark (int): high-water mark of topic, the ordinal number after the
+                last message ever appended to topic or 0 when none. Topics
+                appended before .nxts existed are loaded from their last entry
+
+        Parameters:
+            topic (str | bytes): topic key prefix of message index
+        """
+        key = self.tpcs._tokey(topic)
+        if (mark := self._marks.get(key)) is not None:
+            return mark
+
+        if (nxt := self.nxts.get(keys=key)) is not None:
+            self._marks[key] = int(nxt, 16)
+            return self._marks[key]
+
+        sep = self.tpcs.sep.encode()
+        mark = 0
+        with self._begin(db=self.tpcs.sdb) as txn:
+            cursor = txn.cursor()
+            # position after last entry at topic then step back to it
+            if cursor.set_range(dbing.onKey(key, MaxON, sep=sep)):
+                located = cursor.key() == dbing.onKey(key, MaxON, sep=sep) or cursor.prev()
+            else:
+                located = cursor.last()
+            if located:
+                ckey, on = dbing.splitOnKey(bytes(cursor.key()), sep=sep)
+                if ckey == key:
+                    mark = on + 1
+
+        self._marks[key] = mark
+        return mark
+
+
+    def readTopic(self, topic, fn=0, limit=None, budget=None):
+        """
+        Reads batch of messages at topic beginning with ordinal fn in one read
+        transaction. Reads at most limit messages and stops before the batch
+        exceeds budget bytes but always includes at least one message when any.
+        Returns without reading when fn is at or past the high-water mark of
+        topic.
+
+        Returns:
+            result (tuple): (msgs, fn) where msgs is list of (on, msg) pairs
+                with on int ordinal and msg bytes and fn is ordinal at which
+                to resume reading
+
+        Parameters:
+            topic (str | bytes): topic key prefix of message index
+            fn (int): ordinal number at which to begin reading
+            limit (int | None): max number of messages. None means .Batch.
+                0 means unlimited
+            budget (int | None): max bytes of messages. None means .Budget.
+                0 means unlimited
+        """
+        limit = self.Batch if limit is None else limit
+        budget = self.Budget if budget is None else budget
         msgs = []
-        for keys, on, dig in self.tpcs.getOnItemIter(keys=topic, on=fn):
-            if msg := self.msgs.get(keys=dig):
-                msgs.append(msg.encode())  # want bytes not str
-        return msgs
+        if fn >= self.mark(topic):
+            return (msgs, fn)
+
+        key = self.tpcs._tokey(topic)
+        sep = self.tpcs.sep.encode()
+        size = 0
+        with self._begin(db=self.tpcs.sdb) as txn:
+            cursor = txn.cursor()
+            if not cursor.set_range(dbing.onKey(key, fn, sep=sep)):
+                return (msgs, fn)
+            for ckey, dig in cursor.iternext():
+                ckey, on = dbing.splitOnKey(bytes(ckey), sep=sep)
+                if ckey != key:
+                    break
+                if (msg := txn.get(bytes(dig), db=self.msgs.sdb)) is not None:
+                    msg = bytes(msg)
+                    if msgs and budget and size + len(msg) > budget:
+                        break
+                    size += len(msg)
+                    msgs.append((on, msg))
+                fn = on + 1
+                if limit and len(msgs) >= limit:
+                    break
+
+        return (msgs, fn)
+
+
+    def remTopicMsg(self, topic, on):
+        """
+        Removes index entry at topic.on and its store time and dereferences
+        its message which is removed from .msgs once no topic references it.
+        Counts of messages stored before reference counting are rebuilt by
+        .recount on open.
+
+        Returns:
+            reclaimed (int | None): bytes of message removed, 0 when message
+                still referenced, None when no entry at topic.on
+
+        Parameters:
+            topic (str | bytes): topic key prefix of message index
+            on (int): ordinal number of entry
+        """
+        with self.transact():  # one atomic commit
+            if (dig := self.tpcs.getOn(keys=topic, on=on)) is None:
+                return None
+            self.tpcs.remOn(keys=topic, on=on)
+            self.stms.remOn(keys=topic, on=on)
+            count = self.rcts.get(keys=dig)
+            if count and (count := int(count, 16) - 1) > 0:
+                self.rcts.pin(keys=dig, val=f"{count:x}")
+                return 0
+            self.rcts.rem(keys=dig)
+            msg = self.msgs.get(keys=dig)
+            self.msgs.rem(keys=dig)
+            return len(msg.encode("utf-8")) if msg is not None else 0
+
+
+    def getTopicHeadIter(self, topic=b""):
+        """
+        Returns:
+            heads (Iterator[(key, on)]): first entry of each topic in index
+                order beginning with topic, where key is topic key bytes and on
+                is ordinal number of its oldest entry. Skips from each topic to
+                the next so cost is per topic not per entry.
+
+        Parameters:
+            topic (str | bytes): topic key at which to begin. Empty means first
+        """
+        key = self.tpcs._tokey(topic)
+        sep = self.tpcs.sep.encode()
+        with self._read(db=self.tpcs.sdb) as txn:
+            cursor = txn.cursor()
+            located = cursor.set_range(dbing.onKey(key, 0, sep=sep) if key else b"")
+            while located:
+                ckey, on = dbing.splitOnKey(bytes(cursor.key()), sep=sep)
+                yield (ckey, on)
+                last = dbing.onKey(ckey, MaxON, sep=sep)
+                located = cursor.set_range(last)  # next topic
+                if located and cursor.key() == last:
+                    located = cursor.next()
+
+
+    def size(self):
+        """
+        Returns:
+            size (int): bytes in LMDB pages of mailbox sub dbs
+        """
+        size = 0
+        psize = self.env.stat()["psize"]
+        with self.env.begin() as txn:
+            for sub in (self.tpcs, self.msgs, self.stms, self.rcts):
+                stat = txn.stat(sub.sdb)
+                size += (stat["branch_pages"] + stat["leaf_pages"] +
+                         stat["overflow_pages"]) * psize
+        return size
+
+
+    def subscribe(self, topics, size=None):
+        """
+        Returns:
+            sub (Subscription): subscription notified when messages are stored
+                at any of topics. Held weakly so dropped when no longer used.
+
+        Parameters:
+            topics (Iterable[str | bytes]): topic key prefixes of message index
+            size (int | None): max pending notifications. None means
+                Subscription.Size
+        """
+        sub = Subscription(keys=[self.tpcs._tokey(topic) for topic in topics],
+                           size=size)
+        for key in sub.keys:
+            self._subs.setdefault(key, weakref.WeakSet()).add(sub)
+        return sub
+
+
+    def unsubscribe(self, sub):
+        """
+        Removes subscription sub so it is no longer notified
+
+        Parameters:
+            sub (Subscription): from .subscribe
+        """
+        for key in sub.keys:
+            if (subs := self._subs.get(key)) is not None:
+                subs.discard(sub)
+                if not subs:
+                    del self._subs[key]
+
+
+    def cursor(self, topic, fn=0):
+        """
+        Returns:
+            cursor (TopicCursor): cursor of messages at topic from ordinal fn
+
+        Parameters:
+            topic (str | bytes): topic key prefix of message index
+            fn (int): ordinal number at which to begin reading
+        """
+        return TopicCursor(mbx=self, topic=topic, fn=fn)
 
 
     def storeMsg(self, topic, msg):
@@ -127,8 +415,14 @@ class Mailboxer(dbing.LMDBer):
             msg = msg.encode("utf-8")
 
         digb = coring.Diger(ser=msg, code=MtrDex.Blake3_256).qb64b
-        on = self.tpcs.appendOn(keys=topic, val=digb)
-        return self.msgs.pin(keys=digb, val=msg)
+        with self.transact():  # one atomic commit
+            result = self.msgs.pin(keys=digb, val=msg)
+            on = self._appendRef(topic, digb)
+        key = self.tpcs._tokey(topic)
+        self._marks[key] = on + 1
+        for sub in list(self._subs.get(key, ())):  # wake waiters on topic
+            sub.notify(key, on)
+        return result
 
 
     def cloneTopicIter(self, topic, fn=0):
@@ -150,11 +444,299 @@ class Mailboxer(dbing.LMDBer):
         hidden.
 
         """
-        for keys, on, dig in self.tpcs.getOnItemIter(keys=topic, on=fn):
-            if msg := self.msgs.get(keys=dig):
-                yield (on, topic, msg.encode("utf-8"))
+        if not topic:  # whole database
+            for keys, on, dig in self.tpcs.getOnItemIter(keys=topic, on=fn):
+                if msg := self.msgs.get(keys=dig):
+                    yield (on, topic, msg.encode("utf-8"))
+            return
+
+        while True:  # batched reads so one transaction per batch not per msg
+            msgs, fn = self.readTopic(topic, fn=fn)
+            if not msgs:
+                return
+            for on, msg in msgs:
+                yield (on, topic, msg)
+
+
+class Subscription:
+    """
+    Subscription is a bounded queue of notifications of messages stored at a
+    set of mailbox topics so that a reader wakes only when there is something
+    new to read. Notifications carry only (key, on) since messages are read
+    from the mailbox. When the queue is full further notifications set
+    .overflowed instead of growing the queue so a slow reader costs bounded
+    memory and then rereads all its topics.
+
+    Class Attributes:
+        Size (int): default max number of pending notifications
+
+    Attributes:
+        keys (tuple): topic key bytes subscribed to
+        size (int): max number of pending notifications
+        queue (deque): pending (key, on) notifications
+        overflowed (bool): True means notifications were dropped since last drain
+    """
+    Size = 1024
+
+    def __init__(self, keys, size=None):
+        """
+        Parameters:
+            keys (Iterable[bytes]): topic key bytes subscribed to
+            size (int | None): max pending notifications. None means .Size
+        """
+        self.keys = tuple(keys)
+        self.size = size if size is not None else self.Size
+        self.queue = deque()
+        self.overflowed = False
+
+    @property
+    def ready(self):
+        """
+        Returns True if notified since last drain, False otherwise
+        """
+        return bool(self.queue) or self.overflowed
+
+    def notify(self, key, on):
+        """
+        Queues notification of message at ordinal on of topic key
+
+        Parameters:
+            key (bytes): topic key
+            on (int): ordinal number of stored message
+        """
+        if len(self.queue) >= self.size:
+            self.overflowed = True  # backpressure drop, reader rereads all keys
+            return
+        self.queue.append((key, on))
+
+    def drain(self):
+        """
+        Returns set of topic keys notified since last drain, all .keys when
+        overflowed, and empties queue.
+        """
+        keys = set(self.keys) if self.overflowed else set(key for key, _ in self.queue)
+        self.queue.clear()
+        self.overflowed = False
+        return keys
+
+
+class TopicCursor:
+    """
+    TopicCursor reads the messages of one mailbox topic in batches, resuming
+    after the last message read. Checking for new messages compares .fn to the
+    high-water mark of the topic without a database read.
+
+    Attributes:
+        mbx (Mailboxer): mailbox database
+        topic (str | bytes): topic key prefix of message index
+        fn (int): ordinal number at which next read begins
+    """
+
+    def __init__(self, mbx, topic, fn=0):
+        """
+        Parameters:
+            mbx (Mailboxer): mailbox database
+            topic (str | bytes): topic key prefix of message index
+            fn (int): ordinal number at which to begin reading
+        """
+        self.mbx = mbx
+        self.topic = topic
+        self.fn = fn
+
+    @property
+    def pending(self):
+        """
+        Returns True if messages may be at or after .fn, False otherwise
+        """
+        return self.mbx.mark(self.topic) > self.fn
+
+    def read(self, limit=None, budget=None):
+        """
+        Returns list of (on, msg) pairs of next batch of messages and advances
+        .fn past them. See Mailboxer.readTopic for limit and budget.
+        """
+        msgs, self.fn = self.mbx.readTopic(self.topic, fn=self.fn,
+                                           limit=limit, budget=budget)
+        return msgs
+
+
+
+KERIMailboxTTLKey = "KERI_MAILBOX_TTL"
+KERIMailboxCapKey = "KERI_MAILBOX_CAP"
+KERIMailboxQuotaKey = "KERI_MAILBOX_QUOTA"
 
 
+class Retainer(doing.Doer):
+    """
+    Retainer incrementally garbage collects a Mailboxer under a retention
+    policy of message TTL, max messages per topic, and byte quota.
+
+    Each recur examines at most .work index entries. Topics are visited in
+    rotation from where the last recur stopped. Within each topic entries are
+    removed oldest first while expired by TTL, or while the topic exceeds .cap,
+    or while the mailbox exceeds .quota, in which case one entry per topic is
+    evicted per visit. Entries appended in order so the first retained
+    entry ends the visit. Messages are removed once no topic references them.
+
+    Class Attributes:
+        TTL (float | None): seconds messages are retained. None means forever.
+            May be overridden by env var KERI_MAILBOX_TTL
+        Cap (int): max messages retained per topic. 0 means unlimited.
+            May be overridden by env var KERI_MAILBOX_CAP
+        Quota (int): max bytes of mailbox sub dbs. 0 means unlimited.
+            May be overridden by env var KERI_MAILBOX_QUOTA
+        Work (int): max index entries examined per recur
+
+    Attributes:
+        mbx (Mailboxer): mailbox to garbage collect
+        ttl (float | None): seconds messages are retained. None means forever
+        ttls (dict): seconds messages are retained keyed by topic suffix such
+            as "/receipt" overriding .ttl. None value means forever
+        cap (int): max messages retained per topic. 0 means unlimited
+        quota (int): max bytes of mailbox sub dbs. 0 means unlimited
+        work (int): max index entries examined per recur
+        stats (dict): cumulative counts of index entries, msgs and message
+            bytes reclaimed, and passes over all topics
+
+    Hidden:
+        _resume (bytes): topic key at which next recur resumes
+    """
+    TTL = None
+    Cap = 0
+    Quota = 0
+    Work = 256
+
+    def __init__(self, mbx, ttl=None, ttls=None, cap=None, quota=None, work=None, **kwa):
+        """
+        Parameters:
+            mbx (Mailboxer): mailbox to garbage collect
+            ttl (float | None): seconds messages are retained. None means .TTL
+            ttls (dict | None): seconds messages are retained by topic suffix
+            cap (int | None): max messages per topic. None means .Cap
+            quota (int | None): max bytes of mailbox. None means .Quota
+            work (int | None): max index entries examined per recur.
+                None means .Work
+        """
+        super(Retainer, self).__init__(**kwa)
+        if (envTTL := os.getenv(KERIMailboxTTLKey)) is not None:
+            try:
+                self.TTL = float(envTTL)
+            except ValueError:
+                logger.error("KERI_MAILBOX_TTL must be a number of seconds >=0!")
+                raise
+
+        if (envCap := os.getenv(KERIMailboxCapKey)) is not None:
+            try:
+                self.Cap = int(envCap)
+            except ValueError:
+                logger.error("KERI_MAILBOX_CAP must be an integer value >=0!")
+                raise
+
+        if (envQuota := os.getenv(KERIMailboxQuotaKey)) is not None:
+            try:
+                self.Quota = int(envQuota)
+            except ValueError:
+                logger.error("KERI_MAILBOX_QUOTA must be an integer value >=0!")
+                raise
+
+        self.mbx = mbx
+        self.ttl = ttl if ttl is not None else self.TTL
+        self.ttls = ttls if ttls is not None else {}
+        self.cap = cap if cap is not None else self.Cap
+        self.quota = quota if quota is not None else self.Quota
+        self.work = work if work is not None else self.Work
+        self.stats = dict(entries=0, msgs=0, bytes=0, passes=0)
+        self._resume = b""
+
+    def recur(self, tyme):
+        """
+        Garbage collects one bounded increment of mailbox each run
+        """
+        self.prune()
+        return False
+
+    def ttlOf(self, key):
+        """
+        Returns:
+            ttl (float | None): seconds messages at topic key are retained
+
+        Parameters:
+            key (bytes): topic key
+        """
+        for suffix, ttl in self.ttls.items():
+            if key.endswith(suffix.encode("utf-8")):
+                return ttl
+        return self.ttl
+
+    def prune(self, now=None):
+        """
+        Garbage collects one increment of at most .work index entries.
+
+        Returns:
+            reclaimed (dict): counts of index entries, msgs and message bytes
+                reclaimed by this increment
+
+        Parameters:
+            now (float | None): time in seconds since epoch. None means now
+        """
+        reclaimed = dict(entries=0, msgs=0, bytes=0)
+        if not (self.ttl is not None or any(ttl is not None for ttl in self.ttls.values())
+                or self.cap or self.quota):
+            return reclaimed  # retain everything
+
+        now = int((now if now is not None else time.time()) * 1e6)
+        over = bool(self.quota) and self.mbx.size() > self.quota
+        budget = self.work
+        heads = list(itertools.islice(self.mbx.getTopicHeadIter(self._resume),
+                                      max(1, self.work)))
+        if not heads:  # empty mailbox
+            self._resume = b""
+            return reclaimed
+
+        for key, on in heads:
+            if budget <= 0:
+                self._resume = key
+                break
+            ttl = self.ttlOf(key)
+            count = self.mbx.mark(key) - on  # upper bound since gaps at head only
+            evict = over  # one eviction per topic when over quota
+            for _, on, _ in itertools.islice(self.mbx.tpcs.getOnItemIter(keys=key, on=on),
+                                             budget):
+                budget -= 1
+                if (stamp := self.mbx.stms.getOn(keys=key, on=on)) is None:
+                    # stored before retention so stamp on first visit
+                    self.mbx.stms.pinOn(keys=key, on=on, val=f"{now:x}")
+                    stamp = f"{now:x}"
+                expired = ttl is not None and now - int(stamp, 16) > ttl * 1e6
+                if not (expired or evict or (self.cap and count > self.cap)):
+                    break  # remaining entries are younger
+                if (freed := self.mbx.remTopicMsg(key, on)) is not None:
+                    reclaimed["entries"] += 1
+                    if freed:
+                        reclaimed["msgs"] += 1
+                        reclaimed["bytes"] += freed
+                count -= 1
+                evict = False
+                if budget <= 0:
+                    break
+        else:  # visited all heads so resume after last topic or wrap around
+            last = heads[-1][0]
+            following = [key for key, _ in itertools.islice(self.mbx.getTopicHeadIter(last), 2)
+                         if key != last]
+            if following:
+                self._resume = following[0]
+            else:
+                self._resume = b""
+                self.stats["passes"] += 1
+
+        for name, value in reclaimed.items():
+            self.stats[name] += value
+        if reclaimed["entries"]:
+            logger.info("Retainer reclaimed %s entries, %s msgs of %s bytes "
+                        "from mailbox %s", reclaimed["entries"], reclaimed["msgs"],
+                        reclaimed["bytes"], self.mbx.name)
+        return reclaimed
+
 
 class Respondant(doing.DoDoer):
     """
@@ -0,0 +1,224 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.core.bulking module
+
+bulk ingest of large CESR streams such as KEL backups or clone replays
+"""
+
+import logging
+import time
+
+from . import eventing, parsing
+from .coring import Ilks, Verfer
+from .. import help, kering
+
+logger = help.ogler.getLogger()
+
+
+class Deferrer:
+    """
+    Deferrer stands in for a message handler such as Kevery or Revery while a
+    Parser frames a stream. Each handler method call is queued in stream
+    order instead of being processed so that it may be replayed later.
+
+    Attributes:
+        target (Kevery | Revery): handler whose methods are deferred
+        queue (list): shared queue of (target method, args, kwargs) in stream order
+    """
+
+    def __init__(self, target, queue):
+        """
+        Parameters:
+            target (Kevery | Revery): handler whose methods are deferred
+            queue (list): shared queue of deferred calls
+        """
+        self.target = target
+        self.queue = queue
+
+    def __getattr__(self, name):
+        if not name.startswith("process"):
+            raise AttributeError(name)
+        method = getattr(self.target, name)  # raises AttributeError if missing
+
+        def defer(*pa, **kwa):
+            self.queue.append((method, pa, kwa))
+
+        return defer
+
+
+class Bulker:
+    """
+    Bulker is bulk ingest pipeline for large CESR streams of many KELs, such as
+    witness backups or the output of Baser.cloneAllPreIter from another node.
+
+    Processes stream in windows of .Window messages. For each window:
+        1. Frames stream with a Parser whose handlers are Deferrers so that
+           messages are queued in stream order. Event SAIDs are verified as
+           each event is framed.
+        2. Splits events by AID prefix and tracks the current signing keys and
+           witnesses of each KEL from its establishment events in the stream.
+           Verifies the controller and witness signatures of all events in the
+           window together as one batch across .pool.
+        3. Commits queued messages in stream order through .kvy and .rvy with
+           the batch results provided to .kvy as Verdicts so signatures are not
+           verified twice. Thus within each KEL events are first seen in stream
+           order and there is only one LMDB writer.
+
+    Signatures whose keys can not be determined from the stream, such as those
+    of recovery rotations or of KELs that start mid stream without prior
+    key state, are verified at commit as usual.
+
+    Class Attributes:
+        Window (int): max number of messages per framed and verified window
+
+    Attributes:
+        kvy (Kevery): key event message handler to commit to
+        rvy (Revery | None): reply message handler to commit to
+        pool (Executor | None): executor for parallel signature verification.
+            None means verify in calling thread
+        chunk (int): number of verifications per dispatched pool task
+        local (bool): True means event source is local (protected)
+        keys (dict): current (verfers, wits) of each KEL keyed by prefix qb64
+        stats (dict): throughput stats of last ingest
+    """
+    Window = 10000
+
+    def __init__(self, kvy, rvy=None, pool=None, chunk=64, local=False):
+        """
+        Parameters:
+            kvy (Kevery): key event message handler to commit to
+            rvy (Revery | None): reply message handler to commit to
+            pool (Executor | None): executor for parallel signature verification
+            chunk (int): number of verifications per dispatched pool task
+            local (bool): True means event source is local (protected)
+        """
+        self.kvy = kvy
+        self.rvy = rvy
+        self.pool = pool
+        self.chunk = chunk
+        self.local = True if local else False
+        self.keys = {}
+        self.stats = {}
+
+    def ingest(self, ims):
+        """
+        Returns dict of throughput stats after framing, verifying, and
+        committing all messages in fixed stream ims. Stats are counts of msgs,
+        events, sigs verified in batch, cached verdicts used at commit, and
+        bytes, plus seconds spent to frame, verify, commit and elapsed, and
+        eps (events/s) and bps (bytes/s).
+
+        Parameters:
+            ims (bytes | bytearray | memoryview | mmap): fixed message stream.
+                Not bytearray is fed through parser in chunks without copy.
+        """
+        stats = dict(msgs=0, events=0, sigs=0, cached=0, bytes=len(ims),
+                     frame=0.0, verify=0.0, commit=0.0)
+        start = time.perf_counter()
+
+        queue = []
+        parser = parsing.Parser(kvy=Deferrer(self.kvy, queue),
+                                rvy=Deferrer(self.rvy, queue) if self.rvy else None,
+                                local=self.local)
+        parsator = parser.allParsator(ims=ims)
+        mark = time.perf_counter()
+        for _ in parsator:
+            if len(queue) >= self.Window:
+                stats["frame"] += time.perf_counter() - mark
+                self._flush(queue, stats)
+                mark = time.perf_counter()
+        stats["frame"] += time.perf_counter() - mark
+        self._flush(queue, stats)
+
+        elapsed = time.perf_counter() - start
+        stats["elapsed"] = elapsed
+        stats["eps"] = stats["events"] / elapsed if elapsed else 0.0
+        stats["bps"] = stats["bytes"] / elapsed if elapsed else 0.0
+        self.stats = stats
+        logger.info("Bulker ingested %s events of %s msgs in %s bytes at %.1f "
+                    "events/s %.1f bytes/s", stats["events"], stats["msgs"],
+                    stats["bytes"], stats["eps"], stats["bps"])
+        return stats
+
+    def _flush(self, queue, stats):
+        """
+        Verifies then commits the window of deferred calls in queue and
+        empties queue.
+
+        Parameters:
+            queue (list): of deferred (method, args, kwargs) in stream order
+            stats (dict): throughput stats to update
+        """
+        mark = time.perf_counter()
+        verdicts = eventing.Verdicts(self._verify(queue, stats))
+        stats["verify"] += time.perf_counter() - mark
+
+        mark = time.perf_counter()
+        pool = self.kvy.pool
+        self.kvy.pool = verdicts
+        try:
+            for method, pa, kwa in queue:
+                try:
+                    method(*pa, **kwa)
+                except (kering.ValidationError, Exception) as ex:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.exception("Bulker msg non-extraction error: %s", ex)
+                    else:
+                        logger.error("Bulker msg non-extraction error: %s", ex)
+        finally:
+            self.kvy.pool = pool
+        stats["commit"] += time.perf_counter() - mark
+        stats["cached"] += verdicts.hits
+        stats["msgs"] += len(queue)
+        queue.clear()
+
+    def _verify(self, queue, stats):
+        """
+        Returns dict of verification results keyed by job tuple for the
+        signatures of the events in queue whose keys are known from the stream.
+
+        Parameters:
+            queue (list): of deferred (method, args, kwargs) in stream order
+            stats (dict): throughput stats to update
+        """
+        jobs = []
+        for method, pa, kwa in queue:
+            if method.__name__ != "processEvent" or (serder := kwa.get("serder")) is None:
+                continue
+            stats["events"] += 1
+            pre = serder.pre
+            if serder.estive:
+                verfers = serder.verfers
+                if serder.ilk in (Ilks.icp, Ilks.dip):
+                    wits = list(serder.backs or [])
+                else:
+                    wits = self.keys[pre][1] if pre in self.keys else None
+                    if wits is not None:
+                        cuts = serder.cuts or []
+                        wits = [w for w in wits if w not in cuts] + list(serder.adds or [])
+                self.keys[pre] = (verfers, wits)
+            elif pre in self.keys:
+                verfers, wits = self.keys[pre]
+            elif pre in self.kvy.kevers:  # prior key state
+                kever = self.kvy.kevers[pre]
+                verfers, wits = kever.verfers, kever.wits
+            else:
+                continue  # unknown keys so verify at commit
+
+            ser = bytes(serder.raw)
+            for siger in kwa.get("sigers") or []:
+                if siger.index < len(verfers):
+                    verfer = verfers[siger.index]
+                    jobs.append((verfer.code, verfer.raw, bytes(siger.raw), ser))
+            for wiger in kwa.get("wigers") or []:
+                if wits is not None and wiger.index < len(wits):
+                    werfer = Verfer(qb64=wits[wiger.index])
+                    jobs.append((werfer.code, werfer.raw, bytes(wiger.raw), ser))
+
+        stats["sigs"] += len(jobs)
+        if self.pool is not None and len(jobs) > 1:
+            results = self.pool.map(eventing._verifyJob, jobs,
+                                    chunksize=max(1, self.chunk))
+        else:
+            results = map(eventing._verifyJob, jobs)
+        return dict(zip(jobs, results))
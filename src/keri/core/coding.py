@@ -0,0 +1,193 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.core.coding module
+
+Provides pluggable codec backends for JSON, CBOR, and MGPK serialization kinds
+
+Codecs are registered by serialization kind in .Codecs. The default JSON codec
+uses the orjson engine when installed and otherwise the stdlib json module.
+Any codec must be byte-identical to the reference stdlib serialization since
+SAIDs and signatures are computed over the serialized bytes.
+"""
+
+import json
+
+import cbor2 as cbor
+import msgpack
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON engine
+    orjson = None
+
+from ..kering import Kinds
+
+
+class Codec:
+    """
+    Codec is base class for a serialization kind backend. Subclasses override
+    .dumps and .loads.
+
+    Class Attributes:
+        Kind (str): value of Kinds serialization kind served by codec
+
+    """
+    Kind = None
+
+    def dumps(self, sad):
+        """
+        Returns:
+            raw (bytes): serialization of sad
+
+        Parameters:
+            sad (dict | list): serializable dict or list
+        """
+        raise NotImplementedError
+
+    def loads(self, raw):
+        """
+        Returns:
+            sad (dict | list): deserialization of raw
+
+        Parameters:
+            raw (bytes | bytearray | memoryview): serialization to deserialize
+        """
+        raise NotImplementedError
+
+
+class JSONCodec(Codec):
+    """
+    JSONCodec is reference compact JSON codec using stdlib json
+    """
+    Kind = Kinds.json
+
+    def dumps(self, sad):
+        return json.dumps(sad, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, raw):
+        return json.loads(bytes(raw).decode("utf-8"))
+
+
+class FastJSONCodec(JSONCodec):
+    """
+    FastJSONCodec is compact JSON codec using the orjson engine with fallback
+    to JSONCodec whenever orjson output could differ from the reference.
+
+    orjson formats floats differently and rejects big ints, non str keys,
+    and non standard literals so these fall back to the stdlib json.
+
+    Class Attributes:
+        Passthrough (int): orjson options so types stdlib json does not
+            serialize raise and fall back instead
+    """
+    Passthrough = (orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+                   if orjson is not None else 0)
+
+    def dumps(self, sad):
+        if not self.floaty(sad):
+            try:
+                return orjson.dumps(sad, option=self.Passthrough)
+            except TypeError:  # orjson.JSONEncodeError is TypeError
+                pass
+        return super().dumps(sad)
+
+    def loads(self, raw):
+        try:
+            return orjson.loads(raw)
+        except ValueError:  # orjson.JSONDecodeError is ValueError
+            return super().loads(raw)
+
+    @staticmethod
+    def floaty(sad):
+        """
+        Returns True if any value nested in sad is float, False otherwise
+
+        Parameters:
+            sad (dict | list): serializable dict or list
+        """
+        stack = [sad]
+        while stack:
+            val = stack.pop()
+            if isinstance(val, str):
+                continue
+            if isinstance(val, dict):
+                stack.extend(val.values())
+            elif isinstance(val, (list, tuple)):
+                stack.extend(val)
+            elif isinstance(val, float):
+                return True
+        return False
+
+
+class CBORCodec(Codec):
+    """
+    CBORCodec is CBOR codec using cbor2
+    """
+    Kind = Kinds.cbor
+
+    def dumps(self, sad):
+        return cbor.dumps(sad)
+
+    def loads(self, raw):
+        return cbor.loads(raw)
+
+
+class MGPKCodec(Codec):
+    """
+    MGPKCodec is MessagePack codec using msgpack
+    """
+    Kind = Kinds.mgpk
+
+    def dumps(self, sad):
+        return msgpack.dumps(sad)
+
+    def loads(self, raw):
+        return msgpack.loads(raw)
+
+
+Codecs = {Kinds.json: FastJSONCodec() if orjson is not None else JSONCodec(),
+          Kinds.cbor: CBORCodec(),
+          Kinds.mgpk: MGPKCodec()}
+
+
+def register(codec):
+    """
+    Registers codec for its serialization kind replacing any prior codec.
+    Returns prior codec or None.
+
+    Parameters:
+        codec (Codec): codec instance with .Kind
+    """
+    prior = Codecs.get(codec.Kind)
+    Codecs[codec.Kind] = codec
+    return prior
+
+
+def dumps(sad, kind=Kinds.json):
+    """
+    Returns:
+        raw (bytes): serialization of sad using codec of kind
+
+    Parameters:
+        sad (dict | list): serializable dict or list
+        kind (str): value of Kinds serialization kind
+
+    Raises:
+        KeyError: when no codec for kind
+    """
+    return Codecs[kind].dumps(sad)
+
+
+def loads(raw, kind=Kinds.json):
+    """
+    Returns:
+        sad (dict | list): deserialization of raw using codec of kind
+
+    Parameters:
+        raw (bytes | bytearray | memoryview): serialization to deserialize
+        kind (str): value of Kinds serialization kind
+
+    Raises:
+        KeyError: when no codec for kind
+    """
+    return Codecs[kind].loads(raw)
@@ -13,8 +13,6 @@ from base64 import urlsafe_b64encode as encodeB64
 from base64 import urlsafe_b64decode as decodeB64
 from fractions import Fraction
 
-import cbor2 as cbor
-import msgpack
 import pysodium
 import blake3
 import hashlib
@@ -47,6 +45,8 @@ from ..help.helping import sceil, nonStringIterable, nonStringSequence
 from ..help.helping import (intToB64, intToB64b, b64ToInt, B64_CHARS,
                             codeB64ToB2, codeB2ToB64, Reb64, nabSextets)
 
+from . import coding
+
 
 
 
@@ -132,18 +132,10 @@ def dumps(ked, kind=Kinds.json):
        ked (Optional(dict, list)): key event dict or message dict to serialize
        kind (str): serialization kind (JSON, MGPK, CBOR)
     """
-    if kind == Kinds.json:
-        raw = json.dumps(ked, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
-
-    elif kind == Kinds.mgpk:
-        raw = msgpack.dumps(ked)
-
-    elif kind == Kinds.cbor:
-        raw = cbor.dumps(ked)
-    else:
+    if kind not in coding.Codecs:
         raise ValueError("Invalid serialization kind = {}".format(kind))
 
-    return raw
+    return coding.dumps(ked, kind=kind)
 
 
 def loads(raw, size=None, kind=Kinds.json):
@@ -159,31 +151,16 @@ def loads(raw, size=None, kind=Kinds.json):
                    then consume all bytes
        kind (str): serialization kind (JSON, MGPK, CBOR)
     """
-    if kind == Kinds.json:
-        try:
-            ked = json.loads(raw[:size].decode("utf-8"))
-        except Exception as ex:
-            raise DeserializeError("Error deserializing JSON: {}"
-                                       "".format(raw[:size].decode("utf-8")))
-
-    elif kind == Kinds.mgpk:
-        try:
-            ked = msgpack.loads(raw[:size])
-        except Exception as ex:
-            raise DeserializeError("Error deserializing MGPK: {}"
-                                       "".format(raw[:size]))
-
-    elif kind == Kinds.cbor:
-        try:
-            ked = cbor.loads(raw[:size])
-        except Exception as ex:
-            raise DeserializeError("Error deserializing CBOR: {}"
-                                       "".format(raw[:size]))
-
-    else:
+    if kind not in coding.Codecs:
         raise DeserializeError("Invalid deserialization kind: {}"
                                    "".format(kind))
 
+    try:
+        ked = coding.loads(raw[:size], kind=kind)
+    except Exception as ex:
+        raise DeserializeError("Error deserializing {}: {}"
+                                   "".format(kind, raw[:size]))
+
     return ked
 
 
@@ -691,7 +668,9 @@ class Matter:
         Codex (MatterCodex):  MtrDex
         Hards (dict): hard sizes keyed by qb64 selector
         Bards (dict): hard size keyed by qb2 selector
+        Ords (dict): hard size keyed by ordinal of qb64b selector byte
         Sizes (dict): sizes tables for codes
+        Bodes (dict): maps bytes of hard code to hard code
         Codes (dict): maps code name to code
         Names (dict): maps code to code name
         Pad (str): B64 pad char for xtra size pre-padded soft values
@@ -727,6 +706,9 @@ class Matter:
         _code (str): value for .code property
         _soft (str): soft value of full code
         _raw (bytes): value for .raw property
+        _qb64b (bytes | None): memoized value for .qb64b property
+        _qb64 (str | None): memoized value for .qb64 property
+        _qb2 (bytes | None): memoized value for .qb2 property
         _rawSize():
         _leadSize():
         _special():
@@ -755,6 +737,10 @@ class Matter:
     # hs. Used for ._bexfil.
     Bards = ({codeB64ToB2(c): hs for c, hs in Hards.items()})
 
+    # Ords table maps ordinal of first code char byte to hard size, hs.
+    # Used for ._exfil to lookup on raw stream bytes without decoding.
+    Ords = ({ord(c): hs for c, hs in Hards.items()})
+
     # Sizes table maps from value of hs chars of code to Sizage namedtuple of
     # (hs, ss, xs, fs, ls) where hs is hard size, ss is soft size,
     # xs is extra size of soft, fs is full size, and ls is lead size of raw.
@@ -852,10 +838,20 @@ class Matter:
         '9AAE': Sizage(hs=4, ss=4, xs=0, fs=None, ls=2),
     }
 
+    # Bodes table maps bytes of hard code to str hard code. Used for ._exfil
+    # to lookup hard code on raw stream bytes without decoding.
+    Bodes = ({hard.encode(): hard for hard in Sizes})
+
     Codes = asdict(MtrDex)  # map code name to code
     Names = {val : key for key, val in Codes.items()} # invert map code to code name
     Pad = '_'  # B64 pad char for special codes with xtra size pre-padded soft values
 
+    # Primitives are immutable once created so their encodings are memoized
+    # lazily on first access or kept from the parsed stream slice
+    _qb64b = None
+    _qb64 = None
+    _qb2 = None
+
 
     def __init__(self, raw=None, code=MtrDex.Ed25519N, soft='', rize=None,
                  qb64b=None, qb64=None, qb2=None, strip=False, **kwa):
@@ -1177,8 +1173,11 @@ class Matter:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Memoized in ._qb64b on first access
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
 
     @property
@@ -1187,8 +1186,11 @@ class Matter:
         Property qb64:
         Returns Fully Qualified Base64 Version
         Assumes self.raw and self.code are correctly populated
+        Memoized in ._qb64 on first access
         """
-        return self.qb64b.decode("utf-8")
+        if self._qb64 is None:
+            self._qb64 = self.qb64b.decode("utf-8")
+        return self._qb64
 
 
     @property
@@ -1196,8 +1198,11 @@ class Matter:
         """
         Property qb2:
         Returns Fully Qualified Binary Version Bytes
+        Memoized in ._qb2 on first access
         """
-        return self._binfil()
+        if self._qb2 is None:
+            self._qb2 = self._binfil()
+        return self._qb2
 
 
     @property
@@ -1360,32 +1365,29 @@ class Matter:
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material.")
 
-        first = qb64b[:1]  # extract first char code selector
-        if isinstance(first, memoryview):
-            first = bytes(first)
-        if hasattr(first, "decode"):
-            first = first.decode()  # converts bytes/bytearray to str
-        if first not in self.Hards:
-            if first[0] == '-':
+        if hasattr(qb64b, "encode"):  # str so convert to bytes
+            qb64b = qb64b.encode()
+
+        # code table lookups on raw bytes so no decode of stream slices
+        first = qb64b[0]  # ordinal of first char code selector
+        if first not in self.Ords:
+            if first == 0x2d:  # '-'
                 raise UnexpectedCountCodeError("Unexpected count code start"
                                                "while extracing Matter.")
-            elif first[0] == '_':
+            elif first == 0x5f:  # '_'
                 raise UnexpectedOpCodeError("Unexpected  op code start"
                                             "while extracing Matter.")
             else:
-                raise UnexpectedCodeError(f"Unsupported code start char={first}.")
+                raise UnexpectedCodeError(f"Unsupported code start char={chr(first)}.")
 
-        hs = self.Hards[first]  # get hard code size
+        hs = self.Ords[first]  # get hard code size
         if len(qb64b) < hs:  # need more bytes
             raise ShortageError(f"Need {hs - len(qb64b)} more characters.")
 
-        hard = qb64b[:hs]  # extract hard code
-        if isinstance(hard, memoryview):
-            hard = bytes(hard)
-        if hasattr(hard, "decode"):
-            hard = hard.decode()  # converts bytes/bytearray to str
-        if hard not in self.Sizes:
-            raise UnexpectedCodeError(f"Unsupported code ={hard}.")
+        hard = bytes(qb64b[:hs])  # extract hard code
+        if hard not in self.Bodes:
+            raise UnexpectedCodeError(f"Unsupported code ={hard.decode()}.")
+        hard = self.Bodes[hard]  # str hard code
 
         hs, ss, xs, fs, ls = self.Sizes[hard]  # assumes hs in both tables match
         cs = hs + ss  # both hs and ss
@@ -1396,11 +1398,7 @@ class Matter:
 
         # extract soft chars including xtra, empty when ss==0 and xs == 0
         # assumes that when ss == 0 then xs must be 0
-        soft = qb64b[hs:hs+ss]
-        if isinstance(soft, memoryview):
-            soft = bytes(soft)
-        if hasattr(soft, "decode"):
-            soft = soft.decode()  # converts bytes/bytearray to str
+        soft = bytes(qb64b[hs:hs+ss]).decode() if ss else ''
         xtra = soft[:xs]  # extract xtra if any from front of soft
         soft = soft[xs:]  # strip xtra from soft
         if xtra != f"{self.Pad * xs}":
@@ -1413,11 +1411,7 @@ class Matter:
         if len(qb64b) < fs:  # need more bytes
             raise ShortageError(f"Need {fs - len(qb64b)} more chars.")
 
-        qb64b = qb64b[:fs]  # fully qualified primitive code plus material
-        if isinstance(qb64b, memoryview):
-            qb64b = bytes(qb64b)
-        if hasattr(qb64b, "encode"):  # only convert extracted chars from stream
-            qb64b = qb64b.encode()  # converts str to bytes
+        qb64b = bytes(qb64b[:fs])  # fully qualified primitive code plus material
 
         # check for non-zeroed pad bits and/or lead bytes
         # net prepad ps == cs % 4 (remainer).  Assumes ps != 3 i.e ps in (0,1,2)
@@ -1439,6 +1433,10 @@ class Matter:
         self._code = hard  # hard only str
         self._soft = soft  # soft only str
         self._raw = raw  # ensure bytes for crypto ops, may be empty
+        # keep extracted slice as .qb64b when canonical so no re-encoding
+        self._qb64b = qb64b if Reb64.match(qb64b) else None
+        self._qb64 = None
+        self._qb2 = None
 
 
     def _bexfil(self, qb2):
@@ -1527,6 +1525,9 @@ class Matter:
         self._code = hard  # hard only
         self._soft = soft  # soft only may be empty
         self._raw = bytes(raw)  # ensure bytes for crypto ops may be empty
+        self._qb64b = None
+        self._qb64 = None
+        self._qb2 = bytes(qb2)  # keep extracted slice as .qb2 no re-encoding
 
 
 class Seqner(Matter):
@@ -235,6 +235,9 @@ class Counter:
         ._code (str): value for .code property
         ._raw (bytes): value for .raw property
         ._count (int): value for .count property
+        ._qb64b (bytes | None): memoized value for .qb64b property
+        ._qb64 (str | None): memoized value for .qb64 property
+        ._qb2 (bytes | None): memoized value for .qb2 property
 
 
     Versioning:
@@ -334,6 +337,12 @@ class Counter:
     # converted from first two code char. Used for ._bexfil.
     Bards = ({codeB64ToB2(c): hs for c, hs in Hards.items()})
 
+    # Counters are immutable once created so their encodings are memoized
+    # lazily on first access
+    _qb64b = None
+    _qb64 = None
+    _qb2 = None
+
     # Sizes table indexes size tables first by major version and then by
     # lastest minor version
     # Each size table maps hs chars of code to Cizage namedtuple of (hs, ss, fs)
@@ -650,8 +659,11 @@ class Counter:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Memoized in ._qb64b on first access
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
 
     @property
@@ -660,8 +672,11 @@ class Counter:
         Property qb64:
         Returns Fully Qualified Base64 Version
         Assumes self.raw and self.code are correctly populated
+        Memoized in ._qb64 on first access
         """
-        return self.qb64b.decode("utf-8")
+        if self._qb64 is None:
+            self._qb64 = self.qb64b.decode("utf-8")
+        return self._qb64
 
 
     @property
@@ -669,8 +684,11 @@ class Counter:
         """
         Property qb2:
         Returns Fully Qualified Binary Version Bytes
+        Memoized in ._qb2 on first access
         """
-        return self._binfil()
+        if self._qb2 is None:
+            self._qb2 = self._binfil()
+        return self._qb2
 
 
     def countToB64(self, l=None):
@@ -814,6 +832,9 @@ class Counter:
         if not qb64b:  # empty need more bytes
             raise kering.ShortageError("Empty material, Need more characters.")
 
+        if len(qb64b) < 2:  # need both selector chars
+            raise kering.ShortageError("Need 1 more character.")
+
         first = qb64b[:2]  # extract first two char code selector
         if hasattr(first, "decode"):
             first = first.decode("utf-8")
@@ -26,7 +26,7 @@ from ..kering import (MissingEntryError,
 from ..kering import Version, Versionage, TraitDex
 
 from .. import help
-from ..help import helping
+from ..help import helping, metering
 
 from . import coring
 from .coring import (versify, Kinds, Ilks, PreDex, DigDex,
@@ -48,6 +48,16 @@ from ..db.dbing import dgKey, snKey, fnKey, splitSnKey, splitKey
 
 logger = help.ogler.getLogger()
 
+Stages = metering.registry.histogram("keri_stage_seconds",
+                                     "Seconds spent per event processing stage",
+                                     ("stage",))
+Sigs = metering.registry.counter("keri_signatures_verified_total",
+                                 "Signatures verified by result", ("result",))
+Escrows = metering.registry.counter("keri_escrow_total",
+                                    "Escrowed items processed by escrow and "
+                                    "outcome. Outcome drop includes timeout",
+                                    ("escrow", "outcome"))
+
 EscrowTimeoutPS = 3600  # seconds for partial signed escrow timeout
 
 MaxIntThold = 2 ** 32 - 1
@@ -361,29 +371,115 @@ def deTransReceiptQuintuple(data, strip=False):
 
 
 
-def verifySigs(raw, sigers, verfers):
+def _verifyJob(job):
     """
-    Returns tuple of (vsigers, vindices) where:
-        vsigers is list  of unique verified sigers with assigned verfer
-        vindices is list of indices from those verified sigers
+    Returns True if signature in job verifies False otherwise.
+    Module level so picklable when dispatched to a process pool.
 
-    The returned vsigers  and vindices may be used for threshold validation
+    Parameters:
+        job (tuple): (code, key, sig, ser) where code is verifier derivation
+            code, key is bytes public key, sig is bytes signature and
+            ser is bytes signed serialization
+    """
+    code, key, sig, ser = job
+    return Verfer(raw=key, code=code).verify(sig, ser)
 
-    Assigns appropriate verfer from verfers to each siger based on siger index
-    If no signatures verify then sigers and indices are empty
+
+def batchVerify(triples, pool=None, chunk=16):
+    """
+    Returns list of bools, one per triple in triples, True when the
+    signature of that triple verifies, False otherwise.
+
+    Verifies all the triples together as one batch. When pool is provided
+    the batch is dispatched across the workers of pool in chunks otherwise
+    verifies serially in the calling thread. Both pysodium and cryptography
+    release the GIL while verifying so a ThreadPoolExecutor scales across
+    cores as well as a ProcessPoolExecutor without the pickling overhead.
 
     Parameters:
-        raw (bytes) signed data
-        sigers is list of indexed Siger instances (signatures)
-        verfers is list of Verfer instance (public keys)
+        triples (Iterable): of (verfer, sig, ser) triples where verfer is
+            Verfer instance, sig is bytes signature and ser is bytes
+            signed serialization
+        pool (Executor | Verdicts | None): concurrent.futures executor for
+            parallel verification or Verdicts of precomputed results.
+            None means verify serially.
+        chunk (int): number of verifications per dispatched pool task
+    """
+    triples = list(triples)
+    if pool is None or (len(triples) < 2 and not isinstance(pool, Verdicts)):
+        results = [verfer.verify(sig, ser) for verfer, sig, ser in triples]
+    else:
+        jobs = [(verfer.code, verfer.raw, bytes(sig), bytes(ser))
+                for verfer, sig, ser in triples]
+        results = list(pool.map(_verifyJob, jobs, chunksize=max(1, chunk)))
+
+    if metering.registry.enabled:
+        valid = sum(results)
+        Sigs.inc("valid", n=valid)
+        Sigs.inc("invalid", n=len(results) - valid)
+    return results
 
+
+class Verdicts:
+    """
+    Verdicts is executor-like cache of signature verification results that
+    were computed ahead of time such as by a bulk import that verifies the
+    signatures of many KELs in parallel before committing each KEL in order.
+    Provide as pool to Kevery so batchVerify returns the cached verdicts
+    instead of verifying again. Misses are verified in the calling thread.
+
+    Attributes:
+        verdicts (dict): verification results keyed by job tuple
+            (code, key, sig, ser) as dispatched by batchVerify
+        hits (int): count of jobs answered from .verdicts
+        misses (int): count of jobs verified in calling thread
+    """
+
+    def __init__(self, verdicts=None):
+        """
+        Parameters:
+            verdicts (dict | None): initial verification results by job tuple
+        """
+        self.verdicts = verdicts if verdicts is not None else {}
+        self.hits = 0
+        self.misses = 0
+
+    def map(self, fn, jobs, chunksize=1):
+        """
+        Returns generator of results of fn applied to each job in jobs.
+        Each cached verdict is used once and then removed so memory stays
+        bounded as events are committed.
+
+        Parameters:
+            fn (Callable): verification function applied on miss
+            jobs (Iterable): of job tuples
+            chunksize (int): ignored. For compatibility with Executor.map
+        """
+        for job in jobs:
+            if (verdict := self.verdicts.pop(job, None)) is not None:
+                self.hits += 1
+                yield verdict
+            else:
+                self.misses += 1
+                yield fn(job)
+
+
+def _assignVerfers(sigers, verfers):
+    """
+    Returns list of unique Siger instances from sigers each with its
+    .verfer assigned from verfers by siger index.
+
+    Ensures no duplicate sigers by using set math on sigers' sigs otherwise
+    indices count for threshold will be erroneous. Does not modify in place
+    passed in sigers list, but instead depends on caller to use indices to
+    modify its copy to filter out unverifiable or duplicate sigers
+
+    Parameters:
+        sigers (list | None): of indexed Siger instances (signatures)
+        verfers (list): of Verfer instance (public keys)
     """
     if sigers is None:
         sigers = []
-    # Ensure no duplicate sigers by using set math on sigers' sigs otherwise
-    # indices count for threshold will be erroneous. Does not modify in place
-    # passed in sigers list, but instead depends on caller to use indices to
-    # modify its copy to filter out unverifiable or duplicate sigers
     usigs = oset([siger.qb64 for siger in sigers])
     usigers = [Siger(qb64=sig) for sig in usigs]
 
@@ -394,15 +490,86 @@ def verifySigs(raw, sigers, verfers):
             logger.info("Skipped sig: Index=%s to large.", siger.index)
         siger.verfer = verfers[siger.index]  # assign verfer
 
+    return usigers
+
+
+def verifySigs(raw, sigers, verfers, pool=None):
+    """
+    Returns tuple of (vsigers, vindices) where:
+        vsigers is list  of unique verified sigers with assigned verfer
+        vindices is list of indices from those verified sigers
+
+    The returned vsigers  and vindices may be used for threshold validation
+
+    Assigns appropriate verfer from verfers to each siger based on siger index
+    If no signatures verify then sigers and indices are empty
+
+    Parameters:
+        raw (bytes) signed data
+        sigers is list of indexed Siger instances (signatures)
+        verfers is list of Verfer instance (public keys)
+        pool (Executor | None): optional executor for parallel verification
+
+    """
+    sigers, indices, _, _ = verifySigsWigs(raw=raw, sigers=sigers,
+                                           verfers=verfers, pool=pool)
+    return (sigers, indices)
+
+
+def verifySigsWigs(raw, sigers, verfers, wigers=None, werfers=None, pool=None):
+    """
+    Returns tuple of (vsigers, vindices, vwigers, vwindices) where:
+        vsigers is list of unique verified controller sigers with assigned verfer
+        vindices is list of indices from those verified sigers
+        vwigers is list of unique verified witness wigers with assigned werfer
+        vwindices is list of indices from those verified wigers
+
+    Verifies the controller signatures and the witness signatures on raw
+    together as one batch with batchVerify instead of one at a time so that
+    all the signatures of an event may be verified in parallel when pool.
+
+    Parameters:
+        raw (bytes): signed data
+        sigers (list | None): of indexed Siger instances of controller sigs
+        verfers (list): of Verfer instances of controller keys
+        wigers (list | None): of indexed Siger instances of witness sigs
+        werfers (list | None): of Verfer instances of witness keys
+        pool (Executor | None): optional executor for parallel verification
+    """
+    usigers = _assignVerfers(sigers, verfers)
+    uwigers = _assignVerfers(wigers, werfers if werfers is not None else [])
+    return _verifyAssigned(raw=raw, usigers=usigers, uwigers=uwigers, pool=pool)
+
+
+def _verifyAssigned(raw, usigers, uwigers, pool=None):
+    """
+    Returns tuple of (vsigers, vindices, vwigers, vwindices) of the verified
+    members of usigers and uwigers as for verifySigsWigs. Each member of
+    usigers and uwigers must already have its .verfer assigned such as by
+    _assignVerfers. Both are verified together as one batch.
+
+    Parameters:
+        raw (bytes): signed data
+        usigers (list): of unique Siger instances of controller sigs
+        uwigers (list): of unique Siger instances of witness sigs
+        pool (Executor | None): optional executor for parallel verification
+    """
+    results = batchVerify([(siger.verfer, siger.raw, raw)
+                            for siger in usigers + uwigers], pool=pool)
+
     # create lists of unique verified signatures and indices
-    vindices = []
-    vsigers = []
-    for siger in usigers:
-        if siger.verfer.verify(siger.raw, raw):
+    vsigers, vindices, vwigers, vwindices = [], [], [], []
+    for siger, verified in zip(usigers, results[:len(usigers)]):
+        if verified:
             vindices.append(siger.index)
             vsigers.append(siger)
 
-    return (vsigers, vindices)
+    for wiger, verified in zip(uwigers, results[len(usigers):]):
+        if verified:
+            vwindices.append(wiger.index)
+            vwigers.append(wiger)
+
+    return (vsigers, vindices, vwigers, vwindices)
 
 
 def validateSigs(serder, sigers, verfers, tholder):
@@ -1494,7 +1661,8 @@ class Kever:
 
     def __init__(self, *, state=None, serder=None, sigers=None, wigers=None,
                  db=None, estOnly=None, delseqner=None, delsaider=None, firner=None,
-                 dater=None, cues=None, eager=False, local=True, check=False):
+                 dater=None, cues=None, eager=False, local=True, check=False,
+                 pool=None):
         """
         Create incepting kever and state from inception serder
         Verify incepting serder against sigers raises ValidationError if not
@@ -1535,6 +1703,8 @@ class Kever:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            pool (Executor | None): optional executor for parallel batch
+                signature verification. None means serial.
         """
         if not (state or (serder and sigers)):
             raise ValueError("Missing required arguments. Need state or serder"
@@ -1577,7 +1747,8 @@ class Kever:
                                                         delseqner=delseqner,
                                                         delsaider=delsaider,
                                                         eager=eager,
-                                                        local=local)
+                                                        local=local,
+                                                        pool=pool)
 
         self.delpre = delpre  # may be None
         self.delegated = True if self.delpre else False
@@ -1586,16 +1757,12 @@ class Kever:
         # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
         # all validated above so may add to KEL and FEL logs as first seen
         # returns fn == None if already logged fn log is non idempotent
-        fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                wits=wits,
-                                first=True if not check else False,
-                                seqner=delseqner, saider=delsaider,
-                                firner=firner, dater=dater, local=local)
-        if fn is not None:  # first is non-idempotent for fn check mode fn is None
-            self.fner = Number(num=fn)
-            self.dater = Dater(dts=dts)
-            self.db.states.pin(keys=self.prefixer.qb64,
-                               val=self.state())
+        # event and its key state are logged in one unit of work
+        self.logAccept(serder=serder, sigers=sigers, wigers=wigers,
+                       wits=wits,
+                       first=True if not check else False,
+                       seqner=delseqner, saider=delsaider,
+                       firner=firner, dater=dater, local=local)
 
 
     @property
@@ -1798,6 +1965,10 @@ class Kever:
             raise MissingEntryError(f"Corresponding event not found for state="
                                     f"{state}.")
         self.serder = serdering.SerderKERI(raw=bytes(raw))
+        # key state keys and threshold are those of latest establishment event
+        self.db.cacheVerifiers(pre=self.prefixer.qb64, sn=self.lastEst.s,
+                               dig=self.lastEst.d, tholder=self.tholder,
+                               verfers=self.verfers)
 
         # May want to do additional checks here
 
@@ -1892,8 +2063,10 @@ class Kever:
             self.doNotDelegate = True
 
 
+    @Stages.timed("update")
     def update(self, serder, sigers, wigers=None, delseqner=None, delsaider=None,
-               firner=None, dater=None, eager=False, local=True, check=False):
+               firner=None, dater=None, eager=False, local=True, check=False,
+               pool=None):
         """
         Not an inception event. Verify event serder and indexed signatures
         in sigers and update state
@@ -1930,6 +2103,8 @@ class Kever:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            pool (Executor | None): optional executor for parallel batch
+                signature verification. None means serial.
 
         """
         ked = serder.ked
@@ -1970,38 +2145,33 @@ class Kever:
                                                         delseqner=delseqner,
                                                         delsaider=delsaider,
                                                         eager=eager,
-                                                        local=local)
+                                                        local=local,
+                                                        pool=pool)
 
 
 
             # .valSigWigsDel above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    wits=wits,
-                                    first=True if not check else False,
-                                    seqner=delseqner, saider=delsaider,
-                                    firner=firner, dater=dater, local=local)
-
-            # nxt and signatures verify so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need whole serder for digest agility compare
-            self.ilk = ilk
-            self.tholder = tholder
-            self.verfers = serder.verfers
-            self.ndigers = serder.ndigers
-            self.ntholder = serder.ntholder
-
-            self.toader = toader
-            self.wits = wits
-            self.cuts = cuts
-            self.adds = adds
-
-            # last establishment event location need this to recognize recovery events
-            self.lastEst = LastEstLoc(s=self.sner.num, d=self.serder.said)
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fner = Number(num=fn)
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            # nxt and signatures verify so update state in one unit of work
+            # with logging event and its key state
+            self.logAccept(serder=serder, sigers=sigers, wigers=wigers,
+                           wits=wits,
+                           first=True if not check else False,
+                           seqner=delseqner, saider=delsaider,
+                           firner=firner, dater=dater, local=local,
+                           state=dict(sner=sner,  # sequence number Number instance
+                                      serder=serder,  # need whole serder for digest agility compare
+                                      ilk=ilk,
+                                      tholder=tholder,
+                                      verfers=serder.verfers,
+                                      ndigers=serder.ndigers,
+                                      ntholder=serder.ntholder,
+                                      toader=toader,
+                                      wits=wits,
+                                      cuts=cuts,
+                                      adds=adds,
+                                      # last establishment event location need this to recognize recovery events
+                                      lastEst=LastEstLoc(s=sner.num, d=serder.said)))
 
 
         elif ilk == Ilks.ixn:  # subsequent interaction event
@@ -2037,21 +2207,18 @@ class Kever:
                                                         toader=self.toader,
                                                         wits=self.wits,
                                                         eager=eager,
-                                                        local=local)
+                                                        local=local,
+                                                        pool=pool)
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    first=True if not check else False)  # First seen accepted
-
-            # validates so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need for digest agility includes .serder.diger
-            self.ilk = ilk
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fner = Number(num=fn)
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            # validates so update state in one unit of work with logging
+            # event and its key state
+            self.logAccept(serder=serder, sigers=sigers, wigers=wigers,
+                           first=True if not check else False,  # First seen accepted
+                           state=dict(sner=sner,  # sequence number Number instance
+                                      serder=serder,  # need for digest agility includes .serder.diger
+                                      ilk=ilk))
 
         else:  # unsupported event ilk so discard
             raise ValidationError("Unsupported ilk = {} for evt = {}.".format(ilk, ked))
@@ -2214,7 +2381,7 @@ class Kever:
     def valSigsWigsDel(self, serder, sigers, verfers, tholder,
                                 wigers, toader, wits, *,
                                 delseqner=None, delsaider=None, eager=False,
-                                local=True):
+                                local=True, pool=None):
         """
         Returns triple (sigers, wigers, delegator) where:
         sigers is unique validated signature verified members of inputed sigers
@@ -2252,6 +2419,8 @@ class Kever:
                 True means event source is local (protected).
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote
+            pool (Executor | None): optional executor for parallel batch
+                verification of sigers and wigers. None means serial.
 
         """
         if len(verfers) < tholder.size:
@@ -2274,9 +2443,24 @@ class Kever:
                                                 index=siger.index))
 
 
-        # get unique verified sigers and indices lists from sigers list
-        sigers, indices = verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers)
-        # sigers  now have .verfer assigned
+        # get unique verified sigers and indices lists from sigers list and
+        # unique verified wigers and windices lists from wigers list. Both
+        # are verified together as one batch so may be spread across pool.
+        usigers = _assignVerfers(sigers, verfers)
+        rawigers = wigers  # unverified wigers for misfit escrow
+        try:  # witness errors are raised below after the misfit checks
+            werfers = [Verfer(qb64=wit) for wit in wits]  # get witness public key verifiers
+            uwigers = _assignVerfers(wigers, werfers)
+            wex = None
+        except Exception as ex:  # verify sigers alone and raise ex later
+            uwigers = []
+            wex = ex
+        sigers, indices, wigers, windices = _verifyAssigned(raw=serder.raw,
+                                                            usigers=usigers,
+                                                            uwigers=uwigers,
+                                                            pool=pool)
+        # sigers now have .verfer assigned and
+        # each wiger now has added to it a werfer of its wit in its .verfer property
 
         # check if minimally signed in order to continue processing
         if not indices:  # must have a least one verified sig
@@ -2304,7 +2488,7 @@ class Kever:
         if (not local and (self.locallyOwned() or
                             self.locallyWitnessed(wits=wits) or
                             self.locallyDelegated(pre=delpre))):
-            self.escrowMFEvent(serder=serder, sigers=sigers, wigers=wigers,
+            self.escrowMFEvent(serder=serder, sigers=sigers, wigers=rawigers,
                                seqner=delseqner, saider=delsaider, local=local)
             raise MisfitEventSourceError(f"Nonlocal source for locally owned or"
                                          f"locally witnessed or locally delegated"
@@ -2312,10 +2496,8 @@ class Kever:
                                          f"{self.prefixes}, {wits=}, "
                                          f"delgator={delpre}.")
 
-        werfers = [Verfer(qb64=wit) for wit in wits]  # get witness public key verifiers
-        # get unique verified wigers and windices lists from wigers list
-        wigers, windices = verifySigs(raw=serder.raw, sigers=wigers, verfers=werfers)
-        # each wiger now has added to it a werfer of its wit in its .verfer property
+        if wex is not None:  # bad wigers or wits so fail as when verified here
+            raise wex
 
         # escrow if not fully signed vs signing threshold
         if not tholder.satisfy(indices):  # at least one but not enough
@@ -2457,6 +2639,7 @@ class Kever:
         return odxs
 
 
+    @Stages.timed("delegation")
     def validateDelegation(self, serder, sigers, wigers, wits, delpre, *,
                     delseqner=None, delsaider=None, eager=False, local=True):
         """
@@ -3054,6 +3237,48 @@ class Kever:
 
 
 
+    @dbing.transacting
+    def logAccept(self, serder, state=None, **kwa):
+        """
+        Logs accepted event with .logEvent, updates key state with state and
+        pins resulting key state to .db.states in one unit of work so the KEL
+        is never ahead of the stored key state. On abort the prior key state
+        is restored so that a retry begins from it. Cue of mismatched cloned
+        first seen ordinal is pushed once committed.
+
+        Returns:
+            result (tuple): (fn, dts) of .logEvent
+
+        Parameters:
+            serder (SerderKERI): instance of accepted event
+            state (dict | None): new key state attribute values by attribute
+                name assigned once event is logged
+            kwa (dict): other parameters of .logEvent
+        """
+        state = state if state is not None else {}
+        prior = {name: getattr(self, name, None) for name in (*state, "fner", "dater")}
+        try:
+            with self.db.transact():  # one atomic commit
+                fn, dts = self.logEvent(serder=serder, **kwa)
+                for name, val in state.items():
+                    setattr(self, name, val)
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    self.fner = Number(num=fn)
+                    self.dater = Dater(dts=dts)
+                    self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+        except Exception:
+            for name, val in prior.items():
+                setattr(self, name, val)
+            raise
+
+        firner = kwa.get("firner")
+        if fn is not None and firner and fn != firner.sn and self.cues is not None:
+            self.cues.push(dict(kin="noticeBadCloneFN", serder=serder,  # cue to notice BadCloneFN
+                                fn=fn, firner=firner, dater=kwa.get("dater")))
+        return (fn, dts)
+
+    @Stages.timed("log")
+    @dbing.transacting
     def logEvent(self, serder, sigers=None, wigers=None, wits=None, first=False,
                  seqner=None, saider=None, firner=None, dater=None, local=True):
         """
@@ -3084,71 +3309,77 @@ class Kever:
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote
         """
-        local = True if local else False
-        fn = None  # None means not a first seen log event so does not return an fn
-        dgkeys = (serder.pre, serder.said)
-        dgkey = dgKey(serder.preb, serder.saidb)
-        dtsb = helping.nowIso8601().encode("utf-8")
-        self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if wits:
-            self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
-
-        self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
-        # update event source
-
-        # delegation for authorized delegated or issued event
-        # when seqner and saider are provided they are only assured to be valid
-        # kever for event if kel is delegated and not locallyOwned
-        # and not locallyWitnessed as the validateDelegation is short circuited
-        # for non delegated kels, local controllers, and local witnesses.
-        # These checks prevent ddos via malicious source seal attachments.
-        # MUST NOT setAes if not delegated or locallyOwned or locallyWitnessed
-        if (self.delpre and not serder.ilk == Ilks.ixn and not self.locallyOwned()
-            and not self.locallyWitnessed(wits=wits) and seqner and saider):
-            couple = seqner.qb64b + saider.qb64b
-            self.db.setAes(dgkey, couple)  # authorizer (delegator/issuer) event seal
-
-        #if seqner and saider:
-            #couple = seqner.qb64b + saider.qb64b
-            #self.db.setAes(dgkey, couple)  # authorizer (delegator/issuer) event seal
-
-        if esr := self.db.esrs.get(keys=dgkeys):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkeys, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkeys, val=esr)
-
-        if first:  # append event dig to first seen database in order
-            fn = self.db.appendFe(serder.preb, serder.saidb)
-            if firner and fn != firner.sn:  # cloned replay but replay fn not match
-                if self.cues is not None:  # cue to notice BadCloneFN
-                    self.cues.push(dict(kin="noticeBadCloneFN", serder=serder,
-                                        fn=fn, firner=firner, dater=dater))
-                logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
-                            "ordinal fn %s and clone fn %s, said=%s",
-                            serder.preb, fn, firner.sn, serder.said)
+        with self.db.transact():  # one atomic commit
+            local = True if local else False
+            fn = None  # None means not a first seen log event so does not return an fn
+            dgkeys = (serder.pre, serder.said)
+            dgkey = dgKey(serder.preb, serder.saidb)
+            dtsb = helping.nowIso8601().encode("utf-8")
+            self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if wits:
+                self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
+
+            self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
+            # update event source
+
+            # delegation for authorized delegated or issued event
+            # when seqner and saider are provided they are only assured to be valid
+            # kever for event if kel is delegated and not locallyOwned
+            # and not locallyWitnessed as the validateDelegation is short circuited
+            # for non delegated kels, local controllers, and local witnesses.
+            # These checks prevent ddos via malicious source seal attachments.
+            # MUST NOT setAes if not delegated or locallyOwned or locallyWitnessed
+            if (self.delpre and not serder.ilk == Ilks.ixn and not self.locallyOwned()
+                and not self.locallyWitnessed(wits=wits) and seqner and saider):
+                couple = seqner.qb64b + saider.qb64b
+                self.db.setAes(dgkey, couple)  # authorizer (delegator/issuer) event seal
+
+            #if seqner and saider:
+                #couple = seqner.qb64b + saider.qb64b
+                #self.db.setAes(dgkey, couple)  # authorizer (delegator/issuer) event seal
+
+            if esr := self.db.esrs.get(keys=dgkeys):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkeys, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkeys, val=esr)
+
+            if first:  # append event dig to first seen database in order
+                fn = self.db.appendFe(serder.preb, serder.saidb)
+                if firner and fn != firner.sn:  # cloned replay but replay fn not match
+                    # cue to notice BadCloneFN pushed by .logAccept once committed
+                    logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
+                                "ordinal fn %s and clone fn %s, said=%s",
+                                serder.preb, fn, firner.sn, serder.said)
+                    logger.debug(f"event=\n{serder.pretty()}\n")
+                if dater:  # cloned replay use original's dts from dater
+                    dtsb = dater.dtsb
+                self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
+                self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
+                logger.info("Kever state: %s First seen ordinal %s at %s, said=%s",
+                            serder.pre, fn, dtsb.decode("utf-8"), serder.said)
                 logger.debug(f"event=\n{serder.pretty()}\n")
-            if dater:  # cloned replay use original's dts from dater
-                dtsb = dater.dtsb
-            self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
-            self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
-            logger.info("Kever state: %s First seen ordinal %s at %s, said=%s",
-                        serder.pre, fn, dtsb.decode("utf-8"), serder.said)
+            self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
+            if serder.estive:  # prewarm verifiers superseding any at sn
+                self.db.cacheVerifiers(pre=serder.pre, sn=serder.sn, dig=serder.said,
+                                       tholder=serder.tholder, verfers=serder.verfers)
+            else:
+                self.db.uncacheVerifiers(pre=serder.pre, sn=serder.sn)
+            self.db.indexAnchors(serder)  # anchored event seal index
+            logger.info("Kever state: %s Added to KEL valid said=%s",
+                        serder.pre, serder.said)
             logger.debug(f"event=\n{serder.pretty()}\n")
-        self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
-        logger.info("Kever state: %s Added to KEL valid said=%s",
-                    serder.pre, serder.said)
-        logger.debug(f"event=\n{serder.pretty()}\n")
-        return (fn, dtsb.decode("utf-8"))  # (fn int, dts str) if first else (None, dts str)
+            return (fn, dtsb.decode("utf-8"))  # (fn int, dts str) if first else (None, dts str)
 
 
+    @dbing.transacting
     def escrowMFEvent(self, serder, sigers, wigers=None,
                       seqner=None, saider=None, local=True):
         """
@@ -3165,33 +3396,35 @@ class Kever:
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote
         """
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
-
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if seqner and saider:
-            #couple = seqner.qb64b + saider.qb64b
-            #self.db.putUde(dgkey, couple)  # idempotent
-            self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
-
-        res = self.db.misfits.add(keys=(serder.pre, serder.snh), val=serder.saidb)
-        # log escrowed
-        logger.debug("Kever state: escrowed misfit event=\n%s\n",
-                    json.dumps(serder.ked, indent=1))
+        with self.db.transact():  # one atomic commit
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if seqner and saider:
+                #couple = seqner.qb64b + saider.qb64b
+                #self.db.putUde(dgkey, couple)  # idempotent
+                self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
+
+            res = self.db.misfits.add(keys=(serder.pre, serder.snh), val=serder.saidb)
+            # log escrowed
+            logger.debug("Kever state: escrowed misfit event=\n%s\n",
+                        json.dumps(serder.ked, indent=1))
 
 
+    @dbing.transacting
     def escrowDelegableEvent(self, serder, sigers, wigers=None, local=True):
         """
         Update associated logs for escrow of Delegable event that needs delegation
@@ -3208,28 +3441,30 @@ class Kever:
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote
         """
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
-
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        self.db.delegables.add(snKey(serder.preb, serder.sn), serder.saidb)
-        # log escrowed
-        logger.debug("Kever state: escrowed delegable event=\n%s\n",
-                     json.dumps(serder.ked, indent=1))
+        with self.db.transact():  # one atomic commit
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            self.db.delegables.add(snKey(serder.preb, serder.sn), serder.saidb)
+            # log escrowed
+            logger.debug("Kever state: escrowed delegable event=\n%s\n",
+                         json.dumps(serder.ked, indent=1))
 
 
+    @dbing.transacting
     def escrowPSEvent(self, serder, *, sigers=None, wigers=None,
                       seqner=None, saider=None, local=True):
         """
@@ -3247,33 +3482,36 @@ class Kever:
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote
         """
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if seqner and saider:
-            self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
-
-        self.db.putEvt(dgkey, serder.raw)
-        # update event source
-        if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
-
-        snkey = snKey(serder.preb, serder.sn)
-        self.db.addPse(snkey, serder.saidb)
-        logger.debug("Kever state: Escrowed partially signed or delegated "
-                     "event = %s\n", serder.ked)
-
+        with self.db.transact():  # one atomic commit
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if seqner and saider:
+                self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
 
+            self.db.putEvt(dgkey, serder.raw)
+            # update event source
+            if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            snkey = snKey(serder.preb, serder.sn)
+            if self.db.addPse(snkey, serder.saidb):
+                self.db.stampEscrow("pses", serder.preb, serder.sn, serder.saidb)
+            logger.debug("Kever state: Escrowed partially signed or delegated "
+                         "event = %s\n", serder.ked)
+
+
+    @dbing.transacting
     def escrowPWEvent(self, serder, *, sigers=None, wigers=None,
                       seqner=None, saider=None, local=True):
         """
@@ -3291,33 +3529,37 @@ class Kever:
                 Event validation logic is a function of local or remote
 
         """
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
-
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if seqner and saider:
-            self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
-
-        self.db.putEvt(dgkey, serder.raw)
-        # update event source
-        if (esr := self.db.esrs.get(keys=dgkey)):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else: # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
-
-        logger.debug("Kever state: Escrowed partially witnessed "
-                    "event = %s\n", serder.ked)
-        return self.db.addPwe(snKey(serder.preb, serder.sn), serder.saidb)
+        with self.db.transact():  # one atomic commit
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
 
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if seqner and saider:
+                self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
 
+            self.db.putEvt(dgkey, serder.raw)
+            # update event source
+            if (esr := self.db.esrs.get(keys=dgkey)):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else: # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            logger.debug("Kever state: Escrowed partially witnessed "
+                        "event = %s\n", serder.ked)
+            if added := self.db.addPwe(snKey(serder.preb, serder.sn), serder.saidb):
+                self.db.stampEscrow("pwes", serder.preb, serder.sn, serder.saidb)
+            return added
+
+
+    @dbing.transacting
     def escrowPDEvent(self, serder, *, sigers=None, wigers=None,
                       seqner=None, saider=None, local=True):
         """
@@ -3347,40 +3589,41 @@ class Kever:
                 Event validation logic is a function of local or remote
 
         """
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
-
-        if sigers:  # idempotent
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        if wigers:  # idempotent
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if seqner and saider:  # non-idempotent pin to repair replace
-            self.db.udes.pin(keys=dgkey, val=(seqner, saider))  # non-idempotent
-            logger.debug(f"Kever state: Replaced escrow source couple sn="
-                         f"{seqner.sn}, said={saider.qb64} for partially "
-                         f"delegated/authorized event said={serder.said}.")
-        else:
-            self.db.udes.rem(keys=dgkey)  # nullify non-idempotent
-            logger.debug(f"Kever state: Nullified escrow source couple for "
-                         f"partially delegated/authorized event said="
-                         f"{serder.said}.")
+        with self.db.transact():  # one atomic commit
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
+
+            if sigers:  # idempotent
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            if wigers:  # idempotent
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if seqner and saider:  # non-idempotent pin to repair replace
+                self.db.udes.pin(keys=dgkey, val=(seqner, saider))  # non-idempotent
+                logger.debug(f"Kever state: Replaced escrow source couple sn="
+                             f"{seqner.sn}, said={saider.qb64} for partially "
+                             f"delegated/authorized event said={serder.said}.")
+            else:
+                self.db.udes.rem(keys=dgkey)  # nullify non-idempotent
+                logger.debug(f"Kever state: Nullified escrow source couple for "
+                             f"partially delegated/authorized event said="
+                             f"{serder.said}.")
 
-        self.db.putEvt(dgkey, serder.raw)  # idempotent
+            self.db.putEvt(dgkey, serder.raw)  # idempotent
 
-        # update event source local or remote
-        if (esr := self.db.esrs.get(keys=dgkey)):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else: # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
+            # update event source local or remote
+            if (esr := self.db.esrs.get(keys=dgkey)):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else: # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
 
-        logger.debug(f"Kever state: Escrowed partially delegated event=\n"
-                     f"{serder.ked}\n.")
-        return self.db.pdes.addOn(keys=serder.pre, on=serder.sn, val=serder.said)
+            logger.debug(f"Kever state: Escrowed partially delegated event=\n"
+                         f"{serder.ked}\n.")
+            return self.db.pdes.addOn(keys=serder.pre, on=serder.sn, val=serder.said)
 
 
     def state(self):
@@ -3595,6 +3838,23 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+        pool (Executor | None): concurrent.futures executor used to verify
+                the controller and witness signatures of each event as one
+                parallel batch. None means verify serially.
+        driven (bool): True means event driven escrow processing. Each
+                .processEscrows only retries the escrows of prefixes in .wakes
+                and does a full sweep of all escrows every .EscrowSweep seconds
+                to catch stale escrows.
+                False means every .processEscrows is a full sweep.
+        wakes (set): of qb64 prefixes whose escrows may now progress because
+                an event or receipt for the prefix was received or accepted
+                since the last .processEscrows
+        swept (datetime | None): time of last full escrow sweep when driven
+        stamped (set): names of escrows whose items escrowed before the
+                .db.etms escrow stamps index existed have been indexed
+        expired (dict | None): expired items of each escrow keyed by escrow
+                name found once per .processEscrows pass and shared by its
+                escrow processors. None means not inside a pass
 
 
     Properties:
@@ -3613,9 +3873,11 @@ class Kevery:
     TimeoutVRE = 3600  # seconds to timeout unverified transferable receipt escrows
     TimeoutKSN = 3600  # seconds to timeout key state notice message escrows
     TimeoutQNF = 300   # seconds to timeout query not found escrows
+    EscrowSweep = 60  # seconds between full escrow sweeps when driven
 
     def __init__(self, *, cues=None, db=None, rvy=None,
-                 lax=True, local=False, cloned=False, direct=True, check=False):
+                 lax=True, local=False, cloned=False, direct=True, check=False,
+                 pool=None, driven=False):
         """
         Initialize instance:
 
@@ -3637,17 +3899,31 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            pool (Executor | None): executor for parallel batch signature
+                verification. None means verify serially.
+            driven (bool): True means event driven escrow processing of woken
+                prefixes with periodic full sweeps.
+                False means full sweep of escrows on every .processEscrows
         """
         self.cues = cues if cues is not None else decking.Deck()  # subclass of deque
         if db is None:
             db = basing.Baser(reopen=True)  # default name = "main"
         self.db = db
+        if self.db.kevers.cues is None:  # reloaded kevers cue to this kevery
+            self.db.kevers.cues = self.cues
         self.rvy = rvy
         self.lax = True if lax else False  # promiscuous mode
         self.local = True if local else False  # local vs nonlocal default
         self.cloned = True if cloned else False  # process as cloned
         self.direct = True if direct else False  # process as direct mode
         self.check = True if check else False  # process as check mode
+        self.pool = pool  # executor for parallel signature verification
+        self.driven = True if driven else False  # event driven escrows
+        self.wakes = set()  # prefixes whose escrows may progress
+        self.swept = None  # datetime of last full sweep None means due
+        self.escrowing = False  # True while processing escrows
+        self.stamped = set()  # escrows whose legacy items are indexed
+        self.expired = None  # expired escrow items of current escrow pass
 
 
     @property
@@ -3664,6 +3940,19 @@ class Kevery:
         """
         return self.db.prefixes
 
+    def wake(self, pre):
+        """
+        Wake escrows of identifier prefix pre so next .processEscrows when
+        .driven retries them. Arrivals from outside of escrow processing
+        always wake since they may bring new signatures or receipts.
+        Reprocessing from within escrow processing only wakes on acceptance.
+
+        Parameters:
+            pre (str): qb64 identifier prefix
+        """
+        self.wakes.add(pre)
+
+
     def fetchWitnessState(self, pre, sn):
         """ Returns the list of witness for the identifier prefix at the sequence number
 
@@ -3693,6 +3982,7 @@ class Kevery:
         return []
 
 
+    @Stages.timed("process")
     def processEvent(self, serder, sigers, *, wigers=None,
                      delseqner=None, delsaider=None,
                      firner=None, dater=None, eager=False, local=None):
@@ -3730,6 +4020,8 @@ class Kevery:
         # fetch ked ilk  pre, sn, dig to see how to process
         pre = serder.pre
         ked = serder.ked
+        if not self.escrowing:  # new arrival may complete escrows for pre
+            self.wake(pre)
 
         # See todo for Prefixer fix redundancy XXX
         try:  # see if code of pre is supported and matches size of pre
@@ -3760,8 +4052,10 @@ class Kevery:
                               cues=self.cues,
                               eager=eager,
                               local=local,
-                              check=self.check)
+                              check=self.check,
+                              pool=self.pool)
                 self.kevers[pre] = kever  # not exception so add to kevers
+                self.wake(pre)  # accepted so wake escrows waiting on it
 
                 # At this point  the inceptive event (icp or dip) given by serder
                 # together with its attachments has been accepted as valid with finality.
@@ -3803,13 +4097,13 @@ class Kevery:
                     # raises ValidationError if no valid sig
                     kever = self.kevers[pre]  # get key state
                     # get unique verified lists of sigers and indices from sigers
-                    sigers, indices = verifySigs(raw=serder.raw,
-                                                 sigers=sigers,
-                                                 verfers=eserder.verfers)
-
-                    wigers, windices = verifySigs(raw=serder.raw,
-                                                  sigers=wigers,
-                                                  verfers=eserder.berfers)
+                    sigers, indices, wigers, windices = verifySigsWigs(
+                                                    raw=serder.raw,
+                                                    sigers=sigers,
+                                                    verfers=eserder.verfers,
+                                                    wigers=wigers,
+                                                    werfers=eserder.berfers,
+                                                    pool=self.pool)
 
                     if sigers or wigers:  # at least one verified sig or wig so log evt
                         # this allows late arriving witness receipts or controller
@@ -3845,7 +4139,9 @@ class Kevery:
                                  delseqner=delseqner, delsaider=delsaider,
                                  firner=firner if self.cloned else None,
                                  dater=dater if self.cloned else None,
-                                 eager=eager, local=local, check=self.check)
+                                 eager=eager, local=local, check=self.check,
+                                 pool=self.pool)
+                    self.wake(pre)  # accepted so wake escrows waiting on it
 
                     # At this point the non-inceptive event (rot, drt, or ixn)
                     # given by serder together with its attachments has been
@@ -3880,15 +4176,15 @@ class Kevery:
                         # raises ValidationError if no valid sig
                         kever = self.kevers[pre]
                         # get unique verified lists of sigers and indices from sigers
-                        sigers, indices = verifySigs(raw=serder.raw,
-                                                     sigers=sigers,
-                                                     verfers=eserder.verfers)
-
                         wits = [wit.qb64 for wit in self.fetchWitnessState(pre, sn)]
                         werfers = [Verfer(qb64=wit) for wit in wits]
-                        wigers, windices = verifySigs(raw=serder.raw,
-                                                      sigers=wigers,
-                                                      verfers=werfers)
+                        sigers, indices, wigers, windices = verifySigsWigs(
+                                                        raw=serder.raw,
+                                                        sigers=sigers,
+                                                        verfers=eserder.verfers,
+                                                        wigers=wigers,
+                                                        werfers=werfers,
+                                                        pool=self.pool)
 
                         if sigers or wigers:  # at least one verified sig or wig so log evt
                             # this allows late arriving witness receipts or controller
@@ -3930,6 +4226,8 @@ class Kevery:
         # fetch  pre dig to process
         ked = serder.ked
         pre = serder.pre
+        if not self.escrowing:  # new receipt may complete escrows for pre
+            self.wake(pre)
         sn = serder.sn
 
         # Only accept receipt if for last seen version of event at sn
@@ -4009,6 +4307,8 @@ class Kevery:
         # fetch  pre dig to process
         ked = serder.ked
         pre = serder.pre
+        if not self.escrowing:  # new receipt may complete escrows for pre
+            self.wake(pre)
         sn = serder.sn
 
         # Only accept receipt if for last seen version of event at sn
@@ -4091,6 +4391,8 @@ class Kevery:
         # fetch  pre dig to process
         ked = serder.ked
         pre = serder.pre
+        if not self.escrowing:  # new receipt may complete escrows for pre
+            self.wake(pre)
         sn = serder.sn
 
         # Only accept receipt if event is latest event at sn. Means its been
@@ -4171,6 +4473,8 @@ class Kevery:
         # fetch  pre, dig,seal to process
         ked = serder.ked
         pre = serder.pre
+        if not self.escrowing:  # new receipt may complete escrows for pre
+            self.wake(pre)
         sn = serder.sn
 
         # Only accept receipt if for last seen version of event at sn
@@ -4270,6 +4574,8 @@ class Kevery:
         # fetch  pre, dig,seal to process
         ked = serder.ked
         pre = serder.pre
+        if not self.escrowing:  # new receipt may complete escrows for pre
+            self.wake(pre)
         sn = serder.sn
 
         if firner:  # retrieve last event by fn ordinal
@@ -4989,6 +5295,7 @@ class Kevery:
                 return None
 
 
+    @dbing.transacting
     def escrowMFEvent(self, serder, sigers, wigers=None,
                       seqner=None, saider=None, local=True):
         """
@@ -5005,32 +5312,34 @@ class Kevery:
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote
         """
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
-
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if seqner and saider:
-            #couple = seqner.qb64b + saider.qb64b
-            #self.db.putUde(dgkey, couple)  # idempotent
-            self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
-        self.db.misfits.add(keys=(serder.pre, serder.snh), val=serder.saidb)
-        # log escrowed
-        logger.debug("Kevery process: escrowed misfit event=\n%s",
-                    json.dumps(serder.ked, indent=1))
+        with self.db.transact():  # one atomic commit
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if seqner and saider:
+                #couple = seqner.qb64b + saider.qb64b
+                #self.db.putUde(dgkey, couple)  # idempotent
+                self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
+            self.db.misfits.add(keys=(serder.pre, serder.snh), val=serder.saidb)
+            # log escrowed
+            logger.debug("Kevery process: escrowed misfit event=\n%s",
+                        json.dumps(serder.ked, indent=1))
 
 
+    @dbing.transacting
     def escrowOOEvent(self, serder, sigers, seqner=None, saider=None, wigers=None, local=True):
         """
         Update associated logs for escrow of Out-of-Order event
@@ -5046,31 +5355,34 @@ class Kevery:
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote
         """
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
-
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if seqner and saider:
-            #couple = seqner.qb64b + saider.qb64b
-            #self.db.putUde(dgkey, couple)  # idempotent
-            self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
-        self.db.addOoe(snKey(serder.preb, serder.sn), serder.saidb)
-        # log escrowed
-        logger.debug("Kevery process: escrowed out of order event=\n%s",
-                     json.dumps(serder.ked, indent=1))
+        with self.db.transact():  # one atomic commit
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if seqner and saider:
+                #couple = seqner.qb64b + saider.qb64b
+                #self.db.putUde(dgkey, couple)  # idempotent
+                self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
+            if self.db.addOoe(snKey(serder.preb, serder.sn), serder.saidb):
+                self.db.stampEscrow("ooes", serder.preb, serder.sn, serder.saidb)
+            # log escrowed
+            logger.debug("Kevery process: escrowed out of order event=\n%s",
+                         json.dumps(serder.ked, indent=1))
 
+    @dbing.transacting
     def escrowQueryNotFoundEvent(self, prefixer, serder, sigers, cigars=None):
         """
         Update associated logs for escrow of Out-of-Order event
@@ -5081,20 +5393,22 @@ class Kevery:
             sigers (list): of Siger instance for  event
             cigars (list): of non-transferable receipts
         """
-        cigars = cigars if cigars is not None else []
-        dgkey = dgKey(prefixer.qb64b, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        self.db.qnfs.add(keys=(prefixer.qb64, serder.said), val=serder.saidb)
+        with self.db.transact():  # one atomic commit
+            cigars = cigars if cigars is not None else []
+            dgkey = dgKey(prefixer.qb64b, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            self.db.qnfs.add(keys=(prefixer.qb64, serder.said), val=serder.saidb)
 
-        for cigar in cigars:
-            self.db.addRct(key=dgkey, val=cigar.verfer.qb64b + cigar.qb64b)
+            for cigar in cigars:
+                self.db.addRct(key=dgkey, val=cigar.verfer.qb64b + cigar.qb64b)
 
-        # log escrowed
-        logger.debug("Kevery process: escrowed query not found event=\n%s",
-                     json.dumps(serder.ked, indent=1))
+            # log escrowed
+            logger.debug("Kevery process: escrowed query not found event=\n%s",
+                         json.dumps(serder.ked, indent=1))
 
+    @dbing.transacting
     def escrowLDEvent(self, serder, sigers, local=True):
         """
         Update associated logs for escrow of Likely Duplicitous event
@@ -5107,25 +5421,28 @@ class Kevery:
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote
         """
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
-
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb)
-        # log duplicitous
-        logger.debug("Kevery process: escrowed likely duplicitous event=\n%s",
-                     json.dumps(serder.ked, indent=1))
+        with self.db.transact():  # one atomic commit
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            if self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb):
+                self.db.stampEscrow("ldes", serder.preb, serder.sn, serder.saidb)
+            # log duplicitous
+            logger.debug("Kevery process: escrowed likely duplicitous event=\n%s",
+                         json.dumps(serder.ked, indent=1))
 
+    @dbing.transacting
     def escrowUWReceipt(self, serder, wigers, said):
         """
         Update associated logs for escrow of Unverified Event Witness Receipt
@@ -5144,24 +5461,27 @@ class Kevery:
             said (str) qb64 said of receipted event not serder.dig because
                 serder is a receipt not the receipted event
         """
-        # note receipt dig algo may not match database dig also so must always
-        # serder.compare to match. So receipts for same event may have different
-        # digs of that event due to different algos. So the escrow may have
-        # different dup at same key, sn.  Escrow needs to include dig
-        # so can compare digs from receipt and in database for receipted event
-        # with different algos.  Can't lookup event by dig for same reason. Must
-        # lookup last event by sn not by dig.
-        self.db.putDts(dgKey(serder.preb, said), helping.nowIso8601().encode("utf-8"))
-        for wiger in wigers:  # escrow each couple
-            # don't know witness pre yet without witness list so no verfer in wiger
-            # if wiger.verfer.transferable:  # skip transferable verfers
-            # continue  # skip invalid triplets
-            couple = said.encode("utf-8") + wiger.qb64b
-            self.db.addUwe(key=snKey(serder.preb, serder.sn), val=couple)
-        # log escrowed
-        logger.debug("Kevery process: escrowed unverified witness indexed receipt"
-                     " of pre= %s sn=%x dig=%s", serder.pre, serder.sn, said)
+        with self.db.transact():  # one atomic commit
+            # note receipt dig algo may not match database dig also so must always
+            # serder.compare to match. So receipts for same event may have different
+            # digs of that event due to different algos. So the escrow may have
+            # different dup at same key, sn.  Escrow needs to include dig
+            # so can compare digs from receipt and in database for receipted event
+            # with different algos.  Can't lookup event by dig for same reason. Must
+            # lookup last event by sn not by dig.
+            self.db.putDts(dgKey(serder.preb, said), helping.nowIso8601().encode("utf-8"))
+            for wiger in wigers:  # escrow each couple
+                # don't know witness pre yet without witness list so no verfer in wiger
+                # if wiger.verfer.transferable:  # skip transferable verfers
+                # continue  # skip invalid triplets
+                couple = said.encode("utf-8") + wiger.qb64b
+                self.db.addUwe(key=snKey(serder.preb, serder.sn), val=couple)
+            self.db.stampEscrow("uwes", serder.preb, serder.sn, said)
+            # log escrowed
+            logger.debug("Kevery process: escrowed unverified witness indexed receipt"
+                         " of pre= %s sn=%x dig=%s", serder.pre, serder.sn, said)
 
+    @dbing.transacting
     def escrowUReceipt(self, serder, cigars, said):
         """
         Update associated logs for escrow of Unverified Event Receipt (non-transferable)
@@ -5176,23 +5496,26 @@ class Kevery:
             said (str): qb64 said in receipt of receipted event not serder.dig because
                 serder is of receipt not receipted event
         """
-        # note receipt dig algo may not match database dig also so must always
-        # serder.compare to match. So receipts for same event may have different
-        # digs of that event due to different algos. So the escrow may have
-        # different dup at same key, sn.  Escrow needs to include dig
-        # so can compare digs from receipt and in database for receipted event
-        # with different algos.  Can't lookup event by dig for same reason. Must
-        # lookup last event by sn not by dig.
-        self.db.putDts(dgKey(serder.preb, said), helping.nowIso8601().encode("utf-8"))
-        for cigar in cigars:  # escrow each triple
-            if cigar.verfer.transferable:  # skip transferable verfers
-                continue  # skip invalid triplets
-            triple = said.encode("utf-8") + cigar.verfer.qb64b + cigar.qb64b
-            self.db.addUre(key=snKey(serder.preb, serder.sn), val=triple)  # should be snKey
-        # log escrowed
-        logger.debug("Kevery process: escrowed unverified receipt of pre= %s "
-                     " sn=%x dig=%s", serder.pre, serder.sn, said)
+        with self.db.transact():  # one atomic commit
+            # note receipt dig algo may not match database dig also so must always
+            # serder.compare to match. So receipts for same event may have different
+            # digs of that event due to different algos. So the escrow may have
+            # different dup at same key, sn.  Escrow needs to include dig
+            # so can compare digs from receipt and in database for receipted event
+            # with different algos.  Can't lookup event by dig for same reason. Must
+            # lookup last event by sn not by dig.
+            self.db.putDts(dgKey(serder.preb, said), helping.nowIso8601().encode("utf-8"))
+            for cigar in cigars:  # escrow each triple
+                if cigar.verfer.transferable:  # skip transferable verfers
+                    continue  # skip invalid triplets
+                triple = said.encode("utf-8") + cigar.verfer.qb64b + cigar.qb64b
+                self.db.addUre(key=snKey(serder.preb, serder.sn), val=triple)  # should be snKey
+            self.db.stampEscrow("ures", serder.preb, serder.sn, said)
+            # log escrowed
+            logger.debug("Kevery process: escrowed unverified receipt of pre= %s "
+                         " sn=%x dig=%s", serder.pre, serder.sn, said)
 
+    @dbing.transacting
     def escrowTRGroups(self, serder, tsgs):
         """
         Update associated logs for escrow of Transferable Receipt Groups for
@@ -5215,29 +5538,32 @@ class Kevery:
                 dig is receipt est evant dig
                 sig is indexed sig of receiptor of receipted event
         """
-        # Receipt dig algo may not match database dig. So must always
-        # serder.compare to match. So receipts for same event may have different
-        # digs of that event due to different algos. So the escrow may have
-        # different dup at same key, sn.  Escrow needs to be quintuple with
-        # edig, validator prefix, validtor est event sn, validator est evvent dig
-        # and sig stored at kel pre, sn so can compare digs
-        # with different algos.  Can't lookup by dig for the same reason. Must
-        # lookup last event by sn not by dig.
-        for tsg in tsgs:
-            prefixer, seqner, saider, sigers = tsg
-            self.db.putDts(dgKey(serder.preb, serder.saidb), helping.nowIso8601().encode("utf-8"))
-            # since serder of of receipt not receipted event must use dig in
-            # serder.ked["d"] not serder.dig
-            prelet = (serder.ked["d"].encode("utf-8") + prefixer.qb64b +
-                      seqner.qb64b + saider.qb64b)
-            for siger in sigers:  # escrow each quintlet
-                quintuple = prelet + siger.qb64b  # quintuple
-                self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
-            # log escrowed
-            logger.debug("Kevery process: escrowed unverified transferable receipt "
-                         "of pre=%s sn=%x dig=%s by pre=%s", serder.pre,
-                         serder.sn, serder.ked["d"], prefixer.qb64)
-
+        with self.db.transact():  # one atomic commit
+            # Receipt dig algo may not match database dig. So must always
+            # serder.compare to match. So receipts for same event may have different
+            # digs of that event due to different algos. So the escrow may have
+            # different dup at same key, sn.  Escrow needs to be quintuple with
+            # edig, validator prefix, validtor est event sn, validator est evvent dig
+            # and sig stored at kel pre, sn so can compare digs
+            # with different algos.  Can't lookup by dig for the same reason. Must
+            # lookup last event by sn not by dig.
+            for tsg in tsgs:
+                prefixer, seqner, saider, sigers = tsg
+                self.db.putDts(dgKey(serder.preb, serder.saidb), helping.nowIso8601().encode("utf-8"))
+                # since serder of of receipt not receipted event must use dig in
+                # serder.ked["d"] not serder.dig
+                prelet = (serder.ked["d"].encode("utf-8") + prefixer.qb64b +
+                          seqner.qb64b + saider.qb64b)
+                for siger in sigers:  # escrow each quintlet
+                    quintuple = prelet + siger.qb64b  # quintuple
+                    self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+                self.db.stampEscrow("vres", serder.preb, serder.sn, serder.saidb)
+                # log escrowed
+                logger.debug("Kevery process: escrowed unverified transferable receipt "
+                             "of pre=%s sn=%x dig=%s by pre=%s", serder.pre,
+                             serder.sn, serder.ked["d"], prefixer.qb64)
+
+    @dbing.transacting
     def escrowTReceipts(self, serder, prefixer, seqner, saider, sigers):
         """
         Update associated logs for escrow of Transferable Event Receipt Group
@@ -5259,27 +5585,30 @@ class Kevery:
                 dig is receipt est evant dig
                 sig is indexed sig of receiptor of receipted event
         """
-        # Receipt dig algo may not match database dig. So must always
-        # serder.compare to match. So receipts for same event may have different
-        # digs of that event due to different algos. So the escrow may have
-        # different dup at same key, sn.  Escrow needs to be quintuple with
-        # edig, validator prefix, validtor est event sn, validator est evvent dig
-        # and sig stored at kel pre, sn so can compare digs
-        # with different algos.  Can't lookup by dig for the same reason. Must
-        # lookup last event by sn not by dig.
-        self.db.putDts(dgKey(serder.preb, serder.saidb), helping.nowIso8601().encode("utf-8"))
-        # since serder of of receipt not receipted event must use dig in
-        # serder.ked["d"] not serder.dig
-        prelet = (serder.ked["d"].encode("utf-8") + prefixer.qb64b +
-                  seqner.qb64b + saider.qb64b)
-        for siger in sigers:  # escrow each quintlet
-            quintuple = prelet + siger.qb64b  # quintuple
-            self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
-        # log escrowed
-        logger.debug("Kevery process: escrowed unverified transferable receipt "
-                    "of pre=%s sn=%x dig=%s by pre=%s", serder.pre,
-                    serder.sn, serder.ked["d"], prefixer.qb64)
+        with self.db.transact():  # one atomic commit
+            # Receipt dig algo may not match database dig. So must always
+            # serder.compare to match. So receipts for same event may have different
+            # digs of that event due to different algos. So the escrow may have
+            # different dup at same key, sn.  Escrow needs to be quintuple with
+            # edig, validator prefix, validtor est event sn, validator est evvent dig
+            # and sig stored at kel pre, sn so can compare digs
+            # with different algos.  Can't lookup by dig for the same reason. Must
+            # lookup last event by sn not by dig.
+            self.db.putDts(dgKey(serder.preb, serder.saidb), helping.nowIso8601().encode("utf-8"))
+            # since serder of of receipt not receipted event must use dig in
+            # serder.ked["d"] not serder.dig
+            prelet = (serder.ked["d"].encode("utf-8") + prefixer.qb64b +
+                      seqner.qb64b + saider.qb64b)
+            for siger in sigers:  # escrow each quintlet
+                quintuple = prelet + siger.qb64b  # quintuple
+                self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+            self.db.stampEscrow("vres", serder.preb, serder.sn, serder.saidb)
+            # log escrowed
+            logger.debug("Kevery process: escrowed unverified transferable receipt "
+                        "of pre=%s sn=%x dig=%s by pre=%s", serder.pre,
+                        serder.sn, serder.ked["d"], prefixer.qb64)
 
+    @dbing.transacting
     def escrowTRQuadruple(self, serder, sprefixer, sseqner, saider, siger):
         """
         Update associated logs for escrow of Unverified Transferable Receipt
@@ -5296,40 +5625,110 @@ class Kevery:
             saider is digest of receipted event provided in receipt
 
         """
-        # Receipt dig algo may not match database dig. So must always
-        # serder.compare to match. So receipts for same event may have different
-        # digs of that event due to different algos. So the escrow may have
-        # different dup at same key, sn.  Escrow needs to be quintuple with
-        # edig, validator prefix, validtor est event sn, validator est evvent dig
-        # and sig stored at kel pre, sn so can compare digs
-        # with different algos.  Can't lookup by dig for the same reason. Must
-        # lookup last event by sn not by dig.
-        self.db.putDts(dgKey(serder.preb, serder.said), helping.nowIso8601().encode("utf-8"))
-        quintuple = (serder.saidb + sprefixer.qb64b + sseqner.qb64b +
-                     saider.qb64b + siger.qb64b)
-        self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
-        # log escrowed
-        logger.debug("Kevery process: escrowed unverified transferabe validator "
-                     "receipt of pre= %s sn=%x dig=%s", serder.pre, serder.sn,
-                     serder.said)
+        with self.db.transact():  # one atomic commit
+            # Receipt dig algo may not match database dig. So must always
+            # serder.compare to match. So receipts for same event may have different
+            # digs of that event due to different algos. So the escrow may have
+            # different dup at same key, sn.  Escrow needs to be quintuple with
+            # edig, validator prefix, validtor est event sn, validator est evvent dig
+            # and sig stored at kel pre, sn so can compare digs
+            # with different algos.  Can't lookup by dig for the same reason. Must
+            # lookup last event by sn not by dig.
+            self.db.putDts(dgKey(serder.preb, serder.said), helping.nowIso8601().encode("utf-8"))
+            quintuple = (serder.saidb + sprefixer.qb64b + sseqner.qb64b +
+                         saider.qb64b + siger.qb64b)
+            self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+            self.db.stampEscrow("vres", serder.preb, serder.sn, serder.saidb)
+            # log escrowed
+            logger.debug("Kevery process: escrowed unverified transferabe validator "
+                         "receipt of pre= %s sn=%x dig=%s", serder.pre, serder.sn,
+                         serder.said)
+
+    def expiredEscrows(self, escrow, timeout, itemIter, getter):
+        """
+        Returns dict of .db.etms keys of expired items of escrow keyed by
+        (pre, sn, dig) with pre and dig bytes. An item is expired when the
+        datetime stamp of its event is more than timeout seconds old. Found by
+        one range scan of the .db.etms escrow stamps index up to the cutoff so
+        the stamps of unexpired items are not read or parsed. Index entries of
+        items no longer in escrow are removed.
 
+        On first call for escrow indexes any items escrowed before the index
+        existed. Inside a .processEscrows pass the scan runs once per escrow
+        and its result is shared by the processors of each woken prefix.
+
+        Parameters:
+            escrow (str): name of escrow sub DB such as "ooes"
+            timeout (float): seconds after which escrowed items are stale
+            itemIter (Callable): escrow item iterator such as .db.getOoeItemIter
+            getter (Callable): escrow vals getter by snKey such as .db.getOoes
+        """
+        if self.expired is not None and escrow in self.expired:
+            return self.expired[escrow]
+
+        if escrow not in self.stamped:
+            for ekey, val in dbing.detach(itemIter(key=b'')):
+                pre, sn = splitSnKey(ekey)
+                self.db.stampEscrow(escrow, pre, sn, coring.Matter(qb64b=bytes(val)).qb64b)
+            self.stamped.add(escrow)
+
+        cutoff = helping.nowUTC() - datetime.timedelta(seconds=timeout)
+        expired = {}
+        for keys, pre, sn, dig in list(self.db.getExpiredEscrowIter(escrow, cutoff)):
+            if any(bytes(val).startswith(dig) for val in getter(snKey(pre, sn))):
+                expired[(pre, sn, dig)] = keys
+            else:  # no longer escrowed
+                self.db.etms.rem(keys=keys)
+        if self.expired is not None:
+            self.expired[escrow] = expired
+        return expired
+
+    @Stages.timed("escrows")
     def processEscrows(self):
         """
         Iterate throush escrows and process any that may now be finalized
 
+        When .driven only the escrows of the prefixes in .wakes are retried
+        unless a full sweep is due every .EscrowSweep seconds. Escrows that
+        wait on some other KEL than that of their key prefix, i.e. unverified
+        transferable receipts, partial delegation, delegable and query not
+        found, are processed whenever anything woke. When nothing woke and no
+        sweep is due returns immediately. When a processor raises the woken
+        prefixes are woken again and any due sweep stays due.
+
         Parameters:
         """
+        woke, self.wakes = self.wakes, set()  # wakes during pass are kept
+        swept = self.swept
+        if self.driven:
+            now = helping.nowUTC()
+            if (self.swept is None or
+                    (now - self.swept) > datetime.timedelta(seconds=self.EscrowSweep)):
+                self.swept = now
+                pres = [None]  # None means full sweep
+            elif woke:
+                pres = sorted(woke)
+            else:  # nothing woke so nothing can progress
+                return
+        else:
+            pres = [None]
 
+        self.escrowing = True
+        self.expired = {}
+        done = False
         try:
-            self.processEscrowOutOfOrders()
-            self.processEscrowUnverWitness()
-            self.processEscrowUnverNonTrans()
-            self.processEscrowUnverTrans()
+            for pre in pres:
+                self.processEscrowOutOfOrders(pre=pre)
+                self.processEscrowUnverWitness(pre=pre)
+                self.processEscrowUnverNonTrans(pre=pre)
+            self.processEscrowUnverTrans()  # waits on receipter KEL
             self.processEscrowPartialDels()
-            self.processEscrowPartialWigs()
-            self.processEscrowPartialSigs()
-            self.processEscrowDuplicitous()
+            for pre in pres:
+                self.processEscrowPartialWigs(pre=pre)
+                self.processEscrowPartialSigs(pre=pre)
+                self.processEscrowDuplicitous(pre=pre)
             self.processQueryNotFound()
+            done = True
 
         except Exception as ex:  # log diagnostics errors etc
             if logger.isEnabledFor(logging.DEBUG):
@@ -5338,7 +5737,14 @@ class Kevery:
                 logger.error("Kevery escrow process error: %s", ex.args[0])
             raise ex
 
-    def processEscrowOutOfOrders(self):
+        finally:
+            self.escrowing = False
+            self.expired = None
+            if not done:  # retry woken prefixes and any sweep on next pass
+                self.wakes.update(woke)
+                self.swept = swept
+
+    def processEscrowOutOfOrders(self, pre=None):
         """
         Process events escrowed by Kever that are recieved out-of-order.
         An event is out of order if its prior event has not been accepted into its KEL.
@@ -5374,11 +5780,18 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pre (str | None): qb64 identifier prefix to restrict processing
+                to escrows of pre. None means process all escrows.
         """
 
-        key = ekey = b''  # both start same. when not same means escrows found
+        top = pre.encode("utf-8") + b'.' if pre else b''  # snKey prefix
+        key = ekey = top  # both start same. when not same means escrows found
+        expired = self.expiredEscrows("ooes", self.TimeoutOOE, self.db.getOoeItemIter,
+                                      self.db.getOoes)
         while True:  # break when done
-            for ekey, edig in self.db.getOoeItemIter(key=key):
+            for ekey, edig in dbing.detach(self.db.getOoeItemIter(key=key)):
                 try:
                     pre, sn = splitSnKey(ekey)  # get pre and sn from escrow item
                     dgkey = dgKey(pre, bytes(edig))
@@ -5398,10 +5811,10 @@ class Kevery:
                                               "at dig = {}.".format(bytes(edig)))
 
                     # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
+                    if (keys := expired.get((pre, sn, bytes(edig)))) is not None:
                         # escrow stale so raise ValidationError which unescrows below
+                        self.db.etms.rem(keys=keys)
+                        Escrows.inc("out_of_order", "timeout")
                         logger.info("Kevery unescrow error: Stale event escrow "
                                     " at dig = %s", bytes(edig))
 
@@ -5454,11 +5867,13 @@ class Kevery:
                     # No error at all means processed successfully so also unescrow.
 
                 except OutOfOrderError as ex:
+                    Escrows.inc("out_of_order", "miss")
                     # still waiting on missing prior event to validate
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.exception("Kevery unescrow failed: %s", ex.args[0])
 
                 except Exception as ex:  # log diagnostics errors etc
+                    Escrows.inc("out_of_order", "drop")
                     # error other than out of order so remove from OO escrow
                     self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
                     if logger.isEnabledFor(logging.DEBUG):
@@ -5467,6 +5882,7 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    Escrows.inc("out_of_order", "hit")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -5480,7 +5896,7 @@ class Kevery:
             key = ekey  # setup next while iteration, with key after ekey
 
 
-    def processEscrowPartialSigs(self):
+    def processEscrowPartialSigs(self, pre=None):
         """
         Process events escrowed by Kever that were only partially fulfilled,
         either due to missing signatures or missing dependent events like a
@@ -5513,11 +5929,18 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pre (str | None): qb64 identifier prefix to restrict processing
+                to escrows of pre. None means process all escrows.
         """
 
         #key = ekey = b''  # both start same. when not same means escrows found
         #while True:  # break when done
-        for ekey, edig in self.db.getPseItemIter(key=b''):
+        top = pre.encode("utf-8") + b'.' if pre else b''  # snKey prefix
+        expired = self.expiredEscrows("pses", self.TimeoutPSE, self.db.getPseItemIter,
+                                      self.db.getPses)
+        for ekey, edig in dbing.detach(self.db.getPseItemIter(key=top)):
             eserder = None
             try:
                 pre, sn = splitSnKey(ekey)  # get pre and sn from escrow item
@@ -5538,10 +5961,10 @@ class Kevery:
                                           "at dig = {}.".format(bytes(edig)))
 
                 # do date math here and discard if stale nowIso8601() bytes
-                dtnow = helping.nowUTC()
-                dte = helping.fromIso8601(bytes(dtb))
-                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPSE):
+                if (keys := expired.get((pre, sn, bytes(edig)))) is not None:
                     # escrow stale so raise ValidationError which unescrows below
+                    self.db.etms.rem(keys=keys)
+                    Escrows.inc("partial_sigs", "timeout")
                     logger.info("Kevery unescrow error: Stale event escrow "
                                 " at dig = %s", bytes(edig))
 
@@ -5619,12 +6042,14 @@ class Kevery:
                 # No error at all means processed successfully so also unescrow.
 
             except MissingSignatureError  as ex:  # MissingDelegationError)
+                Escrows.inc("partial_sigs", "miss")
                 # still waiting on missing sigs or missing seal to validate
                 # processEvent idempotently reescrowed
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.exception("Kevery unescrow failed: %s", ex.args[0])
 
             except Exception as ex:  # log diagnostics errors etc
+                Escrows.inc("partial_sigs", "drop")
                 # error other than waiting on sigs  so remove from escrow
                 self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
                 #self.db.udes.rem(keys=dgkey)  # leave here since could PartialDelegationEscrow
@@ -5638,6 +6063,7 @@ class Kevery:
                     logger.error("Kevery unescrowed: %s", ex.args[0])
 
             else:  # unescrow succeeded, remove from escrow
+                Escrows.inc("partial_sigs", "hit")
                 # We don't remove all escrows at pre,sn because some might be
                 # duplicitous so we process remaining escrows in spite of found
                 # valid event escrow.
@@ -5655,7 +6081,7 @@ class Kevery:
                 #break
             #key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowPartialWigs(self):
+    def processEscrowPartialWigs(self, pre=None):
         """
         Process events escrowed by Kever that were only partially fulfilled
         due to missing signatures from witnesses. Events only make into this
@@ -5690,8 +6116,15 @@ class Kevery:
                         Get and Attach Witness Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pre (str | None): qb64 identifier prefix to restrict processing
+                to escrows of pre. None means process all escrows.
         """
-        for ekey, edig in self.db.getPweItemIter(key=b''):
+        top = pre.encode("utf-8") + b'.' if pre else b''  # snKey prefix
+        expired = self.expiredEscrows("pwes", self.TimeoutPWE, self.db.getPweItemIter,
+                                      self.db.getPwes)
+        for ekey, edig in dbing.detach(self.db.getPweItemIter(key=top)):
             try:
                 pre, sn = splitSnKey(ekey)  # get pre and sn from escrow item
                 dgkey = dgKey(pre, bytes(edig))
@@ -5711,10 +6144,10 @@ class Kevery:
                                           "at dig = {}.".format(bytes(edig)))
 
                 # do date math here and discard if stale nowIso8601() bytes
-                dtnow = helping.nowUTC()
-                dte = helping.fromIso8601(bytes(dtb))
-                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPWE):
+                if (keys := expired.get((pre, sn, bytes(edig)))) is not None:
                     # escrow stale so raise ValidationError which unescrows below
+                    self.db.etms.rem(keys=keys)
+                    Escrows.inc("partial_wigs", "timeout")
                     logger.info("Kevery unescrow error: Stale event escrow "
                                 " at dig = %s", bytes(edig))
 
@@ -5802,12 +6235,14 @@ class Kevery:
                 # partially witnessed escrow unless they had already validated
 
             except MissingWitnessSignatureError as ex:  # MissingDelegationError
+                Escrows.inc("partial_wigs", "miss")
                 # still waiting on missing witness sigs or delegation
                 # processEvent idempotently reescrowed
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.exception("Kevery unescrow failed: %s", ex.args[0])
 
             except Exception as ex:  # log diagnostics errors etc
+                Escrows.inc("partial_wigs", "drop")
                 # error other than waiting on wigs so remove from escrow
                 self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
                 #self.db.udes.rem(keys=dgkey)  # leave here since could PartialDelegationEscrow
@@ -5817,6 +6252,7 @@ class Kevery:
                     logger.error("Kevery unescrowed: %s", ex.args[0])
 
             else:  # unescrow succeeded, remove from escrow
+                Escrows.inc("partial_wigs", "hit")
                 # We don't remove all escrows at pre,sn because some might be
                 # duplicitous so we process remaining escrows in spite of found
                 # valid event escrow.
@@ -5854,7 +6290,7 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
-        for (epre,), esn, edig in self.db.pdes.getOnItemIter(keys=b''):
+        for (epre,), esn, edig in dbing.detach(self.db.pdes.getOnItemIter(keys=b'')):
             try:
                 #pre, sn = splitSnKey(ekey)  # get pre and sn from escrow item
                 dgkey = dgKey(epre, edig)
@@ -5878,6 +6314,7 @@ class Kevery:
                 dte = helping.fromIso8601(bytes(dtb))
                 if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPWE):
                     # escrow stale so raise ValidationError which unescrows below
+                    Escrows.inc("partial_dels", "timeout")
                     logger.info("Kevery unescrow error: Stale event escrow "
                                 " at dig = %s", bytes(edig))
 
@@ -5968,12 +6405,14 @@ class Kevery:
                 # partially witnessed escrow unless they had already validated
 
             except MissingDelegationError as ex:
+                Escrows.inc("partial_dels", "miss")
                 # still waiting on missing delegation source seal
                 # processEvent idempotently reescrowed
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.exception("Kevery unescrow failed: %s", ex.args[0])
 
             except Exception as ex:  # log diagnostics errors etc
+                Escrows.inc("partial_dels", "drop")
                 # error other than waiting on sigs or seal so remove from escrow
                 # removes one event escrow at key val
                 self.db.pdes.remOn(keys=epre, on=esn, val=edig)  # event idx escrow
@@ -5984,6 +6423,7 @@ class Kevery:
                     logger.error("Kevery unescrowed: %s", ex.args[0])
 
             else:  # unescrow succeeded, remove from escrow
+                Escrows.inc("partial_dels", "hit")
                 # We don't remove all escrows at pre,sn because some might be
                 # duplicitous so we process remaining escrows in spite of found
                 # valid event escrow.
@@ -5995,7 +6435,7 @@ class Kevery:
                 logger.debug(f"event=\n{eserder.pretty()}\n")
 
 
-    def processEscrowUnverWitness(self):
+    def processEscrowUnverWitness(self, pre=None):
         """
         Process escrowed unverified event receipts from witness receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -6042,12 +6482,19 @@ class Kevery:
                         compare dig so same event
                         verify wigs via wigers
                         If successful then remove from escrow table
+
+        Parameters:
+            pre (str | None): qb64 identifier prefix to restrict processing
+                to escrows of pre. None means process all escrows.
         """
 
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
+        top = pre.encode("utf-8") + b'.' if pre else b''  # snKey prefix
+        key = ekey = top  # both start same. when not same means escrows found
+        expired = self.expiredEscrows("uwes", self.TimeoutUWE, self.db.getUweItemIter,
+                                      self.db.getUwes)
         while True:  # break when done
-            for ekey, ecouple in self.db.getUweItemIter(key=key):
+            for ekey, ecouple in dbing.detach(self.db.getUweItemIter(key=key)):
                 try:
                     pre, sn = splitSnKey(ekey)  # get pre and sn from escrow db key
 
@@ -6066,10 +6513,10 @@ class Kevery:
                                               "at dig = {}.".format(rdiger.qb64b))
 
                     # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutUWE):
+                    if (keys := expired.get((pre, sn, rdiger.qb64b))) is not None:
                         # escrow stale so raise ValidationError which unescrows below
+                        self.db.etms.rem(keys=keys)
+                        Escrows.inc("unver_witness", "timeout")
                         logger.info("Kevery unescrow error: Stale event escrow "
                                     " at dig = %s", rdiger.qb64b)
 
@@ -6092,12 +6539,14 @@ class Kevery:
                                                             "receipted evt at pre={}  sn={:x}".format(pre, sn))
 
                 except UnverifiedWitnessReceiptError as ex:
+                    Escrows.inc("unver_witness", "miss")
                     # still waiting on missing prior event to validate
                     # only happens if we process above
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
                         logger.exception("Kevery unescrow failed: %s", ex.args[0])
 
                 except Exception as ex:  # log diagnostics errors etc
+                    Escrows.inc("unver_witness", "drop")
                     # error other than out of order so remove from OO escrow
                     self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
@@ -6106,6 +6555,7 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    Escrows.inc("unver_witness", "hit")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -6117,7 +6567,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowUnverNonTrans(self):
+    def processEscrowUnverNonTrans(self, pre=None):
         """
         Process escrowed unverified event receipts from nontrans receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -6162,12 +6612,19 @@ class Kevery:
                         compare dig so same event
                         verify sigs via cigars
                         If successful then remove from escrow table
+
+        Parameters:
+            pre (str | None): qb64 identifier prefix to restrict processing
+                to escrows of pre. None means process all escrows.
         """
 
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
+        top = pre.encode("utf-8") + b'.' if pre else b''  # snKey prefix
+        key = ekey = top  # both start same. when not same means escrows found
+        expired = self.expiredEscrows("ures", self.TimeoutURE, self.db.getUreItemIter,
+                                      self.db.getUres)
         while True:  # break when done
-            for ekey, etriplet in self.db.getUreItemIter(key=key):
+            for ekey, etriplet in dbing.detach(self.db.getUreItemIter(key=key)):
                 try:
                     pre, sn = splitSnKey(ekey)  # get pre and sn from escrow item
                     rsaider, sprefixer, cigar = deReceiptTriple(etriplet)
@@ -6184,10 +6641,10 @@ class Kevery:
                                               "at dig = {}.".format(rsaider.qb64b))
 
                     # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutURE):
+                    if (keys := expired.get((pre, sn, rsaider.qb64b))) is not None:
                         # escrow stale so raise ValidationError which unescrows below
+                        self.db.etms.rem(keys=keys)
+                        Escrows.inc("unver_nontrans", "timeout")
                         logger.info("Kevery unescrow error: Stale event escrow "
                                     " at dig = %s", rsaider.qb64b)
 
@@ -6263,12 +6720,14 @@ class Kevery:
 
 
                 except UnverifiedReceiptError as ex:
+                    Escrows.inc("unver_nontrans", "miss")
                     # still waiting on missing prior event to validate
                     # only happens if we process above
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
                         logger.exception("Kevery unescrow failed: %s", ex.args[0])
 
                 except Exception as ex:  # log diagnostics errors etc
+                    Escrows.inc("unver_nontrans", "drop")
                     # error other than out of order so remove from OO escrow
                     self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
@@ -6277,6 +6736,7 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    Escrows.inc("unver_nontrans", "hit")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -6311,7 +6771,7 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
-        for (pre, sn), dig in self.db.delegables.getItemIter():
+        for (pre, sn), dig in dbing.detach(self.db.delegables.getItemIter()):
             try:
                 edig = dig.encode("utf-8")
                 dgkey = dgKey(pre.encode("utf-8"), edig)
@@ -6335,6 +6795,7 @@ class Kevery:
                 dte = helping.fromIso8601(bytes(dtb))
                 if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
                     # escrow stale so raise ValidationError which unescrows below
+                    Escrows.inc("delegables", "timeout")
                     logger.info("Kevery unescrow error: Stale event escrow "
                                 " at dig = %s", bytes(edig))
 
@@ -6383,11 +6844,13 @@ class Kevery:
                     raise MissingDelegableApprovalError("No delegation seal found for event.")
 
             except MissingDelegableApprovalError as ex:
+                Escrows.inc("delegables", "miss")
                 # still waiting on missing delegation approval
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.exception("Kevery unescrow failed: %s", ex.args[0])
 
             except Exception as ex:  # log diagnostics errors etc
+                Escrows.inc("delegables", "drop")
                 # error other than out of order so remove from OO escrow
                 self.db.delegables.rem(keys=(pre, sn,), val=edig)  # removes one escrow at key val
                 if logger.isEnabledFor(logging.DEBUG):
@@ -6396,6 +6859,7 @@ class Kevery:
                     logger.error("Kevery unescrowed: %s", ex.args[0])
 
             else:  # unescrow succeeded, remove from escrow
+                Escrows.inc("delegables", "hit")
                 # We don't remove all escrows at pre,sn because some might be
                 # duplicitous so we process remaining escrows in spite of found
                 # valid event escrow.
@@ -6433,7 +6897,7 @@ class Kevery:
         pre = b''
         sn = 0
         while True:  # break when done
-            for (pre, said), edig in self.db.qnfs.getItemIter(keys=key):
+            for (pre, said), edig in dbing.detach(self.db.qnfs.getItemIter(keys=key)):
                 try:
                     # check date if expired then remove escrow.
                     dgkey = dgKey(pre.encode("utf-8"), edig.encode("utf-8"))
@@ -6451,6 +6915,7 @@ class Kevery:
                     dte = helping.fromIso8601(bytes(dtb))
                     if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutQNF):
                         # escrow stale so raise ValidationError which unescrows below
+                        Escrows.inc("query_not_found", "timeout")
                         logger.info("Kevery unescrow error: Stale qry event escrow "
                                     " at dig = %s", bytes(edig))
 
@@ -6499,11 +6964,13 @@ class Kevery:
                     self.processQuery(serder=eserder, source=source, sigers=sigers, cigars=cigars)
 
                 except QueryNotFoundError as ex:
+                    Escrows.inc("query_not_found", "miss")
                     # still waiting on missing prior event to validate
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.exception("Kevery unescrow failed: %s", ex.args[0])
 
                 except Exception as ex:  # log diagnostics errors etc
+                    Escrows.inc("query_not_found", "drop")
                     # error other than out of order so remove from OO escrow
                     self.db.qnfs.rem(keys=(pre, said), val=edig)  # removes one escrow at key val
                     if logger.isEnabledFor(logging.DEBUG):
@@ -6511,6 +6978,7 @@ class Kevery:
                     else:
                         logger.error("Kevery unescrowed: %s", ex.args[0])
                 else:  # unescrow succeeded, remove from escrow
+                    Escrows.inc("query_not_found", "hit")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -6552,7 +7020,7 @@ class Kevery:
         # snKey(pre,sn) where pre is controller and sn is event sequence number
         # compare dig to rdiger derived from receipt's dig of receipted event
         found = False
-        for dig in self.db.getPwesIter(key=snKey(pre, sn)):  # search entries
+        for dig in dbing.detach(self.db.getPwesIter(key=snKey(pre, sn))):  # search entries
             dig = bytes(dig)  # database dig of receipted event
             # get the escrowed event using database dig in .Pwes
             serder = serdering.SerderKERI(raw=bytes(self.db.getEvt(dgKey(pre, dig))))  # receipted event
@@ -6632,7 +7100,7 @@ class Kevery:
 
         return found
 
-    def processEscrowUnverTrans(self):
+    def processEscrowUnverTrans(self, pre=None):
         """
         Process event receipts from transferable identifiers (validators)
         escrowed by Kever that are unverified.
@@ -6675,12 +7143,19 @@ class Kevery:
                         compare dig so same event
                         verify sigs via sigers
                         If successful then remove from escrow table
+
+        Parameters:
+            pre (str | None): qb64 identifier prefix to restrict processing
+                to escrows of pre. None means process all escrows.
         """
 
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
+        top = pre.encode("utf-8") + b'.' if pre else b''  # snKey prefix
+        key = ekey = top  # both start same. when not same means escrows found
+        expired = self.expiredEscrows("vres", self.TimeoutVRE, self.db.getVreItemIter,
+                                      self.db.getVres)
         while True:  # break when done
-            for ekey, equinlet in self.db.getVreItemIter(key=key):
+            for ekey, equinlet in dbing.detach(self.db.getVreItemIter(key=key)):
                 try:
                     pre, sn = splitSnKey(ekey)  # get pre and sn from escrow item
                     esaider, sprefixer, sseqner, ssaider, siger = deTransReceiptQuintuple(equinlet)
@@ -6696,10 +7171,10 @@ class Kevery:
                                               "at dig = {}.".format(esaider.qb64b))
 
                     # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutVRE):
+                    if (keys := expired.get((pre, sn, esaider.qb64b))) is not None:
                         # escrow stale so raise ValidationError which unescrows below
+                        self.db.etms.rem(keys=keys)
+                        Escrows.inc("unver_trans", "timeout")
                         logger.info("Kevery unescrow error: Stale event escrow "
                                     " at dig = %s", esaider.qb64b)
 
@@ -6787,12 +7262,14 @@ class Kevery:
 
 
                 except UnverifiedTransferableReceiptError as ex:
+                    Escrows.inc("unver_trans", "miss")
                     # still waiting on missing prior event to validate
                     # only happens if we process above
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
                         logger.exception("Kevery unescrow failed: %s", ex.args[0])
 
                 except Exception as ex:  # log diagnostics errors etc
+                    Escrows.inc("unver_trans", "drop")
                     # error other than out of order so remove from OO escrow
                     self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
@@ -6801,6 +7278,7 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    Escrows.inc("unver_trans", "hit")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -6812,7 +7290,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowDuplicitous(self):
+    def processEscrowDuplicitous(self, pre=None):
         """
         Process events escrowed by Kever that are likely duplicitous.
         An event is likely duplicitous if a different version of event already
@@ -6847,10 +7325,17 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pre (str | None): qb64 identifier prefix to restrict processing
+                to escrows of pre. None means process all escrows.
         """
-        key = ekey = b''  # both start same. when not same means escrows found
+        top = pre.encode("utf-8") + b'.' if pre else b''  # snKey prefix
+        key = ekey = top  # both start same. when not same means escrows found
+        expired = self.expiredEscrows("ldes", self.TimeoutLDE, self.db.getLdeItemIter,
+                                      self.db.getLdes)
         while True:  # break when done
-            for ekey, edig in self.db.getLdeItemIter(key=key):
+            for ekey, edig in dbing.detach(self.db.getLdeItemIter(key=key)):
                 try:
                     pre, sn = splitSnKey(ekey)  # get pre and sn from escrow item
                     dgkey = dgKey(pre, bytes(edig))
@@ -6870,10 +7355,10 @@ class Kevery:
                                               "at dig = {}.".format(bytes(edig)))
 
                     # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutLDE):
+                    if (keys := expired.get((pre, sn, bytes(edig)))) is not None:
                         # escrow stale so raise ValidationError which unescrows below
+                        self.db.etms.rem(keys=keys)
+                        Escrows.inc("duplicitous", "timeout")
                         logger.info("Kevery unescrow error: Stale event escrow "
                                     " at dig = %s", bytes(edig))
 
@@ -6920,11 +7405,13 @@ class Kevery:
                     # No error at all means processed successfully so also unescrow.
 
                 except LikelyDuplicitousError as ex:
+                    Escrows.inc("duplicitous", "miss")
                     # still can't determine if duplicitous
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.exception("Kevery unescrow failed: %s", ex.args[0])
 
                 except Exception as ex:  # log diagnostics errors etc
+                    Escrows.inc("duplicitous", "drop")
                     # error other than likely duplicitous so remove from escrow
                     self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
                     if logger.isEnabledFor(logging.DEBUG):
@@ -6933,6 +7420,7 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    Escrows.inc("duplicitous", "hit")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
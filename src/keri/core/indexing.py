@@ -25,7 +25,7 @@ from ..kering import (EmptyMaterialError, RawMaterialError, SoftMaterialError,
 
 from ..help import helping
 from ..help.helping import (sceil, intToB64, b64ToInt,
-                            codeB64ToB2, codeB2ToB64, nabSextets)
+                            codeB64ToB2, codeB2ToB64, Reb64, nabSextets)
 
 
 @dataclass(frozen=True)
@@ -186,6 +186,9 @@ class Indexer:
         ._raw (bytes): value for .raw property
         ._index (int): value for .index property
         ._ondex (int): value for .ondex property
+        ._qb64b (bytes | None): memoized value for .qb64b property
+        ._qb64 (str | None): memoized value for .qb64 property
+        ._qb2 (bytes | None): memoized value for .qb2 property
         ._infil is method to compute fully qualified Base64 from .raw and .code
         ._binfil is method to compute fully qualified Base2 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
@@ -230,6 +233,12 @@ class Indexer:
     Codes = asdict(IdrDex)  # map code name to code
     Names = {val : key for key, val in Codes.items()} # invert map code to code name
 
+    # Primitives are immutable once created so their encodings are memoized
+    # lazily on first access or kept from the parsed stream slice
+    _qb64b = None
+    _qb64 = None
+    _qb2 = None
+
 
 
     def __init__(self, raw=None, code=IdrDex.Ed25519_Sig, index=0, ondex=None,
@@ -386,8 +395,11 @@ class Indexer:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Memoized in ._qb64b on first access
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
     @property
     def qb64(self):
@@ -395,16 +407,22 @@ class Indexer:
         Property qb64:
         Returns Fully Qualified Base64 Version
         Assumes self.raw and self.code are correctly populated
+        Memoized in ._qb64 on first access
         """
-        return self.qb64b.decode("utf-8")
+        if self._qb64 is None:
+            self._qb64 = self.qb64b.decode("utf-8")
+        return self._qb64
 
     @property
     def qb2(self):
         """
         Property qb2:
         Returns Fully Qualified Binary Version Bytes
+        Memoized in ._qb2 on first access
         """
-        return self._binfil()
+        if self._qb2 is None:
+            self._qb2 = self._binfil()
+        return self._qb2
 
     def _infil(self):
         """
@@ -641,6 +659,11 @@ class Indexer:
         self._index = index
         self._ondex = ondex
         self._raw = raw  # must be bytes for crpto opts and immutable not bytearray
+        # keep extracted slice as .qb64b when canonical so no re-encoding
+        qb64b = bytes(qb64b)
+        self._qb64b = qb64b if Reb64.match(qb64b) else None
+        self._qb64 = None
+        self._qb2 = None
 
 
 
@@ -746,6 +769,9 @@ class Indexer:
         self._index = index
         self._ondex = ondex
         self._raw = bytes(raw)  # must be bytes for crypto ops and not bytearray mutable
+        self._qb64b = None
+        self._qb64 = None
+        self._qb2 = bytes(qb2)  # keep extracted slice as .qb2 no re-encoding
 
 
 class Siger(Indexer):
@@ -14,11 +14,16 @@ from .counting import Counter, Codens, CtrDex_1_0
 from .indexing import (Siger, )
 from . import serdering
 from .. import help
+from ..help import metering
 from .. import kering
 from ..kering import Colds, sniff, Vrsn_1_0, Vrsn_2_0
 
 logger = help.ogler.getLogger()
 
+Messages = metering.registry.counter("keri_parsed_messages_total",
+                                     "Messages parsed and dispatched by protocol and ilk",
+                                     ("proto", "ilk"))
+
 
 class Parser:
     """
@@ -35,6 +40,13 @@ class Parser:
 
     Has the following public attributes and properties:
 
+    Class Attributes:
+        Chunk (int): max number of bytes at a time that .allParsator copies
+            into its working buffer from a fixed stream that is not a bytearray
+            such as bytes, memoryview, or mmap. Working buffer is topped up to
+            Chunk bytes at each message boundary and on each shortage so a
+            large fixed stream is never copied whole.
+
     Attributes:
         ims (bytearray): incoming message stream
         framed (bool): True means stream is packet framed
@@ -49,6 +61,7 @@ class Parser:
                          False means event source is remote (unprotected) for validation
 
     """
+    Chunk = 1 << 22  # 4 MiB
 
     def __init__(self, ims=None, framed=True, pipeline=False, kvy=None,
                  tvy=None, exc=None, rvy=None, vry=None, local=False):
@@ -389,7 +402,10 @@ class Parser:
         Parameters:
             ims is bytearray of incoming message stream. May contain one or more
                 sets each of a serialized message with attached cryptographic
-                material such as signatures or receipts.
+                material such as signatures or receipts. When not bytearray,
+                such as bytes, memoryview, or mmap, then ims is fixed and is
+                read through a memoryview in .Chunk sized pieces instead of
+                being copied whole.
 
             framed is Boolean, True means ims contains only one frame of msg plus
                 counted attachments instead of stream with multiple messages
@@ -411,11 +427,14 @@ class Parser:
             Attachments must all have counters so know if txt or bny format for
             attachments. So even when framed==True must still have counters.
         """
+        view = None  # zero copy view of fixed stream
         if ims is not None:  # needs bytearray not bytes since deletes as processes
             if not isinstance(ims, bytearray):
-                ims = bytearray(ims)  # so make bytearray copy
+                view = memoryview(ims).cast('B')  # fixed so feed from view
+                ims = bytearray()  # working buffer
         else:
             ims = self.ims  # use instance attribute by default
+        feeder = self._feeder(ims=ims, view=view)
 
         framed = framed if framed is not None else self.framed
         pipeline = pipeline if pipeline is not None else self.pipeline
@@ -427,18 +446,27 @@ class Parser:
         local = local if local is not None else self.local
         local = True if local else False
 
+        next(feeder)  # top up working buffer at message boundary
         while ims:  # only process until ims empty
             try:
-                done = yield from self.msgParsator(ims=ims,
-                                                   framed=framed,
-                                                   pipeline=pipeline,
-                                                   kvy=kvy,
-                                                   tvy=tvy,
-                                                   exc=exc,
-                                                   rvy=rvy,
-                                                   vry=vry,
-                                                   local=local,
-                                                   gvrsn=gvrsn)
+                parsator = self.msgParsator(ims=ims,
+                                            framed=framed,
+                                            pipeline=pipeline,
+                                            kvy=kvy,
+                                            tvy=tvy,
+                                            exc=exc,
+                                            rvy=rvy,
+                                            vry=vry,
+                                            local=local,
+                                            gvrsn=gvrsn,
+                                            feed=lambda: feeder.send(True))
+                while True:
+                    try:
+                        next(parsator)
+                    except StopIteration:
+                        break
+                    if not feeder.send(True):  # shortage so feed more if any
+                        yield  # otherwise wait
 
             except kering.SizedGroupError as ex:  # error inside sized group
                 # processOneIter already flushed group so do not flush stream
@@ -453,6 +481,8 @@ class Parser:
                 else:
                     logger.error("Parser msg extraction error: %s", ex.args[0])
                 del ims[:]  # delete rest of stream to force cold restart
+                feeder.close()  # including rest of fixed stream
+                feeder = self._feeder(ims=ims)
 
             except (kering.ValidationError, Exception) as ex:  # non Extraction Error
                 # Non extraction errors happen after successfully extracted from stream
@@ -461,11 +491,38 @@ class Parser:
                     logger.exception("Parser msg non-extraction error: %s", ex)
                 else:
                     logger.error("Parser msg non-extraction error: %s", ex)
+            next(feeder)  # top up working buffer at message boundary
             yield
 
         return True
 
 
+    def _feeder(self, ims, view=None):
+        """
+        Returns generator that copies the next .Chunk bytes from view of fixed
+        stream into working buffer ims each time it is advanced, but only while
+        ims holds less than .Chunk bytes unless sent True to force feed on
+        shortage. This keeps memory bounded and avoids copying a large fixed
+        stream such as an mmap whole. Yields True when it fed bytes and False
+        otherwise.
+
+        Parameters:
+            ims (bytearray): working buffer
+            view (memoryview | None): view of fixed stream to feed from.
+                None means nothing to feed.
+        """
+        offset = 0
+        size = len(view) if view is not None else 0
+        force = False
+        while True:
+            if offset < size and (force or len(ims) < self.Chunk):
+                ims.extend(view[offset:offset + self.Chunk])
+                offset += self.Chunk
+                force = yield True
+            else:
+                force = yield False
+
+
     def onceParsator(self, ims=None, framed=None, pipeline=None, kvy=None,
                      tvy=None, exc=None, rvy=None, vry=None, local=None):
         """
@@ -643,7 +700,7 @@ class Parser:
 
     def msgParsator(self, ims=None, framed=True, pipeline=False,
                     kvy=None, tvy=None, exc=None, rvy=None, vry=None,
-                    local=None, gvrsn=Vrsn_1_0):
+                    local=None, gvrsn=Vrsn_1_0, feed=None):
         """
         Returns generator that upon each iteration extracts and parses msg
         with attached crypto material (signature etc) from incoming message
@@ -674,6 +731,10 @@ class Parser:
                           False means event source is remote (unprotected) for validation
                           None means use default .local
             gvrsn (Versionage): instance of genera version of CESR code tables
+            feed (Callable | None): tops up ims from rest of fixed stream and
+                returns True if it fed bytes. Called when framed ims is empty
+                so frame ends only at end of fixed stream not at end of
+                working buffer. None means ims is whole stream
 
         Logic:
             Currently only support couters on attachments not on combined or
@@ -977,7 +1038,7 @@ class Parser:
                     elif framed:
                         # because not all in one pipeline group, each attachment
                         # group may switch stream state txt or bny
-                        if not ims:  # end of frame
+                        if not ims and not (feed and feed()):  # end of frame
                             break
                         cold = sniff(ims)
                         if cold == Colds.msg:  # new message so attachments done
@@ -999,6 +1060,7 @@ class Parser:
                                              "attachment group of size={}.".format(pags))
             raise  # no pipeline group so can't preflush, must flush stream
 
+        Messages.inc(serder.proto, serder.ilk)
         if isinstance(serder, serdering.SerderKERI):
             ilk = serder.ilk  # dispatch abased on ilk
 
@@ -6,6 +6,7 @@ self-addressing and schema support
 """
 
 import json
+from collections import OrderedDict
 
 import cbor2 as cbor
 import jsonschema
@@ -19,6 +20,125 @@ from ..kering import ValidationError, DeserializeError
 logger = help.ogler.getLogger()
 
 
+class ValidatorCache:
+    """ Bounded least recently used (LRU) cache of compiled JSON Schema validators
+    and of resolved schema keyed by schema SAID
+
+    Building a validator checks the schema against its metaschema and creates
+    its reference resolver so validating many documents against the same
+    schema should reuse the compiled validator. Entries are valid for as long
+    as the schema at their SAID is unchanged so the owner of the schema store
+    must call .discard when a schema is pinned or removed.
+
+    Attributes:
+        size (int): max entries of each of .validators and .seds
+        validators (OrderedDict): compiled validators keyed by SAID least
+            recently used first
+        seds (OrderedDict): resolved schema dicts keyed by SAID least recently
+            used first
+        hits (int): count of validator lookups found in cache
+        misses (int): count of validator lookups compiled
+
+    """
+
+    def __init__(self, size=128):
+        """ Create empty cache
+
+        Parameters:
+            size (int): max entries of each of compiled validators and resolved schema
+
+        """
+        self.size = size
+        self.validators = OrderedDict()
+        self.seds = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _lookup(od, key):
+        if key in od:
+            od.move_to_end(key)
+            return od[key]
+        return None
+
+    def _store(self, od, key, val):
+        od[key] = val
+        od.move_to_end(key)
+        while len(od) > self.size:
+            od.popitem(last=False)
+        return val
+
+    def validator(self, schema, resolver=None, resolve=None):
+        """ Returns compiled validator of schema from cache or compiles and caches it
+
+        Schema without a SAID are compiled but not cached.
+
+        Parameters:
+            schema (dict): JSON Schema with SAID in its $id field
+            resolver (Optional(RefResolver)): resolver of $ref references of compiled validator
+            resolve (Optional(Callable)): returns resolver of $ref references of
+                compiled validator. Called only on a cache miss so resolver is
+                not built when validator is cached
+
+        Raises:
+            jsonschema.exceptions.SchemaError: when schema is not valid against its metaschema
+
+        """
+        said = schema.get(JSONSchema.id_) if isinstance(schema, dict) else None
+        if said and (validator := self._lookup(self.validators, said)) is not None:
+            self.hits += 1
+            return validator
+
+        self.misses += 1
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        if resolver is None and resolve is not None:
+            resolver = resolve()
+        kwargs = dict(resolver=resolver) if resolver is not None else dict()
+        validator = cls(schema, **kwargs)
+        if said:
+            self._store(self.validators, said, validator)
+        return validator
+
+    def sed(self, said, load):
+        """ Returns resolved schema dict of said from cache or from load and caches it
+
+        Parameters:
+            said (str): SAID of schema
+            load (Callable): returns schema dict of said or None when not found.
+                             None is not cached.
+
+        """
+        if (sed := self._lookup(self.seds, said)) is not None:
+            return sed
+        if (sed := load(said)) is None:
+            return None
+        return self._store(self.seds, said, sed)
+
+    def discard(self, said):
+        """ Removes entries of said so they are rebuilt on next use
+
+        Compiled validators cache the schema they resolved through $ref so
+        all compiled validators are removed when said was resolved.
+
+        Parameters:
+            said (str): SAID of schema
+
+        """
+        self.validators.pop(said, None)
+        if self.seds.pop(said, None) is not None:
+            self.validators.clear()
+
+    def clear(self):
+        """ Removes all entries """
+        self.validators.clear()
+        self.seds.clear()
+
+
+# compiled validators of schema validated without a CacheResolver
+Validators = ValidatorCache()
+
+
 class CacheResolver:
     """ Sample jsonschema resolver for loading schema $ref references from a local hash.
 
@@ -33,6 +153,11 @@ class CacheResolver:
         """
         self.db = db
 
+    @property
+    def cache(self):
+        """ Returns ValidatorCache of schema store of .db """
+        return self.db.schema.cache
+
     def add(self, key, schema):
         """ Add schema to cache for resolution
 
@@ -52,6 +177,20 @@ class CacheResolver:
             return None
         return schemer.raw
 
+    def schemer(self, said):
+        """ Returns Schemer of said from .db whose validation uses this resolver
+        and the compiled validators of .cache. None when said is not in .db
+
+        Parameters:
+            said (str): SAID of schema
+
+        """
+        schemer = self.db.schema.get(said)
+        if schemer is None:
+            return None
+        schemer.typ = JSONSchema(resolver=self)
+        return schemer
+
     def handler(self, uri):
         """ Handler provided to jsonschema for cache resolution
 
@@ -64,7 +203,11 @@ class CacheResolver:
         except ValueError:
             key = uri
 
-        schemer = self.db.schema.get(key)
+        return self.cache.sed(key, self._load)
+
+    def _load(self, said):
+        """ Returns schema dict of said from .db or None """
+        schemer = self.db.schema.get(said)
         if not schemer:
             return None
 
@@ -212,6 +355,9 @@ class JSONSchema:
     def verify_json(self, schema=b'', raw=b''):
         """ Verify the raw content against the schema for JSON that conforms to the schema
 
+        Validators are compiled once per schema SAID and cached in the cache of
+        .resolver when set else in the module cache Validators.
+
         Parameters:
             schema (bytes): is the schema use for validation
             raw (bytes): is JSON to validate against the Schema
@@ -224,10 +370,14 @@ class JSONSchema:
         """
         try:
             d = json.loads(raw)
-            kwargs = dict()
             if self.resolver is not None:
-                kwargs["resolver"] = self.resolver.resolver(scer=raw)
-            jsonschema.validate(instance=d, schema=schema, **kwargs)
+                validator = self.resolver.cache.validator(schema,
+                                                          resolve=lambda: self.resolver.resolver(scer=schema))
+            else:
+                validator = Validators.validator(schema)
+            error = jsonschema.exceptions.best_match(validator.iter_errors(d))
+            if error is not None:
+                raise error
         except jsonschema.exceptions.ValidationError as ex:
             raise kering.ValidationError(f'Credential validation exception: {ex}')
         except jsonschema.exceptions.SchemaError as ex:
@@ -5,12 +5,11 @@ keri.core.serdering module
 """
 import copy
 import json
+import re
 from collections import namedtuple
 from collections.abc import Mapping
 from dataclasses import dataclass, asdict, field
 
-import cbor2 as cbor
-import msgpack
 import pysodium
 import blake3
 import hashlib
@@ -33,7 +32,7 @@ from .. import help
 from ..help import helping
 
 
-from . import coring
+from . import coding, coring
 from .coring import (MtrDex, DigDex, PreDex, NonTransDex, PreNonDigDex,
                      Saids,  Digestage)
 from .coring import (Matter, Saider, Verfer, Diger, Number, Tholder, Tagger,
@@ -762,15 +761,19 @@ class Serder:
 
         # compute saidive digestive field values using raw from sized dummied sad
         raw = self.dumps(sad, kind=self.kind)  # serialize dummied sad copy
+        patched = None
+        if self.kind in (Kinds.json, Kinds.cbor, Kinds.mgpk):
+            patched = self._patch(raw, sad, saids)  # single pass when unambiguous
+
         for label, code in saids.items():
             if code in DigDex:  # subclass override if non digestive allowed
-                dig = Diger(ser=raw, code=code).qb64
+                dig = sad[label] if patched is not None else Diger(ser=raw, code=code).qb64
                 if dig != self._sad[label]:  # compare to original
                     raise ValidationError(f"Invalid said field '{label}' in sad"
                                           f" = {self._sad}, should be {dig}.")
                 sad[label] = dig
 
-        raw = self.dumps(sad, kind=self.kind)  # compute final raw
+        raw = patched if patched is not None else self.dumps(sad, kind=self.kind)  # compute final raw
 
         if raw != self.raw:
             raise ValidationError(f"Invalid round trip of {sad} != \n"
@@ -967,27 +970,30 @@ class Serder:
             raise SerializeError(f"Missing requires version string field 'v'"
                                           f" in sad = {sad}.")
 
+        raw = None
         if kind in (Kinds.json, Kinds.cbor, Kinds.mgpk):
             # this size of sad needs to be computed based on actual version string span
             # since not same for all versions
             sad['v'] = self.Dummy * self.Spans[vrsn]  # ensure span of vs is dummied MAXVERFULLSPAN
 
-            raw = self.dumps(sad, kind)  # get size of sad with fully dummied vs and saids
-            size = len(raw)
+            dummied = self.dumps(sad, kind)  # get size of sad with fully dummied vs and saids
+            size = len(dummied)
 
             # generate new version string with correct size
             vs = versify(protocol=proto, version=vrsn, kind=kind, size=size)
+            # single pass patch vs and saids into dummied raw when unambiguous
+            raw = self._patch(dummied, sad, _saids, vs=vs)
             sad["v"] = vs  # update version string in sad
             # now have correctly sized version string in sad
 
+        if raw is None:
+            # compute saidive digestive field values using raw from sized dummied sad
+            raw = self.dumps(sad, kind=kind, proto=proto, vrsn=vrsn)  # serialize sized dummied sad
+            for label, code in _saids.items():
+                if code in DigDex:  # subclass override if non digestive allowed
+                    sad[label] = Diger(ser=raw, code=code).qb64
 
-        # compute saidive digestive field values using raw from sized dummied sad
-        raw = self.dumps(sad, kind=kind, proto=proto, vrsn=vrsn)  # serialize sized dummied sad
-        for label, code in _saids.items():
-            if code in DigDex:  # subclass override if non digestive allowed
-                sad[label] = Diger(ser=raw, code=code).qb64
-
-        raw = self.dumps(sad, kind=kind, proto=proto, vrsn=vrsn)  # compute final raw
+            raw = self.dumps(sad, kind=kind, proto=proto, vrsn=vrsn)  # compute final raw
         if kind == Kinds.cesr:# cesr kind version string does not set size
             size = len(raw) # size of whole message
 
@@ -999,6 +1005,55 @@ class Serder:
         self._size = size
 
 
+    def _patch(self, raw, sad, saids, vs=None):
+        """Single pass saidification of raw that is serialization of sad whose
+        digestive said fields, and version string field 'v' when vs is provided,
+        have dummy values. Computes saids from raw with vs and patches them into
+        copy of raw in place of dummy values so sad is not serialized again.
+        Assigns computed saids to sad but not vs.
+
+        Dummy values are located as the runs of dummy chars in raw so raw must
+        have no other dummy chars. Otherwise patching is ambiguous.
+
+        Returns:
+            raw (bytes | None): saidified raw or None when dummy values can
+                not be unambiguously located in raw so sad must be serialized
+
+        Parameters:
+            raw (bytes): serialization of sad with dummy values
+            sad (dict): serializable attribute dict with dummy values
+            saids (dict): codes of said fields keyed by label
+            vs (str | None): version string for dummy 'v' field value
+                None means 'v' is not dummied
+        """
+        labels = [label for label in sad
+                  if (label == 'v' and vs is not None) or
+                     (label in saids and saids[label] in DigDex)]
+        runs = [match.span() for match in
+                re.finditer(re.escape(self.Dummy.encode()) + b'+', raw)]
+        if len(runs) != len(labels):  # stray dummy chars
+            return None
+
+        spans = dict(zip(labels, runs))
+        for label, (start, end) in spans.items():
+            if end - start != len(sad[label]):  # stray dummy chars adjoin
+                return None
+
+        buf = bytearray(raw)
+        if vs is not None:
+            start, end = spans.pop('v')
+            if end - start != len(vs):
+                return None
+            buf[start:end] = vs.encode()
+
+        ser = bytes(buf)  # sized dummied raw
+        for label, (start, end) in spans.items():
+            sad[label] = Diger(ser=ser, code=saids[label]).qb64
+            buf[start:end] = sad[label].encode()
+
+        return bytes(buf)
+
+
     def _inhale(self, raw, *, smellage=None):
         """Deserializes raw.
         Parses serilized event ser of serialization kind and assigns to
@@ -1031,6 +1086,9 @@ class Serder:
         else:  # not passed in so smell raw
             proto, vrsn, kind, size, gvrsn = smell(raw)
 
+        if len(raw) < size:  # partial message so need more bytes
+            raise ShortageError(f"Need {size - len(raw)} more raw bytes.")
+
         sad = self.loads(raw=raw, size=size, kind=kind)
         # ._gvrsn may be set in loads when CESR native deserialization provides _gvrsn
 
@@ -1066,26 +1124,12 @@ class Serder:
         Notes:
             loads of json uses str whereas loads of cbor and msgpack use bytes
         """
-        if kind == Kinds.json:
+        if kind in coding.Codecs:
             try:
-                sad = json.loads(raw[:size].decode("utf-8"))
+                sad = coding.loads(raw[:size], kind=kind)
             except Exception as ex:
-                raise DeserializeError(f"Error deserializing JSON: "
-                    f"{raw[:size].decode('utf-8')}") from ex
-
-        elif kind == Kinds.mgpk:
-            try:
-                sad = msgpack.loads(raw[:size])
-            except Exception as ex:
-                raise DeserializeError(f"Error deserializing MGPK: "
-                    f"{raw[:size].decode('utf-8')}") from ex
-
-        elif kind == Kinds.cbor:
-            try:
-                sad = cbor.loads(raw[:size])
-            except Exception as ex:
-                raise DeserializeError(f"Error deserializing CBOR: "
-                    f"{raw[:size].decode('utf-8')}") from ex
+                raise DeserializeError(f"Error deserializing {kind}: "
+                    f"{bytes(raw[:size]).decode('utf-8', 'replace')}") from ex
 
         else:
             raise DeserializeError(f"Invalid deserialization kind: {kind}")
@@ -1160,15 +1204,8 @@ class Serder:
         """
         sad = sad if sad is not None else self.sad
 
-        if kind == Kinds.json:
-            raw = json.dumps(sad, separators=(",", ":"),
-                             ensure_ascii=False).encode("utf-8")
-
-        elif kind == Kinds.mgpk:
-            raw = msgpack.dumps(sad)
-
-        elif kind == Kinds.cbor:
-            raw = cbor.dumps(sad)
+        if kind in coding.Codecs:  # JSON, MGPK, CBOR
+            raw = coding.dumps(sad, kind=kind)
 
         elif kind == Kinds.cesr:  # does not support list only dict
             raw = self._dumps(sad, proto=proto, vrsn=vrsn)
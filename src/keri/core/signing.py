@@ -4,6 +4,7 @@ keri.core.signing module
 
 Provides support Signer class
 """
+from concurrent.futures import FIRST_COMPLETED, wait
 from dataclasses import dataclass, astuple, asdict
 
 import pysodium
@@ -326,6 +327,25 @@ class Signer(Matter):
 
 
 
+def _stretchJob(job):
+    """
+    Returns bytes of raw seed stretched with argon2id from job.
+    Module level so picklable when dispatched to a process pool.
+
+    Parameters:
+        job (tuple): (size, path, salt, opslimit, memlimit) where size is
+            int number of bytes in seed, path is str of unique derivation chars,
+            salt is bytes raw salt, and opslimit and memlimit are argon2id limits
+    """
+    size, path, salt, opslimit, memlimit = job
+    return pysodium.crypto_pwhash(outlen=size,
+                                  passwd=path,
+                                  salt=salt,
+                                  opslimit=opslimit,
+                                  memlimit=memlimit,
+                                  alg=pysodium.crypto_pwhash_ALG_ARGON2ID13)
+
+
 class Salter(Matter):
     """
     Salter is Matter subclass to maintain random salt for secrets (private keys)
@@ -421,6 +441,19 @@ class Salter(Matter):
             temp is Boolean, True means use quick method to stretch salt
                     for testing only, Otherwise use time set by tier to stretch
         """
+        opslimit, memlimit = self.limits(tier=tier, temp=temp)
+        return _stretchJob((size, path, self.raw, opslimit, memlimit))
+
+    def limits(self, tier=None, temp=False):
+        """
+        Returns tuple (opslimit, memlimit) of argon2id stretch limits where
+        memlimit is bytes of memory used by each stretch.
+
+        Parameters:
+            tier (str): value from Tierage for security level of stretch
+            temp is Boolean, True means use quick method to stretch salt
+                    for testing only, Otherwise use time set by tier to stretch
+        """
         tier = tier if tier is not None else self.tier
 
         if temp:
@@ -439,14 +472,48 @@ class Salter(Matter):
             else:
                 raise ValueError("Unsupported security tier = {}.".format(tier))
 
-        # stretch algorithm is argon2id
-        seed = pysodium.crypto_pwhash(outlen=size,
-                                      passwd=path,
-                                      salt=self.raw,
-                                      opslimit=opslimit,
-                                      memlimit=memlimit,
-                                      alg=pysodium.crypto_pwhash_ALG_ARGON2ID13)
-        return (seed)
+        return (opslimit, memlimit)
+
+    def stretches(self, *, size=32, paths=(), tier=None, temp=False,
+                  pool=None, budget=0):
+        """
+        Returns list of (bytes) raw binary seeds one per path in paths each
+        identical to .stretch of that path.
+
+        When pool is provided the stretches run concurrently across the workers
+        of pool with at most budget // memlimit stretches in flight at once so
+        that the argon2id memory in use never exceeds budget. Otherwise
+        stretches serially in the calling thread.
+
+        Parameters:
+            size (int): number of bytes in each stretched seed
+            paths (Iterable): of str unique chars used in derivation of each seed
+            tier (str): value from Tierage for security level of stretch
+            temp is Boolean, True means use quick method to stretch salt
+                    for testing only, Otherwise use time set by tier to stretch
+            pool (Executor | None): concurrent.futures executor for parallel
+                stretching. None means stretch serially.
+            budget (int): max bytes of memory for concurrent stretches.
+                0 means bounded only by workers of pool. At least one stretch
+                is always in flight.
+        """
+        opslimit, memlimit = self.limits(tier=tier, temp=temp)
+        jobs = [(size, path, self.raw, opslimit, memlimit) for path in paths]
+        if pool is None or len(jobs) < 2:
+            return [_stretchJob(job) for job in jobs]
+
+        window = max(1, budget // memlimit) if budget > 0 else len(jobs)
+        seeds = [None] * len(jobs)
+        pending = {}
+        for i, job in enumerate(jobs):
+            if len(pending) >= window:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    seeds[pending.pop(future)] = future.result()
+            pending[pool.submit(_stretchJob, job)] = i
+        for future in wait(pending).done:
+            seeds[pending[future]] = future.result()
+        return seeds
 
     def signer(self, *, code=MtrDex.Ed25519_Seed, transferable=True, path="",
                tier=None, temp=False):
@@ -480,6 +547,38 @@ class Salter(Matter):
         """
         return [self.signer(path=f"{path}{i + start:x}", **kwa) for i in range(count)]
 
+    def pooledSigners(self, *, codes=(), paths=(), transferable=True, tier=None,
+                      temp=False, pool=None, budget=0):
+        """
+        Returns list of Signer instances one per (code, path) pair in zip of
+        codes and paths each identical to .signer of that code and path but
+        with the stretches run concurrently. See .stretches.
+
+        Parameters:
+            codes (Iterable): of str codes of secret crypto suite
+            paths (Iterable): of str unique chars used in derivation of each secret
+            transferable is Boolean, True means use transferace code for public key
+            tier is str Tierage security level
+            temp is Boolean, True means use quick method to stretch salt
+                    for testing only, Otherwise use more time to stretch
+            pool (Executor | None): executor for parallel stretching
+            budget (int): max bytes of memory for concurrent stretches
+        """
+        codes = list(codes)
+        paths = list(paths)
+        sizes = set(Matter._rawSize(code) for code in codes)
+        seeds = {}
+        for size in sizes:  # group by seed size since stretch size is per call
+            idxs = [i for i, code in enumerate(codes) if Matter._rawSize(code) == size]
+            for i, seed in zip(idxs, self.stretches(size=size,
+                                                    paths=[paths[i] for i in idxs],
+                                                    tier=tier, temp=temp,
+                                                    pool=pool, budget=budget)):
+                seeds[i] = seed
+
+        return [Signer(raw=seeds[i], code=code, transferable=transferable)
+                for i, code in enumerate(codes)]
+
 
 
 
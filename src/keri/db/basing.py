@@ -21,7 +21,7 @@ need to call it
 import importlib
 import os
 import shutil
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass, asdict, field
 import json
@@ -51,7 +51,8 @@ logger = help.ogler.getLogger()
 MIGRATIONS = [
     ("0.6.8", ["hab_data_rename"]),
     ("1.0.0", ["add_key_and_reg_state_schemas"]),
-    ("1.2.0", ["rekey_habs"])
+    ("1.2.0", ["rekey_habs"]),
+    ("1.2.3", ["add_anchor_index", "add_cred_query_index"]),
 ]
 
 
@@ -86,28 +87,94 @@ class dbdict(dict):
     Subclass of dict that has db as attribute and employs read through cache
     from db Baser.stts of kever states to reload kever from state in database
     when not found in memory as dict item.
+
+    When .size is nonzero the cache is bounded to .size kevers with least
+    recently used (LRU) eviction. Kevers of local prefixes in db.prefixes and
+    group prefixes in db.groups are pinned and never evicted. Evicted kevers
+    are reloaded from their persisted key state in db.states on next access.
+    Reloaded kevers get .cues so that their cues reach the owning Kevery.
+
+    Attributes:
+        db (Baser | None): database for read through
+        cues (Deck | None): cue sink of owning Kevery given to reloaded kevers
+        lru (OrderedDict): unpinned keys in recency order least recent first.
+            Empty when unbounded
+        hits (int): count of lookups found in memory
+        misses (int): count of lookups not found in memory
+        evictions (int): count of kevers evicted from memory
+
+    Properties:
+        size (int): maximum number of cached unpinned kevers. 0 means unbounded
     """
-    __slots__ = ('db')  # no .__dict__ just for db reference
+    __slots__ = ('db', 'cues', '_size', 'lru', 'hits', 'misses', 'evictions')
 
-    def __init__(self, *pa, **kwa):
+    def __init__(self, *pa, size=0, **kwa):
         super(dbdict, self).__init__(*pa, **kwa)
         self.db = None
+        self.cues = None
+        self.lru = OrderedDict()
+        self._size = 0
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def size(self):
+        """
+        Returns max number of cached unpinned kevers. 0 means unbounded
+        """
+        return self._size
+
+    @size.setter
+    def size(self, size):
+        """
+        Sets max number of cached unpinned kevers. Bounding an unbounded cache
+        tracks its unpinned kevers in .lru and evicts beyond size.
+        """
+        if size and not self._size:
+            self.lru = OrderedDict.fromkeys(k for k in self if not self.pinned(k))
+        elif not size:
+            self.lru.clear()
+        self._size = size
+        if size:
+            self.evict()
 
     def __getitem__(self, k):
         try:
-            return super(dbdict, self).__getitem__(k)
+            kever = super(dbdict, self).__getitem__(k)
         except KeyError as ex:
+            self.misses += 1
             if not self.db:
                 raise ex  # reraise KeyError
             if (ksr := self.db.states.get(keys=k)) is None:
                 raise ex  # reraise KeyError
             try:
-                kever = eventing.Kever(state=ksr, db=self.db)
+                kever = eventing.Kever(state=ksr, db=self.db, cues=self.cues)
             except kering.MissingEntryError:  # no kel event for keystate
                 raise ex  # reraise KeyError
             self.__setitem__(k, kever)
             return kever
 
+        self.hits += 1
+        if self._size and k in self.lru:
+            self.lru.move_to_end(k)
+        return kever
+
+    def __setitem__(self, k, v):
+        super(dbdict, self).__setitem__(k, v)
+        if self._size:
+            if self.pinned(k):
+                self.lru.pop(k, None)
+            else:
+                self.lru[k] = None
+                self.lru.move_to_end(k)
+                self.evict()
+
+    def __delitem__(self, k):
+        super(dbdict, self).__delitem__(k)
+        self.lru.pop(k, None)
+
     def __contains__(self, k):
         if not super(dbdict, self).__contains__(k):
             try:
@@ -134,7 +201,48 @@ class dbdict(dict):
         else:
             return self.__getitem__(k)
 
+    def pop(self, k, *pa):
+        """Override of dict pop method that keeps .lru consistent"""
+        self.lru.pop(k, None)
+        return super(dbdict, self).pop(k, *pa)
+
+    def clear(self):
+        """Override of dict clear method that keeps .lru consistent"""
+        super(dbdict, self).clear()
+        self.lru.clear()
+
+    def pinned(self, k):
+        """
+        Returns True if kever at k must not be evicted, False otherwise.
+        Kevers of local prefixes and local group prefixes are pinned.
 
+        Parameters:
+            k (str): qb64 identifier prefix key
+        """
+        if not self.db:
+            return False
+        return k in self.db.prefixes or k in self.db.groups
+
+    def evict(self):
+        """
+        Evicts least recently used unpinned kevers until at most .size kevers
+        are unpinned. Pinned kevers do not count against .size. Kevers pinned
+        after they were cached leave .lru when they reach its front.
+        """
+        while len(self.lru) > self._size:
+            k, _ = self.lru.popitem(last=False)
+            if self.pinned(k):
+                continue
+            super(dbdict, self).__delitem__(k)
+            self.evictions += 1
+
+    @property
+    def stats(self):
+        """
+        Returns dict of cache counters and sizes
+        """
+        return dict(size=self.size, count=len(self), hits=self.hits,
+                    misses=self.misses, evictions=self.evictions)
 
 
 
@@ -596,6 +704,8 @@ def reopenDB(db, clear=False, **kwa):
 
 
 KERIBaserMapSizeKey = "KERI_BASER_MAP_SIZE"
+KERIBaserKeverCacheSizeKey = "KERI_BASER_KEVER_CACHE_SIZE"
+KERIBaserVerifierCacheSizeKey = "KERI_BASER_VERIFIER_CACHE_SIZE"
 
 
 class Baser(dbing.LMDBer):
@@ -841,6 +951,14 @@ class Baser(dbing.LMDBer):
             DB is keyed by identifier prefix plus sequence number of key event
             More than one value per DB key is allowed
 
+        .etms is named subDB instance of Suber that indexes the items of the
+            escrows keyed by snKey in order of the datetime stamp in .dtss of
+            the escrowed event so that expired items are found by one range
+            scan instead of parsing the stamp of every item on every pass.
+            key is escrow sub DB name, dtHex of stamp, prefix, hex sn and
+            event digest
+            value is ISO 8601 datetime stamp str
+
 
         .states (subkey stts.) is named subDB instance of SerderSuber that maps a prefix
             to the latest keystate for that prefix. Used by ._kevers.db for read
@@ -936,13 +1054,35 @@ class Baser(dbing.LMDBer):
         the events's prefix and sequence number so can look up an event by any
         of its next public signing key digests. Updated by Kever.logEvent
 
+        .ancs is CatCesrIoSetSuber with subkey="ancs." of concatenated tuples
+        (Prefixer pre, Number sn, Saider said) of anchoring key event indexed
+        by keys (i, s, d) of each SealEvent anchored in that event's seals.
+        Maps an anchored event seal to every event in any KEL that anchors it
+        so anchoring event lookup does not scan the KEL. Updated by
+        Kever.logEvent
+
         Missing ToDo XXXX other attributes as sub dbs not documented here
             such as .wits etc
 
+    Class Attributes:
+        KeverCacheSize (int): max number of non-local kevers held in memory by
+            .kevers read through cache. 0 means unbounded. Override with
+            env var KERI_BASER_KEVER_CACHE_SIZE
+        VerifierCacheSize (int): max number of establishment events whose
+            (tholder, verfers) are held in memory by .verifiers for
+            .resolveVerifiers. 0 means no cache. Override with env var
+            KERI_BASER_VERIFIER_CACHE_SIZE
+
+    Attributes:
+        verifiers (OrderedDict): LRU cache of (dig, tholder, verfers) of
+            establishment events keyed by (pre, sn) least recent first
+
     Properties:
         kevers (dbdict): read through cache of kevers of states for KELs in db
 
     """
+    KeverCacheSize = 0  # unbounded
+    VerifierCacheSize = 1024
 
     def __init__(self, headDirPath=None, reopen=False, **kwa):
         """
@@ -964,9 +1104,26 @@ class Baser(dbing.LMDBer):
         """
         self.prefixes = oset()  # should change to hids for hab ids
         self.groups = oset()  # group hab ids
-        self._kevers = dbdict()
+
+        if (keverCacheSize := os.getenv(KERIBaserKeverCacheSizeKey)) is not None:
+            try:
+                self.KeverCacheSize = int(keverCacheSize)
+            except ValueError:
+                logger.error("KERI_BASER_KEVER_CACHE_SIZE must be an integer value >=0!")
+                raise
+
+        self._kevers = dbdict(size=self.KeverCacheSize)
         self._kevers.db = self  # assign db for read through cache of kevers
 
+        if (verifierCacheSize := os.getenv(KERIBaserVerifierCacheSizeKey)) is not None:
+            try:
+                self.VerifierCacheSize = int(verifierCacheSize)
+            except ValueError:
+                logger.error("KERI_BASER_VERIFIER_CACHE_SIZE must be an integer value >=0!")
+                raise
+
+        self.verifiers = OrderedDict()
+
         if (mapSize := os.getenv(KERIBaserMapSizeKey)) is not None:
             try:
                 self.MapSize = int(mapSize)
@@ -1029,6 +1186,7 @@ class Baser(dbing.LMDBer):
         self.dels = self.env.open_db(key=b'dels.', dupsort=True)
         self.ldes = self.env.open_db(key=b'ldes.', dupsort=True)
         self.qnfs = subing.IoSetSuber(db=self, subkey="qnfs.", dupsort=True)
+        self.etms = subing.Suber(db=self, subkey='etms.')  # escrow stamps index
 
         # events as ordered by first seen ordinals
         self.fons = subing.CesrSuber(db=self, subkey='fons.', klas=core.Number)
@@ -1306,6 +1464,14 @@ class Baser(dbing.LMDBer):
         # TODO: clean
         self.maids = subing.CesrIoSetSuber(db=self, subkey="maids.", klas=coring.Prefixer)
 
+        # anchored event seal index. Keyed by anchored SealEvent (i, s, d) of
+        # seal in 'a' field of key event. Value is (pre, sn, said) of anchoring
+        # key event. Updated by Kever.logEvent
+        self.ancs = subing.CatCesrIoSetSuber(db=self, subkey='ancs.',
+                                             klas=(coring.Prefixer,
+                                                   core.Number,
+                                                   coring.Saider))
+
         self.reload()
 
         return self.env
@@ -1585,6 +1751,8 @@ class Baser(dbing.LMDBer):
         identifier prefix pre starting at first seen order number, fn.
         Essentially a replay in first seen order with attachments
 
+        Whole replay runs in one read transaction that reuses its cursors.
+
         Parameters:
             pre is bytes of itdentifier prefix
             fn is int fn to resume replay. Earliset is fn=0
@@ -1595,12 +1763,53 @@ class Baser(dbing.LMDBer):
         if hasattr(pre, 'encode'):
             pre = pre.encode("utf-8")
 
-        for _, fn, dig in self.getFelItemPreIter(pre, fn=fn):
-            try:
-                msg = self.cloneEvtMsg(pre=pre, fn=fn, dig=dig)
-            except Exception:
-                continue  # skip this event
-            yield msg
+        return self._cloneIter(pre=pre, fn=fn)
+
+
+    def clonePreChunkIter(self, pre, fn=0, size=65536):
+        """
+        Returns generator of bytes chunks of first seen event messages with
+        attachments for the identifier prefix pre starting at first seen order
+        number, fn. Each chunk is at most size bytes unless a single message
+        is larger.
+
+        Each chunk is read in its own read transaction that ends before the
+        chunk is yielded so a slow consumer such as a streamed HTTP response
+        does not hold a read transaction open.
+
+        Parameters:
+            pre is bytes of itdentifier prefix
+            fn is int fn to resume replay. Earliset is fn=0
+            size (int): max chunk size in bytes
+        """
+        if hasattr(pre, 'encode'):
+            pre = pre.encode("utf-8")
+
+        done = False
+        while not done:
+            chunk = bytearray()
+            done = True
+            with self._read() as txn:
+                cursors = {}
+                cursor = txn.cursor(db=self.fels)
+                if cursor.set_range(dbing.onKey(pre, fn)):  # moves to val at key >= onkey
+                    for key, dig in cursor.iternext():
+                        cpre, cfn = dbing.splitOnKey(key)
+                        if cpre != pre:
+                            break
+                        try:
+                            msg = self.cloneEvtMsg(pre=cpre, fn=cfn, dig=dig, txn=txn,
+                                                   cursors=cursors)
+                        except Exception:
+                            fn = cfn + 1
+                            continue  # skip this event
+                        if chunk and len(chunk) + len(msg) > size:
+                            done = False  # resume at cfn in next read transaction
+                            break
+                        chunk.extend(msg)
+                        fn = cfn + 1
+            if chunk:
+                yield bytes(chunk)
 
 
     def cloneAllPreIter(self):
@@ -1611,92 +1820,140 @@ class Baser(dbing.LMDBer):
         Essentially a replay in first seen order with attachments of entire
         set of FELs.
 
+        Whole replay runs in one read transaction that reuses its cursors.
+
         Returns:
            msgs (Iterator): over all items in db
 
         """
-        for pre, fn, dig in self.getFelItemAllPreIter():
-            try:
-                msg = self.cloneEvtMsg(pre=pre, fn=fn, dig=dig)
-            except Exception:
-                continue  # skip this event
-            yield msg
+        return self._cloneIter()
 
 
-    def cloneEvtMsg(self, pre, fn, dig):
+    def _cloneIter(self, pre=b'', fn=0):
+        """
+        Returns generator of first seen event messages with attachments from
+        one read transaction across all events. When pre is empty then all
+        prefixes starting at first key in database.
+
+        Parameters:
+            pre (bytes): identifier prefix or empty for all prefixes
+            fn (int): first seen number to resume replay of pre. Earliest is 0
+        """
+        with self._read() as txn:
+            cursors = {}
+            cursor = txn.cursor(db=self.fels)
+            onkey = dbing.onKey(pre, fn) if pre else pre
+            if not cursor.set_range(onkey):  # moves to val at key >= onkey
+                return
+
+            for key, dig in cursor.iternext():
+                cpre, cfn = dbing.splitOnKey(key)
+                if pre and cpre != pre:
+                    break
+                try:
+                    msg = self.cloneEvtMsg(pre=cpre, fn=cfn, dig=dig, txn=txn,
+                                           cursors=cursors)
+                except Exception:
+                    continue  # skip this event
+                yield msg
+
+
+    def cloneEvtMsg(self, pre, fn, dig, txn=None, cursors=None):
         """
         Clones Event as Serialized CESR Message with Body and attached Foot
 
+        All reads are made in one read transaction. Message is assembled with
+        one allocation sized to fit body and attachments.
+
         Parameters:
             pre (bytes): identifier prefix of event
             fn (int): first seen number (ordinal) of event
             dig (bytes): digest of event
+            txn (lmdb.Transaction | None): read transaction to reuse such as
+                across a replay. None means begin own read transaction
+            cursors (dict | None): cursors of txn keyed by sub db to reuse
+                across calls with same txn
 
         Returns:
             bytearray: message body with attachments
         """
-        msg = bytearray()  # message
-        atc = bytearray()  # attachments
+        if txn is None:
+            with self._begin() as txn:
+                return self.cloneEvtMsg(pre=pre, fn=fn, dig=dig, txn=txn)
+
+        cursors = cursors if cursors is not None else {}
         dgkey = dbing.dgKey(pre, dig)  # get message
-        if not (raw := self.getEvt(key=dgkey)):
+        if not (raw := txn.get(dgkey, db=self.evts)):
             raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
-        msg.extend(raw)
+        parts = [raw, b'']  # body, pipelining counter, then attachments
 
         # add indexed signatures to attachments
-        if not (sigs := self.getSigs(key=dgkey)):
+        if not (sigs := self._getDupVals(txn, cursors, self.sigs, dgkey)):
             raise kering.MissingEntryError("Missing sigs for dig={}.".format(dig))
-        atc.extend(core.Counter(code=core.Codens.ControllerIdxSigs,
+        parts.append(core.Counter(code=core.Codens.ControllerIdxSigs,
                                 count=len(sigs), gvrsn=kering.Vrsn_1_0).qb64b)
-        for sig in sigs:
-            atc.extend(sig)
+        parts.extend(sigs)
 
         # add indexed witness signatures to attachments
-        if wigs := self.getWigs(key=dgkey):
-            atc.extend(core.Counter(code=core.Codens.WitnessIdxSigs,
+        if wigs := self._getDupVals(txn, cursors, self.wigs, dgkey):
+            parts.append(core.Counter(code=core.Codens.WitnessIdxSigs,
                                     count=len(wigs), gvrsn=kering.Vrsn_1_0).qb64b)
-            for wig in wigs:
-                atc.extend(wig)
+            parts.extend(wigs)
 
         # add authorizer (delegator/issuer) source seal event couple to attachments
-        couple = self.getAes(dgkey)
+        couple = txn.get(dgkey, db=self.aess)
         if couple is not None:
-            atc.extend(core.Counter(code=core.Codens.SealSourceCouples,
+            parts.append(core.Counter(code=core.Codens.SealSourceCouples,
                                     count=1, gvrsn=kering.Vrsn_1_0).qb64b)
-            atc.extend(couple)
+            parts.append(couple)
 
         # add trans endorsement quadruples to attachments not controller
         # may have been originally key event attachments or receipted endorsements
-        if quads := self.getVrcs(key=dgkey):
-            atc.extend(core.Counter(code=core.Codens.TransReceiptQuadruples,
+        if quads := self._getDupVals(txn, cursors, self.vrcs, dgkey):
+            parts.append(core.Counter(code=core.Codens.TransReceiptQuadruples,
                                     count=len(quads), gvrsn=kering.Vrsn_1_0).qb64b)
-            for quad in quads:
-                atc.extend(quad)
+            parts.extend(quads)
 
         # add nontrans endorsement couples to attachments not witnesses
         # may have been originally key event attachments or receipted endorsements
-        if coups := self.getRcts(key=dgkey):
-            atc.extend(core.Counter(code=core.Codens.NonTransReceiptCouples,
+        if coups := self._getDupVals(txn, cursors, self.rcts, dgkey):
+            parts.append(core.Counter(code=core.Codens.NonTransReceiptCouples,
                                     count=len(coups), gvrsn=kering.Vrsn_1_0).qb64b)
-            for coup in coups:
-                atc.extend(coup)
+            parts.extend(coups)
 
         # add first seen replay couple to attachments
-        if not (dts := self.getDts(key=dgkey)):
+        if not (dts := txn.get(dgkey, db=self.dtss)):
             raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
-        atc.extend(core.Counter(code=core.Codens.FirstSeenReplayCouples,
+        parts.append(core.Counter(code=core.Codens.FirstSeenReplayCouples,
                                 count=1, gvrsn=kering.Vrsn_1_0).qb64b)
-        atc.extend(core.Number(num=fn, code=core.NumDex.Huge).qb64b)  # may not need to be Huge
-        atc.extend(coring.Dater(dts=bytes(dts)).qb64b)
+        parts.append(core.Number(num=fn, code=core.NumDex.Huge).qb64b)  # may not need to be Huge
+        parts.append(coring.Dater(dts=bytes(dts)).qb64b)
 
-        # prepend pipelining counter to attachments
-        if len(atc) % 4:
+        # insert pipelining counter before attachments
+        size = sum(len(part) for part in parts[2:])
+        if size % 4:
             raise ValueError("Invalid attachments size={}, nonintegral"
-                             " quadlets.".format(len(atc)))
-        pcnt = core.Counter(code=core.Codens.AttachmentGroup,
-                            count=(len(atc) // 4), gvrsn=kering.Vrsn_1_0).qb64b
-        msg.extend(pcnt)
-        msg.extend(atc)
-        return msg
+                             " quadlets.".format(size))
+        parts[1] = core.Counter(code=core.Codens.AttachmentGroup,
+                                count=(size // 4), gvrsn=kering.Vrsn_1_0).qb64b
+        return bytearray().join(parts)  # one allocation of joined size
+
+
+    @staticmethod
+    def _getDupVals(txn, cursors, db, key):
+        """
+        Returns list of dup values at key in dupsort sub db using the cursor of
+        txn for db in cursors. Creates and caches cursor when missing.
+
+        Parameters:
+            txn (lmdb.Transaction): read transaction
+            cursors (dict): cursors of txn keyed by sub db
+            db (lmdb._Database): named sub db with dupsort=True
+            key (bytes): key within sub db's keyspace
+        """
+        if (cursor := cursors.get(db)) is None:
+            cursor = cursors[db] = txn.cursor(db=db)
+        return list(cursor.iternext_dup()) if cursor.set_key(key) else []
 
     def cloneDelegation(self, kever):
         """
@@ -1713,6 +1970,58 @@ class Baser(dbing.LMDBer):
             for dmsg in self.clonePreIter(pre=kever.delpre, fn=0):
                 yield dmsg
 
+    def indexAnchors(self, serder):
+        """
+        Add entries to .ancs anchored event seal index for each SealEvent
+        type seal anchored in serder's seals. Idempotent.
+
+        Parameters:
+            serder (SerderKERI): key event logged to KEL
+        """
+        for seal in serder.seals or []:  # or [] for seals 'a' field missing
+            if (tuple(seal) == eventing.SealEvent._fields and
+                    all(isinstance(v, str) for v in seal.values())):  # well formed
+                self.ancs.add(keys=(seal['i'], seal['s'], seal['d']),
+                              val=(coring.Prefixer(qb64=serder.pre),
+                                   core.Number(num=serder.sn),
+                                   coring.Saider(qb64=serder.said)))
+
+    def fetchAnchoringEventIter(self, pre, seal, sn=0, last=False):
+        """
+        Returns iterator of Serders of events in KEL of pre at or after sn that
+        anchor SealEvent seal and are fully witnessed. Uses .ancs index so
+        does not scan KEL. Events are in sn order and insertion order within sn.
+
+        Parameters:
+            pre (bytes|str): identifier of the KEL to search
+            seal (SealEvent): seal namedtuple to find
+            sn (int): beginning sn to search
+            last (bool): True means only last event at each sn so excludes
+                disputed and superseded events. False means all events.
+        """
+        if hasattr(pre, 'decode'):
+            pre = pre.decode("utf-8")
+
+        if not all(isinstance(v, str) for v in seal):  # malformed never indexed
+            return
+
+        anchors = []
+        for prefixer, number, saider in self.ancs.getIter(keys=(seal.i, seal.s, seal.d)):
+            if prefixer.qb64 == pre and number.num >= sn:
+                anchors.append((number.num, saider.qb64b))
+        anchors.sort(key=lambda anchor: anchor[0])  # stable so keeps insertion order
+
+        for esn, dig in anchors:
+            if last:
+                ldig = self.getKeLast(key=dbing.snKey(pre, esn))
+                if ldig is None or bytes(ldig) != dig:
+                    continue  # disputed or superseded
+            if not (raw := self.getEvt(key=dbing.dgKey(pre, dig))):
+                continue
+            srdr = serdering.SerderKERI(raw=bytes(raw))
+            if self.fullyWitnessed(srdr):
+                yield srdr
+
     def fetchAllSealingEventByEventSeal(self, pre, seal, sn=0):
         """
         Search through a KEL for the event that contains a specific anchored
@@ -1722,6 +2031,7 @@ class Baser(dbing.LMDBer):
         Returns the Serder of the first event with the anchored SealEvent seal,
             None if not found
 
+        Uses .ancs anchored event seal index instead of scanning KEL.
 
         Parameters:
             pre (bytes|str): identifier of the KEL to search
@@ -1735,14 +2045,7 @@ class Baser(dbing.LMDBer):
 
         seal = eventing.SealEvent(**seal)  #convert to namedtuple
 
-        for evt in self.getEvtPreIter(pre=pre, sn=sn):  # includes disputed & superseded
-            srdr = serdering.SerderKERI(raw=evt.tobytes())
-            for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
-                if tuple(eseal) == eventing.SealEvent._fields:
-                    eseal = eventing.SealEvent(**eseal)  # convert to namedtuple
-                    if seal == eseal and self.fullyWitnessed(srdr):
-                        return srdr
-        return None
+        return next(self.fetchAnchoringEventIter(pre=pre, seal=seal, sn=sn), None)
 
     # use alias here until can change everywhere for  backwards compatibility
     findAnchoringSealEvent = fetchAllSealingEventByEventSeal  # alias
@@ -1756,6 +2059,8 @@ class Baser(dbing.LMDBer):
         Searches only last events in KEL of pre so does not include disputed
         and/or superseded events.
 
+        Uses .ancs anchored event seal index instead of scanning KEL.
+
         Returns:
             srdr (Serder): instance of the first event with the matching
                            anchoring SealEvent seal,
@@ -1773,14 +2078,8 @@ class Baser(dbing.LMDBer):
 
         seal = eventing.SealEvent(**seal)  #convert to namedtuple
 
-        for evt in self.getEvtLastPreIter(pre=pre, sn=sn):  # no disputed or superseded
-            srdr = serdering.SerderKERI(raw=evt.tobytes())
-            for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
-                if tuple(eseal) == eventing.SealEvent._fields:
-                    eseal = eventing.SealEvent(**eseal)  # convert to namedtuple
-                    if seal == eseal and self.fullyWitnessed(srdr):
-                        return srdr
-        return None
+        return next(self.fetchAnchoringEventIter(pre=pre, seal=seal, sn=sn,
+                                                 last=True), None)
 
 
 
@@ -1870,6 +2169,12 @@ class Baser(dbing.LMDBer):
         Returns the Tholder and Verfers for the provided identifier prefix.
         Default pre is own .pre
 
+        Establishment events resolved for transferable prefixes are cached in
+        .verifiers. A cached entry is used only while its dig is still the
+        last event at sn in the KEL so an entry superseded by a recovery
+        rotation is never returned. A cache hit costs one index read instead
+        of reading and parsing the event.
+
         Parameters:
             pre(str) is qb64 str of bytes of identifier prefix.
             sn(int) is the sequence number of the est event
@@ -1887,8 +2192,18 @@ class Baser(dbing.LMDBer):
                 # receipter's est event not yet in receipters's KEL
                 raise kering.ValidationError("key event sn {} for pre {} is not yet in KEL"
                                              "".format(sn, pre))
+            sdig = bytes(sdig).decode()
+            if (entry := self.verifiers.get((prefixer.qb64, sn))) and entry[0] == sdig:
+                self.verifiers.move_to_end((prefixer.qb64, sn))
+                if dig is not None and dig != sdig:  # endorser's dig not match event
+                    raise kering.ValidationError("Bad proof sig group at sn = {}"
+                                                 " for pre = {} dig = {}."
+                                                 "".format(sn, pre, sdig))
+                _, tholder, verfers = entry
+                return tholder, verfers
+
             # retrieve last event itself of receipter est evt from sdig
-            sraw = self.getEvt(key=dbing.dgKey(pre=prefixer.qb64b, dig=bytes(sdig)))
+            sraw = self.getEvt(key=dbing.dgKey(pre=prefixer.qb64b, dig=sdig))
             # assumes db ensures that sraw must not be none because sdig was in KE
             sserder = serdering.SerderKERI(raw=bytes(sraw))
             if dig is not None and not sserder.compare(said=dig):  # endorser's dig not match event
@@ -1898,6 +2213,9 @@ class Baser(dbing.LMDBer):
 
             verfers = sserder.verfers
             tholder = sserder.tholder
+            if sserder.estive:
+                self.cacheVerifiers(pre=prefixer.qb64, sn=sn, dig=sdig,
+                                    tholder=tholder, verfers=verfers)
 
         else:
             verfers = [coring.Verfer(qb64=pre)]
@@ -1905,6 +2223,36 @@ class Baser(dbing.LMDBer):
 
         return tholder, verfers
 
+    def cacheVerifiers(self, pre, sn, dig, tholder, verfers):
+        """
+        Cache tholder and verfers of establishment event dig at sn of KEL of
+        pre in .verifiers replacing any entry at sn and evicting least recently
+        used entries beyond .VerifierCacheSize.
+
+        Parameters:
+            pre (str): qb64 identifier prefix
+            sn (int): sequence number of establishment event
+            dig (str): qb64 SAID of establishment event
+            tholder (Tholder): signing threshold of establishment event
+            verfers (list[Verfer]): signing keys of establishment event
+        """
+        if not self.VerifierCacheSize:
+            return
+        self.verifiers[(pre, sn)] = (dig, tholder, verfers)
+        self.verifiers.move_to_end((pre, sn))
+        while len(self.verifiers) > self.VerifierCacheSize:
+            self.verifiers.popitem(last=False)
+
+    def uncacheVerifiers(self, pre, sn):
+        """
+        Remove cached tholder and verfers at sn of KEL of pre from .verifiers
+
+        Parameters:
+            pre (str): qb64 identifier prefix
+            sn (int): sequence number of establishment event
+        """
+        self.verifiers.pop((pre, sn), None)
+
     def putEvt(self, key, val):
         """
         Use dgKey()
@@ -2120,6 +2468,44 @@ class Baser(dbing.LMDBer):
         """
         return self.delVal(self.dtss, key)
 
+    def stampEscrow(self, escrow, pre, sn, dig):
+        """
+        Indexes item of escrow at pre, sn for event dig in .etms by the
+        datetime stamp of the event in .dtss. Idempotent.
+        Returns True if indexed. False if event has no datetime stamp.
+
+        Parameters:
+            escrow (str): name of escrow sub DB such as "ooes"
+            pre (str | bytes): qb64 identifier prefix of escrowed event
+            sn (int): sequence number of escrowed event
+            dig (str | bytes): qb64 digest of escrowed event
+        """
+        if (dts := self.getDts(dbing.dgKey(pre, dig))) is None:
+            return False
+        dts = bytes(dts).decode("utf-8")
+        pre = pre.decode("utf-8") if hasattr(pre, "decode") else pre
+        dig = dig.decode("utf-8") if hasattr(dig, "decode") else dig
+        stamp = dbing.dtHex(helping.fromIso8601(dts))
+        self.etms.pin(keys=(escrow, stamp, pre, f"{sn:x}", dig), val=dts)
+        return True
+
+    def getExpiredEscrowIter(self, escrow, cutoff):
+        """
+        Returns iterator of (keys, pre, sn, dig) of items of escrow indexed in
+        .etms whose datetime stamp is before datetime cutoff, oldest first,
+        where keys are the .etms keys of the item and pre and dig are bytes.
+        Scan stops at the first item not before cutoff.
+
+        Parameters:
+            escrow (str): name of escrow sub DB such as "ooes"
+            cutoff (datetime.datetime): tz aware datetime
+        """
+        limit = dbing.dtHex(cutoff)
+        for keys, _ in self.etms.getItemIter(keys=(escrow, "")):
+            if keys[1] >= limit:
+                break
+            yield keys, keys[2].encode("utf-8"), int(keys[3], 16), keys[4].encode("utf-8")
+
     def putAes(self, key, val):
         """
         Use dgKey()
@@ -45,9 +45,12 @@ l
 
 """
 
+import datetime
+import functools
 import os
 import shutil
 import stat
+import threading
 from collections import abc
 from contextlib import contextmanager
 from typing import Union
@@ -58,7 +61,17 @@ from hio.base import filing
 
 import keri
 from ..kering import MaxON  # maximum ordinal number for seqence or first seen
-from ..help import helping
+from .. import help
+from ..help import helping, metering
+
+logger = help.ogler.getLogger()
+
+Txns = metering.registry.histogram("keri_lmdb_txn_seconds",
+                                   "Seconds per LMDB transaction by kind. Kind unit "
+                                   "and nested are ambient write transactions, write "
+                                   "and read are standalone, iter are iterator reads, "
+                                   "snapshot are ambient read transactions",
+                                   ("kind",))
 
 ProemSize = 32  # does not include trailing separator
 MaxProem = int("f"*(ProemSize), 16)
@@ -138,6 +151,21 @@ def dtKey(pre, dts):
         dts = dts.encode("utf-8")  # convert str to bytes
     return (b'%s|%s' % (pre, dts))
 
+
+Epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def dtHex(dt):
+    """
+    Returns str of 16 hex chars of microseconds since the POSIX epoch of tz
+    aware datetime dt so that the lexical order of keys made with it is
+    chronological order. Datetimes before the epoch map to the epoch.
+
+    Parameters:
+        dt (datetime.datetime): tz aware datetime
+    """
+    return f"{max(0, (dt - Epoch) // datetime.timedelta(microseconds=1)):016x}"
+
 # ToDo right split so key prefix could be top of key space with more than one
 # part
 def splitKey(key, sep=b'.'):
@@ -290,6 +318,139 @@ def openLMDB(*, cls=None, name="test", temp=True, **kwa):
             lmdber.close(clear=lmdber.temp)  # clears if lmdber.temp
 
 
+def growing(method):
+    """
+    Decorator for LMDBer write methods that each begin their own write
+    transaction. When the transaction fails because the map is full, grows the
+    map and retries the method so the write is not lost. When another process
+    has grown the map, adopts the new size and retries. Inside an ambient
+    transaction errors propagate to LMDBer.transact instead.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *pa, **kwa):
+        while True:
+            try:
+                return method(self, *pa, **kwa)
+            except lmdb.MapFullError:
+                if self.txn is not None or not self.grow():
+                    raise
+            except lmdb.MapResizedError:
+                if self.txn is not None or not self.grow(size=0):
+                    raise
+
+    return wrapper
+
+
+def transacting(method):
+    """
+    Decorator for methods of objects with LMDBer .db whose body is one unit of
+    work in .db.transact. When the unit of work aborts because the map is full,
+    LMDBer.transact grows the map and the method is retried for as long as the
+    map grows so the unit of work is not lost. When another process has grown
+    the map, adopts the new size and retries. Inside an enclosing unit of work
+    errors propagate to its LMDBer.transact instead. The method must have no
+    side effects other than its writes before it commits since it may rerun.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *pa, **kwa):
+        while True:
+            size = self.db.env.info()["map_size"]
+            try:
+                return method(self, *pa, **kwa)
+            except lmdb.MapFullError:
+                # not grown when transaction or reader of this process is open
+                if self.db.txn is not None or self.db.env.info()["map_size"] <= size:
+                    raise
+            except lmdb.MapResizedError:
+                if self.db.txn is not None or not self.db.grow(size=0):
+                    raise
+
+    return wrapper
+
+
+def detach(items):
+    """
+    Returns list of items of iterator items with any memoryview copied to
+    bytes so that the read transaction of the iterator ends before the items
+    are processed. Use when processing an item may write, such as escrow
+    processing, since the map may not grow while a read transaction of this
+    process is open so a write that fills the map could not be retried.
+
+    Parameters:
+        items (Iterable): of items each a value or tuple of values
+    """
+    def copy(val):
+        return bytes(val) if isinstance(val, memoryview) else val
+
+    return [tuple(copy(val) for val in item) if isinstance(item, tuple) else copy(item)
+            for item in items]
+
+
+class TimedTxn:
+    """
+    TimedTxn wraps a standalone transaction while metrics are enabled so that
+    its duration from entering to commit or abort on exit is observed.
+
+    Attributes:
+        txn (lmdb.Transaction): wrapped transaction
+        kind (str): kind label of observation
+        timer (Timer | None): active timer while entered
+    """
+    __slots__ = ("txn", "kind", "timer")
+
+    def __init__(self, txn, kind):
+        self.txn = txn
+        self.kind = kind
+        self.timer = None
+
+    def __enter__(self):
+        self.timer = Txns.time(self.kind).__enter__()
+        return self.txn.__enter__()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            return self.txn.__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.timer.__exit__(exc_type, exc_val, exc_tb)
+
+
+class BoundTxn:
+    """
+    BoundTxn wraps the ambient write transaction of an LMDBer so that it may be
+    used as if begun with env.begin(db=db). Methods default to the bound sub db.
+    Entering and exiting does not commit or abort since the ambient transaction
+    is committed or aborted by LMDBer.transact.
+
+    Attributes:
+        txn (lmdb.Transaction): ambient write transaction
+        db (lmdb._Database | None): bound sub db. None means main db
+    """
+    __slots__ = ("txn", "db")
+
+    def __init__(self, txn, db=None):
+        self.txn = txn
+        self.db = db
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def cursor(self, db=None):
+        return self.txn.cursor(db=db if db is not None else self.db)
+
+    def get(self, key, default=None, db=None):
+        return self.txn.get(key, default, db=db if db is not None else self.db)
+
+    def put(self, key, value, dupdata=True, overwrite=True, append=False, db=None):
+        return self.txn.put(key, value, dupdata=dupdata, overwrite=overwrite,
+                            append=append, db=db if db is not None else self.db)
+
+    def delete(self, key, value=b'', db=None):
+        return self.txn.delete(key, value, db=db if db is not None else self.db)
+
+
 class LMDBer(filing.Filer):
     """
     LBDBer base class for LMDB manager instances.
@@ -314,7 +475,32 @@ class LMDBer(filing.Filer):
         env (lmdb.env): LMDB main (super) database environment
         readonly (bool): True means open LMDB env as readonly
 
+    Class Attributes:
+        MaxNamedDBs (int): max number of named sub dbs in env
+        MapSize (int): initial map size in bytes of env
+        MapGrowth (float): factor by which map size grows when full
+        MapFill (float): fraction of map size in use above which map grows
+            before beginning an outermost ambient transaction
+
     Properties:
+        txn (lmdb.Transaction | None): ambient write transaction of calling
+            thread when inside .transact. None otherwise
+
+    Map Growth:
+        A write method whose transaction fails because the map is full grows
+        the map geometrically by .MapGrowth and retries. An outermost .transact
+        grows the map beforehand when more than .MapFill of the map is in use,
+        and after a map full abort so a retry of its unit of work succeeds.
+        LMDB requires that no transaction of the process is active while the
+        map is resized so growth is deferred while any iterator is open.
+
+    Ambient Transactions:
+        Inside a .transact context, all non iterator reads and all writes of
+        this LMDBer, including those of its SuberBase and KomerBase sub dbs,
+        join the ambient write transaction of the calling thread instead of
+        each beginning and committing their own. The whole context is then one
+        atomic commit. Iterator methods read committed state from their own
+        read transaction so do not see uncommitted writes of the context.
 
     File/Directory Creation Mode Notes:
         .Perm provides default restricted access permissions to directory and/or files
@@ -341,6 +527,8 @@ class LMDBer(filing.Filer):
     Perm = stat.S_ISVTX | stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR  # 0o1700==960
     MaxNamedDBs = 96
     MapSize = 104857600
+    MapGrowth = 2.0
+    MapFill = 0.75
 
     def __init__(self, readonly=False, **kwa):
         """
@@ -382,6 +570,8 @@ class LMDBer(filing.Filer):
         self.env = None
         self._version = None
         self.readonly = True if readonly else False
+        self._ambient = threading.local()  # stack of ambient txns per thread
+        self._readers = 0  # number of open iterator read txns
         super(LMDBer, self).__init__(**kwa)
 
     def reopen(self, readonly=False, **kwa):
@@ -471,6 +661,180 @@ class LMDBer(filing.Filer):
 
         return super(LMDBer, self).close(clear=clear)
 
+    @property
+    def txn(self):
+        """
+        Returns ambient write transaction of calling thread or None when not
+        inside .transact
+        """
+        txns = getattr(self._ambient, "txns", None)
+        return txns[-1] if txns else None
+
+    @contextmanager
+    def transact(self):
+        """
+        Context manager for ambient write transaction (unit of work). Writes
+        and non iterator reads inside the context join the ambient transaction
+        which commits on normal exit and aborts on exception.
+
+        Nested contexts begin child transactions of the enclosing transaction
+        so that an exception aborts only the writes of the nested context.
+
+        Reads through the ambient transaction return bytes copies since
+        buffers of a write transaction are invalidated by its next write.
+
+        Usage:
+            with db.transact():
+                db.putVal(db.evts, key, val)
+                db.sigs.put(keys=key, vals=sigs)
+
+        Yields:
+            txn (lmdb.Transaction): ambient write transaction
+        """
+        txns = getattr(self._ambient, "txns", None)
+        if txns is None:
+            txns = self._ambient.txns = []
+        parent = txns[-1] if txns else None
+        if parent is None and self.filled() > self.MapFill:
+            self.grow()  # grow before map is full
+
+        try:
+            with (Txns.time("unit" if parent is None else "nested"),
+                  self.env.begin(write=True, buffers=False, parent=parent) as txn):
+                txns.append(txn)
+                try:
+                    yield txn
+                finally:
+                    txns.pop()
+        except lmdb.MapFullError:
+            if parent is None:  # aborted so grow for retry of unit of work
+                self.grow()
+            raise
+
+    def _begin(self, db=None, write=False):
+        """
+        Returns transaction context for db. When inside .transact returns the
+        ambient transaction bound to db. Otherwise begins new transaction that
+        commits on exit of its context.
+
+        Parameters:
+            db (lmdb._Database | None): sub db. None means main db
+            write (bool): True means write transaction. False means read only
+        """
+        txns = getattr(self._ambient, "txns", None)
+        if txns:
+            return BoundTxn(txns[-1], db=db)
+        if not write and (snap := getattr(self._ambient, "snap", None)) is not None:
+            return BoundTxn(snap, db=db)
+        txn = self.env.begin(db=db, write=write, buffers=True)
+        if metering.registry.enabled:
+            return TimedTxn(txn, "write" if write else "read")
+        return txn
+
+    @contextmanager
+    def snapshot(self):
+        """
+        Context manager for ambient read only transaction. Non iterator reads
+        outside of .transact inside the context share one read transaction so
+        that a batch of reads sees one consistent view of the database and
+        does not begin a transaction per read. Writes inside the context are
+        not seen by its reads. Nested contexts share the outermost.
+
+        Usage:
+            with db.snapshot():
+                for key in keys:
+                    vals.append(db.getVal(db.evts, key))
+
+        Yields:
+            txn (lmdb.Transaction): ambient read only transaction
+        """
+        if (snap := getattr(self._ambient, "snap", None)) is not None:
+            yield snap
+            return
+
+        self._readers += 1
+        try:
+            with Txns.time("snapshot"), self.env.begin(write=False, buffers=True) as txn:
+                self._ambient.snap = txn
+                try:
+                    yield txn
+                finally:
+                    self._ambient.snap = None
+        finally:
+            self._readers -= 1
+
+    @contextmanager
+    def _read(self, db=None):
+        """
+        Context manager for read transaction of iterator method. Open
+        iterator read transactions are counted so that the map is not resized
+        while they are active.
+
+        Parameters:
+            db (lmdb._Database | None): sub db. None means main db
+        """
+        self._readers += 1
+        try:
+            with Txns.time("iter"), self.env.begin(db=db, write=False, buffers=True) as txn:
+                yield txn
+        finally:
+            self._readers -= 1
+
+    def filled(self):
+        """
+        Returns fraction of map size in use
+        """
+        info = self.env.info()
+        return (info["last_pgno"] + 1) * self.env.stat()["psize"] / info["map_size"]
+
+    def grow(self, size=None):
+        """
+        Grows map size of env to size or else by factor .MapGrowth.
+        Size 0 adopts the map size set by another process.
+        Returns True if grown. Returns False if not because a transaction of
+        this process is active so resize is not safe.
+
+        Parameters:
+            size (int | None): new map size in bytes. None means grow by
+                factor .MapGrowth
+        """
+        if self.txn is not None or self._readers:
+            return False
+
+        if size is None:
+            size = int(self.env.info()["map_size"] * self.MapGrowth)
+        self.env.set_mapsize(size)
+        logger.info("LMDBer %s map size now %s bytes", self.name,
+                    self.env.info()["map_size"])
+        return True
+
+    def stats(self):
+        """
+        Returns dict of LMDB usage statistics for capacity planning.
+        Keys are map_size, used, and fill of whole env in bytes and fraction
+        in use, plus dbs whose value is dict keyed by sub db name of dict of
+        its LMDB stat() values with entries count, pages counts, depth, and
+        bytes in its pages.
+        """
+        info = self.env.info()
+        psize = self.env.stat()["psize"]
+        used = (info["last_pgno"] + 1) * psize
+        dbs = {}
+        with self.env.begin() as txn:
+            names = [bytes(key) for key, _ in txn.cursor()]
+            for name in names:
+                try:
+                    db = self.env.open_db(key=name, txn=txn, create=False)
+                except lmdb.Error:  # not a sub db such as __version__ key
+                    continue
+                stat = txn.stat(db)
+                stat["bytes"] = (stat["branch_pages"] + stat["leaf_pages"] +
+                                 stat["overflow_pages"]) * psize
+                dbs[name.decode("utf-8")] = stat
+
+        return dict(map_size=info["map_size"], used=used,
+                    fill=used / info["map_size"], dbs=dbs)
+
     def getVer(self):
         """ Returns the value of the the semver formatted version in the __version__ key in this database
 
@@ -483,6 +847,7 @@ class LMDBer(filing.Filer):
             version = cursor.get(b'__version__')
             return version.decode("utf-8") if version is not None else None
 
+    @growing
     def setVer(self, val):
         """  Set the version of the database in the __version__ key
 
@@ -493,11 +858,12 @@ class LMDBer(filing.Filer):
         if hasattr(val, "encode"):
             val = val.encode("utf-8")  # convert str to bytes
 
-        with self.env.begin(write=True) as txn:
+        with self._begin(write=True) as txn:
             cursor = txn.cursor()
             cursor.replace(b'__version__', val)
 
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
+    @growing
     def putVal(self, db, key, val):
         """
         Write serialized bytes val to location key in db
@@ -510,7 +876,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.put(key, val, overwrite=False))
             except lmdb.BadValsizeError as ex:
@@ -518,6 +884,7 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @growing
     def setVal(self, db, key, val):
         """
         Write serialized bytes val to location key in db
@@ -531,7 +898,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.put(key, val))
             except lmdb.BadValsizeError as ex:
@@ -549,7 +916,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             try:
                 return(txn.get(key))
             except lmdb.BadValsizeError as ex:
@@ -557,6 +924,7 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @growing
     def delVal(self, db, key):
         """
         Deletes value at key in db.
@@ -566,7 +934,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -581,7 +949,7 @@ class LMDBer(filing.Filer):
         Parameters:
             db is opened named sub db with dupsort=True
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             for _, _ in cursor:
@@ -612,7 +980,7 @@ class LMDBer(filing.Filer):
                         In Python str.startswith('') always returns True so if branch
                         key is empty string it matches all keys in db with startswith.
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._read(db=db) as txn:
             cursor = txn.cursor()
             if cursor.set_range(top):  # move to val at key >= key if any
                 for ckey, cval in cursor.iternext():  # get key, val at cursor
@@ -623,6 +991,49 @@ class LMDBer(filing.Filer):
             return  # done raises StopIteration
 
 
+    def getTopRangeIter(self, db, top=b'', after=b'', reverse=False):
+        """
+        Iterates over branch of db given by top key in key order starting
+        after key after so that a scan may be resumed where it left off.
+
+        Returns:
+            items (abc.Iterator): iterator of (full key, val) tuples over a
+                branch of the db given by top key whose keys are greater than
+                after or less than after when reverse
+
+        Parameters:
+            db (lmdb._Database): instance of named sub db with dupsort==False
+            top (bytes): truncated top key, a key space prefix of the branch.
+                Empty means whole db
+            after (bytes): full key after which to start. Empty means start of
+                branch or end of branch when reverse
+            reverse (bool): True means iterate in descending key order
+        """
+        with self._read(db=db) as txn:
+            cursor = txn.cursor()
+            if not reverse:
+                if not cursor.set_range(after if after > top else top):
+                    return
+                items = cursor.iternext()
+            else:  # position at last key before after or end of branch
+                end = after if after else top + b'\xff'  # keys are Base64 or hex
+                if cursor.set_range(end):
+                    if not cursor.prev():
+                        return
+                elif not cursor.last():
+                    return
+                items = cursor.iterprev()
+
+            for ckey, cval in items:
+                ckey = bytes(ckey)
+                if not ckey.startswith(top):
+                    break
+                if ckey == after:
+                    continue
+                yield (ckey, cval)
+
+
+    @growing
     def delTopVal(self, db, top=b''):
         """
         Deletes all values in branch of db given top key.
@@ -646,7 +1057,7 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = False
             cursor = txn.cursor()
             if cursor.set_range(top):  # move to val at key >= key if any
@@ -664,6 +1075,7 @@ class LMDBer(filing.Filer):
     # ordinal number serialized as 32 hex bytes
 
     # used in OnSuberBase
+    @growing
     def putOnVal(self, db, key,  on=0, val=b'', *, sep=b'.'):
         """Write serialized bytes val to location at onkey consisting of
         key + sep + serialized on in db.
@@ -680,7 +1092,7 @@ class LMDBer(filing.Filer):
             val (bytes): to be written at onkey
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             else:
@@ -692,6 +1104,7 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
     # used in OnSuberBase
+    @growing
     def setOnVal(self, db, key, on=0, val=b'',  *, sep=b'.'):
         """
         Write serialized bytes val to location at onkey consisting of
@@ -709,7 +1122,7 @@ class LMDBer(filing.Filer):
             val (bytes): to be written at onkey
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             else:
@@ -722,6 +1135,7 @@ class LMDBer(filing.Filer):
 
 
     # used in OnSuberBase
+    @growing
     def appendOnVal(self, db, key, val, *, sep=b'.'):
         """
         Appends val in order after last previous onkey in db where
@@ -749,7 +1163,7 @@ class LMDBer(filing.Filer):
         # set key with fn at max and then walk backwards to find last entry at pre
         # if any otherwise zeroth entry at pre
         onkey = onKey(key, MaxON, sep=sep)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             on = 0  # unless other cases match then zeroth entry at pre
             cursor = txn.cursor()
             if not cursor.set_range(onkey):  # max is past end of database
@@ -797,7 +1211,7 @@ class LMDBer(filing.Filer):
             sep (bytes): separator character for split
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             else:
@@ -810,6 +1224,7 @@ class LMDBer(filing.Filer):
 
 
     # used in OnSuberBase
+    @growing
     def delOnVal(self, db, key, on=0, *, sep=b'.'):
         """
         Deletes value at onkey consisting of key + sep + serialized on in db.
@@ -821,7 +1236,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to delete
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             else:
@@ -849,7 +1264,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate count
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -922,7 +1337,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._read(db=db) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -952,6 +1367,7 @@ class LMDBer(filing.Filer):
     # size limitation of 511 bytes.
 
 
+    @growing
     def putIoSetVals(self, db, key, vals, *, sep=b'.'):
         """
         Add each val in vals to insertion ordered set of values all with the
@@ -971,7 +1387,7 @@ class LMDBer(filing.Filer):
         """
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
             cursor = txn.cursor()
@@ -995,6 +1411,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @growing
     def addIoSetVal(self, db, key, val, *, sep=b'.'):
         """
         Add val idempotently to insertion ordered set of values all with the
@@ -1011,7 +1428,7 @@ class LMDBer(filing.Filer):
             val (bytes): serialized value to add
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             vals = oset()
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
@@ -1032,6 +1449,7 @@ class LMDBer(filing.Filer):
             return cursor.put(iokey, val, dupdata=False, overwrite=False)
 
 
+    @growing
     def setIoSetVals(self, db, key, vals, *, sep=b'.'):
         """
         Erase all vals at key and then add unique vals as insertion ordered set of
@@ -1050,7 +1468,7 @@ class LMDBer(filing.Filer):
         self.delIoSetVals(db=db, key=key, sep=sep)
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             for i, val in enumerate(vals):
                 iokey = suffix(key, i, sep=sep)  # ion is at add on amount
                 result = txn.put(iokey, val, dupdata=False, overwrite=True) or result
@@ -1072,7 +1490,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             vals = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
@@ -1100,7 +1518,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._read(db=db) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1128,7 +1546,7 @@ class LMDBer(filing.Filer):
         val = None
         ion = None  # no last value
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
@@ -1179,6 +1597,7 @@ class LMDBer(filing.Filer):
         return len(self.getIoSetVals(db=db, key=key, sep=sep))
 
 
+    @growing
     def delIoSetVals(self, db, key, *, sep=b'.'):
         """
         Deletes all values at apparent effective key.
@@ -1194,7 +1613,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
         """
         result = False
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start at zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1208,6 +1627,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @growing
     def delIoSetVal(self, db, key, val, *, sep=b'.'):
         """
         Deletes val at apparent effective key if exists.
@@ -1237,7 +1657,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             val (bytes): value to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1276,6 +1696,7 @@ class LMDBer(filing.Filer):
 
 
     # For subdbs that support duplicates at each key (dupsort==True)
+    @growing
     def putVals(self, db, key, vals):
         """
         Write each entry from list of bytes vals to key in db
@@ -1292,7 +1713,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             vals is list of bytes of values to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = True
             try:
                 for val in vals:
@@ -1303,6 +1724,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @growing
     def addVal(self, db, key, val):
         """
         Add val bytes as dup to key in db
@@ -1325,7 +1747,7 @@ class LMDBer(filing.Filer):
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
+            with self._begin(db=db, write=True) as txn:
                 try:
                     result = txn.put(key, val, dupdata=True)
                 except lmdb.BadValsizeError as ex:
@@ -1346,7 +1768,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1369,7 +1791,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -1393,7 +1815,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._read(db=db) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1413,7 +1835,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -1427,6 +1849,7 @@ class LMDBer(filing.Filer):
 
 
 
+    @growing
     def delVals(self, db, key, val=b''):
         """
         Deletes all values at key in db if val=b'' else deletes the dup
@@ -1438,7 +1861,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of dup val at key to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.delete(key, val))
             except lmdb.BadValsizeError as ex:
@@ -1450,6 +1873,7 @@ class LMDBer(filing.Filer):
     # IoDup class IoVals IoItems
     # dupsort==True and prepends and strips io val proem to each value.
     # because dupsort==True values are limited to 511 bytes including proem
+    @growing
     def putIoDupVals(self, db, key, vals):
         """
         Write each entry from list of bytes vals to key in db in insertion order
@@ -1478,7 +1902,7 @@ class LMDBer(filing.Filer):
 
         result = False
         dups = set(self.getIoDupVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             idx = 0
             cursor = txn.cursor()
             try:
@@ -1553,7 +1977,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1592,7 +2016,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._read(db=db) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1629,7 +2053,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -1642,6 +2066,7 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @growing
     def delIoDupVals(self, db, key):
         """
         Deletes all values at key in db if key present.
@@ -1665,7 +2090,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -1673,6 +2098,7 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @growing
     def delIoDupVal(self, db, key, val):
         """
         Deletes dup io val at key in db. Performs strip search to find match.
@@ -1701,7 +2127,7 @@ class LMDBer(filing.Filer):
             val is bytes of value to be deleted without intersion ordering proem
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             cursor = txn.cursor()
             try:
                 if cursor.set_key(key):  # move to first_dup
@@ -1737,7 +2163,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -2019,7 +2445,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._read(db=db) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -2101,7 +2527,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._read(db=db) as txn:
             cursor = txn.cursor()
             if not cursor.last():  # pre-position cursor at last dup of last key
                 return  # empty database so raise StopIteration
@@ -0,0 +1,19 @@
+from keri.core import serdering
+from keri.db import dbing
+
+
+def migrate(db):
+    """ Adds the .ancs anchored event seal index
+
+    This migration populates .ancs from the key event logs of every identifier
+    with a key state in .stts so that anchoring event lookups by event seal
+    do not have to scan KELs. Indexing is idempotent so rerunning is harmless.
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    for (pre,), _ in db.states.getItemIter():
+        for dig in db.getKelIter(pre):
+            if not (raw := db.getEvt(key=dbing.dgKey(pre, dig))):
+                continue
+            db.indexAnchors(serdering.SerderKERI(raw=bytes(raw)))
@@ -0,0 +1,18 @@
+from keri.vdr import viring
+
+
+def migrate(db):
+    """ Adds the .cqix credential query indexes of the registry database
+
+    This migration indexes every saved credential of the registry database of
+    db so that credential queries are served from the indexes. Indexing is
+    idempotent so rerunning is harmless.
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    rgy = viring.Reger(name=db.name, base=db.base, db=db, temp=db.temp, reopen=True)
+    try:
+        rgy.indexCreds()
+    finally:
+        rgy.close()
@@ -321,6 +321,34 @@ class SuberBase():
             yield (self._tokeys(key), self._des(val))
 
 
+    def getItemRangeIter(self, keys: str|bytes|memoryview|Iterable="",
+                         *, after: str|bytes|memoryview|Iterable="",
+                         reverse=False, topive=False):
+        """Iterator over items of branch given by keys in key order starting
+        after full key given by after so that paginated scans may resume.
+
+        Returns:
+            items (Iterator[tuple[key,val]]): (key, val) tuples of each item
+            of branch whose key is greater than after or less than after when
+            reverse
+
+        Parameters:
+            keys (str|bytes|memoryview|Iterable[str|bytes|memoryview]): of key
+                parts of top branch as for .getItemIter
+            after (str|bytes|memoryview|Iterable[str|bytes|memoryview]): full
+                keys after which to start. Empty means start of branch or end of
+                branch when reverse
+            reverse (bool): True means descending key order
+            topive (bool): True means treat keys as partial key tuple of top
+                branch as for .getItemIter
+        """
+        for key, val in self.db.getTopRangeIter(db=self.sdb,
+                                                top=self._tokey(keys, topive=topive),
+                                                after=self._tokey(after) if after else b'',
+                                                reverse=reverse):
+            yield (self._tokeys(key), self._des(val))
+
+
 class Suber(SuberBase):
     """
     Subclass of SuberBase with no LMDB duplicates (i.e. multiple values at same key).
@@ -1700,6 +1728,11 @@ class SchemerSuber(SerderSuberBase, Suber):
     Sub class of SerderSuberBase and Suber where data is serialized Schemer instance
     Schemer ser/des is ducktype of Serder using .raw
     Automatically serializes and deserializes using Schemer methods
+
+    Attributes:
+        cache (scheming.ValidatorCache): compiled validators and resolved
+            schema keyed by SAID. Entry of SAID is discarded when schema at
+            SAID is put, pinned or removed.
     """
 
     def __init__(self, *pa,
@@ -1726,6 +1759,56 @@ class SchemerSuber(SerderSuberBase, Suber):
         if not issubclass(klas, scheming.Schemer):
             raise TypeError(f"Invalid {klas=}, not subclass of {scheming.Schemer}.")
         super(SchemerSuber, self).__init__(*pa, klas=klas, **kwa)
+        self.cache = scheming.ValidatorCache()
+
+
+    def put(self, keys: Union[str, Iterable], val: scheming.Schemer):
+        """
+        Puts val at key made from keys. Does not overwrite
+        Discards cache entry of key when successful
+
+        Parameters:
+            keys (tuple): of key strs to be combined in order to form key
+            val (Schemer): value
+
+        Returns:
+            result (bool): True If successful, False otherwise, such as key
+                              already in database.
+        """
+        if result := super(SchemerSuber, self).put(keys=keys, val=val):
+            self.cache.discard(self._tokey(keys).decode("utf-8"))
+        return result
+
+
+    def pin(self, keys: Union[str, Iterable], val: scheming.Schemer):
+        """
+        Pins (sets) val at key made from keys. Overwrites.
+        Discards cache entry of key
+
+        Parameters:
+            keys (tuple): of key strs to be combined in order to form key
+            val (Schemer): value
+
+        Returns:
+            result (bool): True If successful. False otherwise.
+        """
+        self.cache.discard(self._tokey(keys).decode("utf-8"))
+        return super(SchemerSuber, self).pin(keys=keys, val=val)
+
+
+    def rem(self, keys: Union[str, Iterable]):
+        """
+        Removes entry at keys
+        Discards cache entry of key
+
+        Parameters:
+            keys (tuple): of key strs to be combined in order to form key
+
+        Returns:
+           result (bool): True if key exists so delete successful. False otherwise
+        """
+        self.cache.discard(self._tokey(keys).decode("utf-8"))
+        return super(SchemerSuber, self).rem(keys=keys)
 
 
 class DupSuber(SuberBase):
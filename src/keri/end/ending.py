@@ -5,6 +5,7 @@ keri.end.ending module
 ReST API endpoints
 
 """
+import itertools
 import json
 import os
 import re
@@ -595,16 +596,20 @@ class OOBIEnd:
         if eid:
             eids.append(eid)
 
-        msgs = hab.replyToOobi(aid=aid, role=role, eids=eids)
-        if not msgs and role is None:
-            msgs = hab.replyToOobi(aid=aid, role=kering.Roles.witness, eids=eids)
-            msgs.extend(hab.replay(aid))
+        # stream replies in bounded chunks instead of accumulating full replay
+        chunks = helping.chunkify(hab.replyToOobiIter(aid=aid, role=role, eids=eids))
+        chunk = next(chunks, None)
+        if chunk is None and role is None:
+            chunks = helping.chunkify(itertools.chain(
+                hab.replyToOobiIter(aid=aid, role=kering.Roles.witness, eids=eids),
+                hab.replayIter(aid)))
+            chunk = next(chunks, None)
 
-        if msgs:
+        if chunk is not None:
             rep.status = falcon.HTTP_200  # This is the default status
             rep.set_header(OOBI_AID_HEADER, aid)
             rep.content_type = "application/json+cesr"
-            rep.data = bytes(msgs)
+            rep.stream = itertools.chain([chunk], chunks)
 
         else:
             rep.status = falcon.HTTP_NOT_FOUND
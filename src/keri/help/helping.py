@@ -119,6 +119,27 @@ def nonStringIterable(obj):
     return (not isinstance(obj, (str, bytes)) and isinstance(obj, Iterable))
 
 
+def chunkify(msgs, size=65536):
+    """
+    Returns generator of bytes chunks coalesced in order from the bytes like
+    messages in iterable msgs. Each chunk is at most size bytes unless a single
+    message is larger. Empty messages are skipped so no chunk is empty. Bounds
+    buffering when streaming many small messages such as a KEL replay.
+
+    Parameters:
+        msgs (Iterable): of bytes like messages
+        size (int): max chunk size in bytes
+    """
+    chunk = bytearray()
+    for msg in msgs:
+        if chunk and len(chunk) + len(msg) > size:
+            yield bytes(chunk)
+            chunk.clear()
+        chunk.extend(msg)
+    if chunk:
+        yield bytes(chunk)
+
+
 def nonStringSequence(obj):
     """
     Returns: True if obj is non-string sequence, False otherwise
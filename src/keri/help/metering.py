@@ -0,0 +1,344 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.help.metering module
+
+Optional metrics of hot paths such as parsing, validation, escrows and
+persistence with export in the Prometheus text exposition format.
+
+Instruments are created once at module import on the module global .registry
+and are no-ops while the registry is disabled so instrumented hot paths pay
+only an attribute check. Enable by setting the KERI_METRICS environment
+variable to a true value or at runtime with registry.enabled = True.
+
+Instruments are not locked since hio runs doers in one thread.
+
+Usage:
+    Events = metering.registry.counter("keri_events_total",
+                                       "Key events processed by ilk", ("ilk",))
+    Events.inc(serder.ilk)
+
+    Stages = metering.registry.histogram("keri_stage_seconds",
+                                         "Seconds per stage", ("stage",))
+    with Stages.time("update"):
+        ...
+
+    @Stages.timed("log")
+    def logEvent(self, ...):
+        ...
+"""
+import functools
+import math
+import os
+import time
+import weakref
+from bisect import bisect_left
+
+KERIMetricsKey = "KERI_METRICS"
+
+# default latency buckets in seconds
+Buckets = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+           0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Null:
+    """
+    _Null is reusable no-op context manager returned by timers while disabled
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+Null = _Null()
+
+
+class Metric:
+    """
+    Metric is base class of named instruments with optional labels
+
+    Class Attributes:
+        Kind (str): Prometheus metric type
+
+    Attributes:
+        registry (Registry): registry whose .enabled gates updates
+        name (str): metric name
+        doc (str): help text
+        labels (tuple): of str label names
+        values (dict): metric state keyed by tuple of label values
+    """
+    Kind = "untyped"
+
+    def __init__(self, registry, name, doc="", labels=()):
+        """
+        Parameters:
+            registry (Registry): registry whose .enabled gates updates
+            name (str): metric name
+            doc (str): help text
+            labels (Iterable[str]): label names
+        """
+        self.registry = registry
+        self.name = name
+        self.doc = doc
+        self.labels = tuple(labels)
+        self.values = {}
+
+    def reset(self):
+        """
+        Clears all recorded values
+        """
+        self.values.clear()
+
+    def _label(self, lvs, extra=()):
+        """
+        Returns str of Prometheus label set of label values lvs plus extra
+        (name, value) pairs
+        """
+        pairs = list(zip(self.labels, lvs)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join('{}="{}"'.format(name, str(value).replace("\\", "\\\\")
+                                                .replace('"', '\\"').replace("\n", "\\n"))
+                              for name, value in pairs) + "}"
+
+    def samples(self):
+        """
+        Returns list of (name suffix, label str, value) samples
+        """
+        return [("", self._label(lvs), value) for lvs, value in sorted(self.values.items())]
+
+    def expose(self):
+        """
+        Returns list of lines of Prometheus text exposition of metric
+        """
+        lines = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} {self.Kind}"]
+        for suffix, label, value in self.samples():
+            lines.append(f"{self.name}{suffix}{label} {_fmt(value)}")
+        return lines
+
+
+class Counter(Metric):
+    """
+    Counter is monotonic count per label set
+    """
+    Kind = "counter"
+
+    def inc(self, *lvs, n=1):
+        """
+        Increments count of label values lvs by n when registry enabled
+        """
+        if self.registry.enabled:
+            self.values[lvs] = self.values.get(lvs, 0) + n
+
+
+class Gauge(Metric):
+    """
+    Gauge is value per label set that may be set directly or sampled at
+    exposition from the lengths of tracked containers such as cue decks.
+
+    Attributes:
+        tracked (dict): lists of weakrefs to tracked containers keyed by
+            tuple of label values
+    """
+    Kind = "gauge"
+
+    def __init__(self, registry, name, doc="", labels=()):
+        super(Gauge, self).__init__(registry, name, doc, labels)
+        self.tracked = {}
+
+    def set(self, value, *lvs):
+        """
+        Sets value of label values lvs when registry enabled
+        """
+        if self.registry.enabled:
+            self.values[lvs] = value
+
+    def track(self, container, *lvs):
+        """
+        Tracks len(container) as value of label values lvs summed over all
+        live containers tracked with the same label values. Holds only
+        a weak reference to container.
+        """
+        self.tracked.setdefault(lvs, []).append(weakref.ref(container))
+
+    def samples(self):
+        values = dict(self.values)
+        for lvs, refs in list(self.tracked.items()):
+            refs[:] = [ref for ref in refs if ref() is not None]
+            if not refs:
+                del self.tracked[lvs]
+                continue
+            values[lvs] = sum(len(c) for ref in refs if (c := ref()) is not None)
+        return [("", self._label(lvs), value) for lvs, value in sorted(values.items())]
+
+
+class Timer:
+    """
+    Timer is context manager that observes elapsed seconds on its histogram
+    """
+    __slots__ = ("histogram", "lvs", "start")
+
+    def __init__(self, histogram, lvs):
+        self.histogram = histogram
+        self.lvs = lvs
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.histogram.observe(time.perf_counter() - self.start, *self.lvs)
+        return False
+
+
+class Histogram(Metric):
+    """
+    Histogram is distribution of observations per label set over fixed
+    buckets. State per label set is [bucket counts, sum, count].
+
+    Attributes:
+        buckets (tuple): of float upper bounds in increasing order
+    """
+    Kind = "histogram"
+
+    def __init__(self, registry, name, doc="", labels=(), buckets=Buckets):
+        super(Histogram, self).__init__(registry, name, doc, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, *lvs):
+        """
+        Records observation value for label values lvs when registry enabled
+        """
+        if not self.registry.enabled:
+            return
+        if (state := self.values.get(lvs)) is None:
+            state = self.values[lvs] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        state[0][bisect_left(self.buckets, value)] += 1
+        state[1] += value
+        state[2] += 1
+
+    def time(self, *lvs):
+        """
+        Returns context manager that observes elapsed seconds of its context
+        for label values lvs. Returns no-op context when registry disabled.
+        """
+        if not self.registry.enabled:
+            return Null
+        return Timer(self, lvs)
+
+    def timed(self, *lvs):
+        """
+        Returns decorator that observes elapsed seconds of each call of the
+        decorated function for label values lvs while registry enabled
+        """
+        def decorator(f):
+            @functools.wraps(f)
+            def wrapper(*pa, **kwa):
+                if not self.registry.enabled:
+                    return f(*pa, **kwa)
+                start = time.perf_counter()
+                try:
+                    return f(*pa, **kwa)
+                finally:
+                    self.observe(time.perf_counter() - start, *lvs)
+            return wrapper
+        return decorator
+
+    def samples(self):
+        samples = []
+        for lvs, (counts, total, count) in sorted(self.values.items()):
+            cum = 0
+            for bound, n in zip(self.buckets + (math.inf,), counts):
+                cum += n
+                samples.append(("_bucket", self._label(lvs, (("le", _fmt(bound)),)), cum))
+            samples.append(("_sum", self._label(lvs), total))
+            samples.append(("_count", self._label(lvs), count))
+        return samples
+
+
+class Registry:
+    """
+    Registry is named collection of metrics with Prometheus text exposition
+
+    Attributes:
+        enabled (bool): True means instruments record. False means no-op
+        metrics (dict): Metric instances keyed by name
+    """
+
+    def __init__(self, enabled=False):
+        """
+        Parameters:
+            enabled (bool): True means instruments record
+        """
+        self.enabled = True if enabled else False
+        self.metrics = {}
+
+    def _metric(self, klas, name, doc, labels, **kwa):
+        """
+        Returns existing metric of name or creates and registers new one
+
+        Raises:
+            ValueError: when metric of name exists with other type or labels
+        """
+        if (metric := self.metrics.get(name)) is not None:
+            if type(metric) is not klas or metric.labels != tuple(labels):
+                raise ValueError(f"Metric {name} already registered as {metric.Kind} "
+                                 f"with labels {metric.labels}.")
+            return metric
+        metric = self.metrics[name] = klas(self, name, doc, labels, **kwa)
+        return metric
+
+    def counter(self, name, doc="", labels=()):
+        """
+        Returns Counter of name
+        """
+        return self._metric(Counter, name, doc, labels)
+
+    def gauge(self, name, doc="", labels=()):
+        """
+        Returns Gauge of name
+        """
+        return self._metric(Gauge, name, doc, labels)
+
+    def histogram(self, name, doc="", labels=(), buckets=Buckets):
+        """
+        Returns Histogram of name
+        """
+        return self._metric(Histogram, name, doc, labels, buckets=buckets)
+
+    def reset(self):
+        """
+        Clears recorded values of all metrics
+        """
+        for metric in self.metrics.values():
+            metric.reset()
+
+    def expose(self):
+        """
+        Returns str of Prometheus text exposition format version 0.0.4 of
+        all metrics
+        """
+        lines = []
+        for name in sorted(self.metrics):
+            lines.extend(self.metrics[name].expose())
+        return "\n".join(lines) + "\n"
+
+
+def _fmt(value):
+    """
+    Returns str of value formatted for Prometheus text exposition
+    """
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if math.isnan(value):
+            return "NaN"
+        return repr(value)
+    return str(value)
+
+
+registry = Registry(enabled=os.getenv(KERIMetricsKey, "").lower() in ("1", "true", "yes", "on"))
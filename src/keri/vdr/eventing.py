@@ -1169,8 +1169,14 @@ class Tever:
           vci (str):  qb64 VC identifier
 
         Returns:
-            status (Serder): transaction event state notification message
+            status (VcStateRecord): transaction event state of credential
+
+        Read from the .reger.vcss index maintained by .logEvent. Credentials
+        logged before the index existed are computed from their TEL and indexed.
         """
+        if (vsr := self.reger.vcss.get(keys=vci)) is not None:
+            return vsr
+
         digs = []
         for _, _, dig in self.reger.getTelItemPreIter(pre=vci.encode("utf-8")):
             digs.append(dig)
@@ -1198,15 +1204,17 @@ class Tever:
         seqner = coring.Seqner(qb64b=ancb, strip=True)
         saider = coring.Saider(qb64b=ancb, strip=True)
 
-        return vcstate(vcpre=vci,
-                       said=vcdig.decode("utf-8"),
-                       sn=vcsn,
-                       ri=self.prefixer.qb64,
-                       dts=serder.ked['dt'],
-                       eilk=vcilk,
-                       ra=ra,
-                       a=dict(s=seqner.sn, d=saider.qb64),
-                       )
+        vsr = vcstate(vcpre=vci,
+                      said=vcdig.decode("utf-8"),
+                      sn=vcsn,
+                      ri=self.prefixer.qb64,
+                      dts=serder.ked['dt'],
+                      eilk=vcilk,
+                      ra=ra,
+                      a=dict(s=seqner.sn, d=saider.qb64),
+                      )
+        self.reger.vcss.pin(keys=vci, val=vsr)
+        return vsr
 
     def vcSn(self, vci):
         """ Calculates the current seq no of VC from db.
@@ -1220,6 +1228,9 @@ class Tever:
             int: current TEL sequence number of credential or None if not found
 
         """
+        if (vsr := self.reger.vcss.get(keys=vci)) is not None:
+            return int(vsr.s, 16)
+
         cnt = self.reger.cntTels(vci)
 
         return None if cnt == 0 else cnt - 1
@@ -1253,10 +1264,39 @@ class Tever:
         self.reger.tets.pin(keys=(pre.decode("utf-8"), dig.decode("utf-8")), val=coring.Dater())
         self.reger.putTvt(key, serder.raw)
         self.reger.putTel(snKey(pre, sn), dig)
+        if serder.ilk in (Ilks.iss, Ilks.bis, Ilks.rev, Ilks.brv):
+            self.logVcState(pre=pre.decode("utf-8"), sn=sn, serder=serder,
+                            seqner=seqner, saider=saider)
         logger.info("Tever state: %s Added to TEL valid said=%s",
                     pre, serder.said)
         logger.debug(f"event=\n{serder.pretty()}\n")
 
+    def logVcState(self, pre, sn, serder, seqner, saider):
+        """ Update .reger.vcss credential state index with credential event
+        when it is not older than the indexed state.
+
+        Parameters:
+            pre (str): qb64 SAID of credential
+            sn (int): is event sequence number
+            serder (Serder): is Serder instance of credential event
+            seqner (Seqner): anchoring event sequence number from controlling KEL.
+            saider (Saider): anchoring event SAID from controlling KEL.
+        """
+        if (vsr := self.reger.vcss.get(keys=pre)) is not None and int(vsr.s, 16) > sn:
+            return
+
+        vsr = vcstate(vcpre=pre,
+                      said=serder.said,
+                      sn=sn,
+                      ri=self.prefixer.qb64,
+                      dts=serder.ked['dt'],
+                      eilk=serder.ilk,
+                      ra=serder.ked["ra"] if serder.ilk in (Ilks.bis, Ilks.brv) else dict(),
+                      a=dict(s=seqner.sn, d=saider.qb64),
+                      )
+        self.reger.vcss.pin(keys=pre, val=vsr)
+        self.reger.indexCredStatus(pre, serder.ilk)
+
     def valAnchorBigs(self, serder, seqner, saider, bigers, toad, baks):
         """ Validate anchor and backer signatures (bigers) when provided.
 
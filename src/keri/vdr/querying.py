@@ -0,0 +1,132 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.vdr.querying module
+
+Credential queries over the credential query indexes of Reger
+"""
+from itertools import islice
+
+from .. import help
+from ..db import dbing
+
+logger = help.ogler.getLogger()
+
+DtSize = len(dbing.dtHex(dbing.Epoch))  # chars of issuance datetime in cursor
+
+
+class Querier:
+    """
+    Querier answers credential queries that combine issuer, subject, schema,
+    registry and status in issuance date order with cursor based pagination.
+
+    Each query scans the one index of Reger.CredIndexes whose fields are all
+    given by the query and whose branch is estimated to be smallest. Other
+    fields of the query are checked for each scanned credential with one key
+    read of their single field index. Every index branch is ordered by
+    issuance datetime and SAID so results stream in that order and a page
+    reads only as far as it needs.
+
+    Class Attributes:
+        Probes (dict): single field index name of each query field
+
+    Attributes:
+        reger (Reger): credential database
+        cap (int): max index entries counted per branch size estimate
+
+    Usage:
+        querier = Querier(reger=reger)
+        saids, cursor = querier.query(schema=schema, issuer=pre, limit=50)
+        while cursor:
+            saids, cursor = querier.query(schema=schema, issuer=pre, limit=50,
+                                          cursor=cursor)
+    """
+    Probes = dict(issuer="issr", subject="subj", schema="schm",
+                  registry="regi", status="stat")
+
+    def __init__(self, reger, cap=1024):
+        """
+        Parameters:
+            reger (Reger): credential database
+            cap (int): max index entries counted per branch size estimate
+        """
+        self.reger = reger
+        self.cap = cap
+
+    def plan(self, **fields):
+        """
+        Returns tuple (name, top, probes) of the query fields where name is
+        the name of the index to scan, top is tuple of key parts of its branch
+        and probes is list of (name, val) of the single field indexes that
+        check the fields not in top.
+
+        Parameters:
+            fields (dict): query field values keyed by field name. None means
+                any value
+        """
+        fields = {field: val for field, val in fields.items() if val is not None}
+        if unknown := set(fields) - set(self.Probes):
+            raise ValueError(f"Invalid credential query fields={unknown}.")
+
+        best = None
+        for name, keys in self.reger.CredIndexes.items():
+            if not set(keys) <= set(fields):
+                continue
+            top = (name, *[fields[key] for key in keys])
+            cost = self.estimate(top)
+            if best is None or (cost, -len(keys)) < best[0]:
+                best = ((cost, -len(keys)), name, keys, top)
+
+        _, name, keys, top = best
+        probes = [(self.Probes[field], val) for field, val in fields.items()
+                  if field not in keys]
+        return name, top, probes
+
+    def estimate(self, top):
+        """
+        Returns int number of entries in index branch top up to .cap
+        """
+        return sum(1 for _ in islice(self.reger.cqix.getItemIter(keys=(*top, "")),
+                                     self.cap))
+
+    def seek(self, *, issuer=None, subject=None, schema=None, registry=None,
+             status=None, reverse=False, cursor=None):
+        """
+        Returns iterator of (cursor, said) of credentials matching all given
+        fields in issuance order where cursor resumes the scan after said.
+
+        Parameters:
+            issuer (str | None): qb64 AID of issuer
+            subject (str | None): qb64 AID of subject
+            schema (str | None): qb64 SAID of schema
+            registry (str | None): qb64 registry identifier
+            status (str | None): "issued" or "revoked"
+            reverse (bool): True means latest issued first
+            cursor (str | None): cursor of last credential of previous page.
+                None means from start
+        """
+        name, top, probes = self.plan(issuer=issuer, subject=subject, schema=schema,
+                                      registry=registry, status=status)
+        after = (*top, cursor[:DtSize], cursor[DtSize:]) if cursor else ""
+        for keys, said in self.reger.cqix.getItemRangeIter(keys=(*top, ""), after=after,
+                                                           reverse=reverse):
+            dt = keys[-2]
+            if all(self.reger.cqix.get(keys=(probe, val, dt, said)) is not None
+                   for probe, val in probes):
+                yield dt + said, said
+
+    def query(self, *, limit=25, **kwa):
+        """
+        Returns tuple (saids, cursor) of page of at most limit credential SAIDs
+        matching query and cursor of next page. Cursor is None on last page.
+
+        Parameters:
+            limit (int): max credentials per page
+            kwa (dict): query fields, reverse and cursor of .seek
+        """
+        if limit < 1:
+            raise ValueError(f"Invalid credential query {limit=}.")
+        page = list(islice(self.seek(**kwa), limit + 1))
+        if len(page) > limit:
+            return [said for _, said in page[:limit]], page[limit - 1][0]
+        return [said for _, said in page], None
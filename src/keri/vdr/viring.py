@@ -160,6 +160,40 @@ class VcStateRecord(basing.RawRecord):
     et: str = ''  # TEL evt packet type (ilk)
 
 
+@dataclass
+class CredIndexRecord:  # reger.cidx
+    """
+    Query index fields of saved credential in Reger.cqix so that its index
+    keys can be found and replaced when its status changes.
+
+    Attributes:
+        issuer (str): qb64 AID of issuer
+        subject (str): qb64 AID of subject. Empty when untargeted
+        schema (str): qb64 SAID of schema
+        registry (str): qb64 registry identifier. Empty when no registry
+        status (str): "issued" or "revoked". Empty when no TEL state
+        dt (str): hex microseconds of issuance datetime, see dbing.dtHex
+    """
+    issuer: str = ''
+    subject: str = ''
+    schema: str = ''
+    registry: str = ''
+    status: str = ''
+    dt: str = ''
+
+
+def credStatus(et):
+    """
+    Returns str query status "issued" or "revoked" of TEL event ilk et. Empty
+    when et is None or not a credential event ilk
+    """
+    if et in (coring.Ilks.iss, coring.Ilks.bis):
+        return "issued"
+    if et in (coring.Ilks.rev, coring.Ilks.brv):
+        return "revoked"
+    return ""
+
+
 def openReger(name="test", **kwa):
     """ Returns contextmanager generated by openLMDB but with Baser instance
 
@@ -233,12 +267,36 @@ class Reger(dbing.LMDBer):
             key is habitat name str
             value is serialized RegistryRecord dataclass
 
+        .cqix is named subDB instance of Suber of credential query indexes
+            keys are index name, the index fields of .CredIndexes, issuance
+            datetime as dtHex and credential SAID so each index branch is in
+            issuance order. value is credential SAID
+        .cidx is named subDB instance of Komer that maps credential SAIDs to
+            serialized CredIndexRecord of their indexed fields
+
+        .vcss is named subDB instance of Komer that maps credential SAIDs to
+            the transaction state of the credential in its TEL
+            key is credential SAID
+            value is serialized VcStateRecord dataclass of latest event
+            maintained by Tever.logEvent
+
 
     """
     TailDirPath = "keri/reg"
     AltTailDirPath = ".keri/reg"
     TempPrefix = "keri_reg_"
 
+    # credential query indexes of .cqix by name with their CredIndexRecord fields
+    CredIndexes = dict(scis=("schema", "issuer"),
+                       scsj=("schema", "subject"),
+                       rgst=("registry", "status"),
+                       issr=("issuer",),
+                       subj=("subject",),
+                       schm=("schema",),
+                       regi=("registry",),
+                       stat=("status",),
+                       cred=())
+
     def __init__(self, headDirPath=None, reopen=True, **kwa):
         """
         Setup named sub databases.
@@ -316,6 +374,12 @@ class Reger(dbing.LMDBer):
                                    subkey='stts.')
         #self.states = subing.SerderSuber(db=self, subkey='stts.')  # registry event state
 
+        # Credential state made of VcStateRecord of latest TEL event of credential
+        # keyed by credential SAID
+        self.vcss = koming.Komer(db=self,
+                                 schema=VcStateRecord,
+                                 subkey='vcss.')
+
         # Holds the credential
         self.creds = subing.SerderSuber(db=self, subkey="creds.", klas=serdering.SerderACDC)
 
@@ -345,6 +409,12 @@ class Reger(dbing.LMDBer):
         # Index of credentials by schema
         self.schms = subing.CesrDupSuber(db=self, subkey='schms.', klas=coring.Saider)
 
+        # Credential query indexes in issuance order and indexed fields by credential
+        self.cqix = subing.Suber(db=self, subkey='cqix.')
+        self.cidx = koming.Komer(db=self,
+                                 schema=CredIndexRecord,
+                                 subkey='cidx.')
+
         # Missing reegistry escrow
         self.mre = subing.CesrSuber(db=self, subkey='mre.', klas=coring.Dater)
         # Broken chain escrow
@@ -395,88 +465,127 @@ class Reger(dbing.LMDBer):
             list: fully hydrated credentials with full chains provided
 
         """
-        creds = []
+        return list(self.cloneCredIter(saids, db))
+
+    def cloneCredIter(self, saids, db, memo=None):
+        """ Iterator of fully expanded credentials with chained credentials attached
+
+        Each credential is hydrated once per call. A credential chained from
+        several credentials, such as the QVI credential of many ECR credentials,
+        is the same dict in each of their chains. The reads that hydrate each
+        credential share one read transaction of .reger and of db which is
+        ended before the credential is yielded so a suspended iterator does
+        not hold a snapshot.
+
+        Parameters:
+           saids (Iterable): of Saider objects
+           db (Baser): baser object to load schema and anchoring events
+           memo (dict | None): hydrated credentials keyed by SAID shared across
+               calls by the caller. None means new memo for this call
+
+        Returns:
+            Iterator: of dict fully hydrated credential with full chains provided
+
+        """
+        memo = memo if memo is not None else dict()
+        schemas = dict()
         for saider in saids:
-            key = saider.qb64
-            creder, prefixer, seqner, asaider = self.cloneCred(said=key)
-            atc = bytearray(signing.serialize(creder, prefixer, seqner, saider))
-            del atc[0:creder.size]
-
-            regk = creder.regi
-            status = self.tevers[regk].vcState(saider.qb64)
-            schemer = db.schema.get(creder.schema)
-
-            iss = bytearray(self.cloneTvtAt(creder.said, sn=0))
-            iserder = serdering.SerderKERI(raw=iss)
-            issatc = bytes(iss[iserder.size:])
-            del iss[0:iserder.size]
-            if status.et in [coring.Ilks.rev, coring.Ilks.brv]:
-                rev = bytearray(self.cloneTvtAt(creder.said, sn=1))
-                rserder = serdering.SerderKERI(raw=rev)
-                revatc = bytes(rev[rserder.size:])
-                del rev[0:rserder.size]
-
-            chainSaids = []
-            for k, p in (creder.edge.items() if creder.edge is not None else {}):
-                if k == "d":
-                    continue
-
-                if not isinstance(p, dict):
-                    continue
-
-                chainSaids.append(coring.Saider(qb64=p["n"]))
-            chains = self.cloneCreds(chainSaids, db)
-
-            cred = dict(
-                sad=creder.sad,
-                atc=atc.decode("utf-8"),
-                iss=iserder.sad,
-                issatc=issatc.decode("utf-8"),
-                rev=rserder.sad if status.et in [coring.Ilks.rev, coring.Ilks.brv] else None,
-                revatc=revatc.decode("utf-8") if status.et in [coring.Ilks.rev, coring.Ilks.brv] else None,
-                pre=creder.issuer,
-                schema=schemer.sed,
-                chains=chains,
-                status=asdict(status),
-                anchor=dict(
-                    pre=prefixer.qb64,
-                    sn=seqner.sn,
-                    d=asaider.qb64
-                )
+            with self.snapshot(), db.snapshot():
+                cred = self._cloneCred(saider.qb64, db, memo, schemas)
+            yield cred
+
+    def _cloneCred(self, said, db, memo, schemas):
+        """ Returns fully hydrated credential of said from memo or else hydrates
+        it and its chains and adds them to memo
+
+        Parameters:
+           said (str): qb64 SAID of credential
+           db (Baser): baser object to load schema and anchoring events
+           memo (dict): hydrated credentials keyed by SAID
+           schemas (dict): schema dicts keyed by schema SAID
+
+        """
+        if (cred := memo.get(said)) is not None:
+            return cred
+
+        creder, prefixer, seqner, asaider = self.cloneCred(said=said)
+        atc = bytearray(signing.serialize(creder, prefixer, seqner, coring.Saider(qb64=said)))
+        del atc[0:creder.size]
+
+        regk = creder.regi
+        status = self.tevers[regk].vcState(said)
+        if creder.schema not in schemas:
+            schemas[creder.schema] = db.schema.get(creder.schema).sed
+
+        iss = bytearray(self.cloneTvtAt(creder.said, sn=0))
+        iserder = serdering.SerderKERI(raw=iss)
+        issatc = bytes(iss[iserder.size:])
+        del iss[0:iserder.size]
+        if status.et in [coring.Ilks.rev, coring.Ilks.brv]:
+            rev = bytearray(self.cloneTvtAt(creder.said, sn=1))
+            rserder = serdering.SerderKERI(raw=rev)
+            revatc = bytes(rev[rserder.size:])
+            del rev[0:rserder.size]
+
+        chains = []
+        for k, p in (creder.edge.items() if creder.edge is not None else {}):
+            if k == "d":
+                continue
+
+            if not isinstance(p, dict):
+                continue
+
+            chains.append(self._cloneCred(p["n"], db, memo, schemas))
+
+        cred = dict(
+            sad=creder.sad,
+            atc=atc.decode("utf-8"),
+            iss=iserder.sad,
+            issatc=issatc.decode("utf-8"),
+            rev=rserder.sad if status.et in [coring.Ilks.rev, coring.Ilks.brv] else None,
+            revatc=revatc.decode("utf-8") if status.et in [coring.Ilks.rev, coring.Ilks.brv] else None,
+            pre=creder.issuer,
+            schema=schemas[creder.schema],
+            chains=chains,
+            status=asdict(status),
+            anchor=dict(
+                pre=prefixer.qb64,
+                sn=seqner.sn,
+                d=asaider.qb64
             )
+        )
 
+        ctr = core.Counter(qb64b=iss, strip=True, gvrsn=kering.Vrsn_1_0)
+        if ctr.code == counting.CtrDex_1_0.AttachmentGroup:
             ctr = core.Counter(qb64b=iss, strip=True, gvrsn=kering.Vrsn_1_0)
+
+        if ctr.code == counting.CtrDex_1_0.SealSourceCouples:
+            coring.Seqner(qb64b=iss, strip=True)
+            saider = coring.Saider(qb64b=iss)
+
+            anc = db.cloneEvtMsg(pre=creder.issuer, fn=0, dig=saider.qb64b)
+            aserder = serdering.SerderKERI(raw=anc)
+            ancatc = bytes(anc[aserder.size:])
+            cred['anc'] = aserder.sad
+            cred['ancatc'] = ancatc.decode("utf-8"),
+
+        if status.et in [coring.Ilks.rev, coring.Ilks.brv]:
+            ctr = core.Counter(qb64b=rev, strip=True, gvrsn=kering.Vrsn_1_0)
             if ctr.code == counting.CtrDex_1_0.AttachmentGroup:
-                ctr = core.Counter(qb64b=iss, strip=True, gvrsn=kering.Vrsn_1_0)
+                ctr = core.Counter(qb64b=rev, strip=True, gvrsn=kering.Vrsn_1_0)
 
             if ctr.code == counting.CtrDex_1_0.SealSourceCouples:
-                coring.Seqner(qb64b=iss, strip=True)
-                saider = coring.Saider(qb64b=iss)
+                coring.Seqner(qb64b=rev, strip=True)
+                saider = coring.Saider(qb64b=rev)
 
                 anc = db.cloneEvtMsg(pre=creder.issuer, fn=0, dig=saider.qb64b)
                 aserder = serdering.SerderKERI(raw=anc)
                 ancatc = bytes(anc[aserder.size:])
-                cred['anc'] = aserder.sad
-                cred['ancatc'] = ancatc.decode("utf-8"),
-            
-            if status.et in [coring.Ilks.rev, coring.Ilks.brv]:
-                ctr = core.Counter(qb64b=rev, strip=True, gvrsn=kering.Vrsn_1_0)
-                if ctr.code == counting.CtrDex_1_0.AttachmentGroup:
-                    ctr = core.Counter(qb64b=rev, strip=True, gvrsn=kering.Vrsn_1_0)
-
-                if ctr.code == counting.CtrDex_1_0.SealSourceCouples:
-                    coring.Seqner(qb64b=rev, strip=True)
-                    saider = coring.Saider(qb64b=rev)
+                cred['revanc'] = aserder.sad
+                cred['revancatc'] = ancatc.decode("utf-8"),
 
-                    anc = db.cloneEvtMsg(pre=creder.issuer, fn=0, dig=saider.qb64b)
-                    aserder = serdering.SerderKERI(raw=anc)
-                    ancatc = bytes(anc[aserder.size:])
-                    cred['revanc'] = aserder.sad
-                    cred['revancatc'] = ancatc.decode("utf-8"),
-
-            creds.append(cred)
-
-        return creds
+        memo[said] = cred
+        return cred
 
     def logCred(self, creder, prefixer, seqner, saider):
         """ Save the base credential and seals (est evt+sigs quad) with no indices.
@@ -492,6 +601,87 @@ class Reger(dbing.LMDBer):
         self.cancs.pin(keys=key, val=[prefixer, seqner, saider])
         self.creds.put(keys=key, val=creder)
 
+    def credIndexKeys(self, said, cir):
+        """ Returns list of keys of .cqix index entries of credential said
+        with indexed fields cir. Indexes with an empty field are skipped.
+
+        Parameters:
+            said (str): qb64 SAID of credential
+            cir (CredIndexRecord): indexed fields of credential
+        """
+        keys = []
+        for name, fields in self.CredIndexes.items():
+            vals = [getattr(cir, field) for field in fields]
+            if all(vals):
+                keys.append((name, *vals, cir.dt, said))
+        return keys
+
+    def indexCred(self, creder):
+        """ Indexes saved credential in .cqix with its current status from
+        .credIlk replacing any prior index entries. Idempotent.
+
+        Parameters:
+            creder (SerderACDC): saved credential
+        """
+        attrib = creder.attrib if isinstance(creder.attrib, dict) else {}
+        dt = attrib.get("dt")
+        cir = CredIndexRecord(issuer=creder.issuer,
+                              subject=attrib.get("i", ""),
+                              schema=creder.schema,
+                              registry=creder.regi or "",
+                              status=credStatus(self.credIlk(creder.said)),
+                              dt=dbing.dtHex(helping.fromIso8601(dt)) if dt else dbing.dtHex(dbing.Epoch))
+        self._reindexCred(creder.said, cir)
+
+    def credIlk(self, said):
+        """ Returns ilk of latest TEL event of credential said from .vcss or
+        from its TEL when logged before .vcss existed. None when never issued.
+
+        Parameters:
+            said (str): qb64 SAID of credential
+        """
+        if (vsr := self.vcss.get(keys=said)) is not None:
+            return vsr.et
+
+        dig = None
+        for _, _, dig in self.getTelItemPreIter(pre=said.encode("utf-8")):
+            pass
+        if dig is None or (raw := self.getTvt(key=dbing.dgKey(said, bytes(dig)))) is None:
+            return None
+        return serdering.SerderKERI(raw=bytes(raw)).ilk
+
+    def indexCredStatus(self, said, et):
+        """ Updates status of indexed credential said in .cqix to that of TEL
+        event ilk et. Credentials not yet indexed are ignored.
+
+        Parameters:
+            said (str): qb64 SAID of credential
+            et (str): ilk of latest TEL event of credential
+        """
+        if (cir := self.cidx.get(keys=said)) is None or cir.status == credStatus(et):
+            return
+        self._reindexCred(said, CredIndexRecord(**{**asdict(cir), "status": credStatus(et)}))
+
+    def _reindexCred(self, said, cir):
+        with self.transact():
+            if (old := self.cidx.get(keys=said)) is not None:
+                for keys in self.credIndexKeys(said, old):
+                    self.cqix.rem(keys=keys)
+            for keys in self.credIndexKeys(said, cir):
+                self.cqix.pin(keys=keys, val=said)
+            self.cidx.pin(keys=said, val=cir)
+
+    def indexCreds(self):
+        """ Indexes all saved credentials not yet in .cqix such as those saved
+        before the indexes existed. Returns number indexed.
+        """
+        count = 0
+        for (said,), _ in self.saved.getItemIter():
+            if self.cidx.get(keys=said) is None and (creder := self.creds.get(keys=said)) is not None:
+                self.indexCred(creder)
+                count += 1
+        return count
+
     def cloneCred(self, said):
         """ Load base credential and CESR proof signatures from database.
 
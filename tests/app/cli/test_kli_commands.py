@@ -1,3 +1,4 @@
+import importlib
 import os
 
 import multicommand
@@ -7,9 +8,9 @@ import pytest
 from keri.kering import ValidationError
 
 from keri import core
-from keri.core import coring
+from keri.core import coring, parsing, serdering
 
-from keri.app import directing
+from keri.app import directing, habbing
 
 from keri.app.cli import commands
 from keri.app.cli.common import existing
@@ -297,5 +298,37 @@ def test_incept_and_rotate_opts(helpers, capsys):
     directing.runController(doers=doers)
 
 
+def test_import(helpers, monkeypatch, tmp_path):
+    """
+    Test kli import of non-pipelined KEL stream larger than one parser chunk
+    """
+    helpers.remove_test_dirs("test-import")
+
+    with habbing.openHby(name="exporter", base="test") as srcHby:
+        hab = srcHby.makeHab(name="exporter")
+        for i in range(4):
+            hab.interact()
+
+        msgs = bytearray()
+        for msg in hab.db.clonePreIter(pre=hab.pre):
+            serder = serdering.SerderKERI(raw=bytes(msg))
+            msgs.extend(serder.raw)  # drop pipeline counter so groups are separate
+            msgs.extend(msg[serder.size + 4:])
+        pre = hab.pre
+
+    path = tmp_path / "kel.cesr"
+    path.write_bytes(msgs)
+    monkeypatch.setattr(parsing.Parser, "Chunk", 1)  # chunk ends between every group
+
+    # command parsers used directly since subparsers may be created only once
+    initing = importlib.import_module("keri.app.cli.commands.init")
+    importing = importlib.import_module("keri.app.cli.commands.import")
+    salt = core.Salter(raw=b'0123456789abcdef').qb64
+    args = initing.parser.parse_args(["--name", "test-import", "--nopasscode", "--salt", salt])
+    directing.runController(doers=args.handler(args))
 
+    args = importing.parser.parse_args(["--name", "test-import", "--file", str(path)])
+    directing.runController(doers=args.handler(args))
 
+    with existing.existingHby("test-import") as hby:
+        assert hby.kevers[pre].sn == 4
@@ -178,6 +178,7 @@ class PublishDoer(doing.DoDoer):
                     if found and serder.pre == found.pre:
                         break
                 yield self.tock
+            reger.close()
 
         self.remove(self.toRemove)
         return True
@@ -944,6 +944,38 @@ def test_postman_endsfor():
         }
 
 
+def test_replay_iter():
+    with habbing.openHby(salt=core.Salter(raw=b'0123456789abcdef').qb64) as hby:
+        hab = hby.makeHab(name="test")
+        hab.rotate()
+        hab.interact()
+
+        msgs = list(hab.replayIter())
+        assert len(msgs) == 1  # one chunk
+        assert b"".join(msgs) == hab.replay()
+        assert b"".join(hab.replayIter(fn=1)) == hab.replay(fn=1)
+        assert b"".join(hab.replayAllIter()) == hab.replayAll()
+
+        msgs = hab.replyEndRoleIter(cid=hab.pre, role=kering.Roles.controller)
+        assert b"".join(msgs) == hab.replyEndRole(cid=hab.pre, role=kering.Roles.controller)
+        assert list(hab.replyEndRoleIter(cid="EUnknown")) == []
+
+        chunks = list(helping.chunkify(hab.replayIter(), size=1))
+        assert len(chunks) == 1
+        assert b"".join(chunks) == hab.replay()
+
+        # each chunk read in own read transaction ended before it is yielded
+        chunks = hab.db.clonePreChunkIter(pre=hab.pre, size=1)
+        chunk = next(chunks)
+        assert hab.db._readers == 0  # no read transaction held while suspended
+        assert chunk == next(hab.db.clonePreIter(pre=hab.pre))  # icp
+        chunks = [chunk] + list(chunks)
+        assert len(chunks) == 3
+        assert b"".join(chunks) == hab.replay()
+        assert b"".join(hab.db.clonePreChunkIter(pre=hab.pre, fn=1, size=1)) == hab.replay(fn=1)
+        assert list(hab.db.clonePreChunkIter(pre="EUnknown")) == []
+
+
 if __name__ == "__main__":
     pass
     test_habery()
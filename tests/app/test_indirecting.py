@@ -18,6 +18,8 @@ from hio.help import decking
 from keri import kering
 from keri import core
 from keri.app import indirecting, storing, habbing, agenting
+from keri.help import metering
+from keri.vdr import viring
 
 
 def test_mailbox_iter():
@@ -68,11 +70,13 @@ def test_mailbox_iter():
     mbx.storeMsg(topic=f"{pre}/replay", msg=json.dumps(msg).encode("utf-8"))
     val = next(mbi)
     assert val == b''
+    assert not mb.sub.ready and not mb.dirty  # idle without reading
 
     mb.TimeoutMBX = 0  # Force the iter to timeout
 
     with pytest.raises(StopIteration):
         next(mbi)
+    assert not mbx._subs  # unsubscribed
 
 
 def test_mailbox_multiple_iter():
@@ -197,6 +201,7 @@ def test_wit_query_ends(seeder):
         assert doist.limit == limit
 
         doist.exit()
+        query_endpoint.reger.close()
 
 
 def wit_querier_test_do(tymth=None, tock=0.0, **opts):
@@ -275,6 +280,26 @@ class MockHttpServer:
         self.servant = servant
 
 
+def test_query_kel_iter():
+    with habbing.openHby(name="wes", salt=core.Salter(raw=b'wess-the-witness').qb64) as hby:
+        hab = hby.makeHab(name="wes")
+        hab.rotate()
+        hab.interact()
+        hab.interact()
+        reger = viring.Reger(name=hab.name, db=hab.db, temp=True)
+        query_endpoint = indirecting.QueryEnd(hab, reger=reger)
+
+        msgs = [hab.db.cloneEvtMsg(pre=hab.pre.encode(), fn=0, dig=dig)
+                for dig in hab.db.getKelIter(hab.pre, sn=1)]
+        chunks = query_endpoint.kelIter(pre=hab.pre, sn=1, size=1)
+        chunk = next(chunks)
+        assert hab.db._readers == 0  # no read transaction held while suspended
+        assert [chunk] + list(chunks) == msgs  # one event per chunk
+        assert list(query_endpoint.kelIter(pre=hab.pre, sn=1)) == [b"".join(msgs)]
+        assert list(query_endpoint.kelIter(pre=hab.pre, sn=4)) == []
+        reger.close(clear=True)
+
+
 def test_createHttpServer(monkeypatch):
     host = "0.0.0.0"
     port = 5632
@@ -291,6 +316,39 @@ def test_createHttpServer(monkeypatch):
     assert isinstance(server.servant, MockServerTls)
 
 
+def test_metrics_end():
+    registry = metering.Registry()
+    counter = registry.counter("test_total", "Test count")
+    deck = decking.Deck([1, 2, 3])
+    indirecting.Cues.track(deck, "test")
+
+    with habbing.openHby(name="wes", base="test") as hby:
+        app = falcon.App()
+        app.add_route("/metrics", indirecting.MetricsEnd(registry=registry, dbs=[hby.db]))
+        client = testing.TestClient(app)
+
+        rep = client.simulate_get("/metrics")
+        assert rep.status == falcon.HTTP_404  # disabled
+
+        registry.enabled = True
+        counter.inc()
+        rep = client.simulate_get("/metrics")
+        assert rep.status == falcon.HTTP_200
+        assert rep.headers["Content-Type"] == "text/plain; version=0.0.4; charset=utf-8"
+        assert "test_total 1" in rep.text.splitlines()
+
+        # default registry samples cue depths and db fill on scrape
+        enabled = metering.registry.enabled
+        metering.registry.enabled = True
+        try:
+            end = indirecting.MetricsEnd(dbs=[hby.db])
+            app.add_route("/all", end)
+            lines = client.simulate_get("/all").text.splitlines()
+            assert 'keri_cue_depth{queue="test"} 3' in lines
+            assert any(line.startswith('keri_lmdb_map_fill{db="wes"} ') for line in lines)
+        finally:
+            metering.registry.enabled = enabled
+            metering.registry.reset()
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ import os
 import stat
 import json
 from dataclasses import asdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from math import ceil
 
 import lmdb
@@ -673,6 +674,21 @@ def test_creator():
     assert signer.verfer.code in coring.NonTransDex
     assert signer.verfer.qb64 == 'BFRtyHAjSuJaRX6TDPva35GN11VHAruaOXMc79ZYDKsT'
 
+    # pooled stretching derives the same keys
+    serial = [signer.qb64 for signer in creator.create(count=3, ridx=1, temp=True)]
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        signers = creator.create(count=3, ridx=1, temp=True, pool=pool, budget=8192)
+    assert [signer.qb64 for signer in signers] == serial
+
+    # sets stretched as one pooled batch derive the same keys per set
+    sets = [([coring.MtrDex.Ed25519_Seed], 0, 0), ([coring.MtrDex.Ed25519_Seed] * 2, 1, 1)]
+    serial = [[signer.qb64 for signer in signers] for signers in creator.creates(sets=sets, temp=True)]
+    assert len(serial[0]) == 1 and len(serial[1]) == 2
+    assert serial[1] == [signer.qb64 for signer in creator.create(count=2, ridx=1, kidx=1, temp=True)]
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        batches = creator.creates(sets=sets, temp=True, pool=pool, budget=8192)
+    assert [[signer.qb64 for signer in signers] for signers in batches] == serial
+
     creator = keeping.Creatory(algo=keeping.Algos.salty).make(salt=salt)
     assert isinstance(creator, keeping.SaltyCreator)
     assert creator.salter.qb64 == salt
@@ -682,6 +698,36 @@ def test_creator():
     """End Test"""
 
 
+def test_manager_pool():
+    """
+    test Manager stretches current and next keys of inception as one pooled batch
+    """
+    class CountPool(ThreadPoolExecutor):
+        submits = 0
+
+        def submit(self, fn, *args, **kwargs):
+            CountPool.submits += 1
+            return super().submit(fn, *args, **kwargs)
+
+    salt = core.Salter(raw=b'0123456789abcdef').qb64
+    with keeping.openKS() as keeper, CountPool(max_workers=2) as pool:
+        manager = keeping.Manager(ks=keeper, salt=salt, pool=pool)
+        verfers, digers = manager.incept(icount=1, ncount=1, temp=True)
+        assert CountPool.submits == 2  # current and next in one batch
+        assert len(verfers) == 1 and len(digers) == 1
+
+        serial = keeping.SaltyCreator(salt=salt).creates(sets=[([coring.MtrDex.Ed25519_Seed], 0, 0),
+                                                               ([coring.MtrDex.Ed25519_Seed], 1, 1)],
+                                                         temp=True)
+        assert verfers[0].qb64 == serial[0][0].verfer.qb64
+        assert digers[0].qb64 == coring.Diger(ser=serial[1][0].verfer.qb64b).qb64
+
+        verfers, digers = manager.rotate(pre=verfers[0].qb64, ncount=2, temp=True)
+        assert CountPool.submits == 4
+        assert len(digers) == 2
+    """End Test"""
+
+
 def test_manager():
     """
     test Manager class
@@ -1997,5 +2043,72 @@ def test_manager_sign_dual_indices():
     assert not manager.ks.opened
     """End Test"""
 
+def test_manager_signer_cache():
+    """
+    Test Manager decrypted signer cache
+    """
+    seed = core.Signer(raw=b'h,#|\x8ap"\x12\xc43t2\xa6\xe1\x18\x19\xf0f2,y\xc4\xc21@\xf5@\x15.\xa2\x1a\xcf',
+                       transferable=False)
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+
+    with keeping.openKS() as keeper:
+        manager = keeping.Manager(ks=keeper, aeid=seed.verfer.qb64, seed=seed.qb64,
+                                  salt='0AAwMTIzNDU2Nzg5YWJjZGVm')
+        assert manager.SignerCacheSize == 0  # disabled by default
+        verfers, digers = manager.incept(icount=3)
+        sigers = [siger.qb64 for siger in manager.sign(ser, verfers=verfers)]
+        assert not manager._signers
+
+        manager.SignerCacheSize = 2
+        fetches = []
+        get = keeper.pris.get
+
+        def counting(*pa, **kwa):
+            fetches.append(pa[0])
+            return get(*pa, **kwa)
+
+        keeper.pris.get = counting
+        assert [siger.qb64 for siger in manager.sign(ser, verfers=verfers)] == sigers
+        assert len(fetches) == 3
+        assert list(manager._signers) == [verfer.qb64 for verfer in verfers[1:]]  # bounded
+        assert [siger.qb64 for siger in manager.sign(ser, verfers=verfers[1:], indices=[1, 2])] == sigers[1:]
+        assert len(fetches) == 3  # cache hits
+        assert [siger.qb64 for siger in manager.sign(ser, pubs=[verfers[2].qb64], indices=[2])] == sigers[2:]
+        assert len(fetches) == 3
+        assert list(manager._signers) == [verfers[1].qb64, verfers[2].qb64]
+
+        manager.SignerCacheTTL = 0.0  # expired
+        assert [siger.qb64 for siger in manager.sign(ser, verfers=verfers[1:2], indices=[1])] == sigers[1:2]
+        assert len(fetches) == 4
+        manager.SignerCacheTTL = 60.0
+
+        # rotation wipes
+        assert [siger.qb64 for siger in manager.sign(ser, verfers=verfers[1:2], indices=[1])] == sigers[1:2]
+        assert manager._signers
+        verfers, digers = manager.rotate(pre=verfers[0].qb64)
+        assert not manager._signers
+
+        # aeid update wipes
+        manager.sign(ser, verfers=verfers)
+        assert manager._signers
+        manager.updateAeid(aeid=seed.verfer.qb64, seed=seed.qb64)
+        assert not manager._signers
+
+        # no decrypter is unauthorized even when cached
+        manager.sign(ser, verfers=verfers)
+        decrypter = manager.decrypter
+        manager.decrypter = None
+        with pytest.raises(kering.DecryptError):
+            manager.sign(ser, verfers=verfers)
+        manager.decrypter = decrypter
+
+        # close wipes
+        doer = keeping.ManagerDoer(manager=manager)
+        doer.exit()
+        assert not manager._signers
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_manager_sign_dual_indices()
@@ -3,15 +3,18 @@
 tests.app.storing
 
 """
+import gc
 import os
+import time
 
 import lmdb
+from hio.base import doing
 
 from keri.app import keeping
 from keri.core import coring, serdering
 from keri.db import dbing, basing, subing
 from keri.peer import exchanging
-from keri.app.storing import Mailboxer
+from keri.app.storing import Mailboxer, Retainer, Subscription, TopicCursor
 
 
 def test_mailboxing():
@@ -111,5 +114,221 @@ def test_mailboxing():
 
 
 
+def test_mailbox_cursor():
+    """
+    Test Mailboxer batched topic reads, cursors and high-water marks
+    """
+    with dbing.openLMDB(cls=Mailboxer) as mber:
+        topic = "EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/receipt"
+        assert mber.mark(topic) == 0
+        assert mber.readTopic(topic) == ([], 0)
+
+        mber.storeMsg(topic="EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/reply", msg=b"x")
+        mber.storeMsg(topic="EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/zzz", msg=b"z")
+        msgs = [b"%d" % i * (i + 1) for i in range(6)]  # distinct sizes 1..6
+        for msg in msgs:
+            mber.storeMsg(topic=topic, msg=msg)
+        assert mber.mark(topic) == 6  # advanced by store
+        assert mber.mark(topic.encode()) == 6
+
+        mber._marks.clear()  # loaded from database
+        assert mber.mark(topic) == 6
+        assert mber.mark("EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/reply") == 1
+        assert mber.mark("EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/zzz") == 1
+        assert mber.mark("EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/a") == 0
+
+        assert mber.readTopic(topic, limit=2) == ([(0, msgs[0]), (1, msgs[1])], 2)
+        assert mber.readTopic(topic, fn=2, budget=7) == ([(2, msgs[2]), (3, msgs[3])], 4)
+        assert mber.readTopic(topic, fn=5, budget=1) == ([(5, msgs[5])], 6)  # at least one
+        assert mber.readTopic(topic, fn=6) == ([], 6)
+        assert mber.getTopicMsgs(topic, fn=3) == msgs[3:]
+
+        mber.delTopic(topic, on=1)  # gaps are skipped
+        assert mber.readTopic(topic, limit=2) == ([(0, msgs[0]), (2, msgs[2])], 3)
+
+        cursor = mber.cursor(topic, fn=4)
+        assert isinstance(cursor, TopicCursor)
+        assert cursor.pending
+        assert cursor.read() == [(4, msgs[4]), (5, msgs[5])]
+        assert cursor.fn == 6
+        assert not cursor.pending
+        assert cursor.read() == []
+
+        mber.storeMsg(topic=topic, msg=b"new")
+        assert cursor.pending
+        assert cursor.read() == [(6, b"new")]
+
+        mber.Batch = 2
+        assert [on for on, _, _ in mber.cloneTopicIter(topic)] == [0, 2, 3, 4, 5, 6]
+
+    """End Test"""
+
+
+def test_mailbox_subscription():
+    """
+    Test Mailboxer subscriptions notified on store with bounded queue
+    """
+    with dbing.openLMDB(cls=Mailboxer) as mber:
+        pre = "EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I"
+        sub = mber.subscribe([pre + "/receipt", pre + "/reply"], size=2)
+        assert isinstance(sub, Subscription)
+        assert sub.keys == (f"{pre}/receipt".encode(), f"{pre}/reply".encode())
+        assert not sub.ready
+
+        mber.storeMsg(topic=pre + "/other", msg=b"o")
+        assert not sub.ready  # other topic
+        mber.storeMsg(topic=pre + "/receipt", msg=b"a")
+        assert sub.ready
+        assert list(sub.queue) == [(f"{pre}/receipt".encode(), 0)]
+        assert sub.drain() == {f"{pre}/receipt".encode()}
+        assert not sub.ready
+
+        for i in range(3):  # overflows bounded queue
+            mber.storeMsg(topic=pre + "/receipt", msg=b"b%d" % i)
+        assert len(sub.queue) == 2
+        assert sub.overflowed
+        assert sub.drain() == set(sub.keys)  # reread all
+        assert not sub.ready
+
+        mber.unsubscribe(sub)
+        assert not mber._subs
+        mber.storeMsg(topic=pre + "/receipt", msg=b"c")
+        assert not sub.ready
+
+        sub = mber.subscribe([pre + "/receipt"])
+        assert sub.size == Subscription.Size
+        del sub
+        gc.collect()
+        assert not mber._subs[f"{pre}/receipt".encode()]  # held weakly
+        mber.storeMsg(topic=pre + "/receipt", msg=b"d")
+
+    """End Test"""
+
+
+def test_mailbox_retention():
+    """
+    Test Retainer mailbox garbage collection with reference counted messages
+    """
+    with dbing.openLMDB(cls=Mailboxer) as mber:
+        pre = "EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I"
+        for i in range(5):
+            mber.storeMsg(topic=pre + "/receipt", msg=b"r%d" % i)
+            mber.storeMsg(topic=pre + "/reply", msg=b"p%d" % i)
+        mber.storeMsg(topic=pre + "/multisig", msg=b"r0")  # shared with /receipt
+        dig = mber.tpcs.getOn(keys=pre + "/receipt", on=0)
+        assert mber.rcts.get(keys=dig) == "2"
+        assert int(mber.stms.getOn(keys=pre + "/receipt", on=0), 16) <= time.time() * 1e6
+        assert [key for key, on in mber.getTopicHeadIter()] == [f"{pre}/multisig".encode(),
+                                                             f"{pre}/receipt".encode(),
+                                                             f"{pre}/reply".encode()]
+        assert mber.size() > 0
+
+        # no policy retains everything
+        retainer = Retainer(mbx=mber)
+        assert retainer.prune(now=time.time() + 1e9) == dict(entries=0, msgs=0, bytes=0)
+
+        # shared message kept until last reference removed
+        assert mber.remTopicMsg(pre + "/receipt", 0) == 0
+        assert mber.rcts.get(keys=dig) == "1"
+        assert mber.msgs.get(keys=dig) == "r0"
+        assert mber.remTopicMsg(pre + "/receipt", 0) is None
+        assert mber.remTopicMsg(pre + "/multisig", 0) == 2
+        assert mber.msgs.get(keys=dig) is None
+        assert mber.rcts.get(keys=dig) is None
+
+        # cap with bounded work per recur
+        retainer = Retainer(mbx=mber, cap=2, work=2)
+        assert retainer.prune() == dict(entries=2, msgs=2, bytes=4)  # /receipt
+        assert retainer._resume == f"{pre}/reply".encode()
+        assert retainer.prune() == dict(entries=2, msgs=2, bytes=4)  # /reply
+        assert retainer.prune() == dict(entries=1, msgs=1, bytes=2)  # wraps
+        assert retainer.prune() == dict(entries=0, msgs=0, bytes=0)
+        assert mber.getTopicMsgs(pre + "/receipt") == [b"r3", b"r4"]
+        assert mber.getTopicMsgs(pre + "/reply") == [b"p3", b"p4"]
+        assert retainer.stats["entries"] == 5
+        assert retainer.stats["passes"] >= 1
+
+        # per topic TTL, legacy entries without stamp are stamped on first visit
+        mber.stms.remOn(keys=pre + "/reply", on=4)
+        retainer = Retainer(mbx=mber, ttl=None, ttls={"/reply": 60})
+        now = time.time()
+        assert retainer.prune(now=now) == dict(entries=0, msgs=0, bytes=0)
+        assert retainer.prune(now=now + 61) == dict(entries=1, msgs=1, bytes=2)
+        assert mber.getTopicMsgs(pre + "/reply") == [b"p4"]  # stamped at now
+        assert retainer.prune(now=now + 122) == dict(entries=1, msgs=1, bytes=2)
+        assert mber.getTopicMsgs(pre + "/receipt") == [b"r3", b"r4"]  # retained forever
+
+        # quota evicts oldest entry of each topic per visit
+        retainer = Retainer(mbx=mber, quota=1)
+        assert retainer.prune() == dict(entries=1, msgs=1, bytes=2)
+        assert retainer.prune() == dict(entries=1, msgs=1, bytes=2)
+        assert retainer.prune() == dict(entries=0, msgs=0, bytes=0)  # empty
+        assert not list(mber.msgs.getItemIter())
+        assert not list(mber.stms.getItemIter())
+        assert not list(mber.rcts.getItemIter())
+
+        doist = doing.Doist(limit=0.1, tock=0.03125, real=True)
+        doist.do(doers=[Retainer(mbx=mber, ttl=0)])
+
+        # ordinals of topic emptied by retention are not reused
+        topic = pre + "/credential"
+        for i in range(3):
+            mber.storeMsg(topic=topic, msg=b"c%d" % i)
+        cursor = mber.cursor(topic)
+        assert cursor.read() == [(0, b"c0"), (1, b"c1"), (2, b"c2")]
+        assert Retainer(mbx=mber, ttl=0).prune(now=time.time() + 1) == dict(entries=3, msgs=3, bytes=6)
+        assert mber.getTopicMsgs(topic) == []
+        assert mber.mark(topic) == 3
+        mber.storeMsg(topic=topic, msg=b"c3")
+        assert cursor.pending
+        assert cursor.read() == [(3, b"c3")]
+        mber._marks.clear()  # loaded from database
+        assert mber.mark(topic) == 4
+        assert mber.appendToTopic(topic, mber.tpcs.getOn(keys=topic, on=3)) == 4
+        assert mber.mark(topic) == 5
+
+    """End Test"""
+
+
+def test_mailbox_recount():
+    """
+    Test Mailboxer reference counts rebuilt for messages stored before counting
+    and kept by topic index methods
+    """
+    with dbing.openLMDB(cls=Mailboxer) as mber:
+        pre = "EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I"
+        mber.storeMsg(topic=pre + "/receipt", msg=b"r0")
+        mber.storeMsg(topic=pre + "/multisig", msg=b"r0")  # shared with /receipt
+        mber.storeMsg(topic=pre + "/receipt", msg=b"r1")
+        dig = mber.tpcs.getOn(keys=pre + "/receipt", on=0)
+        assert mber.rcts.get(keys=dig) == "2"
+
+        assert mber.rcts.trim()  # legacy mailbox without counts
+        mber.reopen(reuse=True)
+        assert mber.rcts.get(keys=dig) == "2"  # rebuilt on open
+        assert mber.rcts.get(keys=mber.tpcs.getOn(keys=pre + "/receipt", on=1)) == "1"
+
+        assert mber.remTopicMsg(pre + "/receipt", 0) == 0  # still referenced
+        assert mber.msgs.get(keys=dig) == "r0"
+        assert mber.getTopicMsgs(pre + "/multisig") == [b"r0"]
+
+        # append and delete of topic index count references
+        assert mber.appendToTopic(pre + "/reply", dig) == 0
+        assert mber.rcts.get(keys=dig) == "2"
+        assert mber.stms.getOn(keys=pre + "/reply", on=0) is not None
+        assert mber.delTopic(pre + "/multisig")
+        assert not mber.delTopic(pre + "/multisig")
+        assert mber.msgs.get(keys=dig) == "r0"
+        assert mber.delTopic(pre + "/reply")
+        assert mber.msgs.get(keys=dig) is None
+        assert mber.rcts.get(keys=dig) is None
+
+    """End Test"""
+
+
 if __name__ == '__main__':
     test_mailboxing()
+    test_mailbox_cursor()
+    test_mailbox_subscription()
+    test_mailbox_retention()
+    test_mailbox_recount()
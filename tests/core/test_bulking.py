@@ -0,0 +1,75 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.core.test_bulking module
+
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from keri.app import habbing
+from keri.core import bulking, eventing
+
+
+def test_verdicts():
+    """
+    Test Verdicts cache of precomputed verification results
+    """
+    calls = []
+
+    def fn(job):
+        calls.append(job)
+        return True
+
+    verdicts = eventing.Verdicts({("A", b"k", b"s", b"r"): False})
+    jobs = [("A", b"k", b"s", b"r"), ("A", b"k", b"s", b"r")]
+    assert list(verdicts.map(fn, jobs, chunksize=4)) == [False, True]
+    assert calls == [("A", b"k", b"s", b"r")]  # used once then verified
+    assert verdicts.hits == 1
+    assert verdicts.misses == 1
+    assert not verdicts.verdicts
+
+    """End Test"""
+
+
+def test_bulker():
+    """
+    Test Bulker bulk ingest of multiple KELs
+    """
+    with (habbing.openHby(name="src", base="test") as srcHby,
+          habbing.openHby(name="dst", base="test") as dstHby):
+        amy = srcHby.makeHab(name="amy", isith="2", icount=3, nsith="2", ncount=3)
+        bob = srcHby.makeHab(name="bob")
+        for _ in range(3):
+            amy.interact()
+            bob.rotate()
+            bob.interact()
+        amy.rotate(isith="2", ncount=3, nsith="2")
+        amy.interact()
+
+        msgs = bytearray()
+        for msg in srcHby.db.cloneAllPreIter():
+            msgs.extend(msg)
+        sigs = 3 * 6 + 7  # amy sigs + bob sigs, but not signator's
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            bulker = bulking.Bulker(kvy=dstHby.kvy, rvy=dstHby.rvy, pool=pool)
+            bulker.Window = 4  # several windows
+            stats = bulker.ingest(ims=bytes(msgs))
+
+        assert dstHby.kvy.pool is None  # restored
+        assert stats["bytes"] == len(msgs)
+        assert stats["events"] == stats["msgs"] >= 13
+        assert stats["sigs"] >= sigs
+        assert stats["cached"] == stats["sigs"]  # none verified twice
+        assert stats["eps"] > 0.0 and stats["bps"] > 0.0
+        assert bulker.stats == stats
+
+        for hab in (amy, bob):
+            kever = dstHby.kvy.kevers[hab.pre]
+            assert kever.sn == hab.kever.sn
+            assert kever.serder.said == hab.kever.serder.said
+            assert ([verfer.qb64 for verfer in kever.verfers] ==
+                    [verfer.qb64 for verfer in hab.kever.verfers])
+            assert (list(dstHby.db.getFelItemPreIter(hab.pre)) ==
+                    list(srcHby.db.getFelItemPreIter(hab.pre)))
+
+    """End Test"""
@@ -0,0 +1,108 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.core.test_coding module
+
+"""
+import json
+
+import pytest
+
+from keri import kering
+from keri.core import coding, coring, serdering
+from keri.kering import Kinds
+
+KEY = "DA8-J3EW3Yj_7v5XZ0G1X-BzrS7jBE3ufnYj0QeR6Kkv"
+
+def test_codecs():
+    """
+    Test codecs are byte identical to reference serialization
+    """
+    ref = coding.JSONCodec()
+    sads = [dict(v="KERI10JSON000000_", k=["DAbc", "DDef"], a=[dict(i="E", s="0")]),
+            dict(a="\x00\x1f\x7f é 𝄞 \"\\/", b=[True, None, False, -1, 2 ** 63 - 1]),
+            dict(a=1e16, b=1e-7, c=0.1, d=float("inf")),  # floats fall back
+            dict(a=2 ** 70),  # big int falls back
+            {1: "a"},  # non str key falls back
+            [dict(a=(1, 2))]]
+    for sad in sads:
+        raw = coding.dumps(sad, kind=Kinds.json)
+        assert raw == ref.dumps(sad)
+        assert raw == json.dumps(sad, separators=(",", ":"),
+                                 ensure_ascii=False).encode("utf-8")
+        assert coding.loads(raw) == json.loads(raw.decode("utf-8"))
+        assert coding.loads(memoryview(raw)) == json.loads(raw.decode("utf-8"))
+
+    assert coding.loads(b'{"a":NaN,"b":1E400}') == json.loads('{"a":NaN,"b":1E400}')
+    assert coding.FastJSONCodec.floaty(dict(a=[dict(b=1.0)]))
+    assert not coding.FastJSONCodec.floaty(dict(a=[dict(b=1, c="1.0")]))
+    with pytest.raises(TypeError):
+        coding.dumps(dict(a=object()))
+    with pytest.raises(ValueError):
+        coding.loads(b'{"a":')
+    with pytest.raises(KeyError):
+        coding.dumps(dict(), kind=Kinds.cesr)
+
+    for kind in (Kinds.cbor, Kinds.mgpk):
+        raw = coding.dumps(sads[0], kind=kind)
+        assert coding.loads(raw, kind=kind) == sads[0]
+        assert coring.loads(raw, kind=kind) == sads[0]
+        assert coring.dumps(sads[0], kind=kind) == raw
+
+    with pytest.raises(ValueError):
+        coring.dumps(dict(), kind=Kinds.cesr)
+    with pytest.raises(kering.DeserializeError):
+        coring.loads(b'{"a":', kind=Kinds.json)
+
+    # pluggable
+    class CountingCodec(coding.JSONCodec):
+        count = 0
+
+        def dumps(self, sad):
+            self.count += 1
+            return super().dumps(sad)
+
+    codec = CountingCodec()
+    prior = coding.register(codec)
+    try:
+        assert coring.dumps(dict(a="b")) == b'{"a":"b"}'
+        assert codec.count == 1
+        serder = serdering.SerderKERI(makify=True, sad=dict(t="icp", k=[KEY]))
+        assert codec.count == 3  # single pass said computation and verify
+        assert serdering.SerderKERI(raw=serder.raw).said == serder.said
+        assert codec.count == 4  # single pass verify
+    finally:
+        assert coding.register(prior) is codec
+
+    """End Test"""
+
+
+def test_single_pass_said():
+    """
+    Test single pass said patching matches serialization of saidified sad
+    """
+    for kind in (Kinds.json, Kinds.cbor, Kinds.mgpk):
+        serder = serdering.SerderKERI(makify=True, kind=kind,
+                                      sad=dict(t="icp", k=[KEY], n=["EAbc"]))
+        assert serder.raw == serder.dumps(serder.sad, kind=kind)
+        assert serder.said == serder.pre  # both i and d saidive
+        assert serder.verify()
+
+    # stray dummy chars fall back to serializing again
+    sad = dict(t="icp", k=[KEY], a=[dict(d="#" * 44)])
+    serder = serdering.SerderKERI(makify=True, sad=sad)
+    assert serder.raw == serder.dumps(serder.sad)
+    assert serder.sad["a"] == [dict(d="#" * 44)]
+    assert serder.said == serder.pre
+    assert serder.verify()
+
+    raw = b'{"v":"#####","d":"##"}'
+    assert serder._patch(raw, dict(v="#####", d="##"), dict(d="E"), vs="ABC") is None
+    raw = b'{"v":"#####","d":"###"}'
+    assert serder._patch(raw, dict(v="#####", d="##"), dict(d="E"), vs="ABCDE") is None
+
+    """End Test"""
+
+
+if __name__ == "__main__":
+    test_codecs()
+    test_single_pass_said()
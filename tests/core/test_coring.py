@@ -1862,6 +1862,43 @@ def test_matter():
 
     """ Done Test """
 
+
+def test_matter_memo():
+    """
+    Test Matter memoizes encodings and keeps parsed stream slice
+    """
+    raw = b'\x9f{\xa8\xa7\xa8C9\x96&\xfa\xb1\x99\xeb\xaa \xc4\x1bG\x11\xc4\xaeSAR' \
+          b'\xc9\xbd\x04\x9d\x85)~\x93'
+    matter = Matter(raw=raw, code=MtrDex.Ed25519N)
+    assert matter._qb64b is None and matter._qb2 is None
+    qb64b = matter.qb64b
+    assert matter.qb64b is qb64b  # memoized
+    assert matter.qb64 is matter.qb64
+    assert matter.qb2 is matter.qb2
+    assert qb64b == matter._infil()
+    assert matter.qb2 == matter._binfil()
+
+    stream = bytearray(qb64b + b'extra')
+    matter = Matter(qb64b=stream, strip=True)
+    assert isinstance(matter._qb64b, bytes)  # kept slice not bytearray
+    assert matter._qb64b == qb64b
+    assert stream == bytearray(b'extra')
+    assert matter.qb64b == matter._infil()
+
+    qb2 = bytearray(matter.qb2)
+    matter = Matter(qb2=memoryview(qb2))
+    assert matter._qb2 == bytes(qb2)
+    assert matter.qb2 == matter._binfil()
+    assert matter.qb64b == qb64b
+
+    # noncanonical Base64 chars are re-encoded not kept
+    qb64 = 'DC8kCMHKrYZewclvG9vj1R1nSspiRwPi-ByqRwFuyq4i'
+    matter = Matter(qb64=qb64.replace("-", "+"))
+    assert matter._qb64b is None
+    assert matter.qb64 == qb64
+    """ Done Test """
+
+
 def test_matter_special():
     """
     Test Matter instances using code with special soft values
@@ -7,6 +7,8 @@ import os
 import time
 import datetime
 
+import pytest
+
 from keri import help
 from keri.help import helping
 
@@ -14,7 +16,7 @@ from keri import core, kering
 from keri.core import coring, eventing, parsing
 
 from keri.db import dbing, basing
-from keri.app import keeping
+from keri.app import habbing, keeping
 
 
 logger = help.ogler.getLogger()
@@ -857,6 +859,111 @@ def test_out_of_order_escrow():
     """End Test"""
 
 
+def test_driven_escrow():
+    """
+    Test event driven escrow processing only retries woken prefixes
+    """
+    salt = core.Salter(raw=b'0123456789abcdef').qb64
+    psr = parsing.Parser()
+
+    with habbing.openHby(name="wes", salt=salt) as hby, \
+            basing.openDB(name="val") as db:
+        hab = hby.makeHab(name="wes", isith="1", icount=1)
+        hab.interact()
+        hab.interact()
+        pre = hab.pre
+        icpmsg = hab.makeOwnEvent(sn=0)
+        ixnmsg1 = hab.makeOwnEvent(sn=1)
+        ixnmsg2 = hab.makeOwnEvent(sn=2)
+
+        kvy = eventing.Kevery(db=db, lax=True, local=False, driven=True)
+        assert kvy.driven
+        assert not kvy.wakes
+        assert kvy.swept is None
+
+        passes = []
+        processOOE = kvy.processEscrowOutOfOrders
+
+        def countOOE(pre=None):
+            passes.append(pre)
+            processOOE(pre=pre)
+
+        kvy.processEscrowOutOfOrders = countOOE
+
+        psr.parse(ims=bytearray(ixnmsg2), kvy=kvy)
+        psr.parse(ims=bytearray(ixnmsg1), kvy=kvy)
+        assert pre not in kvy.kevers
+        assert kvy.db.getOoes(dbing.snKey(pre, 1))
+        assert kvy.db.getOoes(dbing.snKey(pre, 2))
+        assert kvy.wakes == {pre}
+
+        kvy.processEscrows()  # first pass is full sweep
+        assert passes == [None]
+        assert kvy.swept is not None
+        assert not kvy.wakes  # still out of order so not rewoken
+        assert kvy.db.getOoes(dbing.snKey(pre, 1))
+
+        kvy.processEscrows()  # nothing woke so nothing retried
+        assert passes == [None]
+
+        psr.parse(ims=bytearray(icpmsg), kvy=kvy)
+        assert pre in kvy.kevers
+        assert kvy.wakes == {pre}
+
+        def failOOE(pre=None):
+            raise ValueError("Escrow failure")
+
+        kvy.processEscrowOutOfOrders = failOOE
+        with pytest.raises(ValueError):
+            kvy.processEscrows()
+        assert kvy.wakes == {pre}  # woken prefix not lost
+        assert not kvy.escrowing
+        kvy.processEscrowOutOfOrders = countOOE
+
+        kvy.processEscrows()  # only woken prefix retried
+        assert passes == [None, pre]
+        assert kvy.kevers[pre].sn == 2
+        assert not kvy.db.getOoes(dbing.snKey(pre, 1))
+        assert not kvy.db.getOoes(dbing.snKey(pre, 2))
+
+        kvy.swept -= datetime.timedelta(seconds=kvy.EscrowSweep + 1)
+        kvy.wakes.clear()
+        kvy.processEscrows()  # sweep due so full sweep
+        assert passes == [None, pre, None]
+
+        # transferable receipt escrowed under receipted prefix waits on receipter
+        bob = hby.makeHab(name="bob", isith="1", icount=1)
+        rctmsg = bob.receipt(hab.kever.serder)
+        psr.parse(ims=bytearray(rctmsg), kvy=kvy)
+        assert kvy.db.getVres(dbing.snKey(pre, 2))
+        kvy.processEscrows()
+        assert kvy.db.getVres(dbing.snKey(pre, 2))  # receipter KEL still missing
+
+        psr.parse(ims=bytearray(bob.makeOwnEvent(sn=0)), kvy=kvy)
+        assert kvy.wakes == {bob.pre}  # only receipter woken
+        kvy.processEscrows()
+        assert passes[-1] == bob.pre
+        assert not kvy.db.getVres(dbing.snKey(pre, 2))
+        assert len(kvy.db.getVrcs(dbing.dgKey(pre, hab.kever.serder.said))) == 1
+
+        # expired items of each escrow are found once per pass for all woken
+        scans = []
+        getExpired = kvy.db.getExpiredEscrowIter
+
+        def countScans(escrow, cutoff):
+            scans.append(escrow)
+            return getExpired(escrow, cutoff)
+
+        kvy.db.getExpiredEscrowIter = countScans
+        kvy.wakes.update({pre, bob.pre})
+        kvy.processEscrows()
+        assert passes[-2:] == sorted([pre, bob.pre])
+        assert scans and len(scans) == len(set(scans))
+        assert kvy.expired is None
+
+    """End Test"""
+
+
 def test_unverified_receipt_escrow():
     """
     Test unverified receipt escrow
@@ -4,6 +4,7 @@ tests.core.test_eventing module
 
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import blake3
 import pysodium
@@ -606,6 +607,79 @@ def test_lastestloc():
     """End Test """
 
 
+def test_verify_sigs_wigs():
+    """
+    Test batch signature verification verifySigsWigs serial and pooled
+    """
+    salt = b'g\x15\x89\x1a@\xa4\xa47\x07\xb9Q\xb8\x18\xcdJW'
+    signers = core.Salter(raw=salt).signers(count=3)
+    wesigners = core.Salter(raw=salt).signers(count=2, transferable=False,
+                                              temp=True, path="wit")
+    verfers = [signer.verfer for signer in signers]
+    werfers = [signer.verfer for signer in wesigners]
+
+    raw = b'{"v":"KERI10JSON000000_","t":"icp"}'
+    sigers = [signer.sign(raw, index=i) for i, signer in enumerate(signers)]
+    sigers.append(sigers[0])  # duplicate is ignored
+    bad = signers[2].sign(b'wrong', index=2)  # index 2 does not verify
+    sigers[2] = bad
+    wigers = [signer.sign(raw, index=i) for i, signer in enumerate(wesigners)]
+
+    vsigers, vindices = eventing.verifySigs(raw, sigers, verfers)
+    assert vindices == [0, 1]
+    assert [siger.verfer.qb64 for siger in vsigers] == [verfers[0].qb64,
+                                                        verfers[1].qb64]
+
+    result = eventing.verifySigsWigs(raw=raw, sigers=sigers, verfers=verfers,
+                                     wigers=wigers, werfers=werfers)
+    vsigers, vindices, vwigers, vwindices = result
+    assert vindices == [0, 1]
+    assert vwindices == [0, 1]
+    assert [wiger.verfer.qb64 for wiger in vwigers] == [werfer.qb64 for werfer in werfers]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert eventing.batchVerify([(verfers[0], sigers[0].raw, raw),
+                                     (verfers[2], bad.raw, raw)],
+                                    pool=pool) == [True, False]
+        presult = eventing.verifySigsWigs(raw=raw, sigers=sigers, verfers=verfers,
+                                          wigers=wigers, werfers=werfers,
+                                          pool=pool)
+        assert presult[1] == vindices
+        assert presult[3] == vwindices
+
+        # pooled Kevery accepts fully signed inception
+        serder = incept(keys=[verfer.qb64 for verfer in verfers[:2]], isith="2",
+                        ndigs=[coring.Diger(ser=verfers[2].qb64b).qb64])
+        esigers = [signers[i].sign(serder.raw, index=i) for i in range(2)]
+        with openDB(name="pooled") as db:
+            kvy = Kevery(db=db, pool=pool)
+            kvy.processEvent(serder=serder, sigers=esigers)
+            assert serder.pre in kvy.kevers
+            assert kvy.kevers[serder.pre].sn == 0
+
+    # misfit checks come before witness index errors so misfit still escrows
+    with habbing.openHby(name="misfit", base="test") as hby:
+        hab = hby.makeHab(name="misfit")
+        kever = hab.kever
+        serder = interact(pre=hab.pre, dig=kever.serder.said, sn=1)
+        sigers = hab.sign(ser=serder.raw, indexed=True)
+        wigers = [wesigners[0].sign(serder.raw, index=1)]  # no witness at 1
+        with pytest.raises(kering.MisfitEventSourceError):
+            kever.valSigsWigsDel(serder=serder, sigers=sigers,
+                                 verfers=kever.verfers, tholder=kever.tholder,
+                                 wigers=wigers, toader=kever.toader,
+                                 wits=kever.wits, local=False)
+        assert hby.db.misfits.get(keys=(hab.pre, serder.snh)) == [serder.said]
+
+        with pytest.raises(IndexError):  # local so not misfit
+            kever.valSigsWigsDel(serder=serder, sigers=sigers,
+                                 verfers=kever.verfers, tholder=kever.tholder,
+                                 wigers=wigers, toader=kever.toader,
+                                 wits=kever.wits, local=True)
+
+    """End Test """
+
+
 def test_seals_states():
     """
     Test seal and state namedtuples
@@ -4976,6 +5050,89 @@ def test_load_event(mockHelpingNowUTC):
     """End Test"""
 
 
+def test_log_event_map_full():
+    """
+    Test logEvent retries its unit of work after the map fills during it
+    """
+    with habbing.openHby(name="filler", base="test") as hby, openDB(name="full") as db:
+        hab = hby.makeHab(name="filler")
+        kvy = Kevery(db=db)
+        parsing.Parser(kvy=kvy).parse(ims=bytearray(next(hab.db.clonePreIter(pre=hab.pre))))
+        assert kvy.kevers[hab.pre].sn == 0
+
+        seal = dict(i=hab.pre, s="0", d=hab.kever.serder.said)
+        msg = hab.interact(data=[seal] * 256)  # event larger than free map
+        db.MapFill = 1.0  # do not grow before unit of work
+        db.env.set_mapsize((db.env.info()["last_pgno"] + 1) * db.env.stat()["psize"])
+        size = db.env.info()["map_size"]
+
+        parsing.Parser(kvy=kvy).parse(ims=bytearray(msg))
+        assert kvy.kevers[hab.pre].sn == 1  # not lost
+        assert db.env.info()["map_size"] > size
+        assert db.getKeLast(snKey(hab.pre, 1)) is not None
+
+    """End Test"""
+
+
+def test_escrow_map_full():
+    """
+    Test escrowed event is not lost when the map fills while it is unescrowed
+    """
+    with habbing.openHby(name="filler", base="test") as hby, openDB(name="full") as db:
+        hab = hby.makeHab(name="filler")
+        kvy = Kevery(db=db)
+        parsing.Parser(kvy=kvy).parse(ims=bytearray(next(hab.db.clonePreIter(pre=hab.pre))))
+
+        first = hab.interact()
+        seals = [dict(i=hab.pre, s=f"{i:x}", d=hab.kever.serder.said) for i in range(1024)]
+        msg = hab.interact(data=seals)  # anchor index larger than free map
+        parsing.Parser(kvy=kvy).parse(ims=bytearray(msg))  # out of order so escrowed
+        parsing.Parser(kvy=kvy).parse(ims=bytearray(first))
+        assert kvy.kevers[hab.pre].sn == 1
+
+        db.MapFill = 1.0  # do not grow before unit of work
+        db.env.set_mapsize((db.env.info()["last_pgno"] + 1) * db.env.stat()["psize"])
+        size = db.env.info()["map_size"]
+
+        kvy.processEscrows()
+        assert kvy.kevers[hab.pre].sn == 2  # not lost
+        assert db.env.info()["map_size"] > size
+        assert db._readers == 0
+        assert not db.getOoes(snKey(hab.pre, 2))
+
+    """End Test"""
+
+
+def test_accept_one_unit():
+    """
+    Test Kever logs accepted event and pins its key state in one unit of work
+    """
+    with habbing.openHby(name="acceptor", base="test") as hby:
+        hab = hby.makeHab(name="acceptor")
+        kever = hab.kever
+        serder = interact(pre=hab.pre, dig=kever.serder.said, sn=1)
+        sigers = hab.sign(ser=serder.raw, verfers=kever.verfers)
+
+        pin = hab.db.states.pin
+        def fail(**kwa):
+            raise ValueError("crash before key state pinned")
+        hab.db.states.pin = fail
+        with pytest.raises(ValueError):
+            kever.update(serder=serder, sigers=sigers)
+        assert hab.db.getKeLast(snKey(hab.pre, 1)) is None  # event aborted with state
+        assert hab.db.getFe(dbing.fnKey(hab.pre, 1)) is None
+        assert kever.sn == 0 and kever.fn == 0  # prior key state restored
+        assert hab.db.states.get(keys=hab.pre).s == "0"
+
+        hab.db.states.pin = pin
+        kever.update(serder=serder, sigers=sigers)
+        assert hab.db.getKeLast(snKey(hab.pre, 1)) is not None
+        assert kever.sn == 1 and kever.fn == 1
+        assert hab.db.states.get(keys=hab.pre).s == "1"
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     # pytest.main(['-vv', 'test_eventing.py::test_keyeventfuncs'])
     #test_process_manual()
@@ -743,6 +743,18 @@ def test_indexer():
     assert indexer.qb64b == b'0zAA'
     assert indexer.qb64 == '0zAA'
     assert indexer.qb2 == b'\xd30\x00'
+
+    # test memoized encodings and kept stream slice
+    assert indexer.qb64b is indexer.qb64b
+    assert indexer.qb2 is indexer.qb2
+    stream = bytearray(b'0zAA' + b'extra')
+    indexer = Indexer(qb64b=stream, strip=True)
+    assert indexer._qb64b == b'0zAA' and isinstance(indexer._qb64b, bytes)
+    assert stream == bytearray(b'extra')
+    assert indexer.qb64b == indexer._infil()
+    indexer = Indexer(qb2=bytearray(b'\xd30\x00'))
+    assert indexer._qb2 == b'\xd30\x00'
+    assert indexer.qb2 == indexer._binfil()
     """ Done Test """
 
 
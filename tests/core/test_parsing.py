@@ -245,6 +245,19 @@ def test_parser():
         db_digs = [bytes(val).decode("utf-8") for val in kevery.db.getKelIter(pre)]
         assert db_digs == event_digs
 
+        # fixed stream fed from memoryview in chunks smaller than stream
+        with openDB(name="chunked") as chkDB:
+            chkKvy = Kevery(db=chkDB)
+            parser = parsing.Parser(kvy=chkKvy)
+            parser.Chunk = 512  # larger than any one message
+            view = memoryview(bytes(msgs))
+            parser.parse(ims=view)
+            assert view == msgs  # not consumed
+            assert parser.ims == bytearray(b'')  # not used
+            assert chkKvy.kevers[pre].sn == kever.sn
+            db_digs = [bytes(val).decode("utf-8") for val in chkKvy.db.getKelIter(pre)]
+            assert db_digs == event_digs
+
         parser = parsing.Parser()  # no kevery so drops all messages
         parser.parse(ims=msgs)
         assert parser.ims == bytearray(b'')
@@ -256,6 +269,35 @@ def test_parser():
 
 
 
+def test_parser_chunked_groups():
+    """
+    Test fixed stream fed in chunks whose boundaries fall between the
+    attachment groups of non-pipelined messages
+    """
+    with habbing.openHby(name="chunker", base="test") as hby:
+        hab = hby.makeHab(name="chunker", isith="1", icount=1)
+        for i in range(4):
+            hab.interact()
+
+        msgs = bytearray()
+        for msg in hab.db.clonePreIter(pre=hab.pre):
+            serder = core.serdering.SerderKERI(raw=bytes(msg))
+            msgs.extend(serder.raw)  # drop pipeline counter so groups are separate
+            msgs.extend(msg[serder.size + 4:])
+
+        sizes = (1, 2, 3, 4, 5, 6, 10, 15, 17, 23, 25, 30, 50, 75, 125, 150, 250, 391)
+        for size in sizes:
+            with openDB(name=f"chunk{size}") as db:
+                kvy = Kevery(db=db)
+                parser = parsing.Parser(kvy=kvy)
+                parser.Chunk = size
+                parser.parse(ims=bytes(msgs))
+                assert kvy.kevers[hab.pre].sn == 4, size
+
+    """ Done Test """
+
+
 
 if __name__ == "__main__":
     test_parser()
+    test_parser_chunked_groups()
@@ -8,7 +8,7 @@ import json
 import pytest
 
 from keri.core.coring import MtrDex, dumps, Saider, Saids
-from keri.core.scheming import Schemer, JSONSchema, CacheResolver
+from keri.core.scheming import Schemer, JSONSchema, CacheResolver, ValidatorCache
 from keri.db import basing
 from keri.kering import ValidationError
 
@@ -295,7 +295,73 @@ def test_resolution():
             schemer.verify(badload)
 
 
+def test_validator_cache():
+    """ Test compiled validator cache keyed by schema SAID """
+    refsad = {"$id": "",
+              "$schema": "http://json-schema.org/draft-07/schema#",
+              "type": "object",
+              "properties": {"z": {"type": "number"}}}
+    _, refsad = Saider.saidify(refsad, label=Saids.dollar)
+    refsaid = refsad["$id"]
+
+    ssad = {"$id": "",
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "properties": {"a": {"type": "string"},
+                           "xy": {"$ref": f"did:keri:{refsaid}"}}}
+    _, ssad = Saider.saidify(ssad, label=Saids.dollar)
+    said = ssad["$id"]
+
+    payload = b'{"a": "test", "xy": {"z": 456}}'
+    badload = b'{"a": "test", "xy": {"z": "456"}}'
+
+    cache = ValidatorCache(size=1)
+    validator = cache.validator(ssad)
+    assert cache.validator(ssad) is validator
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.validator(refsad) is not validator
+    assert list(cache.validators) == [refsaid]  # bounded LRU
+    assert cache.sed(said, lambda said: None) is None
+    assert cache.sed(said, lambda said: ssad) is ssad
+    assert cache.sed(said, lambda said: None) is ssad
+
+    with basing.openDB(name="edy") as db:
+        resolver = CacheResolver(db=db)
+        resolver.add(refsaid, dumps(refsad))
+        db.schema.pin(said, Schemer(sed=ssad))
+        assert resolver.cache is db.schema.cache
+
+        schemer = resolver.schemer(said)
+        assert schemer.verify(payload)
+        with pytest.raises(ValidationError):
+            resolver.schemer(said).verify(badload)
+        assert list(db.schema.cache.validators) == [said]
+        assert list(db.schema.cache.seds) == [refsaid]  # resolved $ref
+        assert db.schema.cache.hits == 1
+
+        builds = []  # $ref resolver built only on a validator cache miss
+        resolve = resolver.resolver
+        resolver.resolver = lambda scer=b'': builds.append(scer) or resolve(scer=scer)
+        assert resolver.schemer(said).verify(payload)
+        assert db.schema.cache.hits == 2
+        assert not builds
+
+        db.schema.pin(said, Schemer(sed=ssad))  # re-pin invalidates
+        assert not db.schema.cache.validators
+        assert resolver.schemer(said).verify(payload)
+        assert said in db.schema.cache.validators
+        assert builds == [ssad]
+
+        assert db.schema.rem(refsaid)  # resolved $ref invalidates dependents
+        assert not db.schema.cache.validators and not db.schema.cache.seds
+        with pytest.raises(ValidationError):
+            resolver.schemer(said).verify(payload)
+
+        assert resolver.schemer(refsaid) is None
+
+
 if __name__ == '__main__':
     test_json_schema()
     test_json_schema_dict()
     test_resolution()
+    test_validator_cache()
@@ -4,6 +4,7 @@ tests.core.test_indexing module
 
 """
 from base64 import urlsafe_b64decode as decodeB64
+from concurrent.futures import ThreadPoolExecutor
 
 import pysodium
 import pytest
@@ -451,6 +452,59 @@ def test_gensignerswithsalter():
 
     """ End Test """
 
+
+def test_pooled_stretches():
+    """
+    Test pooled stretches and signers are identical to serial ones
+    """
+    salter = Salter(raw=b'g\x15\x89\x1a@\xa4\xa47\x07\xb9Q\xb8\x18\xcdJW')
+    assert salter.limits() == (2, 67108864)
+    assert salter.limits(temp=True) == (1, 8192)
+    with pytest.raises(ValueError):
+        salter.limits(tier="bogus")
+
+    class CountingPool(ThreadPoolExecutor):
+        def __init__(self, **kwa):
+            super().__init__(**kwa)
+            self.flight = self.peak = self.calls = 0
+
+        def submit(self, fn, *pa, **kwa):
+            self.calls += 1
+            self.flight += 1
+            self.peak = max(self.peak, self.flight)
+            future = super().submit(fn, *pa, **kwa)
+
+            def land(_):
+                self.flight -= 1
+
+            future.add_done_callback(land)
+            return future
+
+    paths = [f"{i:x}" for i in range(6)]
+    serial = [salter.stretch(path=path, temp=True) for path in paths]
+    with CountingPool(max_workers=4) as pool:
+        assert salter.stretches(paths=paths, temp=True, pool=pool) == serial
+        assert pool.calls == 6
+
+        pool.calls = pool.peak = 0
+        assert salter.stretches(paths=paths, temp=True, pool=pool,
+                                budget=2 * 8192) == serial
+        assert pool.calls == 6
+        assert pool.peak <= 2  # bounded by memory budget
+
+        pool.calls = 0
+        assert salter.stretches(paths=paths, temp=True, pool=pool, budget=1) == serial
+        assert pool.calls == 6  # at least one in flight
+
+        codes = [MtrDex.Ed25519_Seed, MtrDex.ECDSA_256k1_Seed, MtrDex.Ed25519_Seed]
+        signers = salter.pooledSigners(codes=codes, paths=paths[:3], temp=True,
+                                       transferable=False, pool=pool)
+        assert ([signer.qb64 for signer in signers] ==
+                [salter.signer(code=code, path=path, temp=True, transferable=False).qb64
+                 for code, path in zip(codes, paths)])
+
+    """ End Test """
+
 def test_cipher_closs():
     """
     Test class attributes of Cipher
@@ -1359,6 +1413,7 @@ if __name__ == "__main__":
     test_signer()
     test_salter()
     test_gensignerswithsalter()
+    test_pooled_stretches()
     test_cipher_closs()
     test_cipher()
     test_encrypter()
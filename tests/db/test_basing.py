@@ -11,7 +11,7 @@ import pytest
 
 import lmdb
 from hio.base import doing
-from keri import core
+from keri import core, kering
 from keri.app import habbing
 from keri.core import coring, eventing, serdering
 from keri.core.coring import Kinds, versify, Seqner
@@ -23,6 +23,7 @@ from keri.db import subing
 from keri.db.basing import openDB, Baser, KeyStateRecord, OobiRecord
 from keri.db.dbing import (dgKey, onKey, snKey)
 from keri.db.dbing import openLMDB
+from keri.help import helping
 from keri.help.helping import datify, dictify
 # this breaks when running as __main__ better to do a custom import call to
 # walk the directory tree and import explicity rather than depend on it
@@ -1691,6 +1692,225 @@ def test_dbdict():
 
 
 
+    """End Test"""
+
+
+def test_dbdict_lru():
+    """
+    Test bounded LRU eviction of dbdict read through cache
+    """
+    dbd = basing.dbdict(size=2)
+    dbd['a'] = 1
+    dbd['b'] = 2
+    assert dbd['a'] == 1  # a now most recent
+    dbd['c'] = 3  # evicts b
+    assert list(dbd.keys()) == ['a', 'c']
+    assert list(dbd.lru) == ['a', 'c']
+    assert dbd.evictions == 1
+    assert 'b' not in dbd  # no db so miss
+
+    del dbd['a']
+    assert list(dbd.lru) == ['c']
+    assert dbd.pop('c') == 3
+    assert not dbd.lru
+    assert dbd.stats == dict(size=2, count=0, hits=1, misses=1, evictions=1)
+
+    dbd = basing.dbdict()  # unbounded so no lru bookkeeping
+    dbd['a'] = 1
+    assert dbd['a'] == 1
+    assert not dbd.lru
+    dbd.size = 1  # bounding tracks cached keys
+    assert list(dbd.lru) == ['a']
+    dbd['b'] = 2
+    assert list(dbd) == ['b'] and dbd.evictions == 1
+
+    with habbing.openHby(name="lru", base="test") as hby:
+        hab = hby.makeHab(name="local")
+        kevers = hby.db.kevers
+        kevers.size = 1
+        assert kevers.evictions == 0
+        remotes = []
+        for i in range(3):  # remote kels
+            salter = core.Salter(raw=b'0123456789abcdef'[:-1] + str(i).encode())
+            signers = salter.signers(count=2, path="lru", temp=True)
+            serder = incept(keys=[signers[0].verfer.qb64],
+                            ndigs=[coring.Diger(ser=signers[1].verfer.qb64b).qb64])
+            sigers = [signers[0].sign(ser=serder.raw, index=0)]
+            hby.kvy.processEvent(serder=serder, sigers=sigers)
+            remotes.append(serder.pre)
+
+        # local prefix is pinned, only most recent remote kever stays in memory
+        assert dict.__contains__(kevers, hab.pre)
+        assert hab.pre not in kevers.lru
+        assert [pre for pre in kevers.keys() if pre != hab.pre] == [remotes[-1]]
+        assert kevers.evictions >= 2  # also evicts unpinned signator kever
+
+        kever = kevers[remotes[0]]  # reloaded from db.states
+        assert kever.prefixer.qb64 == remotes[0]
+        assert kever.sn == 0
+        assert not dict.__contains__(kevers, remotes[-1])  # evicted
+        assert dict.__contains__(kevers, hab.pre)
+        assert kevers.cues is hby.kvy.cues
+        assert kever.cues is hby.kvy.cues  # reloaded kever cues to kevery
+
+    """End Test"""
+
+
+def test_KERI_BASER_KEVER_CACHE_SIZE():
+    os.environ["KERI_BASER_KEVER_CACHE_SIZE"] = "10"
+    try:
+        db = Baser(reopen=False, temp=True)
+        assert db.KeverCacheSize == 10
+        assert db.kevers.size == 10
+        os.environ["KERI_BASER_KEVER_CACHE_SIZE"] = "foo"  # Not an int
+        with pytest.raises(ValueError):
+            Baser(reopen=False, temp=True)
+    finally:
+        os.environ.pop("KERI_BASER_KEVER_CACHE_SIZE")
+    assert Baser(reopen=False, temp=True).kevers.size == 0
+
+
+def test_verifier_cache():
+    """
+    Test .verifiers cache of establishment event verifiers of resolveVerifiers
+    """
+    with habbing.openHby(name="ver", base="test") as hby:
+        hab = hby.makeHab(name="verifier")
+        db = hby.db
+        icp = hab.kever.serder
+        assert db.verifiers[(hab.pre, 0)][0] == icp.said  # prewarmed by logEvent
+        hab.interact()
+        assert (hab.pre, 1) not in db.verifiers
+        hab.rotate()
+        rot = hab.kever.serder
+        assert db.verifiers[(hab.pre, 2)][0] == rot.said
+
+        db.verifiers.clear()
+        tholder, verfers = db.resolveVerifiers(pre=hab.pre, sn=2, dig=rot.said)
+        assert [verfer.qb64 for verfer in verfers] == rot.keys
+        assert tholder.sith == rot.tholder.sith
+        entry = db.verifiers[(hab.pre, 2)]  # cached on miss
+        assert db.resolveVerifiers(pre=hab.pre, sn=2) == (entry[1], entry[2])
+        with pytest.raises(kering.ValidationError):
+            db.resolveVerifiers(pre=hab.pre, sn=2, dig=icp.said)
+        db.resolveVerifiers(pre=hab.pre, sn=1)  # interaction not cached
+        assert (hab.pre, 1) not in db.verifiers
+
+        # entry no longer last event at sn is not used
+        db.addKe(snKey(hab.pre, 2), icp.saidb)
+        tholder, verfers = db.resolveVerifiers(pre=hab.pre, sn=2, dig=icp.said)
+        assert [verfer.qb64 for verfer in verfers] == icp.keys
+        assert db.verifiers[(hab.pre, 2)][0] == icp.said
+
+        # reloaded kever prewarms its latest establishment event
+        db.verifiers.clear()
+        Kever(state=db.states.get(keys=hab.pre), db=db)
+        assert db.verifiers[(hab.pre, 2)][0] == rot.said
+
+        db.VerifierCacheSize = 1
+        db.cacheVerifiers(pre=hab.pre, sn=0, dig=icp.said, tholder=icp.tholder,
+                          verfers=icp.verfers)
+        assert list(db.verifiers) == [(hab.pre, 0)]
+        db.uncacheVerifiers(pre=hab.pre, sn=0)
+        assert not db.verifiers
+        db.VerifierCacheSize = 0
+        db.resolveVerifiers(pre=hab.pre, sn=0)
+        assert not db.verifiers
+
+    os.environ["KERI_BASER_VERIFIER_CACHE_SIZE"] = "10"
+    try:
+        assert Baser(reopen=False, temp=True).VerifierCacheSize == 10
+        os.environ["KERI_BASER_VERIFIER_CACHE_SIZE"] = "foo"  # Not an int
+        with pytest.raises(ValueError):
+            Baser(reopen=False, temp=True)
+    finally:
+        os.environ.pop("KERI_BASER_VERIFIER_CACHE_SIZE")
+
+    """End Test"""
+
+
+def test_anchor_index():
+    """
+    Test .ancs anchored event seal index and fetch of sealing events
+    """
+    from keri.db.migrations import add_anchor_index
+
+    with habbing.openHby(name="anc", base="test") as hby:
+        hab = hby.makeHab(name="anchorer")
+        seal0 = dict(i=hab.pre, s="0", d=hab.kever.serder.said)
+        seal1 = dict(i="EAskHI462CuIMS_gNkcl_QewzrRSKH2p9zHQIO132Z30", s="1",
+                     d="EAskHI462CuIMS_gNkcl_QewzrRSKH2p9zHQIO132Z30")
+        hab.interact()
+        hab.interact(data=[seal0, dict(d=seal1["d"])])
+        hab.interact(data=[seal1])
+        assert hab.kever.sn == 3
+
+        vals = hby.db.ancs.get(keys=(seal0["i"], seal0["s"], seal0["d"]))
+        assert len(vals) == 1
+        prefixer, number, saider = vals[0]
+        assert prefixer.qb64 == hab.pre
+        assert number.num == 2
+
+        srdr = hby.db.fetchAllSealingEventByEventSeal(pre=hab.pre, seal=seal0)
+        assert srdr.sn == 2
+        assert srdr.said == saider.qb64
+        srdr = hby.db.fetchLastSealingEventByEventSeal(pre=hab.pre, seal=seal1)
+        assert srdr.sn == 3
+        assert hby.db.fetchLastSealingEventByEventSeal(pre=hab.pre, seal=seal1, sn=4) is None
+        assert hby.db.fetchAllSealingEventByEventSeal(pre=seal1["i"], seal=seal1) is None
+        assert hby.db.fetchAllSealingEventByEventSeal(pre=hab.pre,
+                                                      seal=dict(d=seal1["d"])) is None
+
+        # migration rebuilds index
+        hby.db.ancs.trim()
+        assert hby.db.fetchAllSealingEventByEventSeal(pre=hab.pre, seal=seal0) is None
+        add_anchor_index.migrate(hby.db)
+        assert hby.db.fetchAllSealingEventByEventSeal(pre=hab.pre, seal=seal0).sn == 2
+        assert hby.db.fetchLastSealingEventByEventSeal(pre=hab.pre, seal=seal1).sn == 3
+
+    """End Test"""
+
+
+def test_clone_txn():
+    """
+    Test cloneEvtMsg and replays from one read transaction
+    """
+    with habbing.openHby(name="clone", base="test") as hby:
+        amy = hby.makeHab(name="amy", isith="2", icount=3)
+        bob = hby.makeHab(name="bob")
+        amy.interact()
+        bob.rotate()
+        amy.rotate(isith="2", ncount=3, nsith="2")
+
+        msgs = []
+        for pre, fn, dig in hby.db.getFelItemPreIter(amy.pre.encode()):
+            msg = hby.db.cloneEvtMsg(pre=pre, fn=fn, dig=dig)
+            assert isinstance(msg, bytearray)
+            dgkey = dgKey(pre, dig)
+            assert msg.startswith(bytes(hby.db.getEvt(dgkey)))
+            for sig in hby.db.getSigs(dgkey):
+                assert bytes(sig) in msg
+            msgs.append(msg)
+        assert len(msgs) == 3
+        assert list(hby.db.clonePreIter(pre=amy.pre)) == msgs
+        assert list(hby.db.clonePreIter(pre=amy.pre, fn=1)) == msgs[1:]
+        assert list(hby.db.clonePreIter(pre="EUnknown")) == []
+
+        with hby.db.env.begin(write=False, buffers=True) as txn:
+            cursors = {}
+            for fn, msg in enumerate(msgs):
+                dig = hby.db.getFe(onKey(amy.pre, fn))
+                assert hby.db.cloneEvtMsg(pre=amy.pre, fn=fn, dig=dig, txn=txn,
+                                          cursors=cursors) == msg
+            assert len(cursors) == 4  # one cursor each for sigs wigs vrcs rcts
+
+        allMsgs = list(hby.db.cloneAllPreIter())
+        assert len(allMsgs) == 3 + 2 + 1  # amy, bob, signator
+        assert all(msg in allMsgs for msg in msgs)
+
+        with pytest.raises(kering.MissingEntryError):
+            hby.db.cloneEvtMsg(pre=amy.pre, fn=0, dig=bob.kever.serder.saidb)
+
     """End Test"""
 
 
@@ -1907,6 +2127,50 @@ def test_clear_escrows():
         assert db.epse.get(keys=('dig',)) is None
         assert db.dune.get(keys=(pre, 'said')) is None
 
+def test_escrow_stamps():
+    """
+    Test Baser escrow stamps index of escrowed events by datetime stamp
+    """
+    pre = 'BAKY1sKmgyjAiUDdUBPNPyrSz_ad_Qf9yzhDNZlEKiMc'
+    digs = ['EGAPkzNZMtX-QiVgbRbyAIZGoXvbGv9IPb0foWTZvI_4',
+            'EFBKxBV9xC0cLvaOIu_fKY4-dtBjemoJ2i9dpJUE9NGA',
+            'EA4vCeJswIBJlO3RqE-wsE72Vt3wAceJ_LzqKvbDtBSY']
+    stamps = ['2021-01-01T00:00:02.000000+00:00',
+              '2021-01-01T00:00:00.000000+00:00',
+              '2021-01-01T00:00:01.000000+00:00']
+
+    assert dbing.dtHex(dbing.Epoch) == '0' * 16
+    assert dbing.dtHex(helping.fromIso8601(stamps[1])) == '0005b7cb6be58000'
+
+    with openDB() as db:
+        assert not db.stampEscrow("ooes", pre, 1, digs[0])  # no dts
+        for sn, (dig, dts) in enumerate(zip(digs, stamps), start=1):
+            db.putDts(dgKey(pre, dig), dts.encode("utf-8"))
+            assert db.stampEscrow("ooes", pre.encode("utf-8"), sn, dig.encode("utf-8"))
+        assert db.stampEscrow("ooes", pre, 1, digs[0])  # idempotent
+        assert db.stampEscrow("pses", pre, 1, digs[0])  # other escrow
+        assert len(list(db.etms.getItemIter(keys=("ooes", "")))) == 3
+
+        cutoff = helping.fromIso8601('2021-01-01T00:00:01.500000+00:00')
+        items = list(db.getExpiredEscrowIter("ooes", cutoff))  # oldest first
+        assert [(pre, sn, dig) for _, pre, sn, dig in items] == [
+            (pre.encode("utf-8"), 2, digs[1].encode("utf-8")),
+            (pre.encode("utf-8"), 3, digs[2].encode("utf-8"))]
+        assert db.etms.get(keys=items[0][0]) == stamps[1]
+        assert not list(db.getExpiredEscrowIter("ooes", helping.fromIso8601(stamps[1])))
+
+        # Kevery finds expired escrowed events and prunes unescrowed ones
+        for sn, dig in enumerate(digs[:2], start=1):
+            db.addOoe(snKey(pre, sn), dig.encode("utf-8"))
+        kvy = eventing.Kevery(db=db)
+        expired = kvy.expiredEscrows("ooes", 0, db.getOoeItemIter, db.getOoes)
+        assert set(expired) == {(pre.encode("utf-8"), 1, digs[0].encode("utf-8")),
+                                (pre.encode("utf-8"), 2, digs[1].encode("utf-8"))}
+        assert len(list(db.etms.getItemIter(keys=("ooes", "")))) == 2  # sn 3 pruned
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_baser()
     test_clean_baser()
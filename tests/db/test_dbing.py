@@ -1154,8 +1154,170 @@ def test_lmdber():
     """ End Test """
 
 
+def test_transact():
+    """
+    Test LMDBer.transact ambient write transactions
+    """
+    with openLMDB() as dber:
+        db = dber.env.open_db(key=b'beep.')
+        dups = dber.env.open_db(key=b'boop.', dupsort=True)
+        assert dber.txn is None
+
+        with dber.transact() as txn:
+            assert dber.txn is txn
+            assert dber.putVal(db, b'a', b'1')
+            assert dber.addIoDupVal(dups, b'a', b'x')
+            assert bytes(dber.getVal(db, b'a')) == b'1'  # reads own writes
+            assert [bytes(val) for val in dber.getIoDupVals(dups, b'a')] == [b'x']
+            assert list(dber.getTopItemIter(db)) == []  # iterator reads committed
+            with dber.env.begin(buffers=True) as rtxn:  # not yet committed
+                assert rtxn.get(b'a', db=db) is None
+        assert dber.txn is None
+        assert bytes(dber.getVal(db, b'a')) == b'1'  # committed
+        assert [(key, bytes(val)) for key, val in dber.getTopItemIter(db)] == [(b'a', b'1')]
+
+        with pytest.raises(ValueError):  # aborts all writes on exception
+            with dber.transact():
+                assert dber.setVal(db, b'a', b'2')
+                assert dber.putVal(db, b'b', b'3')
+                raise ValueError("abort")
+        assert dber.txn is None
+        assert bytes(dber.getVal(db, b'a')) == b'1'
+        assert dber.getVal(db, b'b') is None
+
+        with dber.transact() as txn:  # nested aborts only its own writes
+            assert dber.putVal(db, b'b', b'3')
+            try:
+                with dber.transact() as child:
+                    assert dber.txn is child
+                    assert child is not txn
+                    assert bytes(dber.getVal(db, b'b')) == b'3'
+                    assert dber.putVal(db, b'c', b'4')
+                    raise ValueError("abort")
+            except ValueError:
+                pass
+            assert dber.txn is txn
+            assert dber.getVal(db, b'c') is None
+            with dber.transact():
+                assert dber.putVal(db, b'd', b'5')
+        assert [bytes(key) for key, val in dber.getTopItemIter(db)] == [b'a', b'b', b'd']
+
+        dber.version = "1.2.3"
+        with dber.transact():
+            dber.version = "1.2.4"
+        dber._version = None
+        assert dber.version == "1.2.4"
+
+    """ End Test """
+
+
+def test_snapshot():
+    """
+    Test LMDBer.snapshot ambient read only transactions
+    """
+    with openLMDB() as dber:
+        db = dber.env.open_db(key=b'beep.')
+        assert dber.putVal(db, b'a', b'1')
+
+        with dber.snapshot() as snap:
+            assert dber._readers == 1
+            with dber.snapshot() as inner:  # nested shares outermost
+                assert inner is snap
+            assert bytes(dber.getVal(db, b'a')) == b'1'
+            assert dber.setVal(db, b'a', b'2')  # writes outside snapshot
+            assert dber.putVal(db, b'b', b'3')
+            assert bytes(dber.getVal(db, b'a')) == b'1'  # consistent view
+            assert dber.getVal(db, b'b') is None
+            with dber.transact():  # ambient write txn reads own writes
+                assert bytes(dber.getVal(db, b'a')) == b'2'
+        assert dber._readers == 0
+        with dber.transact():  # copies survive later writes in ambient write txn
+            val = dber.getVal(db, b'a')
+            assert isinstance(val, bytes)
+            assert dber.setVal(db, b'a', b'4')
+            assert dber.delVal(db, b'a')
+            assert val == b'2'
+        assert dber.setVal(db, b'a', b'2')
+        assert bytes(dber.getVal(db, b'a')) == b'2'
+        assert bytes(dber.getVal(db, b'b')) == b'3'
+
+    """ End Test """
+
+
+def test_map_growth():
+    """
+    Test LMDBer map size growth and stats
+    """
+    with openLMDB() as dber:
+        assert dber.MapGrowth == 2.0
+        assert dber.MapFill == 0.75
+        dber.env.set_mapsize(1 << 18)  # small map
+        assert dber.env.info()["map_size"] == 1 << 18
+        db = dber.env.open_db(key=b'beep.')
+        dups = dber.env.open_db(key=b'boop.', dupsort=True)
+
+        val = b'x' * 1024
+        for i in range(512):  # about 512K so must grow
+            assert dber.putVal(db, b'%04d' % i, val)
+        assert dber.env.info()["map_size"] >= 1 << 19
+        assert dber.cnt(db) == 512  # no writes lost
+
+        iterator = dber.getTopItemIter(db)
+        next(iterator)  # open read txn so can not resize
+        assert dber._readers == 1
+        assert not dber.grow()
+        iterator.close()
+        assert dber._readers == 0
+
+        size = dber.env.info()["map_size"]
+        with dber.transact():
+            assert not dber.grow()  # active write txn so can not resize
+        assert dber.grow()
+        assert dber.env.info()["map_size"] == 2 * size
+
+        size = dber.env.info()["map_size"]
+        with pytest.raises(lmdb.MapFullError):  # unit of work too big
+            with dber.transact():
+                for i in range(2 * size // 1024):
+                    dber.putVal(db, b'big%08d' % i, val)
+        assert dber.env.info()["map_size"] == 2 * size  # grown for retry
+        assert dber.cnt(db) == 512  # aborted
+
+        while dber.filled() <= dber.MapFill:  # fill so grows before transact
+            with dber.transact():
+                for i in range(64):
+                    dber.putVal(db, b'fill%08d' % dber.cnt(db), val)
+        size = dber.env.info()["map_size"]
+        with dber.transact():
+            assert dber.addVal(dups, b'a', b'1')
+        assert dber.env.info()["map_size"] == 2 * size
+
+        stats = dber.stats()
+        assert stats["map_size"] == dber.env.info()["map_size"]
+        assert 0 < stats["used"] <= stats["map_size"]
+        assert stats["fill"] == stats["used"] / stats["map_size"]
+        assert set(stats["dbs"]) == {"beep.", "boop."}  # not __version__
+        assert stats["dbs"]["beep."]["entries"] == dber.cnt(db)
+        assert stats["dbs"]["beep."]["bytes"] >= 1024 * dber.cnt(db)
+        assert stats["dbs"]["boop."]["entries"] == 1
+
+        # detached items end read transaction so map may grow while processing
+        items = dber.getTopItemIter(db=db, top=b'00')
+        assert dber.grow()
+        detached = dbing.detach(items)
+        assert dber._readers == 0
+        assert all(isinstance(key, bytes) and isinstance(val, bytes) for key, val in detached)
+        assert len(detached) == 100  # b'0000' to b'0099'
+        assert dber.grow()
+        assert dbing.detach([memoryview(b'a'), (memoryview(b'b'), ("c",))]) == [b'a', (b'b', ("c",))]
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_key_funcs()
     test_suffix()
     test_lmdber()
     test_opendatabaser()
+    test_transact()
+    test_map_growth()
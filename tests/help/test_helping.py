@@ -436,6 +436,25 @@ def test_b64_conversions():
     """End Test"""
 
 
+def test_chunkify():
+    """
+    Test chunkify coalescing of messages into bounded chunks
+    """
+    assert list(helping.chunkify([])) == []
+    assert list(helping.chunkify([b"", bytearray()])) == []
+
+    msgs = [b"abc", bytearray(b"de"), b"", memoryview(b"fghij"), b"k"]
+    chunks = list(helping.chunkify(msgs, size=5))
+    assert chunks == [b"abcde", b"fghij", b"k"]
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+
+    chunks = list(helping.chunkify((msg for msg in [b"ab", b"cdefgh", b"i"]), size=4))
+    assert chunks == [b"ab", b"cdefgh", b"i"]  # oversize msg is own chunk
+    assert b"".join(helping.chunkify(msgs)) == b"abcdefghijk"
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_utilities()
     test_datify()
@@ -444,3 +463,4 @@ if __name__ == "__main__":
     test_extractvalues()
     test_iso8601()
     test_b64_conversions()
+    test_chunkify()
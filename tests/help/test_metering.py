@@ -0,0 +1,141 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.help.test_metering module
+
+"""
+import pytest
+from hio.help import decking
+
+from keri.app import habbing
+from keri.core import eventing, parsing
+from keri.db import dbing
+from keri.help import metering
+
+
+def test_registry():
+    """
+    Test Registry instruments and Prometheus exposition
+    """
+    registry = metering.Registry()
+    assert not registry.enabled
+    counter = registry.counter("test_total", "Test count", ("kind",))
+    gauge = registry.gauge("test_depth", "Test depth", ("queue",))
+    histogram = registry.histogram("test_seconds", "Test seconds", ("stage",),
+                                   buckets=(0.1, 1.0))
+    assert registry.counter("test_total", labels=("kind",)) is counter
+    with pytest.raises(ValueError):
+        registry.gauge("test_total", labels=("kind",))
+    with pytest.raises(ValueError):
+        registry.counter("test_total", labels=("other",))
+
+    # disabled is no-op
+    counter.inc("a")
+    gauge.set(3, "q")
+    histogram.observe(0.5, "s")
+    assert histogram.time("s") is metering.Null
+    assert not counter.values and not gauge.values and not histogram.values
+
+    @histogram.timed("f")
+    def f(x):
+        return x + 1
+
+    assert f(1) == 2
+    assert f.__name__ == "f"
+    assert not histogram.values
+
+    registry.enabled = True
+    counter.inc("a")
+    counter.inc("a", n=2)
+    counter.inc('b"\n')
+    gauge.set(3, "q")
+    deck = decking.Deck([1, 2])
+    gauge.track(deck, "cues")
+    histogram.observe(0.05, "s")
+    histogram.observe(1.0, "s")
+    histogram.observe(5.0, "s")
+    with histogram.time("ctx"):
+        pass
+    with pytest.raises(ValueError):
+        with histogram.time("ctx"):
+            raise ValueError("observed anyway")
+    assert f(1) == 2
+    assert histogram.values[("f",)][2] == 1
+    assert histogram.values[("ctx",)][2] == 2
+
+    text = registry.expose()
+    lines = text.splitlines()
+    assert text.endswith("\n")
+    assert "# HELP test_total Test count" in lines
+    assert "# TYPE test_total counter" in lines
+    assert 'test_total{kind="a"} 3' in lines
+    assert 'test_total{kind="b\\"\\n"} 1' in lines
+    assert "# TYPE test_depth gauge" in lines
+    assert 'test_depth{queue="q"} 3' in lines
+    assert 'test_depth{queue="cues"} 2' in lines
+    assert "# TYPE test_seconds histogram" in lines
+    assert 'test_seconds_bucket{stage="s",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{stage="s",le="1.0"} 2' in lines  # le inclusive
+    assert 'test_seconds_bucket{stage="s",le="+Inf"} 3' in lines
+    assert 'test_seconds_sum{stage="s"} 6.05' in lines
+    assert 'test_seconds_count{stage="s"} 3' in lines
+
+    del deck  # tracked weakly
+    assert 'test_depth{queue="cues"} 2' not in registry.expose().splitlines()
+    assert not gauge.tracked
+
+    registry.reset()
+    assert not counter.values and not histogram.values
+    assert 'test_depth{queue="q"} 3' not in registry.expose().splitlines()
+
+    """End Test"""
+
+
+def test_hot_path_metrics():
+    """
+    Test instrumented parsing, validation, escrow and persistence hot paths
+    """
+    registry = metering.registry
+    enabled = registry.enabled
+    registry.reset()
+    registry.enabled = True
+    try:
+        with (habbing.openHby(name="src", base="test") as srcHby,
+              habbing.openHby(name="dst", base="test") as dstHby):
+            hab = srcHby.makeHab(name="amy", isith="2", icount=3)
+            hab.interact()
+            hab.interact()
+            msgs = [bytes(msg) for msg in srcHby.db.clonePreIter(pre=hab.pre)]
+            assert len(msgs) == 3
+
+            kvy = eventing.Kevery(db=dstHby.db, lax=False, local=False)
+            parser = parsing.Parser(kvy=kvy)
+            parser.parse(ims=bytearray(msgs[0] + msgs[2]))  # out of order
+            parser.parse(ims=bytearray(msgs[1]))
+            kvy.processEscrows()
+            assert kvy.kevers[hab.pre].sn == 2
+
+        assert parsing.Messages.values[("KERI", "icp")] == 1
+        assert parsing.Messages.values[("KERI", "ixn")] == 2
+        assert eventing.Sigs.values[("valid",)] >= 9
+        assert eventing.Escrows.values[("out_of_order", "hit")] == 1
+        stages = eventing.Stages.values
+        assert stages[("process",)][2] >= 4  # three events plus unescrow
+        assert stages[("update",)][2] >= 2
+        assert stages[("log",)][2] >= 3
+        assert stages[("escrows",)][2] == 1
+        assert dbing.Txns.values[("iter",)][2] > 0
+        assert dbing.Txns.values[("write",)][2] > 0
+
+        text = registry.expose()
+        assert 'keri_escrow_total{escrow="out_of_order",outcome="hit"} 1' in text
+        assert 'keri_stage_seconds_count{stage="escrows"} 1' in text
+    finally:
+        registry.enabled = enabled
+        registry.reset()
+
+    """End Test"""
+
+
+if __name__ == "__main__":
+    test_registry()
+    test_hot_path_metrics()
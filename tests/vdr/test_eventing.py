@@ -670,6 +670,20 @@ def test_tevery():
         status = tev.vcState(vcdig.decode("utf-8"))
         assert status.et == Ilks.rev
         assert status.s == '1'
+        assert status.d == rev.said
+        assert status.a == dict(s=seqner.sn, d=saider.qb64)
+        assert tev.vcSn(vcdig.decode("utf-8")) == 1
+
+        # status is indexed by logEvent and indexed on read when missing
+        assert reg.vcss.get(keys=vcdig.decode("utf-8")) == status
+        assert reg.vcss.rem(keys=vcdig.decode("utf-8"))
+        assert tev.vcState(vcdig.decode("utf-8")) == status
+        assert reg.vcss.get(keys=vcdig.decode("utf-8")) == status
+
+        tev.logVcState(pre=vcdig.decode("utf-8"), sn=0, serder=iss, seqner=seqner,
+                       saider=saider)  # older event does not replace state
+        assert tev.vcState(vcdig.decode("utf-8")).et == Ilks.rev
+        assert tev.vcState('EMissingVcStateInTelAAAAAAAAAAAAAAAAAAAAAAAA') is None
 
 
 def test_tevery_process_escrow(mockCoringRandomNonce):
@@ -0,0 +1,119 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.vdr.querying module
+
+"""
+import pytest
+
+from keri.core.coring import Ilks, Saider
+from keri.db import dbing
+from keri.vc import proving
+from keri.vdr import eventing, viring
+from keri.vdr.querying import Querier
+
+
+def test_querier():
+    """
+    Test Querier credential queries over Reger credential query indexes
+    """
+    amy = 'EKC8085pwSwzLwUGzh-HrEoFDwZnCJq27bVp5atdMT9o'
+    bob = 'EOp2vZP2BrlH3DX9H3w-ghvr3c9kkDv0gS5ELFyutxwk'
+    cal = 'EN6Ta5X_B7DrYR1HVGw25YgFVep4zGb5TMIoyCBaKb7R'
+    ecr = 'EEy9PkikFcANV1l7EHukCeXqrzT1hNZjGlUk7wuMO5jw'
+    qvi = 'EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao'
+    regk = 'EBwEKSIMG_3tp7kVCLWJ9c-tPdwtDXIeLlfdm5-IMTZv'
+
+    # issuer, subject, schema by issuance order
+    specs = [(amy, cal, ecr), (amy, bob, ecr), (bob, cal, ecr),
+             (amy, cal, qvi), (amy, cal, ecr), (amy, None, ecr)]
+
+    with viring.openReger() as reger:
+        creds = []
+        for n, (issuer, subject, schema) in enumerate(specs):
+            creder = proving.credential(issuer=issuer, schema=schema, recipient=subject,
+                                        data=dict(dt=f"2024-01-01T00:00:0{n}.000000+00:00", n=n),
+                                        status=regk)
+            vsr = eventing.vcstate(vcpre=creder.said, said=creder.said, sn=0, ri=regk,
+                                   eilk=Ilks.iss, a=dict(s=n, d=creder.said))
+            reger.vcss.pin(keys=creder.said, val=vsr)
+            reger.creds.put(keys=creder.said, val=creder)
+            reger.saved.pin(keys=creder.said, val=Saider(qb64=creder.said))
+            creds.append(creder.said)
+
+        assert reger.indexCreds() == 6
+        assert reger.indexCreds() == 0  # idempotent
+        cir = reger.cidx.get(keys=creds[0])
+        assert (cir.issuer, cir.subject, cir.schema, cir.registry, cir.status) == (
+            amy, cal, ecr, regk, "issued")
+        assert cir.dt == '00060dd710212000'
+        assert reger.cidx.get(keys=creds[5]).subject == ''
+        assert len(list(reger.cqix.getItemIter(keys=("subj", "")))) == 5  # no subject
+
+        querier = Querier(reger=reger)
+        assert [said for _, said in querier.seek()] == creds
+        assert [said for _, said in querier.seek(reverse=True)] == creds[::-1]
+
+        assert querier.plan(schema=ecr, issuer=amy) == ("scis", ("scis", ecr, amy), [])
+        assert [said for _, said in querier.seek(schema=ecr, issuer=amy)] == [
+            creds[0], creds[1], creds[4], creds[5]]
+        assert [said for _, said in querier.seek(schema=ecr, subject=cal)] == [
+            creds[0], creds[2], creds[4]]
+        # most selective index drives scan and other fields are probed
+        assert querier.plan(issuer=bob, subject=cal) == ("issr", ("issr", bob), [("subj", cal)])
+        assert [said for _, said in querier.seek(issuer=bob, subject=cal)] == [creds[2]]
+        name, _, probes = querier.plan(schema=ecr, issuer=amy, subject=cal, status="issued")
+        assert name == "scsj" and probes == [("issr", amy), ("stat", "issued")]  # 3 < 4
+        assert [said for _, said in querier.seek(schema=ecr, issuer=amy, subject=cal,
+                                                  status="issued")] == [creds[0], creds[4]]
+        assert list(querier.seek(issuer=cal)) == []
+
+        # pagination resumes after cursor
+        saids, cursor = querier.query(schema=ecr, issuer=amy, limit=3)
+        assert saids == [creds[0], creds[1], creds[4]]
+        saids, cursor = querier.query(schema=ecr, issuer=amy, limit=3, cursor=cursor)
+        assert saids == [creds[5]] and cursor is None
+        saids, cursor = querier.query(issuer=amy, limit=2, reverse=True)
+        assert saids == [creds[5], creds[4]]
+        saids, cursor = querier.query(issuer=amy, limit=2, reverse=True, cursor=cursor)
+        assert saids == [creds[3], creds[1]]
+        saids, cursor = querier.query(issuer=amy, limit=2, reverse=True, cursor=cursor)
+        assert saids == [creds[0]] and cursor is None
+
+        # revocation moves credential between status index branches
+        reger.indexCredStatus(creds[1], Ilks.rev)
+        assert reger.cidx.get(keys=creds[1]).status == "revoked"
+        assert [said for _, said in querier.seek(registry=regk, status="revoked")] == [creds[1]]
+        assert creds[1] not in [said for _, said in querier.seek(registry=regk, status="issued")]
+        assert [said for _, said in querier.seek(issuer=amy, status="revoked")] == [creds[1]]
+        reger.indexCredStatus('EMissingCredIndexAAAAAAAAAAAAAAAAAAAAAAAAAA', Ilks.rev)
+
+        with pytest.raises(ValueError):
+            querier.plan(holder=amy)
+        with pytest.raises(ValueError):
+            querier.query(limit=0)
+
+    # credential logged before .vcss existed is indexed with status from its TEL
+    with viring.openReger() as reger:
+        creder = proving.credential(issuer=amy, schema=qvi, recipient=bob,
+                                    data=dict(dt="2024-01-01T00:00:09.000000+00:00"),
+                                    status=regk)
+        iss = eventing.issue(vcdig=creder.said, regk=regk)
+        rev = eventing.revoke(vcdig=creder.said, regk=regk, dig=iss.said)
+        for sn, serder in enumerate([iss, rev]):
+            reger.putTvt(dbing.dgKey(creder.said, serder.said), serder.raw)
+            reger.putTel(dbing.snKey(creder.said, sn), serder.saidb)
+        reger.creds.put(keys=creder.said, val=creder)
+        reger.saved.pin(keys=creder.said, val=Saider(qb64=creder.said))
+
+        assert reger.vcss.get(keys=creder.said) is None
+        assert reger.credIlk(creder.said) == Ilks.rev
+        assert reger.credIlk(iss.said) is None  # never issued
+        assert reger.indexCreds() == 1
+        assert reger.cidx.get(keys=creder.said).status == "revoked"
+        assert [said for _, said in Querier(reger=reger).seek(status="revoked")] == [creder.said]
+
+    """End Test"""
+
+
+if __name__ == "__main__":
+    test_querier()
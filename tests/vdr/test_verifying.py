@@ -13,7 +13,7 @@ from keri.core import parsing, coring, indexing
 from keri.core.eventing import SealEvent
 from keri.help import helping
 from keri.vc import proving
-from keri.vdr import verifying, credentialing, eventing
+from keri.vdr import verifying, credentialing, eventing, querying
 
 
 def test_verifier_query(mockHelpingNowUTC, mockCoringRandomNonce):
@@ -495,6 +495,29 @@ def test_verifier_chained_credential(seeder):
         assert saider[0].qb64 == vLeiCreder.said
         saider = ianreg.reger.schms.get(vLeiSchema)
         assert saider[0].qb64 == vLeiCreder.said
+        assert [said for _, said in querying.Querier(reger=ianreg.reger).seek(
+            issuer=ian.pre, subject=han.pre, schema=vLeiSchema, status="issued")] == [vLeiCreder.said]
+
+        # chained credential is hydrated once and shared by chains
+        saids = [coring.Saider(qb64=vLeiCreder.said), coring.Saider(qb64=creder.said)]
+        creds = ianreg.reger.cloneCreds(saids=saids, db=ian.db)
+        assert [cred['sad']['d'] for cred in creds] == [vLeiCreder.said, creder.said]
+        assert creds[0]['chains'] == [creds[1]]
+        assert creds[0]['chains'][0] is creds[1]
+        assert creds[1]['chains'] == []
+        assert creds[1]['anc']['i'] == ron.pre
+        memo = dict()
+        assert next(ianreg.reger.cloneCredIter(saids=saids[1:], db=ian.db, memo=memo)) == creds[1]
+        assert list(memo) == [creder.said]
+        cloner = ianreg.reger.cloneCredIter(saids=saids, db=ian.db)
+        assert next(cloner) == creds[0]
+        # suspended iterator holds no snapshot so reads see writes and map may grow
+        assert ianreg.reger._readers == 0 and ian.db._readers == 0
+        ianreg.reger.setVal(ianreg.reger.tvts, b'a', b'1')
+        ianreg.reger.setVal(ianreg.reger.tvts, b'a', b'2')
+        assert bytes(ianreg.reger.getVal(ianreg.reger.tvts, b'a')) == b'2'
+        ianreg.reger.delVal(ianreg.reger.tvts, b'a')
+        assert next(cloner) == creds[1]
 
         # test operators
 